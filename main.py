@@ -448,6 +448,29 @@ class FuelTuneApplication:
             logger.error(f"Erro durante limpeza: {e}", exc_info=True)
             return 1
 
+    def backfill_session_summaries(self) -> int:
+        """
+        Calcular resumos estatísticos das sessões que ainda não têm resumo.
+
+        Returns:
+            int: 0 se sucesso, 1 se alguma sessão falhou
+        """
+        logger.info("Calculando resumos de sessões...")
+
+        try:
+            from src.data.database import get_database
+
+            results = get_database().backfill_session_summaries()
+        except Exception as e:
+            logger.error(f"Erro no backfill de resumos: {e}")
+            return 1
+
+        logger.info(
+            f"Resumos: {results['processed']} calculados, {results['skipped']} sem dados, "
+            f"{results['failed']} com erro"
+        )
+        return 1 if results["failed"] else 0
+
     def add_shutdown_handler(self, handler):
         """Adicionar handler de shutdown."""
         self.shutdown_handlers.append(handler)
@@ -492,6 +515,7 @@ Exemplos:
     %(prog)s --health-check            # Verificar saúde do sistema
     %(prog)s --setup                   # Setup inicial
     %(prog)s --clean                   # Limpar caches
+    %(prog)s --backfill-summaries      # Calcular resumos de sessões antigas
 
 Variáveis de ambiente:
     FUELTUNE_DEBUG=1                   # Habilitar modo debug
@@ -536,6 +560,12 @@ Variáveis de ambiente:
 
     parser.add_argument("--clean", action="store_true", help="Limpar caches e arquivos temporários")
 
+    parser.add_argument(
+        "--backfill-summaries",
+        action="store_true",
+        help="Calcular resumos estatísticos de sessões importadas antes da tabela session_summary",
+    )
+
     # Streamlit options
     parser.add_argument(
         "--host",
@@ -573,6 +603,8 @@ Variáveis de ambiente:
         return app.setup()
     elif args.clean:
         return app.clean()
+    elif args.backfill_summaries:
+        return app.backfill_session_summaries()
     else:
         # Default: run Streamlit
         app.run_streamlit(host=args.host, port=args.port)
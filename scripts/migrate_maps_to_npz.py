@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+"""
+Migra os mapas JSON de data/fuel_maps/ para o formato binário (.npz por veículo).
+
+Execução:
+  python scripts/migrate_maps_to_npz.py [vehicle_id] [--remove-json]
+
+Depois da migração, defina FUEL_MAPS_STORAGE_FORMAT=npz para usar o novo formato.
+"""
+import sys
+
+from src.core.fuel_maps.persistence import PersistenceManager
+
+
+def main():
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    remove_json = "--remove-json" in sys.argv
+    vehicle_id = args[0] if args else None
+
+    manager = PersistenceManager(storage_format="npz")
+    migrated = manager.migrate_json_to_binary(vehicle_id, remove_json=remove_json)
+    print(f"Mapas migrados: {migrated}")
+
+
+if __name__ == "__main__":
+    main()
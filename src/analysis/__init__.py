@@ -8,10 +8,11 @@ Created: 2025-01-02
 Updated: 2025-09-04 - Added Analysis Engine Components
 """
 
-from .anomaly import AnomalyDetector, AnomalyResults
+from .anomaly import AnomalyDetector, AnomalyModel, AnomalyModelStore, AnomalyResults
 from .binning import (
     AdaptiveBinner,
     BinCell,
+    BinningAccumulator,
     BinningConfig,
     BinningResult,
     analyze_bin_density,
@@ -31,10 +32,20 @@ from .confidence import (
 )
 from .correlation import CorrelationAnalyzer, CorrelationMatrix
 from .dynamics import GForceAnalysis, VehicleDynamicsAnalyzer
+from .events import EventRuns, find_runs, threshold_events
 from .fuel_efficiency import BSFCAnalysisResults, FuelEfficiencyAnalyzer
+from .imu import (
+    attitude_from_acceleration,
+    combined_g,
+    derive_imu_columns,
+    detect_g_events,
+    friction_circle_usage,
+    jerk,
+)
 from .performance import PerformanceAnalyzer, PowerTorqueResults
 from .predictive import FailurePredictionResults, PredictiveAnalyzer
 from .reports import ExecutiveSummary, ReportGenerator
+from .result_cache import AnalysisResultCache, frame_content_hash
 from .safety import (
     SafetyConfig,
     SafetyLevel,
@@ -84,6 +95,8 @@ __all__ = [
     "TimeSeriesAnalyzer",
     # Original Results Classes
     "AnomalyResults",
+    "AnomalyModel",
+    "AnomalyModelStore",
     "CorrelationMatrix",
     "GForceAnalysis",
     "BSFCAnalysisResults",
@@ -101,6 +114,7 @@ __all__ = [
     "BinningResult",
     "BinningConfig",
     "BinCell",
+    "BinningAccumulator",
     "SuggestionEngine",
     "SuggestionsResult",
     "SuggestionConfig",
@@ -135,6 +149,20 @@ __all__ = [
     "validate_safety_limits",
     "check_critical_parameters",
     "apply_safety_constraints",
+    # IMU Kernels
+    "attitude_from_acceleration",
+    "combined_g",
+    "jerk",
+    "friction_circle_usage",
+    "detect_g_events",
+    "derive_imu_columns",
+    # Run-Length Events
+    "EventRuns",
+    "find_runs",
+    "threshold_events",
+    # Result Cache
+    "AnalysisResultCache",
+    "frame_content_hash",
 ]
 
 __version__ = "1.0.0"
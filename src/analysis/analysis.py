@@ -7,7 +7,17 @@ Author: FuelTune Development Team
 Version: 1.0.0
 """
 
-from typing import Any, Dict, List, Optional
+import os
+import tempfile
+import time
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
@@ -22,17 +32,74 @@ from .fuel_efficiency import FuelEfficiencyAnalyzer
 from .performance import PerformanceAnalyzer
 from .predictive import PredictiveAnalyzer
 from .reports import ReportGenerator
+from .result_cache import AnalysisResultCache, frame_content_hash
 from .statistics import StatisticalAnalyzer
 from .time_series import TimeSeriesAnalyzer
 
+# pyarrow is optional: without it process mode falls back to threads
+try:
+    import pyarrow as pa
+    import pyarrow.ipc as ipc
+
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+    pa = None
+    ipc = None
+
 logger = get_logger(__name__)
 
+# Analysis type -> (engine attribute, method, log label)
+ANALYSIS_TASKS: Dict[str, Tuple[str, str, str]] = {
+    "statistics": ("statistics_analyzer", "analyze", "Statistics analysis"),
+    "anomaly": ("anomaly_detector", "detect_anomalies", "Anomaly detection"),
+    "correlation": ("correlation_analyzer", "analyze", "Correlation analysis"),
+    "dynamics": ("dynamics_analyzer", "analyze", "Dynamics analysis"),
+    "fuel_efficiency": ("fuel_analyzer", "analyze", "Fuel efficiency analysis"),
+    "performance": ("performance_analyzer", "analyze", "Performance analysis"),
+    "predictive": ("predictive_analyzer", "analyze", "Predictive analysis"),
+    "time_series": ("time_series_analyzer", "analyze", "Time series analysis"),
+    "report": ("report_generator", "generate_comprehensive_report", "Report generation"),
+}
+
+# Analyses run by default (in this order when sequential)
+DEFAULT_ANALYSIS_TYPES = [
+    "statistics",
+    "anomaly",
+    "correlation",
+    "dynamics",
+    "fuel_efficiency",
+    "performance",
+    "predictive",
+    "time_series",
+]
+
+# Engine built once per worker process
+_worker_engine: Optional["AnalysisEngine"] = None
+
+
+def _run_analysis_in_process(analysis_type: str, path: str) -> Any:
+    """Run one analysis in a worker process on the memory-mapped session frame."""
+    global _worker_engine
+    if _worker_engine is None:
+        _worker_engine = AnalysisEngine()
+
+    with pa.memory_map(path, "r") as source:
+        data = ipc.open_file(source).read_all().to_pandas()
+    return _worker_engine.run_analysis(analysis_type, data)
+
 
 class AnalysisEngine:
     """Motor de análise principal do FuelTune."""
 
-    def __init__(self):
-        """Inicializar o motor de análise."""
+    def __init__(self, result_cache: Optional[AnalysisResultCache] = None):
+        """
+        Inicializar o motor de análise.
+
+        Args:
+            result_cache: Cache de resultados (padrão: criado no primeiro uso,
+                          sobre o cache manager global)
+        """
         self.anomaly_detector = AnomalyDetector()
         self.correlation_analyzer = CorrelationAnalyzer()
         self.dynamics_analyzer = VehicleDynamicsAnalyzer()
@@ -42,103 +109,278 @@ class AnalysisEngine:
         self.statistics_analyzer = StatisticalAnalyzer()
         self.time_series_analyzer = TimeSeriesAnalyzer()
         self.report_generator = ReportGenerator()
+        self._result_cache = result_cache
 
         logger.info("Analysis Engine initialized")
 
+    @property
+    def result_cache(self) -> AnalysisResultCache:
+        """Cache persistente de resultados das análises."""
+        if self._result_cache is None:
+            self._result_cache = AnalysisResultCache()
+        return self._result_cache
+
+    def _analyzer(self, analysis_type: str) -> Any:
+        """Instância do analisador de um tipo de análise."""
+        return getattr(self, ANALYSIS_TASKS[analysis_type][0])
+
+    def run_analysis(self, analysis_type: str, data: pd.DataFrame) -> Any:
+        """
+        Executar um único tipo de análise (sem tratamento de erro).
+
+        Args:
+            analysis_type: Chave de ANALYSIS_TASKS
+            data: DataFrame com dados de telemetria
+
+        Returns:
+            Resultado do analisador
+        """
+        _, method, _ = ANALYSIS_TASKS[analysis_type]
+        return getattr(self._analyzer(analysis_type), method)(data)
+
     def analyze(
-        self, data: pd.DataFrame, analysis_types: Optional[List[str]] = None
+        self,
+        data: pd.DataFrame,
+        analysis_types: Optional[List[str]] = None,
+        parallel: bool = False,
+        executor: str = "thread",
+        max_workers: Optional[int] = None,
+        timeout: Optional[float] = None,
+        on_result: Optional[Callable[[str, Any], None]] = None,
+        session_id: Optional[str] = None,
+        content_hash: Optional[str] = None,
+        time_window: Optional[Tuple[float, float]] = None,
     ) -> Dict[str, Any]:
         """
         Executar análises selecionadas nos dados.
 
+        Com session_id, resultados são lidos do e gravados no cache persistente
+        (chave: hash do conteúdo, janela de tempo, analisador, parâmetros e
+        versão do código); apenas as análises ausentes do cache são executadas.
+
         Args:
             data: DataFrame com dados de telemetria
             analysis_types: Lista de tipos de análise a executar
                            Se None, executa todas
+            parallel: Executar análises independentes em paralelo
+            executor: 'thread' ou 'process' (modo paralelo)
+            max_workers: Número máximo de workers (padrão: CPUs)
+            timeout: Tempo máximo (s) por análise no modo paralelo
+            on_result: Callback (tipo, resultado) chamado quando cada análise termina
+            session_id: ID da sessão (habilita o cache de resultados)
+            content_hash: Hash dos dados (padrão: calculado a partir do DataFrame)
+            time_window: Janela de tempo aplicada aos dados, se houver
 
         Returns:
             Dicionário com resultados de todas as análises
         """
         if analysis_types is None:
-            analysis_types = [
-                "statistics",
-                "anomaly",
-                "correlation",
-                "dynamics",
-                "fuel_efficiency",
-                "performance",
-                "predictive",
-                "time_series",
-            ]
+            analysis_types = DEFAULT_ANALYSIS_TYPES
 
         results = {}
 
-        # Executar análises selecionadas
-        if "statistics" in analysis_types:
-            try:
-                results["statistics"] = self.statistics_analyzer.analyze(data)
-                logger.info("Statistics analysis completed")
-            except Exception as e:
-                logger.error(f"Statistics analysis failed: {e}")
-                results["statistics"] = {"error": str(e)}
+        def emit(analysis_type: str, result: Any) -> None:
+            results[analysis_type] = result
+            if on_result is not None:
+                on_result(analysis_type, result)
+
+        use_cache = session_id is not None
+        if use_cache:
+            if content_hash is None:
+                content_hash = frame_content_hash(data)
+
+            missing = []
+            for analysis_type in analysis_types:
+                if analysis_type not in ANALYSIS_TASKS:
+                    continue
+                cached = self._cached_result(analysis_type, session_id, content_hash, time_window)
+                if cached is None:
+                    missing.append(analysis_type)
+                else:
+                    logger.info(f"{ANALYSIS_TASKS[analysis_type][2]} loaded from cache")
+                    emit(analysis_type, cached)
+            analysis_types = missing
+
+        if parallel:
+            iterator = self.iter_analyses(data, analysis_types, executor, max_workers, timeout)
+        else:
+            iterator = (
+                (analysis_type, self._run_safely(analysis_type, data))
+                for analysis_type in analysis_types
+                if analysis_type in ANALYSIS_TASKS
+            )
 
-        if "anomaly" in analysis_types:
-            try:
-                results["anomaly"] = self.anomaly_detector.detect_anomalies(data)
-                logger.info("Anomaly detection completed")
-            except Exception as e:
-                logger.error(f"Anomaly detection failed: {e}")
-                results["anomaly"] = {"error": str(e)}
+        for analysis_type, result in iterator:
+            if use_cache and not (isinstance(result, dict) and "error" in result):
+                self._store_result(analysis_type, session_id, content_hash, time_window, result)
+            emit(analysis_type, result)
 
-        if "correlation" in analysis_types:
-            try:
-                results["correlation"] = self.correlation_analyzer.analyze(data)
-                logger.info("Correlation analysis completed")
-            except Exception as e:
-                logger.error(f"Correlation analysis failed: {e}")
-                results["correlation"] = {"error": str(e)}
+        return results
 
-        if "dynamics" in analysis_types:
-            try:
-                results["dynamics"] = self.dynamics_analyzer.analyze(data)
-                logger.info("Dynamics analysis completed")
-            except Exception as e:
-                logger.error(f"Dynamics analysis failed: {e}")
-                results["dynamics"] = {"error": str(e)}
+    def _cached_result(
+        self,
+        analysis_type: str,
+        session_id: str,
+        content_hash: str,
+        time_window: Optional[Tuple[float, float]],
+    ) -> Optional[Any]:
+        """Resultado em cache (None em caso de falha ou ausência)."""
+        try:
+            return self.result_cache.get(
+                session_id, analysis_type, self._analyzer(analysis_type), content_hash, time_window
+            )
+        except Exception as e:
+            logger.warning(f"Analysis cache lookup failed for {analysis_type}: {e}")
+            return None
+
+    def _store_result(
+        self,
+        analysis_type: str,
+        session_id: str,
+        content_hash: str,
+        time_window: Optional[Tuple[float, float]],
+        result: Any,
+    ) -> None:
+        """Gravar resultado no cache (falhas não interrompem a análise)."""
+        try:
+            self.result_cache.set(
+                session_id,
+                analysis_type,
+                self._analyzer(analysis_type),
+                content_hash,
+                result,
+                time_window,
+            )
+        except Exception as e:
+            logger.warning(f"Failed to cache {analysis_type} result: {e}")
+
+    def iter_analyses(
+        self,
+        data: pd.DataFrame,
+        analysis_types: Optional[List[str]] = None,
+        executor: str = "thread",
+        max_workers: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ) -> Iterator[Tuple[str, Any]]:
+        """
+        Executar análises em paralelo, produzindo resultados à medida que terminam.
 
-        if "fuel_efficiency" in analysis_types:
-            try:
-                results["fuel_efficiency"] = self.fuel_analyzer.analyze(data)
-                logger.info("Fuel efficiency analysis completed")
-            except Exception as e:
-                logger.error(f"Fuel efficiency analysis failed: {e}")
-                results["fuel_efficiency"] = {"error": str(e)}
+        As análises são independentes entre si (o relatório recalcula seus
+        próprios resumos a partir dos dados) e são agendadas no pool à medida
+        que há workers livres. No modo thread o DataFrame é compartilhado sem cópia (o
+        trabalho pesado em NumPy/SciPy/sklearn libera o GIL); no modo process
+        ele é escrito uma única vez em um arquivo Arrow IPC que os workers
+        mapeiam em memória, em vez de ser serializado para cada análise.
 
-        if "performance" in analysis_types:
-            try:
-                results["performance"] = self.performance_analyzer.analyze(data)
-                logger.info("Performance analysis completed")
-            except Exception as e:
-                logger.error(f"Performance analysis failed: {e}")
-                results["performance"] = {"error": str(e)}
+        Uma análise que excede o timeout é reportada como erro e abandonada
+        (o worker não pode ser interrompido, mas o resultado é descartado).
 
-        if "predictive" in analysis_types:
-            try:
-                results["predictive"] = self.predictive_analyzer.analyze(data)
-                logger.info("Predictive analysis completed")
-            except Exception as e:
-                logger.error(f"Predictive analysis failed: {e}")
-                results["predictive"] = {"error": str(e)}
+        Args:
+            data: DataFrame com dados de telemetria
+            analysis_types: Lista de tipos de análise (padrão: todas)
+            executor: 'thread' ou 'process'
+            max_workers: Número máximo de workers (padrão: CPUs)
+            timeout: Tempo máximo (s) por análise, contado a partir do início dela
 
-        if "time_series" in analysis_types:
-            try:
-                results["time_series"] = self.time_series_analyzer.analyze(data)
-                logger.info("Time series analysis completed")
-            except Exception as e:
-                logger.error(f"Time series analysis failed: {e}")
-                results["time_series"] = {"error": str(e)}
+        Yields:
+            Tuplas (tipo de análise, resultado)
+        """
+        if analysis_types is None:
+            analysis_types = DEFAULT_ANALYSIS_TYPES
+        if executor not in ("thread", "process"):
+            raise ValueError(f"Unknown executor: {executor}")
+        if executor == "process" and not PYARROW_AVAILABLE:
+            logger.warning("pyarrow not available, running analyses in threads")
+            executor = "thread"
+
+        selected = [t for t in dict.fromkeys(analysis_types) if t in ANALYSIS_TASKS]
+        workers = max_workers or min(len(selected), os.cpu_count() or 1) or 1
+
+        shared_path = None
+        if executor == "process":
+            shared_path = self._share_frame(data)
+            pool = ProcessPoolExecutor(max_workers=workers)
+        else:
+            pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="analysis")
+
+        running: Dict[Future, Tuple[str, float]] = {}
+        queued = iter(selected)
+        abandoned = False
+
+        def submit_ready() -> None:
+            # Never queue beyond the pool size, so timeouts count from the real start
+            while len(running) < workers:
+                analysis_type = next(queued, None)
+                if analysis_type is None:
+                    return
+                if shared_path is not None:
+                    future = pool.submit(_run_analysis_in_process, analysis_type, shared_path)
+                else:
+                    future = pool.submit(self.run_analysis, analysis_type, data)
+                running[future] = (analysis_type, time.monotonic())
 
-        return results
+        try:
+            submit_ready()
+            while running:
+                wait_for = None
+                if timeout is not None:
+                    earliest = min(started for _, started in running.values())
+                    wait_for = max(0.0, earliest + timeout - time.monotonic())
+
+                finished, _ = wait(list(running), timeout=wait_for, return_when=FIRST_COMPLETED)
+
+                for future in finished:
+                    analysis_type, _ = running.pop(future)
+                    label = ANALYSIS_TASKS[analysis_type][2]
+                    try:
+                        result = future.result()
+                        logger.info(f"{label} completed")
+                    except Exception as e:
+                        logger.error(f"{label} failed: {e}")
+                        result = {"error": str(e)}
+                    yield analysis_type, result
+
+                if timeout is not None:
+                    now = time.monotonic()
+                    for future, (analysis_type, started) in list(running.items()):
+                        if now - started >= timeout:
+                            running.pop(future)
+                            future.cancel()
+                            abandoned = True
+                            label = ANALYSIS_TASKS[analysis_type][2]
+                            logger.error(f"{label} timed out after {timeout}s")
+                            yield analysis_type, {"error": f"Timed out after {timeout}s"}
+
+                submit_ready()
+        finally:
+            pool.shutdown(wait=not (running or abandoned), cancel_futures=True)
+            # A worker still holding the file keeps its mapping valid after unlink (POSIX)
+            if shared_path is not None:
+                try:
+                    os.unlink(shared_path)
+                except OSError:
+                    pass
+
+    def _run_safely(self, analysis_type: str, data: pd.DataFrame) -> Any:
+        """Executar uma análise, convertendo exceções em resultado de erro."""
+        label = ANALYSIS_TASKS[analysis_type][2]
+        try:
+            result = self.run_analysis(analysis_type, data)
+            logger.info(f"{label} completed")
+            return result
+        except Exception as e:
+            logger.error(f"{label} failed: {e}")
+            return {"error": str(e)}
+
+    def _share_frame(self, data: pd.DataFrame) -> str:
+        """Escrever o DataFrame em um arquivo Arrow IPC temporário (não comprimido)."""
+        table = pa.Table.from_pandas(data, preserve_index=False)
+        fd, path = tempfile.mkstemp(prefix="fueltune_analysis_", suffix=".arrow")
+        os.close(fd)
+        with pa.OSFile(path, "wb") as sink:
+            with ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        return path
 
     def generate_report(self, analysis_results: Dict[str, Any], format: str = "html") -> str:
         """
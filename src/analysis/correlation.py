@@ -16,7 +16,7 @@ import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 from scipy import stats
-from scipy.linalg import pinv
+from scipy.fft import irfft, next_fast_len, rfft
 from scipy.stats import pearsonr, spearmanr
 from sklearn.ensemble import RandomForestRegressor
 from sklearn.feature_selection import SelectKBest, f_regression, mutual_info_regression
@@ -79,6 +79,19 @@ class CrossCorrelationResults:
     confidence_interval: float
 
 
+@dataclass
+class LagCorrelationMatrix:
+    """All-pairs lagged cross-correlation results."""
+
+    variables: List[str]
+    lags: np.ndarray
+    correlations: np.ndarray  # (n_vars, n_vars, n_lags); [i, j, k] = corr(x_i[t + lag_k], x_j[t])
+    max_correlation: pd.DataFrame
+    optimal_lag: pd.DataFrame  # positive: row variable lags behind column variable
+    confidence_interval: float
+    sample_size: int
+
+
 class CorrelationAnalyzer:
     """Advanced correlation analysis for FuelTune telemetry data."""
 
@@ -448,17 +461,12 @@ class CorrelationAnalyzer:
             arr1 = (arr1 - np.mean(arr1)) / np.std(arr1)
             arr2 = (arr2 - np.mean(arr2)) / np.std(arr2)
 
-            # Compute cross-correlation
-            correlation_full = np.correlate(arr1, arr2, mode="full")
-            correlation_full = correlation_full / min_len  # Normalize
-
-            # Extract relevant lags
-            mid = len(correlation_full) // 2
-            start_idx = max(0, mid - max_lag)
-            end_idx = min(len(correlation_full), mid + max_lag + 1)
-
-            correlation_function = correlation_full[start_idx:end_idx]
-            lags = np.arange(start_idx - mid, end_idx - mid)
+            # Compute cross-correlation (FFT, only lags up to max_lag are kept)
+            max_lag = min(max_lag, min_len - 1)
+            lags = np.arange(-max_lag, max_lag + 1)
+            correlation_function = (
+                self._fft_lag_correlations(np.column_stack([arr1, arr2]), max_lag)[0, 1] / min_len
+            )
 
             # Find maximum correlation and optimal lag
             max_idx = np.argmax(np.abs(correlation_function))
@@ -480,6 +488,117 @@ class CorrelationAnalyzer:
             self.logger.error(f"Error in cross-correlation computation: {e}")
             raise
 
+    def _fft_lag_correlations(
+        self, Z: np.ndarray, max_lag: int, pair_block: int = 8
+    ) -> np.ndarray:
+        """
+        Raw lagged cross-products of every column pair via FFT.
+
+        Equivalent to ``np.correlate(Z[:, i], Z[:, j], mode="full")`` truncated
+        to lags -max_lag..max_lag, for all (i, j), in O(C² N log N) instead of
+        O(C² N²). Inverse transforms run in blocks of pair_block columns to
+        bound memory.
+
+        Args:
+            Z: Data matrix (n_samples, n_columns)
+            max_lag: Maximum lag kept
+            pair_block: Columns per inverse-transform block
+
+        Returns:
+            Array (n_columns, n_columns, 2 * max_lag + 1) where
+            [i, j, k] = sum_t Z[t + lag_k, i] * Z[t, j]
+        """
+        n, n_cols = Z.shape
+        nfft = next_fast_len(2 * n - 1, real=True)
+        spectra = rfft(Z, n=nfft, axis=0, workers=-1)
+
+        result = np.empty((n_cols, n_cols, 2 * max_lag + 1))
+        for i in range(n_cols):
+            for start in range(i, n_cols, pair_block):
+                stop = min(start + pair_block, n_cols)
+                # Circular cross-correlation: index L holds lag L, index nfft - L holds lag -L
+                circular = irfft(
+                    spectra[:, i : i + 1] * np.conj(spectra[:, start:stop]),
+                    n=nfft,
+                    axis=0,
+                    workers=-1,
+                )
+                block = np.concatenate([circular[nfft - max_lag :], circular[: max_lag + 1]])
+                result[i, start:stop] = block.T
+                # corr(x_j[t + L], x_i[t]) = corr(x_i[t - L], x_j[t])
+                result[start:stop, i] = block[::-1].T
+        return result
+
+    def compute_lag_correlation_matrix(
+        self,
+        data: pd.DataFrame,
+        variables: Optional[List[str]] = None,
+        max_lag: Optional[int] = None,
+    ) -> LagCorrelationMatrix:
+        """
+        Compute lagged cross-correlation for every pair of channels.
+
+        Rows with a missing value in any selected channel are dropped so all
+        channels stay aligned. Correlations use the same normalization as
+        compute_cross_correlation (z-scored series, divided by N).
+
+        Args:
+            data: DataFrame with time series data
+            variables: Channels to include (default: all numeric columns)
+            max_lag: Maximum lag in samples (default: min(N // 4, 50))
+
+        Returns:
+            LagCorrelationMatrix object
+        """
+        try:
+            if variables is None:
+                variables = list(data.select_dtypes(include=[np.number]).columns)
+            missing_vars = [var for var in variables if var not in data.columns]
+            if missing_vars:
+                raise ValueError(f"Missing variables in data: {missing_vars}")
+
+            clean = data[variables].dropna().to_numpy(dtype=np.float64)
+            n = len(clean)
+            if n < 10 or len(variables) < 2:
+                raise ValueError("Insufficient data for lag correlation analysis")
+
+            if max_lag is None:
+                max_lag = min(n // 4, 50)
+            max_lag = min(max_lag, n - 1)
+
+            # Normalize (constant channels give NaN correlations)
+            std = clean.std(axis=0)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                Z = (clean - clean.mean(axis=0)) / np.where(std > 0, std, np.nan)
+            valid = std > 0
+            Z_valid = Z[:, valid]
+
+            correlations = np.full((len(variables), len(variables), 2 * max_lag + 1), np.nan)
+            if Z_valid.shape[1] > 0:
+                idx = np.flatnonzero(valid)
+                correlations[np.ix_(idx, idx)] = self._fft_lag_correlations(Z_valid, max_lag) / n
+
+            lags = np.arange(-max_lag, max_lag + 1)
+            with np.errstate(invalid="ignore"):
+                filled = np.nan_to_num(np.abs(correlations), nan=-1.0)
+                best = np.argmax(filled, axis=2)
+            max_corr = np.take_along_axis(correlations, best[..., None], axis=2)[..., 0]
+            optimal = np.where(np.isnan(max_corr), 0, lags[best])
+
+            return LagCorrelationMatrix(
+                variables=list(variables),
+                lags=lags,
+                correlations=correlations,
+                max_correlation=pd.DataFrame(max_corr, index=variables, columns=variables),
+                optimal_lag=pd.DataFrame(optimal, index=variables, columns=variables),
+                confidence_interval=1.96 / np.sqrt(n),
+                sample_size=n,
+            )
+
+        except Exception as e:
+            self.logger.error(f"Error in lag correlation matrix computation: {e}")
+            raise
+
     def analyze_granger_causality(
         self,
         data: pd.DataFrame,
@@ -513,31 +632,23 @@ class CorrelationAnalyzer:
             causal_graph = {var: [] for var in variables}
             causal_strength = {}
 
-            # Test causality for each pair of variables
-            for cause_var in variables:
+            # All pairs at once from one shared lag matrix
+            f_stats, p_values = self._batched_granger(
+                clean_data.to_numpy(dtype=np.float64), max_lag
+            )
+
+            for i, cause_var in enumerate(variables):
                 granger_results[cause_var] = {}
 
-                for effect_var in variables:
+                for j, effect_var in enumerate(variables):
                     if cause_var != effect_var:
-                        # Prepare data for Granger test
-                        y = clean_data[effect_var].values
-                        x = clean_data[cause_var].values
-
-                        # Simple Granger causality test using F-test
-                        try:
-                            f_stat, p_value = self._granger_causality_test(y, x, max_lag)
-                            granger_results[cause_var][effect_var] = (f_stat, p_value)
-
-                            # Determine causality
-                            if p_value < self.significance_level:
-                                causal_graph[cause_var].append(effect_var)
-                                causal_strength[(cause_var, effect_var)] = 1 - p_value
-
-                        except Exception as e:
-                            self.logger.warning(
-                                f"Granger test failed for {cause_var}->{effect_var}: {e}"
-                            )
-                            granger_results[cause_var][effect_var] = (np.nan, np.nan)
+                        f_stat, p_value = float(f_stats[i, j]), float(p_values[i, j])
+                        granger_results[cause_var][effect_var] = (f_stat, p_value)
+
+                        # Determine causality
+                        if p_value < self.significance_level:
+                            causal_graph[cause_var].append(effect_var)
+                            causal_strength[(cause_var, effect_var)] = 1 - p_value
 
             return CausalAnalysisResults(
                 granger_results=granger_results,
@@ -716,54 +827,95 @@ class CorrelationAnalyzer:
             Tuple of (F-statistic, p-value)
         """
         try:
-            from scipy.stats import f
-
-            n = len(y)
-
-            # Create lagged variables
-            Y = y[max_lag:]
-            X_restricted = np.column_stack([y[max_lag - i - 1 : n - i - 1] for i in range(max_lag)])
-            X_unrestricted = np.column_stack(
-                [
-                    X_restricted,
-                    np.column_stack([x[max_lag - i - 1 : n - i - 1] for i in range(max_lag)]),
-                ]
+            f_stats, p_values = self._batched_granger(
+                np.column_stack([x, y]).astype(np.float64), max_lag
             )
+            return f_stats[0, 1], p_values[0, 1]
 
-            # Add constant term
-            X_restricted = np.column_stack([np.ones(len(Y)), X_restricted])
-            X_unrestricted = np.column_stack([np.ones(len(Y)), X_unrestricted])
+        except Exception:
+            return np.nan, np.nan
 
-            # Fit restricted model (without x lags)
-            try:
-                beta_restricted = pinv(X_restricted.T @ X_restricted) @ X_restricted.T @ Y
-                residuals_restricted = Y - X_restricted @ beta_restricted
-                ssr_restricted = np.sum(residuals_restricted**2)
-            except Exception:
-                return np.nan, np.nan
+    def _batched_granger(
+        self, values: np.ndarray, max_lag: int, chunk_rows: int = 65536
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Granger F-tests for every (cause, effect) pair of columns.
 
-            # Fit unrestricted model (with x lags)
-            try:
-                beta_unrestricted = pinv(X_unrestricted.T @ X_unrestricted) @ X_unrestricted.T @ Y
-                residuals_unrestricted = Y - X_unrestricted @ beta_unrestricted
-                ssr_unrestricted = np.sum(residuals_unrestricted**2)
-            except Exception:
-                return np.nan, np.nan
+        One lag matrix X = [1, lags 1..max_lag of every column, current values]
+        is shared by all tests. Its R factor (X = QR) is accumulated once over
+        row chunks; since Q has orthonormal columns, every least-squares fit
+        on columns of X has the same residual as the fit on the matching
+        columns of R. The restricted (effect lags only) and unrestricted
+        (effect and cause lags) fits are then solved by SVD-based least
+        squares on those small R sub-blocks, batched over causes, which
+        avoids the squared conditioning of the normal equations.
 
-            # Compute F-statistic
-            df_num = max_lag  # Number of restrictions
-            df_den = len(Y) - X_unrestricted.shape[1]  # Degrees of freedom denominator
+        Args:
+            values: Data matrix (n_samples, n_columns) without missing values
+            max_lag: Number of lags in each model
+            chunk_rows: Rows per chunk when accumulating the R factor
 
-            if df_den <= 0 or ssr_unrestricted <= 0:
-                return np.nan, np.nan
+        Returns:
+            Tuple of (F statistics, p-values) arrays indexed [cause, effect];
+            NaN on the diagonal and for degenerate fits
+        """
+        n, n_cols = values.shape
+        p = max_lag
+        n_obs = n - p
+        f_stats = np.full((n_cols, n_cols), np.nan)
+
+        df_num = p  # Number of restrictions
+        df_den = n_obs - (1 + 2 * p)  # Degrees of freedom denominator
+        if p < 1 or df_den <= 0:
+            return f_stats, f_stats.copy()
+
+        std = values.std(axis=0)
+        Z = (values - values.mean(axis=0)) / np.where(std > 0, std, 1.0)
+
+        # Column layout: 0 = constant, 1 + (k - 1) * n_cols + c = lag k of c,
+        # 1 + p * n_cols + c = current value of c
+        width = 1 + (p + 1) * n_cols
+        r_factor = np.zeros((0, width))
+        for start in range(0, n_obs, chunk_rows):
+            stop = min(start + chunk_rows, n_obs)
+            block = np.hstack(
+                [np.ones((stop - start, 1))]
+                + [Z[start + p - k : stop + p - k] for k in range(1, p + 1)]
+                + [Z[start + p : stop + p]]
+            )
+            r_factor = np.linalg.qr(np.vstack([r_factor, block]), mode="r")
 
-            f_stat = ((ssr_restricted - ssr_unrestricted) / df_num) / (ssr_unrestricted / df_den)
-            p_value = 1 - f.cdf(f_stat, df_num, df_den)
+        # Same singular value cutoff as np.linalg.lstsq on the full lag matrix
+        rcond = np.finfo(np.float64).eps * n_obs
 
-            return f_stat, p_value
+        def residual_ss(design: np.ndarray, target: np.ndarray) -> np.ndarray:
+            coefficients = np.einsum("...ij,...j->...i", np.linalg.pinv(design, rcond), target)
+            residuals = target - np.einsum("...ij,...j->...i", design, coefficients)
+            return np.sum(residuals**2, axis=-1)
 
-        except Exception:
-            return np.nan, np.nan
+        lag_columns = 1 + np.arange(p)[None, :] * n_cols + np.arange(n_cols)[:, None]  # (c, k)
+
+        for effect in range(n_cols):
+            target = r_factor[:, 1 + p * n_cols + effect]
+            restricted = np.concatenate([[0], lag_columns[effect]])
+            ssr_restricted = residual_ss(r_factor[:, restricted], target)
+
+            # Unrestricted designs for every cause at once: (n_cols, rows of R, 1 + 2p)
+            unrestricted = np.hstack([np.broadcast_to(restricted, (n_cols, p + 1)), lag_columns])
+            designs = r_factor[:, unrestricted].transpose(1, 0, 2)
+            ssr_unrestricted = residual_ss(designs, np.broadcast_to(target, designs.shape[:2]))
+
+            with np.errstate(divide="ignore", invalid="ignore"):
+                f_effect = ((ssr_restricted - ssr_unrestricted) / df_num) / (
+                    ssr_unrestricted / df_den
+                )
+            f_effect[ssr_unrestricted <= 0] = np.nan
+            f_stats[:, effect] = f_effect
+
+        np.fill_diagonal(f_stats, np.nan)
+        p_values = stats.f.sf(f_stats, df_num, df_den)
+
+        return f_stats, p_values
 
     def generate_correlation_summary(
         self, data: pd.DataFrame, target_variable: Optional[str] = None
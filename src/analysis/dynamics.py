@@ -20,6 +20,7 @@ from scipy import signal
 
 from ..data.cache import cached_analysis as cache_result
 from ..utils.logging_config import get_logger
+from . import imu
 
 logger = get_logger(__name__)
 
@@ -187,7 +188,7 @@ class VehicleDynamicsAnalyzer:
                 raise ValueError("Insufficient IMU data")
 
             # Extract acceleration components (convert from m/s² to g)
-            g_constant = 9.80665
+            g_constant = imu.G_CONSTANT
 
             if accel_x_col in available_cols:
                 longitudinal_g = clean_data[accel_x_col].fillna(0).values / g_constant
@@ -207,7 +208,7 @@ class VehicleDynamicsAnalyzer:
                 vertical_g = np.zeros(len(clean_data))
 
             # Calculate combined G-force
-            combined_g = np.sqrt(longitudinal_g**2 + lateral_g**2)
+            combined_g = imu.combined_g(longitudinal_g, lateral_g)
 
             # Find maximum values
             max_longitudinal_g = np.max(np.abs(longitudinal_g))
@@ -226,23 +227,11 @@ class VehicleDynamicsAnalyzer:
             )
 
             # G-force distribution analysis
-            g_ranges = [(0, 0.3), (0.3, 0.6), (0.6, 0.9), (0.9, 1.2), (1.2, np.inf)]
-            g_range_labels = ["low", "moderate", "high", "very_high", "extreme"]
-
-            g_force_distribution = {}
-            for (min_g, max_g), label in zip(g_ranges, g_range_labels):
-                count = np.sum((combined_g >= min_g) & (combined_g < max_g))
-                g_force_distribution[label] = count
+            g_force_distribution = imu.g_force_distribution(combined_g)
 
             # Comfort rating (lower G-forces = more comfortable)
             # Based on sustained G-force levels
-            comfort_penalty = 0
-            for g_val in combined_g:
-                if g_val > 0.5:
-                    comfort_penalty += (g_val - 0.5) * 0.1
-                if g_val > 1.0:
-                    comfort_penalty += (g_val - 1.0) * 0.2
-
+            comfort_penalty = imu.comfort_penalty(combined_g)
             comfort_rating = max(0, 1 - comfort_penalty / len(combined_g))
 
             return GForceAnalysis(
@@ -304,9 +293,6 @@ class VehicleDynamicsAnalyzer:
             if len(clean_data) < 10:
                 raise ValueError("Insufficient IMU data")
 
-            # Initialize attitude arrays
-            pitch_angle = np.zeros(len(clean_data))
-            roll_angle = np.zeros(len(clean_data))
             yaw_rate = np.zeros(len(clean_data))
 
             # Extract gyroscope data (angular rates)
@@ -355,21 +341,9 @@ class VehicleDynamicsAnalyzer:
                 accel_z_filtered = accel_z
 
             # Calculate attitude angles from accelerometer
-            for i in range(len(clean_data)):
-                # Normalize acceleration vector
-                acc_magnitude = np.sqrt(
-                    accel_x_filtered[i] ** 2 + accel_y_filtered[i] ** 2 + accel_z_filtered[i] ** 2
-                )
-                if acc_magnitude > 0:
-                    ax_norm = accel_x_filtered[i] / acc_magnitude
-                    ay_norm = accel_y_filtered[i] / acc_magnitude
-                    az_norm = accel_z_filtered[i] / acc_magnitude
-
-                    # Calculate pitch and roll (in radians, then convert to degrees)
-                    pitch_angle[i] = (
-                        np.arctan2(ax_norm, np.sqrt(ay_norm**2 + az_norm**2)) * 180 / np.pi
-                    )
-                    roll_angle[i] = np.arctan2(ay_norm, az_norm) * 180 / np.pi
+            pitch_angle, roll_angle = imu.attitude_from_acceleration(
+                accel_x_filtered, accel_y_filtered, accel_z_filtered
+            )
 
             # Find maximum values
             max_pitch = np.max(np.abs(pitch_angle))
@@ -775,7 +749,7 @@ class VehicleDynamicsAnalyzer:
             acceleration_ms2 = np.diff(speed_ms) / dt
 
             # Convert to G-force
-            g_constant = 9.80665
+            g_constant = imu.G_CONSTANT
             longitudinal_g = acceleration_ms2 / g_constant
 
             # Assume no lateral acceleration data
@@ -804,13 +778,7 @@ class VehicleDynamicsAnalyzer:
             )
 
             # Distribution
-            g_ranges = [(0, 0.3), (0.3, 0.6), (0.6, 0.9), (0.9, 1.2), (1.2, np.inf)]
-            g_range_labels = ["low", "moderate", "high", "very_high", "extreme"]
-
-            g_force_distribution = {}
-            for (min_g, max_g), label in zip(g_ranges, g_range_labels):
-                count = np.sum((combined_g >= min_g) & (combined_g < max_g))
-                g_force_distribution[label] = count
+            g_force_distribution = imu.g_force_distribution(combined_g)
 
             # Comfort rating
             comfort_rating = max(0, 1 - np.mean(combined_g))
@@ -0,0 +1,254 @@
+"""
+IMU Kernels for FuelTune.
+
+Vectorized computations shared by the vehicle dynamics analyzer and the IMU
+page: attitude from the accelerometer, combined G, jerk, friction circle
+usage, G-force events and the derived IMU columns. Every function works on
+whole arrays, so 1 kHz track-day logs are processed in milliseconds.
+
+Author: A04-ANALYSIS-SCIPY Agent
+Created: 2026-10-16
+"""
+
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Standard gravity (m/s²)
+G_CONSTANT = 9.80665
+
+# Default threshold (g) for acceleration, braking and cornering events
+EVENT_THRESHOLD_G = 0.3
+
+# Window (samples) of the rolling attitude variation
+ATTITUDE_VARIATION_WINDOW = 10
+
+# Combined G bands used for the G-force distribution
+G_FORCE_BANDS = (
+    ("low", 0.0, 0.3),
+    ("moderate", 0.3, 0.6),
+    ("high", 0.6, 0.9),
+    ("very_high", 0.9, 1.2),
+    ("extreme", 1.2, np.inf),
+)
+
+# Percentile of combined G taken as the grip limit when none is given
+GRIP_LIMIT_PERCENTILE = 99.5
+
+
+def _as_float(values) -> np.ndarray:
+    """Float64 array with NaN for missing values."""
+    if isinstance(values, pd.Series):
+        return values.to_numpy(dtype=np.float64, na_value=np.nan)
+    return np.asarray(values, dtype=np.float64)
+
+
+def attitude_from_acceleration(
+    accel_x: np.ndarray, accel_y: np.ndarray, accel_z: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Pitch and roll (degrees) from the direction of the acceleration vector.
+
+    Samples with a zero acceleration vector get 0 for both angles.
+
+    Args:
+        accel_x: Longitudinal acceleration
+        accel_y: Lateral acceleration
+        accel_z: Vertical acceleration
+
+    Returns:
+        Tuple of (pitch, roll) arrays
+    """
+    accel_x, accel_y, accel_z = _as_float(accel_x), _as_float(accel_y), _as_float(accel_z)
+    magnitude = np.sqrt(accel_x**2 + accel_y**2 + accel_z**2)
+    valid = magnitude > 0
+    scale = np.divide(1.0, magnitude, out=np.zeros_like(magnitude), where=valid)
+
+    ax_norm = accel_x * scale
+    ay_norm = accel_y * scale
+    az_norm = accel_z * scale
+
+    pitch = np.arctan2(ax_norm, np.sqrt(ay_norm**2 + az_norm**2)) * 180 / np.pi
+    roll = np.arctan2(ay_norm, az_norm) * 180 / np.pi
+    return np.where(valid, pitch, 0.0), np.where(valid, roll, 0.0)
+
+
+def combined_g(longitudinal_g, lateral_g) -> np.ndarray:
+    """Magnitude of the horizontal G vector (missing components count as 0)."""
+    longitudinal_g = np.nan_to_num(_as_float(longitudinal_g), nan=0.0)
+    lateral_g = np.nan_to_num(_as_float(lateral_g), nan=0.0)
+    return np.sqrt(longitudinal_g**2 + lateral_g**2)
+
+
+def jerk(values, time=None, sample_rate: float = 1.0) -> np.ndarray:
+    """
+    Rate of change per second (backward difference, 0 for the first sample).
+
+    Args:
+        values: Signal (e.g. combined G)
+        time: Timestamps in seconds; non-increasing steps use the median step
+        sample_rate: Sampling rate in Hz when no timestamps are given
+
+    Returns:
+        Array with the same length as values
+    """
+    values = _as_float(values)
+    result = np.zeros(len(values))
+    if len(values) < 2:
+        return result
+
+    if time is None:
+        dt = np.full(len(values) - 1, 1.0 / sample_rate)
+    else:
+        dt = np.diff(_as_float(time))
+        valid = dt > 0
+        if not valid.all():
+            dt[~valid] = np.median(dt[valid]) if valid.any() else 1.0 / sample_rate
+
+    result[1:] = np.diff(values) / dt
+    return result
+
+
+def friction_circle_usage(g_total, grip_limit_g: Optional[float] = None) -> np.ndarray:
+    """
+    Share of the available grip in use, in percent.
+
+    Args:
+        g_total: Combined G
+        grip_limit_g: Grip limit in g (default: GRIP_LIMIT_PERCENTILE of g_total)
+
+    Returns:
+        Usage array (can exceed 100 above the grip limit)
+    """
+    g_total = _as_float(g_total)
+    if grip_limit_g is None:
+        finite = g_total[np.isfinite(g_total)]
+        grip_limit_g = float(np.percentile(finite, GRIP_LIMIT_PERCENTILE)) if len(finite) else 0.0
+    if grip_limit_g <= 0:
+        return np.zeros(len(g_total))
+    return g_total / grip_limit_g * 100
+
+
+def detect_g_events(
+    longitudinal_g=None, lateral_g=None, threshold: float = EVENT_THRESHOLD_G
+) -> Dict[str, np.ndarray]:
+    """
+    Boolean masks of acceleration, braking and cornering samples.
+
+    Missing samples never count as events.
+
+    Returns:
+        Dictionary with acceleration_event, braking_event and cornering_event
+        (only for the components given)
+    """
+    events = {}
+    if longitudinal_g is not None:
+        longitudinal_g = _as_float(longitudinal_g)
+        events["acceleration_event"] = longitudinal_g > threshold
+        events["braking_event"] = longitudinal_g < -threshold
+    if lateral_g is not None:
+        events["cornering_event"] = np.abs(_as_float(lateral_g)) > threshold
+    return events
+
+
+def g_force_distribution(g_total) -> Dict[str, int]:
+    """Number of samples in each combined G band (see G_FORCE_BANDS)."""
+    g_total = _as_float(g_total)
+    return {
+        label: int(np.count_nonzero((g_total >= low) & (g_total < high)))
+        for label, low, high in G_FORCE_BANDS
+    }
+
+
+def comfort_penalty(g_total) -> float:
+    """Summed discomfort of sustained G above 0.5 g (heavier above 1 g)."""
+    g_total = _as_float(g_total)
+    return float(
+        np.sum(np.maximum(g_total - 0.5, 0) * 0.1) + np.sum(np.maximum(g_total - 1.0, 0) * 0.2)
+    )
+
+
+def rolling_std(values, window: int) -> np.ndarray:
+    """
+    Trailing rolling standard deviation (ddof=1) from prefix sums.
+
+    Matches Series.rolling(window).std(): NaN until the window is full and
+    for windows containing NaN.
+    """
+    values = _as_float(values)
+    n = len(values)
+    result = np.full(n, np.nan)
+    if window < 2 or n < window:
+        return result
+
+    missing = np.isnan(values)
+    offset = np.nanmean(values) if not missing.all() else 0.0
+    centered = np.where(missing, 0.0, values - offset)
+    sums = np.concatenate(([0.0], np.cumsum(centered)))
+    squares = np.concatenate(([0.0], np.cumsum(centered * centered)))
+    gaps = np.concatenate(([0], np.cumsum(missing)))
+
+    window_sum = sums[window:] - sums[:-window]
+    variance = (squares[window:] - squares[:-window] - window_sum * window_sum / window) / (
+        window - 1
+    )
+    std = np.sqrt(np.maximum(variance, 0.0))
+    std[(gaps[window:] - gaps[:-window]) > 0] = np.nan
+    result[window - 1 :] = std
+    return result
+
+
+def derive_imu_columns(
+    df: pd.DataFrame,
+    event_threshold: float = EVENT_THRESHOLD_G,
+    variation_window: int = ATTITUDE_VARIATION_WINDOW,
+) -> Dict[str, np.ndarray]:
+    """
+    Derived IMU columns for a session frame (FuelTech field names).
+
+    Args:
+        df: Frame with g_force_accel, g_force_lateral, pitch_angle, roll_angle,
+            traction_speed and time (any subset)
+        event_threshold: Threshold (g) for the event masks
+        variation_window: Window (samples) of the attitude variation
+
+    Returns:
+        Dictionary of column name -> array, in the order they should be added
+    """
+    derived: Dict[str, np.ndarray] = {}
+    has_accel = "g_force_accel" in df.columns
+    has_lateral = "g_force_lateral" in df.columns
+
+    if has_accel and has_lateral:
+        resultant = combined_g(df["g_force_accel"], df["g_force_lateral"])
+        derived["g_force_resultant"] = resultant
+        time = df["time"] if "time" in df.columns else None
+        derived["g_force_jerk"] = jerk(resultant, time)
+        derived["friction_circle_usage"] = friction_circle_usage(resultant)
+
+    if has_lateral and "traction_speed" in df.columns:
+        # Simplified: angle from lateral force only
+        lateral = np.nan_to_num(_as_float(df["g_force_lateral"]), nan=0.0)
+        derived["slip_angle_estimate"] = np.degrees(np.arctan(lateral / 9.81 * 0.1))
+
+    derived.update(
+        detect_g_events(
+            df["g_force_accel"] if has_accel else None,
+            df["g_force_lateral"] if has_lateral else None,
+            event_threshold,
+        )
+    )
+
+    variations = []
+    for angle_col in ["pitch_angle", "roll_angle"]:
+        if angle_col in df.columns:
+            variation = rolling_std(df[angle_col], variation_window)
+            derived[f"{angle_col}_variation"] = variation
+            variations.append(np.nan_to_num(variation, nan=0.0))
+
+    if variations:
+        # Stability index: inverted and scaled mean variation
+        derived["stability_index"] = np.clip(100 - np.mean(variations, axis=0) * 10, 0, 100)
+
+    return derived
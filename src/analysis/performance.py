@@ -19,6 +19,7 @@ from scipy import signal
 
 from ..data.cache import cached_analysis as cache_result
 from ..utils.logging_config import get_logger
+from .events import find_runs
 
 logger = get_logger(__name__)
 
@@ -701,13 +702,22 @@ class PerformanceAnalyzer:
             knock_sensor_values = clean_data[knock_sensor_col].values
 
             # Simple knock detection based on amplitude
-            knock_events = []
-            for i, intensity in enumerate(knock_sensor_values):
-                if intensity > intensity_threshold:
-                    # Estimate frequency (simplified)
-                    frequency = frequency_threshold + (intensity - intensity_threshold) * 1000
-                    time = i * 0.1  # Assume 100ms intervals
-                    knock_events.append((time, intensity, frequency))
+            knock_mask = knock_sensor_values > intensity_threshold
+            knock_indices = np.flatnonzero(knock_mask)
+            sample_times = np.arange(len(knock_sensor_values)) * 0.1  # Assume 100ms intervals
+
+            knock_intensities = knock_sensor_values[knock_indices]
+            # Estimate frequency (simplified)
+            knock_frequencies = (
+                frequency_threshold + (knock_intensities - intensity_threshold) * 1000
+            )
+            knock_events = list(
+                zip(
+                    sample_times[knock_indices].tolist(),
+                    knock_intensities.tolist(),
+                    knock_frequencies.tolist(),
+                )
+            )
 
             # Create knock intensity profile
             knock_intensity_profile = pd.DataFrame(
@@ -720,21 +730,28 @@ class PerformanceAnalyzer:
             # Analyze knock-prone conditions
             knock_prone_conditions = {}
 
-            if len(knock_events) > 0:
-                knock_times = [event[0] for event in knock_events]
-                knock_indices = [
-                    int(t / 0.1) for t in knock_times if int(t / 0.1) < len(clean_data)
-                ]
-
-                if knock_indices:
-                    # Conditions during knock events
-                    if load_col in clean_data.columns:
-                        knock_loads = clean_data.iloc[knock_indices][load_col].values
-                        knock_prone_conditions["avg_load_during_knock"] = np.mean(knock_loads)
+            if len(knock_indices) > 0:
+                # Conditions during knock events
+                if load_col in clean_data.columns:
+                    knock_loads = clean_data[load_col].values[knock_indices]
+                    knock_prone_conditions["avg_load_during_knock"] = np.mean(knock_loads)
 
-                    if coolant_temp_col in clean_data.columns:
-                        knock_temps = clean_data.iloc[knock_indices][coolant_temp_col].values
-                        knock_prone_conditions["avg_temp_during_knock"] = np.mean(knock_temps)
+                if coolant_temp_col in clean_data.columns:
+                    knock_temps = clean_data[coolant_temp_col].values[knock_indices]
+                    knock_prone_conditions["avg_temp_during_knock"] = np.mean(knock_temps)
+
+                # Knock episodes (consecutive knocking samples)
+                episodes = find_runs(
+                    knock_mask,
+                    values=knock_sensor_values,
+                    time=sample_times,
+                    baseline=intensity_threshold,
+                )
+                knock_prone_conditions["knock_episodes"] = len(episodes)
+                knock_prone_conditions["longest_knock_episode"] = float(
+                    np.max(episodes.duration)
+                )
+                knock_prone_conditions["peak_knock_intensity"] = float(np.max(episodes.peak))
 
             # Correlation analysis
             ignition_timing_correlation = 0.0
@@ -0,0 +1,253 @@
+"""
+Analysis Result Cache for FuelTune.
+
+Persistent cache of analyzer results keyed by session content hash, time
+window, analyzer name, analyzer parameters and analyzer code version. Results
+are stored through FuelTechCacheManager (memory + disk) under the session ID,
+so deleting or reimporting a session invalidates them.
+
+Result dataclasses (AnomalyResults, CorrelationMatrix, ...) are stored in a
+typed form: each dataclass and enum is recorded by its qualified name and
+rebuilt on load, and only types defined in the analysis package are accepted.
+
+Author: A04-ANALYSIS-SCIPY Agent
+Created: 2026-10-16
+"""
+
+import hashlib
+import importlib
+import sys
+from dataclasses import fields, is_dataclass
+from enum import Enum
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import pandas as pd
+
+from ..data.cache import FuelTechCacheManager, get_cache_manager
+from ..utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Bump to invalidate every cached result (e.g. after changing the encoding)
+CACHE_FORMAT_VERSION = "1"
+
+# Markers of encoded dataclasses and enums
+_DATACLASS_KEY = "__result_dataclass__"
+_ENUM_KEY = "__result_enum__"
+
+# Only types from this package are rebuilt on load
+_ANALYSIS_PACKAGE = __name__.rsplit(".", 1)[0]
+
+
+def _type_path(cls: type) -> str:
+    """Qualified name of a type (module:qualname)."""
+    return f"{cls.__module__}:{cls.__qualname__}"
+
+
+def _resolve_type(path: str) -> type:
+    """Resolve a qualified type name, restricted to the analysis package."""
+    module_name, _, qualname = path.partition(":")
+    if not (module_name == _ANALYSIS_PACKAGE or module_name.startswith(_ANALYSIS_PACKAGE + ".")):
+        raise ValueError(f"Refusing to load type outside {_ANALYSIS_PACKAGE}: {path}")
+
+    obj: Any = importlib.import_module(module_name)
+    for part in qualname.split("."):
+        obj = getattr(obj, part)
+    return obj
+
+
+def encode_result(value: Any) -> Any:
+    """
+    Encode an analysis result for caching.
+
+    Dataclasses and enums become tagged dictionaries; containers are encoded
+    recursively. DataFrames, arrays and scalars are kept as they are.
+    """
+    if is_dataclass(value) and not isinstance(value, type):
+        return {
+            _DATACLASS_KEY: _type_path(type(value)),
+            "fields": {f.name: encode_result(getattr(value, f.name)) for f in fields(value)},
+        }
+    if isinstance(value, Enum):
+        return {_ENUM_KEY: _type_path(type(value)), "value": value.value}
+    if isinstance(value, dict):
+        return {key: encode_result(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return type(value)(encode_result(item) for item in value)
+    return value
+
+
+def decode_result(value: Any) -> Any:
+    """Rebuild an analysis result encoded by encode_result."""
+    if isinstance(value, dict):
+        if _DATACLASS_KEY in value:
+            cls = _resolve_type(value[_DATACLASS_KEY])
+            if not is_dataclass(cls):
+                raise ValueError(f"Not a dataclass: {value[_DATACLASS_KEY]}")
+            # Bypass __init__/__post_init__: fields are restored as they were saved
+            obj = cls.__new__(cls)
+            for name, item in value["fields"].items():
+                object.__setattr__(obj, name, decode_result(item))
+            return obj
+        if _ENUM_KEY in value:
+            cls = _resolve_type(value[_ENUM_KEY])
+            return cls(value["value"])
+        return {key: decode_result(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return type(value)(decode_result(item) for item in value)
+    return value
+
+
+def frame_content_hash(data: pd.DataFrame) -> str:
+    """Hash of a DataFrame's columns and values (row order matters, index does not)."""
+    digest = hashlib.md5()
+    digest.update("\x1f".join(map(str, data.columns)).encode("utf-8"))
+    digest.update(pd.util.hash_pandas_object(data, index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def _is_plain(value: Any) -> bool:
+    """Whether a value is a JSON-like configuration value."""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return True
+    if isinstance(value, (list, tuple)):
+        return all(_is_plain(item) for item in value)
+    if isinstance(value, dict):
+        return all(isinstance(k, str) and _is_plain(v) for k, v in value.items())
+    return False
+
+
+def analyzer_parameters(analyzer: Any) -> Dict[str, Any]:
+    """Public configuration attributes of an analyzer (fitted state is ignored)."""
+    return {
+        name: value
+        for name, value in sorted(vars(analyzer).items())
+        if not name.startswith("_") and _is_plain(value)
+    }
+
+
+@lru_cache(maxsize=None)
+def _module_digest(module_name: str) -> str:
+    """Short hash of a module's source file."""
+    path = getattr(sys.modules.get(module_name), "__file__", None)
+    if not path or not Path(path).exists():
+        return "unknown"
+    return hashlib.md5(Path(path).read_bytes()).hexdigest()[:12]
+
+
+def analyzer_code_version(analyzer: Any) -> str:
+    """Code version of an analyzer: cache format plus its module source hash."""
+    return f"{CACHE_FORMAT_VERSION}-{_module_digest(type(analyzer).__module__)}"
+
+
+class AnalysisResultCache:
+    """
+    Persistent cache of analyzer results.
+
+    Features:
+    - Key: session content hash, time window, analyzer name, analyzer
+      parameters and analyzer code version
+    - Stored in memory and on disk through FuelTechCacheManager
+    - Invalidated with the session (FuelTechCacheManager.invalidate_session)
+    - Typed serialization of result dataclasses
+    """
+
+    DEFAULT_TTL = 7 * 24 * 3600
+
+    def __init__(
+        self,
+        cache_manager: Optional[FuelTechCacheManager] = None,
+        ttl: int = DEFAULT_TTL,
+    ):
+        """
+        Initialize analysis result cache.
+
+        Args:
+            cache_manager: Cache manager to store results in (default: global one)
+            ttl: Time-to-live of cached results in seconds
+        """
+        self.cache_manager = cache_manager or get_cache_manager()
+        self.ttl = ttl
+
+    def _parameters(
+        self,
+        analyzer: Any,
+        content_hash: str,
+        time_window: Optional[Tuple[float, float]],
+    ) -> Dict[str, Any]:
+        """Key parameters for one analyzer run."""
+        return {
+            "content_hash": content_hash,
+            "time_window": list(time_window) if time_window is not None else None,
+            "analyzer": _type_path(type(analyzer)),
+            "parameters": analyzer_parameters(analyzer),
+            "code_version": analyzer_code_version(analyzer),
+        }
+
+    def get(
+        self,
+        session_id: str,
+        analysis_type: str,
+        analyzer: Any,
+        content_hash: str,
+        time_window: Optional[Tuple[float, float]] = None,
+    ) -> Optional[Any]:
+        """
+        Get a cached result.
+
+        Args:
+            session_id: Session ID
+            analysis_type: Analysis name (e.g. 'anomaly')
+            analyzer: Analyzer instance that would produce the result
+            content_hash: Hash of the analyzed data (see frame_content_hash)
+            time_window: Time window the data was filtered to, if any
+
+        Returns:
+            Decoded result or None on a miss
+        """
+        parameters = self._parameters(analyzer, content_hash, time_window)
+        cached = self.cache_manager.get_analysis_result(session_id, analysis_type, parameters)
+        if cached is None:
+            return None
+
+        try:
+            return decode_result(cached)
+        except Exception as e:
+            logger.warning(f"Discarding unreadable cached {analysis_type} result: {e}")
+            return None
+
+    def set(
+        self,
+        session_id: str,
+        analysis_type: str,
+        analyzer: Any,
+        content_hash: str,
+        result: Any,
+        time_window: Optional[Tuple[float, float]] = None,
+    ) -> None:
+        """
+        Cache a result (memory and disk).
+
+        Args:
+            session_id: Session ID
+            analysis_type: Analysis name (e.g. 'anomaly')
+            analyzer: Analyzer instance that produced the result
+            content_hash: Hash of the analyzed data (see frame_content_hash)
+            result: Analyzer result
+            time_window: Time window the data was filtered to, if any
+        """
+        parameters = self._parameters(analyzer, content_hash, time_window)
+        self.cache_manager.set_analysis_result(
+            session_id,
+            analysis_type,
+            encode_result(result),
+            parameters,
+            ttl=self.ttl,
+            persist=True,
+        )
+
+    def invalidate_session(self, session_id: str) -> None:
+        """Drop every cached result of a session."""
+        self.cache_manager.invalidate_session(session_id)
@@ -30,6 +30,8 @@ from typing import Any, Dict, List, Optional, Union
 import numpy as np
 import pandas as pd
 
+from .events import find_runs
+
 logger = logging.getLogger(__name__)
 
 
@@ -444,24 +446,17 @@ class SafetyValidator:
         safety_level: SafetyLevel = SafetyLevel.WARNING,
     ) -> None:
         """Process and create lambda violation objects."""
-        violation_indices = np.where(violation_mask)[0]
-
-        if len(violation_indices) == 0:
-            return
-
         # Group consecutive violations
-        consecutive_groups = self._find_consecutive_groups(violation_indices)
-
-        for group in consecutive_groups:
-            start_idx, end_idx = group[0], group[-1]
+        runs = find_runs(
+            violation_mask,
+            values=lambda_values,
+            peak="max" if violation_type == ViolationType.LEAN_CONDITION else "min",
+        )
 
+        for start_idx, end_idx, count, worst_value in zip(
+            runs.start, runs.end, runs.active_samples, runs.peak
+        ):
             # Calculate violation metrics
-            group_lambda = lambda_values[group]
-            worst_value = (
-                np.max(group_lambda)
-                if violation_type == ViolationType.LEAN_CONDITION
-                else np.min(group_lambda)
-            )
             deviation_pct = abs((worst_value - safe_limit) / safe_limit) * 100.0
 
             # Create violation object
@@ -474,7 +469,7 @@ class SafetyValidator:
                 deviation_percentage=float(deviation_pct),
                 timestamp=float(timestamps[start_idx]) if len(timestamps) > start_idx else None,
                 data_index=int(start_idx),
-                consecutive_count=len(group),
+                consecutive_count=int(count),
                 duration=(
                     float(timestamps[end_idx] - timestamps[start_idx])
                     if len(timestamps) > end_idx
@@ -602,18 +597,11 @@ class SafetyValidator:
     ) -> List[SafetyViolation]:
         """Create temperature violation objects."""
         violations = []
-        violation_indices = np.where(violation_mask)[0]
-
-        if len(violation_indices) == 0:
-            return violations
-
-        consecutive_groups = self._find_consecutive_groups(violation_indices)
-
-        for group in consecutive_groups:
-            start_idx, end_idx = group[0], group[-1]
-            group_temps = temp_values[group]
-            max_temp = np.max(group_temps)
+        runs = find_runs(violation_mask, values=temp_values, peak="max")
 
+        for start_idx, end_idx, count, max_temp in zip(
+            runs.start, runs.end, runs.active_samples, runs.peak
+        ):
             deviation_pct = ((max_temp - safe_limit) / safe_limit) * 100.0
 
             violation = SafetyViolation(
@@ -625,7 +613,7 @@ class SafetyValidator:
                 deviation_percentage=float(deviation_pct),
                 timestamp=float(timestamps[start_idx]) if len(timestamps) > start_idx else None,
                 data_index=int(start_idx),
-                consecutive_count=len(group),
+                consecutive_count=int(count),
                 duration=(
                     float(timestamps[end_idx] - timestamps[start_idx])
                     if len(timestamps) > end_idx
@@ -710,16 +698,12 @@ class SafetyValidator:
     ) -> List[SafetyViolation]:
         """Create timing violation objects."""
         violations = []
-        violation_indices = np.where(violation_mask)[0]
-
-        if len(violation_indices) == 0:
-            return violations
+        runs = find_runs(violation_mask, values=timing_values, peak="max")
+        boost_runs = runs.reduce(is_boost, np.logical_or)
 
-        consecutive_groups = self._find_consecutive_groups(violation_indices)
-
-        for group in consecutive_groups:
-            max_timing = np.max(timing_values[group])
-            is_boost_condition = np.any(is_boost[group])
+        for start_idx, count, max_timing, is_boost_condition in zip(
+            runs.start, runs.active_samples, runs.peak, boost_runs
+        ):
             safe_limit = (
                 self.config.max_timing_boost_warning
                 if is_boost_condition
@@ -733,8 +717,8 @@ class SafetyValidator:
                 current_value=float(max_timing),
                 safe_limit=safe_limit,
                 deviation_percentage=((max_timing - safe_limit) / safe_limit) * 100.0,
-                timestamp=float(timestamps[group[0]]) if len(timestamps) > group[0] else None,
-                consecutive_count=len(group),
+                timestamp=float(timestamps[start_idx]) if len(timestamps) > start_idx else None,
+                consecutive_count=int(count),
                 severity_score=min((max_timing - safe_limit) / 10.0, 1.0),
                 immediate_action="Reduce ignition advance immediately",
                 corrective_action="Review timing maps and reduce advance in affected areas",
@@ -799,12 +783,9 @@ class SafetyValidator:
     ) -> List[SafetyViolation]:
         """Create boost pressure violation objects."""
         violations = []
-        violation_indices = np.where(violation_mask)[0]
+        runs = find_runs(violation_mask, values=map_values, peak="max")
 
-        consecutive_groups = self._find_consecutive_groups(violation_indices)
-
-        for group in consecutive_groups:
-            max_boost = np.max(map_values[group])
+        for start_idx, count, max_boost in zip(runs.start, runs.active_samples, runs.peak):
 
             violation = SafetyViolation(
                 violation_type=ViolationType.OVERBOOST,
@@ -813,8 +794,8 @@ class SafetyValidator:
                 current_value=float(max_boost),
                 safe_limit=safe_limit,
                 deviation_percentage=((max_boost - safe_limit) / safe_limit) * 100.0,
-                timestamp=float(timestamps[group[0]]) if len(timestamps) > group[0] else None,
-                consecutive_count=len(group),
+                timestamp=float(timestamps[start_idx]) if len(timestamps) > start_idx else None,
+                consecutive_count=int(count),
                 immediate_action="Reduce boost pressure immediately",
                 corrective_action="Check wastegate operation and boost control system",
                 prevention_strategy="Regular boost control system maintenance",
@@ -878,12 +859,9 @@ class SafetyValidator:
     ) -> List[SafetyViolation]:
         """Create RPM violation objects."""
         violations = []
-        violation_indices = np.where(violation_mask)[0]
+        runs = find_runs(violation_mask, values=rpm_values, peak="max")
 
-        consecutive_groups = self._find_consecutive_groups(violation_indices)
-
-        for group in consecutive_groups:
-            max_rpm = np.max(rpm_values[group])
+        for start_idx, count, max_rpm in zip(runs.start, runs.active_samples, runs.peak):
 
             violation = SafetyViolation(
                 violation_type=ViolationType.RPM_OVERLIMIT,
@@ -892,8 +870,8 @@ class SafetyValidator:
                 current_value=float(max_rpm),
                 safe_limit=safe_limit,
                 deviation_percentage=((max_rpm - safe_limit) / safe_limit) * 100.0,
-                timestamp=float(timestamps[group[0]]) if len(timestamps) > group[0] else None,
-                consecutive_count=len(group),
+                timestamp=float(timestamps[start_idx]) if len(timestamps) > start_idx else None,
+                consecutive_count=int(count),
                 immediate_action="Reduce engine RPM immediately",
                 corrective_action="Check rev limiter operation",
                 prevention_strategy="Conservative rev limit settings",
@@ -957,12 +935,9 @@ class SafetyValidator:
     ) -> List[SafetyViolation]:
         """Create fuel pressure violation objects."""
         violations = []
-        violation_indices = np.where(violation_mask)[0]
-
-        consecutive_groups = self._find_consecutive_groups(violation_indices)
+        runs = find_runs(violation_mask, values=pressure_values, peak="min")
 
-        for group in consecutive_groups:
-            min_pressure = np.min(pressure_values[group])
+        for start_idx, count, min_pressure in zip(runs.start, runs.active_samples, runs.peak):
 
             violation = SafetyViolation(
                 violation_type=ViolationType.FUEL_PRESSURE_LOW,
@@ -971,8 +946,8 @@ class SafetyValidator:
                 current_value=float(min_pressure),
                 safe_limit=safe_limit,
                 deviation_percentage=((safe_limit - min_pressure) / safe_limit) * 100.0,
-                timestamp=float(timestamps[group[0]]) if len(timestamps) > group[0] else None,
-                consecutive_count=len(group),
+                timestamp=float(timestamps[start_idx]) if len(timestamps) > start_idx else None,
+                consecutive_count=int(count),
                 immediate_action="Check fuel system immediately",
                 corrective_action="Inspect fuel pump, filter, and pressure regulator",
                 prevention_strategy="Regular fuel system maintenance and monitoring",
@@ -1011,24 +986,6 @@ class SafetyValidator:
 
         return self.config.target_lambda_cruise  # Default
 
-    def _find_consecutive_groups(self, indices: np.ndarray) -> List[List[int]]:
-        """Find consecutive groups in an array of indices."""
-        if len(indices) == 0:
-            return []
-
-        groups = []
-        current_group = [indices[0]]
-
-        for i in range(1, len(indices)):
-            if indices[i] == indices[i - 1] + 1:
-                current_group.append(indices[i])
-            else:
-                groups.append(current_group)
-                current_group = [indices[i]]
-
-        groups.append(current_group)
-        return groups
-
     def _calculate_safety_metrics(
         self, result: SafetyResult, arrays: Dict[str, np.ndarray]
     ) -> None:
@@ -28,6 +28,8 @@ from typing import Any, Dict, List, Optional, Tuple, Union
 import numpy as np
 import pandas as pd
 
+from .events import find_runs
+
 logger = logging.getLogger(__name__)
 
 
@@ -391,19 +393,11 @@ class EngineStateSegmenter:
                 processed[state] = mask
                 continue
 
-            # Find continuous segments
-            segments = self._find_continuous_segments(mask)
-
-            # Filter by minimum duration
-            valid_mask = np.zeros_like(mask, dtype=bool)
-
-            for start_idx, end_idx in segments:
-                segment_duration = timestamps[end_idx - 1] - timestamps[start_idx]
-
-                if segment_duration >= self.config.minimum_segment_duration:
-                    valid_mask[start_idx:end_idx] = True
-
-            processed[state] = valid_mask
+            # Keep continuous segments that last the minimum duration
+            runs = find_runs(
+                mask, time=timestamps, min_duration=self.config.minimum_segment_duration
+            )
+            processed[state] = runs.to_mask(len(mask))
 
         return processed
 
@@ -417,15 +411,8 @@ class EngineStateSegmenter:
         Returns:
             List of (start_index, end_index) tuples
         """
-        if not np.any(mask):
-            return []
-
-        # Find transitions
-        diff = np.diff(np.concatenate(([False], mask, [False])).astype(int))
-        starts = np.where(diff == 1)[0]
-        ends = np.where(diff == -1)[0]
-
-        return list(zip(starts, ends))
+        runs = find_runs(mask)
+        return list(zip(runs.start, runs.end + 1))
 
     def _calculate_segment_statistics(
         self, segments: Dict[EngineState, np.ndarray], arrays: Dict[str, np.ndarray]
@@ -29,7 +29,7 @@ from typing import Any, Dict, List, Optional, Tuple, Union
 import numpy as np
 import pandas as pd
 
-from .binning import BinCell, BinningResult
+from .binning import BinCell, BinningAccumulator, BinningResult
 from .confidence import ConfidenceScorer
 from .segmentation import EngineState, SegmentationResult
 
@@ -165,7 +165,7 @@ class SuggestionEngine:
         self,
         data: Union[pd.DataFrame, Dict[str, np.ndarray]],
         segmentation_result: Optional[SegmentationResult] = None,
-        binning_result: Optional[BinningResult] = None,
+        binning_result: Optional[Union[BinningResult, BinningAccumulator]] = None,
         additional_context: Optional[Dict[str, Any]] = None,
     ) -> SuggestionsResult:
         """
@@ -174,7 +174,7 @@ class SuggestionEngine:
         Args:
             data: Raw engine data
             segmentation_result: Engine state segmentation results
-            binning_result: Adaptive binning results
+            binning_result: Adaptive binning results or an incremental accumulator
             additional_context: Additional context information
 
         Returns:
@@ -194,6 +194,10 @@ class SuggestionEngine:
             # Validate data sufficiency
             self._validate_analysis_data(analysis_data)
 
+            # Incremental accumulators are consumed through their (cached) summary
+            if isinstance(binning_result, BinningAccumulator):
+                binning_result = binning_result.to_result()
+
             # Generate suggestions by category
             fuel_suggestions = self._generate_fuel_suggestions(
                 analysis_data, segmentation_result, binning_result
@@ -882,7 +886,7 @@ def generate_tuning_suggestions(
     data: Union[pd.DataFrame, Dict[str, np.ndarray]],
     config: Optional[SuggestionConfig] = None,
     segmentation_result: Optional[SegmentationResult] = None,
-    binning_result: Optional[BinningResult] = None,
+    binning_result: Optional[Union[BinningResult, BinningAccumulator]] = None,
     **kwargs,
 ) -> SuggestionsResult:
     """
@@ -892,7 +896,7 @@ def generate_tuning_suggestions(
         data: Engine log data
         config: Suggestion configuration
         segmentation_result: Optional segmentation results
-        binning_result: Optional binning results
+        binning_result: Optional binning results or incremental accumulator
         **kwargs: Additional context
 
     Returns:
@@ -16,6 +16,7 @@ import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 from scipy import signal
+from scipy.fft import irfft, next_fast_len, rfft
 from scipy.signal import find_peaks, welch
 from scipy.stats import linregress
 
@@ -24,6 +25,130 @@ from ..utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Above this many lags autocorrelation sums are computed by FFT
+DIRECT_AUTOCORR_MAX_LAG = 128
+
+CHANGE_POINT_METHODS = ("variance", "mean", "binseg")
+
+
+def _autocorrelation_sums(data: np.ndarray, max_lag: int) -> np.ndarray:
+    """
+    Lagged products sum(x[t] * x[t + k]) for k = 0..max_lag.
+
+    Same values as the non-negative half of np.correlate(x, x, "full"),
+    but O(N * max_lag) (or O(N log N) by FFT) instead of O(N^2).
+    """
+    n = len(data)
+    max_lag = min(max_lag, n - 1)
+    if max_lag <= DIRECT_AUTOCORR_MAX_LAG:
+        return np.array([np.dot(data[: n - k], data[k:]) for k in range(max_lag + 1)])
+
+    size = next_fast_len(2 * n - 1, real=True)
+    spectrum = rfft(data, size)
+    return irfft(spectrum * np.conj(spectrum), size)[: max_lag + 1]
+
+
+def _prefix_sums(data: np.ndarray) -> Tuple[np.ndarray, np.ndarray, float]:
+    """
+    Cumulative sums of x and x**2 (with a leading 0) for O(1) window statistics.
+
+    The data is centered first so window variances do not suffer from
+    cancellation on signals with a large offset (e.g. RPM).
+
+    Returns:
+        Tuple of (sum prefix, square prefix, offset removed)
+    """
+    offset = float(np.mean(data)) if len(data) else 0.0
+    centered = np.asarray(data, dtype=np.float64) - offset
+    sums = np.concatenate(([0.0], np.cumsum(centered)))
+    squares = np.concatenate(([0.0], np.cumsum(centered * centered)))
+    return sums, squares, offset
+
+
+def _window_moments(
+    sums: np.ndarray, squares: np.ndarray, starts: np.ndarray, stops: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Mean (of the centered data) and population variance of windows [start, stop)."""
+    lengths = stops - starts
+    means = (sums[stops] - sums[starts]) / lengths
+    variances = (squares[stops] - squares[starts]) / lengths - means * means
+    return means, np.maximum(variances, 0.0)
+
+
+def _centered_moving_average(data: np.ndarray, half_window: int) -> np.ndarray:
+    """Mean of data[i - half_window : i + half_window + 1]; NaN where incomplete."""
+    n = len(data)
+    average = np.full(n, np.nan)
+    if n <= 2 * half_window:
+        return average
+    sums, _, offset = _prefix_sums(data)
+    window = 2 * half_window + 1
+    average[half_window : n - half_window] = (sums[window:] - sums[:-window]) / window + offset
+    return average
+
+
+def _segment_gain(sums: np.ndarray, squares: np.ndarray, start: int, stop: int, min_size: int):
+    """
+    Best split of [start, stop) under the L2 (mean shift) cost.
+
+    Returns:
+        Tuple of (split index, cost reduction, left mean, right mean), or None
+        if no split leaves both sides with at least min_size points
+    """
+    splits = np.arange(start + min_size, stop - min_size + 1)
+    if len(splits) == 0:
+        return None
+
+    def cost(a, b):
+        length = b - a
+        total = sums[b] - sums[a]
+        return squares[b] - squares[a] - total * total / length
+
+    gains = cost(start, stop) - cost(start, splits) - cost(splits, stop)
+    best = int(np.argmax(gains))
+    split = int(splits[best])
+    left_mean = (sums[split] - sums[start]) / (split - start)
+    right_mean = (sums[stop] - sums[split]) / (stop - split)
+    return split, float(gains[best]), left_mean, right_mean
+
+
+def _binary_segmentation(
+    data: np.ndarray, min_size: int, penalty: Optional[float] = None
+) -> Tuple[List[int], List[float]]:
+    """
+    Offline mean-shift change points by binary segmentation on cumulative costs.
+
+    A segment is split at the point that most reduces the within-segment sum
+    of squares, as long as the reduction exceeds the penalty (BIC-like
+    2 * sigma**2 * log(n) by default, sigma from the first differences).
+    Every split evaluation is vectorized over the cumulative sums, so the
+    total cost is O(N log K) for K change points.
+
+    Returns:
+        Tuple of (sorted change points, standardized mean shift at each point)
+    """
+    n = len(data)
+    sigma = np.median(np.abs(np.diff(data))) / (0.6745 * np.sqrt(2))
+    if not sigma > 0:
+        sigma = np.std(data) or 1.0
+    if penalty is None:
+        penalty = 2 * sigma**2 * np.log(n)
+
+    sums, squares, _ = _prefix_sums(data)
+    found = {}
+    pending = [(0, n)]
+    while pending:
+        start, stop = pending.pop()
+        best = _segment_gain(sums, squares, start, stop, min_size)
+        if best is None or best[1] <= penalty:
+            continue
+        split, _, left_mean, right_mean = best
+        found[split] = abs(left_mean - right_mean) / sigma
+        pending += [(start, split), (split, stop)]
+
+    points = sorted(found)
+    return points, [float(found[p]) for p in points]
+
 
 @dataclass
 class TrendAnalysisResults:
@@ -207,8 +332,7 @@ class TimeSeriesAnalyzer:
             detrended_data = y - trend_line
 
             # Check for seasonal component using autocorrelation
-            autocorr = np.correlate(detrended_data, detrended_data, mode="full")
-            autocorr = autocorr[autocorr.size // 2 :]
+            autocorr = _autocorrelation_sums(detrended_data, 99)
             autocorr = autocorr / autocorr[0]  # Normalize
 
             # Look for significant autocorrelation beyond lag 1
@@ -319,9 +443,7 @@ class TimeSeriesAnalyzer:
                 max_lags = min(len(clean_data) // 4, 100)
 
             # Compute autocorrelation
-            autocorr_full = np.correlate(clean_data, clean_data, mode="full")
-            mid = len(autocorr_full) // 2
-            autocorr_values = autocorr_full[mid : mid + max_lags + 1]
+            autocorr_values = _autocorrelation_sums(clean_data, max_lags)
             autocorr_values = autocorr_values / autocorr_values[0]  # Normalize
 
             lags = np.arange(len(autocorr_values))
@@ -329,11 +451,9 @@ class TimeSeriesAnalyzer:
             # Find significant lags (beyond 95% confidence interval)
             n = len(clean_data)
             confidence_interval = 1.96 / np.sqrt(n)
-            significant_lags = []
-
-            for i in range(1, len(autocorr_values)):
-                if abs(autocorr_values[i]) > confidence_interval:
-                    significant_lags.append(i)
+            significant_lags = (
+                np.flatnonzero(np.abs(autocorr_values[1:]) > confidence_interval) + 1
+            ).tolist()
 
             # Find maximum autocorrelation (excluding lag 0)
             if len(autocorr_values) > 1:
@@ -460,19 +580,30 @@ class TimeSeriesAnalyzer:
         data: Union[pd.Series, np.ndarray],
         method: str = "variance",
         min_segment_length: int = 10,
+        penalty: Optional[float] = None,
     ) -> ChangePointResults:
         """
         Detect change points in time series data.
 
+        The 'variance' and 'mean' methods compare the two half-windows around
+        every index; window statistics come from cumulative sums, so the scan
+        is O(N) regardless of the window size. 'binseg' is an offline
+        mean-shift segmentation (binary segmentation on cumulative costs).
+
         Args:
             data: Time series data
-            method: Change point detection method ('variance', 'mean')
+            method: Change point detection method ('variance', 'mean', 'binseg')
             min_segment_length: Minimum length of segments
+            penalty: Cost reduction required for a 'binseg' split
+                (default: 2 * sigma**2 * log(n))
 
         Returns:
             ChangePointResults object
         """
         try:
+            if method not in CHANGE_POINT_METHODS:
+                raise ValueError(f"Unknown change point method: {method}")
+
             # Prepare data
             if isinstance(data, pd.Series):
                 clean_data = data.dropna().values
@@ -482,82 +613,37 @@ class TimeSeriesAnalyzer:
             if len(clean_data) < 20:
                 raise ValueError("Insufficient data for change point detection")
 
-            change_points = []
-            change_point_scores = []
-
-            # Simple variance-based change point detection
-            window_size = max(min_segment_length, len(clean_data) // 20)
-
-            for i in range(window_size, len(clean_data) - window_size):
-                left_segment = clean_data[i - window_size : i]
-                right_segment = clean_data[i : i + window_size]
-
-                if method == "variance":
-                    left_var = np.var(left_segment)
-                    right_var = np.var(right_segment)
-                    score = abs(left_var - right_var) / (left_var + right_var + 1e-8)
-                elif method == "mean":
-                    left_mean = np.mean(left_segment)
-                    right_mean = np.mean(right_segment)
-                    pooled_std = np.sqrt((np.var(left_segment) + np.var(right_segment)) / 2)
-                    score = abs(left_mean - right_mean) / (pooled_std + 1e-8)
-                else:
-                    raise ValueError(f"Unknown change point method: {method}")
-
-                if score > 1.0:  # Threshold for significant change
-                    change_points.append(i)
-                    change_point_scores.append(score)
-
-            # Remove nearby change points (keep only the one with highest score)
-            if change_points:
-                filtered_points = []
-                filtered_scores = []
-
-                i = 0
-                while i < len(change_points):
-                    # Find all points within min_segment_length
-                    group_points = [change_points[i]]
-                    group_scores = [change_point_scores[i]]
-
-                    j = i + 1
-                    while (
-                        j < len(change_points)
-                        and change_points[j] - change_points[i] < min_segment_length
-                    ):
-                        group_points.append(change_points[j])
-                        group_scores.append(change_point_scores[j])
-                        j += 1
-
-                    # Keep point with highest score
-                    best_idx = np.argmax(group_scores)
-                    filtered_points.append(group_points[best_idx])
-                    filtered_scores.append(group_scores[best_idx])
-
-                    i = j
-
-                change_points = filtered_points
-                change_point_scores = filtered_scores
+            if method == "binseg":
+                change_points, change_point_scores = _binary_segmentation(
+                    clean_data, min_segment_length, penalty
+                )
+            else:
+                change_points, change_point_scores = self._window_change_points(
+                    clean_data, method, min_segment_length
+                )
 
             # Create segments
-            segments = []
             segment_starts = [0] + change_points
             segment_ends = change_points + [len(clean_data)]
-
-            for start, end in zip(segment_starts, segment_ends):
-                segments.append((start, end))
-
-            # Compute segment statistics
-            segment_statistics = []
-            for start, end in segments:
-                segment_data = clean_data[start:end]
-                stats = {
-                    "mean": float(np.mean(segment_data)),
-                    "std": float(np.std(segment_data)),
+            segments = list(zip(segment_starts, segment_ends))
+
+            # Compute segment statistics in one pass over the data
+            starts = np.array(segment_starts)
+            lengths = np.array(segment_ends) - starts
+            means = np.add.reduceat(clean_data, starts) / lengths
+            deviations = clean_data - np.repeat(means, lengths)
+            stds = np.sqrt(np.add.reduceat(deviations * deviations, starts) / lengths)
+
+            segment_statistics = [
+                {
+                    "mean": float(means[k]),
+                    "std": float(stds[k]),
                     "length": int(end - start),
                     "start_idx": int(start),
                     "end_idx": int(end),
                 }
-                segment_statistics.append(stats)
+                for k, (start, end) in enumerate(segments)
+            ]
 
             return ChangePointResults(
                 change_points=change_points,
@@ -570,6 +656,44 @@ class TimeSeriesAnalyzer:
             self.logger.error(f"Error in change point detection: {e}")
             raise
 
+    def _window_change_points(
+        self, data: np.ndarray, method: str, min_segment_length: int
+    ) -> Tuple[List[int], List[float]]:
+        """Sliding half-window change point scan ('variance' or 'mean')."""
+        window_size = max(min_segment_length, len(data) // 20)
+        positions = np.arange(window_size, len(data) - window_size)
+        if len(positions) == 0:
+            return [], []
+
+        sums, squares, _ = _prefix_sums(data)
+        left_mean, left_var = _window_moments(sums, squares, positions - window_size, positions)
+        right_mean, right_var = _window_moments(sums, squares, positions, positions + window_size)
+
+        if method == "variance":
+            scores = np.abs(left_var - right_var) / (left_var + right_var + 1e-8)
+        else:
+            pooled_std = np.sqrt((left_var + right_var) / 2)
+            scores = np.abs(left_mean - right_mean) / (pooled_std + 1e-8)
+
+        # Threshold for significant change
+        significant = scores > 1.0
+        points = positions[significant]
+        scores = scores[significant]
+
+        # Remove nearby change points: each group spans min_segment_length from
+        # its first point and keeps only the point with the highest score
+        change_points = []
+        change_point_scores = []
+        i = 0
+        while i < len(points):
+            j = int(np.searchsorted(points, points[i] + min_segment_length))
+            best = i + int(np.argmax(scores[i:j]))
+            change_points.append(int(points[best]))
+            change_point_scores.append(float(scores[best]))
+            i = j
+
+        return change_points, change_point_scores
+
     def create_time_series_plots(
         self,
         data: Union[pd.Series, np.ndarray],
@@ -793,13 +917,11 @@ class TimeSeriesAnalyzer:
             if len(data) < 20:
                 return None
 
-            # Compute autocorrelation
-            autocorr = np.correlate(data, data, mode="full")
-            autocorr = autocorr[len(autocorr) // 2 :]
-            autocorr = autocorr / autocorr[0]
-
             # Look for peaks in autocorrelation
             max_lag = min(len(data) // 4, 100)
+            autocorr = _autocorrelation_sums(data, max_lag - 1)
+            autocorr = autocorr / autocorr[0]
+
             peaks, _ = find_peaks(autocorr[1:max_lag], height=0.3)
 
             if len(peaks) > 0:
@@ -823,25 +945,16 @@ class TimeSeriesAnalyzer:
                 period = 3
 
             # Use centered moving average
-            trend = np.full_like(data, np.nan)
             half_period = period // 2
+            trend = _centered_moving_average(data, half_period)
 
-            for i in range(half_period, len(data) - half_period):
-                trend[i] = np.mean(data[i - half_period : i + half_period + 1])
-
-            # Fill edges with linear extrapolation
+            # Fill edges from the nearest valid values
             valid_indices = ~np.isnan(trend)
             if np.any(valid_indices):
                 valid_trend = trend[valid_indices]
                 valid_x = np.where(valid_indices)[0]
-
-                # Fill beginning
-                for i in range(half_period):
-                    trend[i] = np.interp(i, valid_x, valid_trend)
-
-                # Fill end
-                for i in range(len(data) - half_period, len(data)):
-                    trend[i] = np.interp(i, valid_x, valid_trend)
+                edges = np.r_[0:half_period, len(data) - half_period : len(data)]
+                trend[edges] = np.interp(edges, valid_x, valid_trend)
 
             return trend
 
@@ -854,14 +967,12 @@ class TimeSeriesAnalyzer:
         else:  # multiplicative
             detrended = data / (trend + 1e-8)
 
-        seasonal = np.zeros_like(data)
-
-        # Average over each seasonal position
-        for i in range(period):
-            indices = np.arange(i, len(data), period)
-            if len(indices) > 1:
-                seasonal_value = np.mean(detrended[indices])
-                seasonal[indices] = seasonal_value
+        # Average over each seasonal position (positions seen once stay 0)
+        positions = np.arange(len(data)) % period
+        counts = np.bincount(positions, minlength=period)
+        totals = np.bincount(positions, weights=detrended, minlength=period)
+        means = np.divide(totals, counts, out=np.zeros(period), where=counts > 1)
+        seasonal = means[positions]
 
         # Center the seasonal component
         if model == "additive":
@@ -875,13 +986,13 @@ class TimeSeriesAnalyzer:
             from scipy.stats import chi2
 
             n = len(data)
-            autocorr_full = np.correlate(data, data, mode="full")
-            mid = len(autocorr_full) // 2
-            autocorr = autocorr_full[mid + 1 : mid + lags + 1]
-            autocorr = autocorr / autocorr_full[mid]
+            sums = _autocorrelation_sums(data, lags)
+            autocorr = sums[1:] / sums[0]
+            if len(autocorr) < lags:
+                raise ValueError("Not enough data for the requested lags")
 
             # Ljung-Box statistic
-            lb_stat = n * (n + 2) * np.sum([autocorr[i] ** 2 / (n - i - 1) for i in range(lags)])
+            lb_stat = n * (n + 2) * np.sum(autocorr**2 / (n - np.arange(1, lags + 1)))
 
             # p-value from chi-square distribution
             p_value = 1 - chi2.cdf(lb_stat, lags)
@@ -0,0 +1,245 @@
+"""
+Armazenamento binário compacto para mapas de combustível.
+Todos os mapas de um veículo ficam em um único arquivo .npz, com cache LRU
+em memória invalidado pelo mtime do arquivo.
+"""
+
+import json
+import logging
+import os
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Campos numéricos gravados como arrays; o restante vai para o índice JSON
+ARRAY_FIELDS = ("rpm_axis", "map_axis", "values_matrix", "axis_values", "values")
+
+INDEX_KEY = "__index__"
+
+MapKey = Tuple[str, str, str]
+
+
+class BinaryMapStore:
+    """Armazena mapas 2D/3D em um arquivo .npz por veículo.
+
+    O arquivo contém um array por campo numérico de cada mapa e um índice
+    JSON com os demais campos (eixos habilitados, metadados, timestamp).
+    Abrir um veículo lê o arquivo uma única vez; leituras seguintes saem do
+    cache enquanto o mtime/tamanho do arquivo não mudar.
+    """
+
+    def __init__(self, data_dir: str = "data/fuel_maps", cache_size: int = 256):
+        self.data_dir = Path(data_dir)
+        self.cache_size = cache_size
+        # (vehicle_id, map_type, bank_id) -> registro com arrays
+        self._cache: "OrderedDict[MapKey, Dict[str, Any]]" = OrderedDict()
+        # vehicle_id -> (assinatura do arquivo, chaves presentes)
+        self._signatures: Dict[str, Tuple[Tuple[int, int], frozenset]] = {}
+
+    def _get_filename(self, vehicle_id: str) -> Path:
+        """Gera nome do arquivo do veículo."""
+        return self.data_dir / f"maps_{vehicle_id}.npz"
+
+    @staticmethod
+    def _member_name(map_type: str, bank_id: str, field: str) -> str:
+        """Nome do array dentro do .npz."""
+        return f"{map_type}/{bank_id}/{field}"
+
+    @staticmethod
+    def _signature(path: Path) -> Optional[Tuple[int, int]]:
+        """Assinatura (mtime_ns, tamanho) do arquivo, ou None se não existir."""
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def _read_file(self, path: Path) -> Dict[Tuple[str, str], Dict[str, Any]]:
+        """Lê todos os mapas de um arquivo .npz."""
+        records: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        with np.load(path, allow_pickle=False) as npz:
+            index = json.loads(npz[INDEX_KEY].tobytes().decode("utf-8"))
+            for entry in index:
+                record = dict(entry["fields"])
+                for field in entry["arrays"]:
+                    name = self._member_name(entry["map_type"], entry["bank_id"], field)
+                    record[field] = npz[name]
+                records[(entry["map_type"], entry["bank_id"])] = record
+        return records
+
+    def _write_file(self, path: Path, records: Dict[Tuple[str, str], Dict[str, Any]]) -> None:
+        """Grava todos os mapas do veículo de forma atômica."""
+        arrays: Dict[str, np.ndarray] = {}
+        index = []
+        for (map_type, bank_id), record in records.items():
+            fields = {}
+            array_fields = []
+            for field, value in record.items():
+                array = self._as_numeric_array(value) if field in ARRAY_FIELDS else None
+                if array is None:
+                    fields[field] = value
+                else:
+                    arrays[self._member_name(map_type, bank_id, field)] = array
+                    array_fields.append(field)
+            index.append(
+                {
+                    "map_type": map_type,
+                    "bank_id": bank_id,
+                    "arrays": array_fields,
+                    "fields": fields,
+                }
+            )
+
+        arrays[INDEX_KEY] = np.frombuffer(
+            json.dumps(index, ensure_ascii=False).encode("utf-8"), dtype=np.uint8
+        )
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez(f, **arrays)
+            os.replace(tmp_name, path)
+        except Exception:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    @staticmethod
+    def _as_numeric_array(value: Any) -> Optional[np.ndarray]:
+        """Converte listas numéricas em array; retorna None para o resto."""
+        if value is None:
+            return None
+        try:
+            array = np.asarray(value)
+        except ValueError:
+            return None
+        # float64 preserva exatamente os valores que o JSON preservaria
+        if array.dtype.kind in "iu":
+            return array.astype(np.int64, copy=False)
+        if array.dtype.kind == "f":
+            return array.astype(np.float64, copy=False)
+        return None
+
+    @staticmethod
+    def _materialize(record: Dict[str, Any]) -> Dict[str, Any]:
+        """Copia o registro com arrays convertidos em listas (formato do JSON)."""
+        data = {}
+        for field, value in record.items():
+            if isinstance(value, np.ndarray):
+                data[field] = value.tolist()
+            else:
+                data[field] = json.loads(json.dumps(value))
+        return data
+
+    def _forget_vehicle(self, vehicle_id: str) -> None:
+        """Remove do cache todas as entradas de um veículo."""
+        self._signatures.pop(vehicle_id, None)
+        for key in [k for k in self._cache if k[0] == vehicle_id]:
+            del self._cache[key]
+
+    def _remember(self, vehicle_id: str, signature, records) -> None:
+        """Registra os mapas de um veículo no cache LRU."""
+        self._forget_vehicle(vehicle_id)
+        self._signatures[vehicle_id] = (signature, frozenset(records))
+        for (map_type, bank_id), record in records.items():
+            self._cache[(vehicle_id, map_type, bank_id)] = record
+        self._trim_cache()
+
+    def _trim_cache(self) -> None:
+        """Descarta as entradas menos usadas além do limite."""
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def _reload_vehicle(self, vehicle_id: str) -> Dict[Tuple[str, str], Dict[str, Any]]:
+        """Lê o arquivo do veículo e repopula o cache."""
+        path = self._get_filename(vehicle_id)
+        signature = self._signature(path)
+        if signature is None:
+            self._forget_vehicle(vehicle_id)
+            return {}
+        records = self._read_file(path)
+        self._remember(vehicle_id, signature, records)
+        return records
+
+    def _vehicle_keys(self, vehicle_id: str) -> frozenset:
+        """Valida o cache do veículo pelo mtime e retorna as chaves presentes."""
+        signature = self._signature(self._get_filename(vehicle_id))
+        if signature is None:
+            self._forget_vehicle(vehicle_id)
+            return frozenset()
+
+        cached = self._signatures.get(vehicle_id)
+        if cached is None or cached[0] != signature:
+            return frozenset(self._reload_vehicle(vehicle_id))
+        return cached[1]
+
+    def exists(self, vehicle_id: str, map_type: str, bank_id: str) -> bool:
+        """Verifica se o mapa existe (usa o índice em cache)."""
+        return (map_type, bank_id) in self._vehicle_keys(vehicle_id)
+
+    def load(self, vehicle_id: str, map_type: str, bank_id: str) -> Optional[Dict[str, Any]]:
+        """Carrega um mapa; retorna um dicionário novo no mesmo formato do JSON."""
+        if (map_type, bank_id) not in self._vehicle_keys(vehicle_id):
+            return None
+
+        key = (vehicle_id, map_type, bank_id)
+        record = self._cache.get(key)
+        if record is None:
+            # Entrada despejada pelo LRU: relê o arquivo do veículo
+            record = self._reload_vehicle(vehicle_id).get((map_type, bank_id))
+            if record is None:
+                return None
+            self._cache[key] = record
+            self._trim_cache()
+        self._cache.move_to_end(key)
+        return self._materialize(record)
+
+    def save(self, data: Dict[str, Any]) -> None:
+        """Salva (ou substitui) um mapa no arquivo do veículo."""
+        self.save_many(data["vehicle_id"], [data])
+
+    def save_many(self, vehicle_id: str, maps: Iterable[Dict[str, Any]]) -> None:
+        """Salva vários mapas do mesmo veículo com uma única escrita."""
+        path = self._get_filename(vehicle_id)
+        records = self._read_file(path) if path.exists() else {}
+        for data in maps:
+            records[(data["map_type"], data["bank_id"])] = dict(data)
+        self._write_file(path, records)
+        # Relê para o cache guardar exatamente o que foi gravado
+        self._reload_vehicle(vehicle_id)
+
+    def delete(self, vehicle_id: str, map_type: str, bank_id: str) -> bool:
+        """Remove um mapa do arquivo do veículo."""
+        path = self._get_filename(vehicle_id)
+        if (map_type, bank_id) not in self._vehicle_keys(vehicle_id):
+            return False
+
+        records = self._read_file(path)
+        del records[(map_type, bank_id)]
+        if records:
+            self._write_file(path, records)
+        else:
+            path.unlink()
+        self._forget_vehicle(vehicle_id)
+        return True
+
+    def list_maps(self, vehicle_id: str) -> List[Tuple[str, str]]:
+        """Lista (map_type, bank_id) dos mapas salvos para o veículo."""
+        return sorted(self._vehicle_keys(vehicle_id))
+
+    def list_files(self, vehicle_id: Optional[str] = None) -> List[Path]:
+        """Lista os arquivos .npz de veículos."""
+        if vehicle_id:
+            path = self._get_filename(vehicle_id)
+            return [path] if path.exists() else []
+        return list(self.data_dir.glob("maps_*.npz"))
+
+    def clear_cache(self) -> None:
+        """Esvazia o cache em memória."""
+        self._cache.clear()
+        self._signatures.clear()
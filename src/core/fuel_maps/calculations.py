@@ -127,6 +127,42 @@ def _interp1d(x: float, xs: Sequence[float], ys: Sequence[float]) -> float:
     return float(ys[-1])
 
 
+def _interp1d_array(x: Sequence[float], xs: Sequence[float], ys: Sequence[float]) -> np.ndarray:
+    """Versão vetorizada de `_interp1d` para um eixo inteiro.
+
+    Usa a mesma aritmética do laço escalar (segmento mais à esquerda que contém x,
+    y0 + t * (y1 - y0)), portanto o resultado é idêntico bit a bit.
+    """
+    x = np.asarray(x, dtype=float)
+    if len(xs) == 0 or len(ys) == 0 or len(xs) != len(ys):
+        return np.full(x.shape, np.nan)
+
+    xp = np.asarray(xs, dtype=float)
+    fp = np.asarray(ys, dtype=float)
+    if len(xp) > 1 and np.any(np.diff(xp) < 0):
+        # Eixo fora de ordem: manter o critério do laço escalar
+        return np.array([_interp1d(float(v), xs, ys) for v in x.ravel()]).reshape(x.shape)
+
+    result = np.full(x.shape, fp[-1])
+    if len(xp) > 1:
+        # Primeiro segmento [x0, x1] com x0 < x <= x1
+        seg = np.clip(np.searchsorted(xp, x, side="left") - 1, 0, len(xp) - 2)
+        x0, x1 = xp[seg], xp[seg + 1]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            t = (x - x0) / (x1 - x0)
+            inner = fp[seg] + t * (fp[seg + 1] - fp[seg])
+        result = np.where(np.isnan(x), fp[-1], inner)
+
+    result = np.where(x >= xp[-1], fp[-1], result)
+    return np.where(x <= xp[0], fp[0], result)
+
+
+def _clamp(values: np.ndarray, low: float, high: float) -> np.ndarray:
+    """Equivalente vetorizado de `max(low, min(high, v))` (mesma semântica, inclusive NaN)."""
+    values = np.where(values < high, values, high)
+    return np.where(values > low, values, low)
+
+
 def generate_ve_3d_matrix(
     rpm_axis: Sequence[float],
     map_axis: Sequence[float],
@@ -158,17 +194,10 @@ def generate_ve_3d_matrix(
         return np.zeros((0, 0), dtype=float)
     # IMPORTANTE: O restante da aplicação usa convenção [map_idx][rpm_idx]
     # Portanto, geramos a matriz com linhas = MAP e colunas = RPM.
-    matrix: List[List[float]] = []
-    for m in map_axis:
-        row: List[float] = []
-        gain = _interp1d(float(m), map_points, gain_points)
-        for r in rpm_axis:
-            ve_base = _interp1d(float(r), rpm_points, ve_points)
-            ve = ve_base * gain
-            ve = max(ve_min, min(ve_max, ve))
-            row.append(ve)
-        matrix.append(row)
-    return np.array(matrix, dtype=float)
+    gain = _interp1d_array(map_axis, map_points, gain_points)
+    ve_base = _interp1d_array(rpm_axis, rpm_points, ve_points)
+    ve = ve_base[np.newaxis, :] * gain[:, np.newaxis]
+    return _clamp(ve, ve_min, ve_max)
 
 
 # ===============================
@@ -182,6 +211,11 @@ def _lambda_base_from_strategy(map_rel: float, strategy: str) -> float:
       BAL:  -1.0:1.02, -0.3:1.01, 0.0:0.87, 0.5:0.83, 1.0:0.81, 2.0:0.79
       AGR:  -1.0:1.04, -0.3:1.02, 0.0:0.89, 0.5:0.85, 1.0:0.83, 2.0:0.81
     """
+    return _interp1d(map_rel, *_lambda_curve_for_strategy(strategy))
+
+
+def _lambda_curve_for_strategy(strategy: str) -> Tuple[Sequence[float], Sequence[float]]:
+    """Pontos (MAP relativo, λ) da curva base da estratégia."""
     xs = (-1.0, -0.3, 0.0, 0.5, 1.0, 2.0)
     if strategy == "conservadora":
         ys = (1.02, 1.00, 0.88, 0.84, 0.82, 0.80)
@@ -189,7 +223,7 @@ def _lambda_base_from_strategy(map_rel: float, strategy: str) -> float:
         ys = (1.04, 1.02, 0.89, 0.85, 0.83, 0.81)
     else:  # balanceada default
         ys = (1.02, 1.01, 0.87, 0.83, 0.81, 0.79)
-    return _interp1d(map_rel, xs, ys)
+    return xs, ys
 
 
 def _rpm_shape_for_fuel(fuel_type: str, rpm: float, rpm_min: float, rpm_max: float) -> float:
@@ -199,20 +233,33 @@ def _rpm_shape_for_fuel(fuel_type: str, rpm: float, rpm_min: float, rpm_max: flo
     if rpm_max <= rpm_min:
         return 1.0
     t = min(1.0, max(0.0, (rpm - rpm_min) / (rpm_max - rpm_min)))
+    return 1.0 - _rpm_shape_coefficient(fuel_type) * t
+
+
+def _rpm_shape_array(fuel_type: str, rpm: np.ndarray, rpm_min: float, rpm_max: float) -> np.ndarray:
+    """Versão vetorizada de `_rpm_shape_for_fuel` para um eixo de RPM."""
+    if rpm_max <= rpm_min:
+        return np.ones(rpm.shape)
+    t = (rpm - rpm_min) / (rpm_max - rpm_min)
+    t = np.where(t > 0.0, t, 0.0)
+    t = np.where(t < 1.0, t, 1.0)
+    return 1.0 - _rpm_shape_coefficient(fuel_type) * t
+
+
+def _rpm_shape_coefficient(fuel_type: str) -> float:
+    """Redução máxima de λ em alta rotação por tipo de combustível."""
     ft = (fuel_type or "").lower()
     if "methanol" in ft:
-        k = 0.07
+        return 0.07
     elif "ethanol" in ft:
-        k = 0.06
+        return 0.06
     elif "e85" in ft:
-        k = 0.05
+        return 0.05
     elif "diesel" in ft:
-        k = 0.03
+        return 0.03
     elif "nitromethane" in ft or "nitro" in ft:
-        k = 0.08
-    else:
-        k = 0.04
-    return 1.0 - k * t
+        return 0.08
+    return 0.04
 
 
 def calculate_lambda_target_closed_loop(
@@ -241,30 +288,22 @@ def calculate_lambda_target_closed_loop(
 
     rpm_min = float(min(rpm_axis))
     rpm_max = float(max(rpm_axis))
+    rpm = np.asarray(rpm_axis, dtype=float)
 
-    def f_user(r: float) -> float:
-        if not rpm_user_pairs:
-            return 1.0
+    if rpm_user_pairs:
         xs = [float(x) for x, _ in rpm_user_pairs]
         ys = [float(y) for _, y in rpm_user_pairs]
-        return _interp1d(float(r), xs, ys)
+        f_user = _interp1d_array(rpm, xs, ys)
+    else:
+        f_user = np.ones(rpm.shape)
 
-    matrix: List[List[float]] = []
     eff_factor = 1.0 / max(float(cl_factor), 1e-6)
-    for m in map_axis:
-        lam_base = _lambda_base_from_strategy(float(m), strategy)
-        row: List[float] = []
-        for r in rpm_axis:
-            lam = (
-                lam_base
-                * eff_factor
-                * f_user(float(r))
-                * _rpm_shape_for_fuel(fuel_type, float(r), rpm_min, rpm_max)
-            )
-            lam = max(lam_min, min(lam_max, lam))
-            row.append(lam)
-        matrix.append(row)
-    return np.array(matrix, dtype=float)
+    lam_base = _interp1d_array(map_axis, *_lambda_curve_for_strategy(strategy))
+    shape = _rpm_shape_array(fuel_type, rpm, rpm_min, rpm_max)
+
+    # Mesma ordem de operações do cálculo célula a célula
+    lam = lam_base[:, np.newaxis] * eff_factor * f_user[np.newaxis, :] * shape[np.newaxis, :]
+    return _clamp(lam, lam_min, lam_max)
 
 
 def calculate_temp_compensation(
@@ -605,7 +644,6 @@ class Calculator:
         """
         rows = len(map_axis)
         cols = len(rpm_axis)
-        matrix = np.zeros((rows, cols), dtype=float)
 
         # Parâmetros do motor
         raw_disp = float(vehicle_data.get("displacement", 2.0))
@@ -671,11 +709,15 @@ class Calculator:
         dead_time_ms = float(vehicle_data.get("dead_time_ms", 1.0))
         pw_min = float(vehicle_data.get("pw_min_ms", 1.6))
 
+        # Grandezas por linha (MAP): pressão absoluta, fluxo corrigido e AFR da estratégia
+        p_abs_pa = np.empty(rows)
+        flow_mg_ms = np.empty(rows)
+        lam_strategy = np.empty(rows)
         for i, map_rel in enumerate(map_axis):
             p_abs_bar = 1.0 + float(map_rel)
             if not consider_boost and p_abs_bar > 1.0:
                 p_abs_bar = 1.0
-            p_abs_pa = p_abs_bar * 1e5
+            p_abs_pa[i] = p_abs_bar * 1e5
             # ΔP em bar
             if regulator_11:
                 delta_p_bar = base_bar
@@ -683,37 +725,34 @@ class Calculator:
                 delta_p_bar = base_bar - float(map_rel)
             delta_p_bar = max(0.0, delta_p_bar)
             # Correção de fluxo pela raiz
-            flow_mg_ms = flow_mg_ms_nom * (delta_p_bar / base_bar) ** 0.5 if base_bar > 0 else 0.0
-
-            for j, rpm in enumerate(rpm_axis):
-                ve = float(ve_matrix[i, j])
-                # Massa de ar por admissão (mg)
-                m_air_mg = (p_abs_pa * v_cyl_m3) / (R * T) * ve * 1e6
-
-                # AFR alvo (aplicar fator de segurança como riqueza em ambos os casos)
-                if lambda_matrix is not None and lambda_matrix.shape == (rows, cols):
-                    lam = float(lambda_matrix[i, j])
-                    afr_target = afr_stoich * lam
-                else:
-                    # AFR por estratégia (kPa) → converter para λ (dividir por 14.7)
-                    map_kpa = p_abs_bar * 100.0
-                    afr_gas = Calculator.get_afr_target_3d(map_kpa, strategy)
-                    lam_strategy = afr_gas / 14.7
-                    afr_target = afr_stoich * lam_strategy
-                # Fator de segurança: FS>1 ⇒ mistura mais rica (AFR menor)
-                afr_target *= eff_fs
-
-                # Massa de combustível (mg)
-                afr_target = max(0.1, float(afr_target))
-                m_fuel_mg = m_air_mg / afr_target
-
-                # Tempo de injeção (ms)
-                if flow_mg_ms > 0:
-                    pw = m_fuel_mg / flow_mg_ms
-                else:
-                    pw = 0.0
-                pw = max(pw + dead_time_ms, pw_min)
-                matrix[i, j] = pw
+            flow_mg_ms[i] = (
+                flow_mg_ms_nom * (delta_p_bar / base_bar) ** 0.5 if base_bar > 0 else 0.0
+            )
+            # AFR por estratégia (kPa) → converter para λ (dividir por 14.7)
+            lam_strategy[i] = Calculator.get_afr_target_3d(p_abs_bar * 100.0, strategy) / 14.7
+
+        # Massa de ar por admissão (mg), célula a célula via broadcast
+        ve = np.asarray(ve_matrix, dtype=float)
+        m_air_mg = (p_abs_pa[:, np.newaxis] * v_cyl_m3) / (R * T) * ve * 1e6
+
+        # AFR alvo (aplicar fator de segurança como riqueza em ambos os casos)
+        if lambda_matrix is not None and lambda_matrix.shape == (rows, cols):
+            afr_target = afr_stoich * np.asarray(lambda_matrix, dtype=float)
+        else:
+            afr_target = np.broadcast_to(afr_stoich * lam_strategy[:, np.newaxis], (rows, cols))
+        # Fator de segurança: FS>1 ⇒ mistura mais rica (AFR menor)
+        afr_target = afr_target * eff_fs
+
+        # Massa de combustível (mg)
+        afr_target = np.where(afr_target > 0.1, afr_target, 0.1)
+        m_fuel_mg = m_air_mg / afr_target
+
+        # Tempo de injeção (ms)
+        flow = flow_mg_ms[:, np.newaxis]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            pw = np.where(flow > 0, m_fuel_mg / flow, 0.0)
+        pw = pw + dead_time_ms
+        matrix = np.where(pw > pw_min, pw, pw_min)
 
         return matrix
 
@@ -725,33 +764,32 @@ class Calculator:
         octane_rating: float = 91.0,
     ) -> np.ndarray:
         """Calcula matriz 3D de valores de ignição (avanço)."""
-        matrix = np.zeros((len(map_axis), len(rpm_axis)))
-
+        # Correção por carga (MAP) - uma por linha
+        load_correction = np.empty(len(map_axis))
         for i, map_value in enumerate(map_axis):
-            map_kpa = (map_value + 1.013) * 100 if map_value < 0 else (map_value + 1.013) * 100
-
-            for j, rpm in enumerate(rpm_axis):
-                # Avanço base por RPM
-                base_advance = 15.0 + (rpm - 1000) / 1000 * 5.0
-
-                # Correção por carga (MAP)
-                if map_kpa < 50:  # Vácuo - mais avanço
-                    load_correction = 5.0
-                elif map_kpa < 90:  # Carga parcial
-                    load_correction = 2.0
-                elif map_kpa < 100:  # WOT atmosférico
-                    load_correction = 0.0
-                else:  # Boost - menos avanço
-                    boost_level = (map_kpa - 100) / 100
-                    load_correction = -3.0 * boost_level
-
-                # Correção por octanagem
-                octane_correction = (octane_rating - 91) * 0.5
-
-                total_advance = base_advance + load_correction + octane_correction
-                matrix[i, j] = max(-10.0, min(45.0, total_advance))
-
-        return matrix
+            map_kpa = (map_value + 1.013) * 100
+
+            if map_kpa < 50:  # Vácuo - mais avanço
+                load_correction[i] = 5.0
+            elif map_kpa < 90:  # Carga parcial
+                load_correction[i] = 2.0
+            elif map_kpa < 100:  # WOT atmosférico
+                load_correction[i] = 0.0
+            else:  # Boost - menos avanço
+                boost_level = (map_kpa - 100) / 100
+                load_correction[i] = -3.0 * boost_level
+
+        # Avanço base por RPM - um por coluna
+        rpm = np.asarray(rpm_axis, dtype=float)
+        base_advance = 15.0 + (rpm - 1000) / 1000 * 5.0
+
+        # Correção por octanagem
+        octane_correction = (octane_rating - 91) * 0.5
+
+        total_advance = (
+            base_advance[np.newaxis, :] + load_correction[:, np.newaxis] + octane_correction
+        )
+        return _clamp(total_advance, -10.0, 45.0)
 
     @staticmethod
     def calculate_lambda_3d_matrix(
@@ -761,18 +799,10 @@ class Calculator:
         strategy: str = "balanced",
     ) -> np.ndarray:
         """Calcula matriz 3D de valores de lambda."""
-        matrix = np.zeros((len(map_axis), len(rpm_axis)))
-
-        for i, map_value in enumerate(map_axis):
-            map_kpa = (map_value + 1.013) * 100 if map_value < 0 else (map_value + 1.013) * 100
-
-            for j, rpm in enumerate(rpm_axis):
-                afr_target = Calculator.get_afr_target_3d(map_kpa, strategy)
-                # Lambda = AFR / AFR_stoich (14.7 para gasolina)
-                lambda_value = afr_target / 14.7
-                matrix[i, j] = max(0.7, min(1.3, lambda_value))
-
-        return matrix
+        afr_rows = Calculator._afr_targets_by_map(map_axis, strategy)
+        # Lambda = AFR / AFR_stoich (14.7 para gasolina)
+        lambda_rows = _clamp(afr_rows / 14.7, 0.7, 1.3)
+        return np.repeat(lambda_rows[:, np.newaxis], len(rpm_axis), axis=1)
 
     @staticmethod
     def calculate_afr_3d_matrix(
@@ -782,16 +812,19 @@ class Calculator:
         strategy: str = "balanced",
     ) -> np.ndarray:
         """Calcula matriz 3D de valores de AFR."""
-        matrix = np.zeros((len(map_axis), len(rpm_axis)))
-
-        for i, map_value in enumerate(map_axis):
-            map_kpa = (map_value + 1.013) * 100 if map_value < 0 else (map_value + 1.013) * 100
+        afr_rows = Calculator._afr_targets_by_map(map_axis, strategy)
+        return np.repeat(afr_rows[:, np.newaxis], len(rpm_axis), axis=1)
 
-            for j, rpm in enumerate(rpm_axis):
-                afr_target = Calculator.get_afr_target_3d(map_kpa, strategy)
-                matrix[i, j] = afr_target
-
-        return matrix
+    @staticmethod
+    def _afr_targets_by_map(map_axis: List[float], strategy: str) -> np.ndarray:
+        """AFR alvo da estratégia para cada linha (MAP relativo) - não depende do RPM."""
+        return np.array(
+            [
+                Calculator.get_afr_target_3d((map_value + 1.013) * 100, strategy)
+                for map_value in map_axis
+            ],
+            dtype=float,
+        )
 
     @staticmethod
     def calculate_3d_map_values_universal(
@@ -859,19 +892,20 @@ class Calculator:
     def interpolate_3d_matrix(matrix: np.ndarray, method: str = "linear") -> np.ndarray:
         """Aplica interpolação suave na matriz 3D."""
         if method == "linear":
-            # Interpolação linear simples - média dos vizinhos
+            # Interpolação linear simples - média dos vizinhos (kernel em cruz 2-1-1-1-1 / 6)
             result = matrix.copy()
             rows, cols = matrix.shape
 
-            for i in range(1, rows - 1):
-                for j in range(1, cols - 1):
-                    neighbors = [
-                        matrix[i - 1, j],
-                        matrix[i + 1, j],  # vertical
-                        matrix[i, j - 1],
-                        matrix[i, j + 1],  # horizontal
-                    ]
-                    result[i, j] = (matrix[i, j] * 2 + sum(neighbors)) / 6
+            if rows > 2 and cols > 2:
+                # Vizinhos como fatias deslocadas, somados na mesma ordem do cálculo original
+                neighbors = (
+                    0  # sum() parte de 0 (normaliza -0.0 como no cálculo original)
+                    + matrix[:-2, 1:-1]
+                    + matrix[2:, 1:-1]  # vertical
+                    + matrix[1:-1, :-2]
+                    + matrix[1:-1, 2:]  # horizontal
+                )
+                result[1:-1, 1:-1] = (matrix[1:-1, 1:-1] * 2 + neighbors) / 6
 
             return result
 
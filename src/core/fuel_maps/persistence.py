@@ -1,28 +1,40 @@
 """
 Gerenciamento de persistência para mapas de combustível 3D.
-Salva/carrega dados de mapas em arquivos JSON.
+Salva/carrega dados de mapas em arquivos JSON ou no formato binário (.npz).
 """
 
 import json
 import logging
+import os
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 import numpy as np
 
+from .binary_store import BinaryMapStore
+
 # from .models import Map3DData, MapConfig, VehicleData  # Removido imports não utilizados
 from .defaults import ConfigManager
 
 logger = logging.getLogger(__name__)
 
+# Formatos de armazenamento suportados: "json" (um arquivo por mapa) ou "npz" (um por veículo)
+STORAGE_FORMATS = ("json", "npz")
+
 
 class PersistenceManager:
     """Gerenciador de persistência de mapas 3D."""
 
-    def __init__(self, data_dir: str = "data/fuel_maps"):
+    def __init__(self, data_dir: str = "data/fuel_maps", storage_format: Optional[str] = None):
         self.data_dir = Path(data_dir)
         self.config_manager = ConfigManager()
+        self.storage_format = (
+            storage_format or os.getenv("FUEL_MAPS_STORAGE_FORMAT", "json")
+        ).lower()
+        if self.storage_format not in STORAGE_FORMATS:
+            raise ValueError(f"Formato de armazenamento inválido: {self.storage_format}")
+        self.binary_store = BinaryMapStore(str(self.data_dir))
         self._ensure_data_dir()
 
     def _ensure_data_dir(self):
@@ -33,6 +45,39 @@ class PersistenceManager:
         """Gera nome do arquivo baseado nos parâmetros."""
         return self.data_dir / f"map_{vehicle_id}_{map_type}_{bank_id}.json"
 
+    @property
+    def use_binary(self) -> bool:
+        """Indica se os mapas são guardados no arquivo .npz por veículo."""
+        return self.storage_format == "npz"
+
+    def _map_exists(self, vehicle_id: str, map_type: str, bank_id: str) -> bool:
+        """Verifica se o mapa existe no formato de armazenamento ativo."""
+        if self.use_binary:
+            return self.binary_store.exists(vehicle_id, map_type, bank_id)
+        return self._get_filename(vehicle_id, map_type, bank_id).exists()
+
+    def _write_map(self, data: Dict[str, Any]) -> str:
+        """Grava o mapa no formato ativo e retorna o destino para log."""
+        if self.use_binary:
+            self.binary_store.save(data)
+            return f"{data['vehicle_id']}/{data['map_type']}/{data['bank_id']} (npz)"
+
+        filename = self._get_filename(data["vehicle_id"], data["map_type"], data["bank_id"])
+        with open(filename, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+        return str(filename)
+
+    def _read_map(self, vehicle_id: str, map_type: str, bank_id: str) -> Optional[Dict]:
+        """Lê o mapa do formato ativo; retorna None se não existir."""
+        if self.use_binary:
+            return self.binary_store.load(vehicle_id, map_type, bank_id)
+
+        filename = self._get_filename(vehicle_id, map_type, bank_id)
+        if not filename.exists():
+            return None
+        with open(filename, "r", encoding="utf-8") as f:
+            return json.load(f)
+
     def save_3d_map_data(
         self,
         vehicle_id: str,
@@ -45,9 +90,8 @@ class PersistenceManager:
         values_matrix: np.ndarray,
         metadata: Optional[Dict[str, Any]] = None,
     ) -> bool:
-        """Salva dados do mapa 3D em arquivo JSON persistente."""
+        """Salva dados do mapa 3D em arquivo persistente (JSON ou .npz)."""
         try:
-            filename = self._get_filename(vehicle_id, map_type, bank_id)
             # Garantir tipo numpy para serialização consistente
             if not isinstance(values_matrix, np.ndarray):
                 values_matrix = np.array(values_matrix)
@@ -68,8 +112,7 @@ class PersistenceManager:
             }
 
             # Salvar no arquivo
-            with open(filename, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            filename = self._write_map(data)
 
             logger.info(f"Mapa 3D salvo: {filename}")
             return True
@@ -79,18 +122,15 @@ class PersistenceManager:
             return False
 
     def load_3d_map_data(self, vehicle_id: str, map_type: str, bank_id: str) -> Optional[Dict]:
-        """Carrega dados do mapa 3D de arquivo JSON persistente."""
+        """Carrega dados do mapa 3D de arquivo persistente (JSON ou .npz)."""
         try:
-            filename = self._get_filename(vehicle_id, map_type, bank_id)
+            data = self._read_map(vehicle_id, map_type, bank_id)
 
-            if filename.exists():
-                with open(filename, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-
-                logger.debug(f"Mapa 3D carregado: {filename}")
+            if data is not None:
+                logger.debug(f"Mapa 3D carregado: {vehicle_id}/{map_type}/{bank_id}")
                 return data
 
-            logger.debug(f"Arquivo não encontrado: {filename}")
+            logger.debug(f"Mapa não encontrado: {vehicle_id}/{map_type}/{bank_id}")
             return None
         except Exception as e:
             logger.error(f"Erro ao carregar mapa 3D: {e}")
@@ -262,9 +302,7 @@ class PersistenceManager:
                 banks = ["A", "B"] if map_type == "main_fuel_3d_map" else ["shared"]
 
                 for bank in banks:
-                    filename = self._get_filename(vehicle_id, map_type, bank)
-
-                    if not filename.exists():
+                    if not self._map_exists(vehicle_id, map_type, bank):
                         logger.info(
                             f"Criando mapa padrão: {map_type} bank {bank} para veículo {vehicle_id}"
                         )
@@ -317,8 +355,8 @@ class PersistenceManager:
     def backup_map(self, vehicle_id: str, map_type: str, bank_id: str) -> bool:
         """Cria backup de um mapa específico."""
         try:
-            original_file = self._get_filename(vehicle_id, map_type, bank_id)
-            if not original_file.exists():
+            data = self._read_map(vehicle_id, map_type, bank_id)
+            if data is None:
                 return False
 
             backup_dir = self.data_dir / "backups"
@@ -329,10 +367,7 @@ class PersistenceManager:
                 backup_dir / f"map_{vehicle_id}_{map_type}_{bank_id}_backup_{timestamp}.json"
             )
 
-            # Copiar arquivo
-            with open(original_file, "r", encoding="utf-8") as src:
-                data = json.load(src)
-
+            # Backups ficam sempre em JSON, independente do formato ativo
             with open(backup_file, "w", encoding="utf-8") as dst:
                 json.dump(data, dst, indent=2, ensure_ascii=False)
 
@@ -345,6 +380,8 @@ class PersistenceManager:
 
     def list_map_files(self, vehicle_id: Optional[str] = None) -> List[Path]:
         """Lista arquivos de mapas disponíveis."""
+        if self.use_binary:
+            return self.binary_store.list_files(vehicle_id)
         pattern = f"map_{vehicle_id}_*.json" if vehicle_id else "map_*.json"
         return list(self.data_dir.glob(pattern))
 
@@ -356,6 +393,12 @@ class PersistenceManager:
             if create_backup:
                 self.backup_map(vehicle_id, map_type, bank_id)
 
+            if self.use_binary:
+                if self.binary_store.delete(vehicle_id, map_type, bank_id):
+                    logger.info(f"Mapa removido: {vehicle_id}/{map_type}/{bank_id}")
+                    return True
+                return False
+
             filename = self._get_filename(vehicle_id, map_type, bank_id)
             if filename.exists():
                 filename.unlink()
@@ -378,10 +421,8 @@ class PersistenceManager:
         enabled: List[bool],
         metadata: Optional[Dict[str, Any]] = None,
     ) -> bool:
-        """Salva dados do mapa 2D em arquivo JSON persistente."""
+        """Salva dados do mapa 2D em arquivo persistente (JSON ou .npz)."""
         try:
-            filename = self._get_filename(vehicle_id, map_type, bank_id)
-
             # Dados a salvar para mapa 2D
             data = {
                 "vehicle_id": vehicle_id,
@@ -397,8 +438,7 @@ class PersistenceManager:
             }
 
             # Salvar no arquivo
-            with open(filename, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            filename = self._write_map(data)
 
             logger.info(f"Mapa 2D salvo: {filename}")
             return True
@@ -408,23 +448,21 @@ class PersistenceManager:
             return False
 
     def load_2d_map_data(self, vehicle_id: str, map_type: str, bank_id: str) -> Optional[Dict]:
-        """Carrega dados do mapa 2D de arquivo JSON persistente."""
+        """Carrega dados do mapa 2D de arquivo persistente (JSON ou .npz)."""
         try:
-            filename = self._get_filename(vehicle_id, map_type, bank_id)
-
-            if filename.exists():
-                with open(filename, "r", encoding="utf-8") as f:
-                    data = json.load(f)
+            data = self._read_map(vehicle_id, map_type, bank_id)
+            name = f"{vehicle_id}/{map_type}/{bank_id}"
 
+            if data is not None:
                 # Verificar se é um mapa 2D
                 if data.get("dimension") == "2D":
-                    logger.debug(f"Mapa 2D carregado: {filename}")
+                    logger.debug(f"Mapa 2D carregado: {name}")
                     return data
                 else:
-                    logger.warning(f"Arquivo não é um mapa 2D: {filename}")
+                    logger.warning(f"Arquivo não é um mapa 2D: {name}")
                     return None
 
-            logger.debug(f"Arquivo 2D não encontrado: {filename}")
+            logger.debug(f"Mapa 2D não encontrado: {name}")
             return None
 
         except Exception as e:
@@ -511,9 +549,7 @@ class PersistenceManager:
                 )
 
                 for bank in banks:
-                    filename = self._get_filename(vehicle_id, map_type, bank)
-
-                    if not filename.exists():
+                    if not self._map_exists(vehicle_id, map_type, bank):
                         logger.info(
                             f"Criando mapa {dimension} padrão: {map_type} bank {bank} para veículo {vehicle_id}"
                         )
@@ -552,24 +588,64 @@ class PersistenceManager:
 
     def load_map_data(self, vehicle_id: str, map_type: str, bank_id: str) -> Optional[Dict]:
         """Carrega dados de mapa (detecta automaticamente se é 2D ou 3D)."""
-        # Primeiro tenta carregar como qualquer tipo
-        filename = self._get_filename(vehicle_id, map_type, bank_id)
-
-        if not filename.exists():
-            return None
-
         try:
-            with open(filename, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = self._read_map(vehicle_id, map_type, bank_id)
+            if data is None:
+                return None
 
             dimension = data.get("dimension", "3D")  # Default 3D para compatibilidade
-            logger.debug(f"Mapa {dimension} carregado: {filename}")
+            logger.debug(f"Mapa {dimension} carregado: {vehicle_id}/{map_type}/{bank_id}")
             return data
 
         except Exception as e:
             logger.error(f"Erro ao carregar mapa: {e}")
             return None
 
+    def migrate_json_to_binary(
+        self, vehicle_id: Optional[str] = None, remove_json: bool = False
+    ) -> int:
+        """Copia mapas JSON existentes para os arquivos .npz por veículo.
+
+        Os mapas de cada veículo são gravados com uma única escrita. Retorna o
+        número de mapas migrados.
+        """
+        pattern = f"map_{vehicle_id}_*.json" if vehicle_id else "map_*.json"
+        by_vehicle: Dict[str, List[Dict[str, Any]]] = {}
+        sources: Dict[str, List[Path]] = {}
+
+        for path in sorted(self.data_dir.glob(pattern)):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+            except Exception as e:
+                logger.error(f"Erro ao ler mapa para migração {path}: {e}")
+                continue
+
+            # O nome do arquivo é ambíguo quando o id contém "_"; usar o conteúdo
+            owner = data.get("vehicle_id")
+            if not owner or not data.get("map_type") or not data.get("bank_id"):
+                logger.warning(f"Mapa sem identificação ignorado: {path}")
+                continue
+            if vehicle_id and owner != vehicle_id:
+                continue
+            by_vehicle.setdefault(owner, []).append(data)
+            sources.setdefault(owner, []).append(path)
+
+        migrated = 0
+        for owner, maps in by_vehicle.items():
+            try:
+                self.binary_store.save_many(owner, maps)
+            except Exception as e:
+                logger.error(f"Erro ao migrar mapas do veículo {owner}: {e}")
+                continue
+            migrated += len(maps)
+            if remove_json:
+                for path in sources[owner]:
+                    path.unlink()
+
+        logger.info(f"Migrados {migrated} mapas para o formato binário")
+        return migrated
+
 
 # Instância global do gerenciador de persistência
 persistence_manager = PersistenceManager()
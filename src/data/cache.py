@@ -10,20 +10,35 @@ Created: 2025-01-02
 
 import hashlib
 import json
+import os
 import pickle
 import sqlite3
+import sys
 import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from functools import wraps
 from pathlib import Path
-from typing import Any, Callable, Dict, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
 
 from ..utils.logging_config import get_logger
 
+# pyarrow is optional: without it DataFrames are pickled to disk
+try:
+    import pyarrow as pa
+    import pyarrow.ipc as ipc
+
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+    pa = None
+    ipc = None
+
 logger = get_logger(__name__)
 
 
@@ -48,9 +63,20 @@ class CacheError(Exception):
 class MemoryCache:
     """
     In-memory cache with LRU eviction and size limits.
+
+    Entries are kept in an ordered dict in access order, so touching and
+    evicting an entry are O(1). Keys of the form ``"<namespace>:..."`` can be
+    given their own size quota (e.g. ``{"df": 128, "chart": 16}`` in MB);
+    a namespace over its quota evicts its own least recently used entries.
     """
 
-    def __init__(self, max_size_mb: int = 256, max_entries: int = 1000, default_ttl: int = 3600):
+    def __init__(
+        self,
+        max_size_mb: int = 256,
+        max_entries: int = 1000,
+        default_ttl: int = 3600,
+        namespace_quotas_mb: Optional[Dict[str, float]] = None,
+    ):
         """
         Initialize memory cache.
 
@@ -58,50 +84,102 @@ class MemoryCache:
             max_size_mb: Maximum cache size in MB
             max_entries: Maximum number of cache entries
             default_ttl: Default time-to-live in seconds
+            namespace_quotas_mb: Optional size limit in MB per key namespace
         """
         self.max_size_bytes = max_size_mb * 1024 * 1024
         self.max_entries = max_entries
         self.default_ttl = default_ttl
+        self.namespace_quotas = {
+            namespace: int(quota * 1024 * 1024)
+            for namespace, quota in (namespace_quotas_mb or {}).items()
+        }
 
-        self._cache: Dict[str, CacheEntry] = {}
+        # Least recently used entries first
+        self._cache: "OrderedDict[str, CacheEntry]" = OrderedDict()
         self._lock = threading.RLock()
         self._total_size = 0
 
+        # Per-namespace LRU order and size, only for namespaces with a quota
+        self._namespace_keys: Dict[str, "OrderedDict[str, None]"] = {
+            namespace: OrderedDict() for namespace in self.namespace_quotas
+        }
+        self._namespace_sizes: Dict[str, int] = dict.fromkeys(self.namespace_quotas, 0)
+
         logger.info(f"Memory cache initialized: {max_size_mb}MB, {max_entries} entries")
 
+    @staticmethod
+    def _namespace(key: str) -> str:
+        """Namespace of a cache key (text before the first ':')."""
+        return key.split(":", 1)[0] if ":" in key else ""
+
     def _calculate_size(self, obj: Any) -> int:
-        """Estimate object size in bytes."""
+        """Estimate object size in bytes without serializing it."""
         try:
-            if isinstance(obj, pd.DataFrame):
-                return int(obj.memory_usage(deep=True).sum())
-            elif isinstance(obj, np.ndarray):
-                return int(obj.nbytes)
-            elif isinstance(obj, (str, bytes)):
-                return len(obj)
-            elif isinstance(obj, dict):
-                return len(json.dumps(obj, default=str).encode("utf-8"))
-            else:
-                return len(pickle.dumps(obj))
+            return self._structural_size(obj, depth=3)
         except Exception:
             # Fallback estimation
             return 1024  # 1KB default
 
+    def _structural_size(self, obj: Any, depth: int) -> int:
+        """Shallow structural size, recursing a few levels into containers."""
+        if isinstance(obj, (pd.DataFrame, pd.Series)):
+            usage = obj.memory_usage(deep=False)
+            return int(usage.sum() if isinstance(obj, pd.DataFrame) else usage)
+        elif isinstance(obj, np.ndarray):
+            return int(obj.nbytes)
+        elif isinstance(obj, (str, bytes)):
+            return len(obj)
+
+        size = sys.getsizeof(obj)
+        if depth <= 0:
+            return size
+        if isinstance(obj, dict):
+            for key, value in obj.items():
+                size += self._structural_size(key, depth - 1)
+                size += self._structural_size(value, depth - 1)
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            for item in obj:
+                size += self._structural_size(item, depth - 1)
+        elif hasattr(obj, "__dict__"):
+            size += self._structural_size(vars(obj), depth - 1)
+        return size
+
+    def _remove(self, key: str) -> Optional[CacheEntry]:
+        """Remove an entry and its size accounting; caller holds the lock."""
+        entry = self._cache.pop(key, None)
+        if entry is None:
+            return None
+
+        self._total_size -= entry.size_bytes
+        namespace = self._namespace(key)
+        if namespace in self._namespace_keys:
+            del self._namespace_keys[namespace][key]
+            self._namespace_sizes[namespace] -= entry.size_bytes
+        return entry
+
+    def _touch(self, key: str) -> None:
+        """Mark an entry as most recently used."""
+        self._cache.move_to_end(key)
+        namespace_keys = self._namespace_keys.get(self._namespace(key))
+        if namespace_keys is not None:
+            namespace_keys.move_to_end(key)
+
     def _evict_lru(self) -> None:
         """Evict least recently used entries."""
-        if not self._cache:
-            return
-
-        # Sort by last accessed time
-        sorted_entries = sorted(self._cache.items(), key=lambda x: x[1].last_accessed)
+        # Namespaces over quota evict their own oldest entries first
+        for namespace, quota in self.namespace_quotas.items():
+            namespace_keys = self._namespace_keys[namespace]
+            while self._namespace_sizes[namespace] > quota and namespace_keys:
+                key = next(iter(namespace_keys))
+                self._remove(key)
+                logger.debug(f"Evicted cache entry (namespace quota): {key}")
 
         # Remove oldest entries until we're under limits
-        while (
+        while self._cache and (
             len(self._cache) > self.max_entries or self._total_size > self.max_size_bytes
-        ) and sorted_entries:
-
-            key, entry = sorted_entries.pop(0)
-            self._total_size -= entry.size_bytes
-            del self._cache[key]
+        ):
+            key = next(iter(self._cache))
+            self._remove(key)
             logger.debug(f"Evicted cache entry: {key}")
 
     def _is_expired(self, entry: CacheEntry) -> bool:
@@ -126,6 +204,7 @@ class MemoryCache:
             # Update access statistics
             entry.last_accessed = datetime.now()
             entry.access_count += 1
+            self._touch(key)
 
             return entry.data
 
@@ -146,27 +225,29 @@ class MemoryCache:
                 size_bytes = 1024  # 1KB default
 
             # Check if item is too large
-            if size_bytes > self.max_size_bytes:
+            namespace = self._namespace(key)
+            limit = min(self.max_size_bytes, self.namespace_quotas.get(namespace, float("inf")))
+            if size_bytes > limit:
                 logger.warning(f"Item too large for cache: {key} ({size_bytes} bytes)")
                 return
 
             # Remove existing entry if present
-            if key in self._cache:
-                self._total_size -= self._cache[key].size_bytes
+            self._remove(key)
 
             # Calculate expiration
+            now = datetime.now()
             expires_at = None
             if ttl is not None:
-                expires_at = datetime.now() + timedelta(seconds=ttl)
+                expires_at = now + timedelta(seconds=ttl)
             elif self.default_ttl > 0:
-                expires_at = datetime.now() + timedelta(seconds=self.default_ttl)
+                expires_at = now + timedelta(seconds=self.default_ttl)
 
             # Create cache entry
             entry = CacheEntry(
                 key=key,
                 data=data,
-                created_at=datetime.now(),
-                last_accessed=datetime.now(),
+                created_at=now,
+                last_accessed=now,
                 access_count=1,
                 size_bytes=size_bytes,
                 metadata=metadata or {},
@@ -175,6 +256,9 @@ class MemoryCache:
 
             self._cache[key] = entry
             self._total_size += size_bytes
+            if namespace in self._namespace_keys:
+                self._namespace_keys[namespace][key] = None
+                self._namespace_sizes[namespace] += size_bytes
 
             # Evict if necessary
             self._evict_lru()
@@ -182,17 +266,16 @@ class MemoryCache:
     def delete(self, key: str) -> bool:
         """Delete item from cache."""
         with self._lock:
-            entry = self._cache.pop(key, None)
-            if entry:
-                self._total_size -= entry.size_bytes
-                return True
-            return False
+            return self._remove(key) is not None
 
     def clear(self) -> None:
         """Clear all cache entries."""
         with self._lock:
             self._cache.clear()
             self._total_size = 0
+            for namespace in self._namespace_keys:
+                self._namespace_keys[namespace].clear()
+                self._namespace_sizes[namespace] = 0
 
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
@@ -204,19 +287,43 @@ class MemoryCache:
                 "max_entries": self.max_entries,
                 "utilization": (len(self._cache) / self.max_entries) * 100,
                 "size_utilization": (self._total_size / self.max_size_bytes) * 100,
+                "namespaces": {
+                    namespace: {
+                        "entries": len(self._namespace_keys[namespace]),
+                        "size_mb": self._namespace_sizes[namespace] / (1024 * 1024),
+                        "quota_mb": quota / (1024 * 1024),
+                    }
+                    for namespace, quota in self.namespace_quotas.items()
+                },
             }
 
 
 class DiskCache:
     """
     Disk-based cache for persistent storage of larger datasets.
+
+    Metadata lives in a SQLite database opened once in WAL mode and shared
+    by all calls. Access statistics are buffered and written in batches,
+    and expired entries are swept periodically rather than on every call.
+    DataFrames are stored as Arrow IPC files and numeric arrays as ``.npy``
+    so both are read back memory-mapped; other objects are pickled.
     """
 
+    PICKLE_SUFFIX = ".pkl"
+    ARROW_SUFFIX = ".arrow"
+    NUMPY_SUFFIX = ".npy"
+    DATA_SUFFIXES = (PICKLE_SUFFIX, ARROW_SUFFIX, NUMPY_SUFFIX)
+
+    # Buffered access updates are flushed after this many hits
+    ACCESS_FLUSH_SIZE = 64
+
     def __init__(
         self,
         cache_dir: Union[str, Path] = "cache",
         max_size_mb: int = 1024,
         compression: bool = True,
+        cleanup_interval: float = 60.0,
+        access_flush_interval: float = 5.0,
     ):
         """
         Initialize disk cache.
@@ -225,23 +332,41 @@ class DiskCache:
             cache_dir: Directory for cache files
             max_size_mb: Maximum cache size in MB
             compression: Whether to compress cache files
+            cleanup_interval: Minimum seconds between expired-entry sweeps
+            access_flush_interval: Maximum seconds buffered access updates are kept
         """
         self.cache_dir = Path(cache_dir)
         self.max_size_bytes = max_size_mb * 1024 * 1024
         self.compression = compression
+        self.cleanup_interval = cleanup_interval
+        self.access_flush_interval = access_flush_interval
 
         # Create cache directory
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
+        self._lock = threading.RLock()
+        # key -> (last_accessed, pending hit count)
+        self._pending_access: Dict[str, Tuple[str, int]] = {}
+        self._last_access_flush = time.monotonic()
+        self._last_cleanup = float("-inf")
+
         # Initialize metadata database
         self.metadata_db = self.cache_dir / "metadata.db"
+        self._conn = self._connect()
         self._init_metadata_db()
 
         logger.info(f"Disk cache initialized: {self.cache_dir}, {max_size_mb}MB")
 
+    def _connect(self) -> sqlite3.Connection:
+        """Open the shared metadata connection."""
+        conn = sqlite3.connect(self.metadata_db, check_same_thread=False, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
     def _init_metadata_db(self) -> None:
         """Initialize metadata SQLite database."""
-        with sqlite3.connect(self.metadata_db) as conn:
+        with self._lock, self._conn as conn:
             conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS cache_metadata (
@@ -260,16 +385,114 @@ class DiskCache:
                 "CREATE INDEX IF NOT EXISTS idx_last_accessed ON cache_metadata(last_accessed)"
             )
 
-    def _get_filename(self, key: str) -> str:
+    def close(self) -> None:
+        """Flush pending access updates and close the metadata connection."""
+        with self._lock:
+            self._flush_access()
+            self._conn.close()
+
+    def _get_filename(self, key: str, suffix: str = PICKLE_SUFFIX) -> str:
         """Generate filename for cache key."""
         hash_obj = hashlib.md5(key.encode("utf-8"))
-        return f"{hash_obj.hexdigest()}.pkl"
+        return f"{hash_obj.hexdigest()}{suffix}"
+
+    def _select_suffix(self, data: Any) -> str:
+        """Choose the on-disk format for a value."""
+        if isinstance(data, pd.DataFrame) and PYARROW_AVAILABLE:
+            return self.ARROW_SUFFIX
+        if isinstance(data, np.ndarray) and not data.dtype.hasobject:
+            return self.NUMPY_SUFFIX
+        return self.PICKLE_SUFFIX
+
+    def _write_file(self, file_path: Path, data: Any, suffix: str) -> None:
+        """Serialize a value in the format given by the suffix."""
+        if suffix == self.ARROW_SUFFIX:
+            table = pa.Table.from_pandas(data)
+            with pa.OSFile(str(file_path), "wb") as sink:
+                with ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+        elif suffix == self.NUMPY_SUFFIX:
+            with open(file_path, "wb") as f:
+                np.save(f, data, allow_pickle=False)
+        else:
+            with open(file_path, "wb") as f:
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def _read_file(self, file_path: Path) -> Any:
+        """Load a value; Arrow and .npy files are memory-mapped."""
+        if file_path.suffix == self.ARROW_SUFFIX:
+            with pa.memory_map(str(file_path), "r") as source:
+                return ipc.open_file(source).read_all().to_pandas()
+        if file_path.suffix == self.NUMPY_SUFFIX:
+            # Copy-on-write mapping: callers may modify the array without touching the file
+            return np.load(file_path, mmap_mode="c", allow_pickle=False)
+        with open(file_path, "rb") as f:
+            return pickle.load(f)
+
+    def _store_file(self, filename: str, data: Any) -> int:
+        """Write a value to a temporary file, move it into place and return its size."""
+        file_path = self.cache_dir / filename
+        tmp_path = file_path.with_name(f"{filename}.{threading.get_ident()}.tmp")
+        try:
+            self._write_file(tmp_path, data, file_path.suffix)
+            os.replace(tmp_path, file_path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+        return file_path.stat().st_size
+
+    def _remove_file(self, filename: str) -> None:
+        """Remove a cache file if present."""
+        (self.cache_dir / filename).unlink(missing_ok=True)
+
+    def _data_files(self) -> List[Path]:
+        """List cache data files on disk."""
+        return [
+            path
+            for suffix in self.DATA_SUFFIXES
+            for path in self.cache_dir.glob(f"*{suffix}")
+            if path.is_file()
+        ]
+
+    def _record_access(self, key: str) -> None:
+        """Buffer an access statistics update; caller holds the lock."""
+        _, hits = self._pending_access.get(key, (None, 0))
+        self._pending_access[key] = (datetime.now().isoformat(), hits + 1)
+
+        if (
+            len(self._pending_access) >= self.ACCESS_FLUSH_SIZE
+            or time.monotonic() - self._last_access_flush >= self.access_flush_interval
+        ):
+            self._flush_access()
+
+    def _flush_access(self) -> None:
+        """Write buffered access statistics in one transaction; caller holds the lock."""
+        self._last_access_flush = time.monotonic()
+        if not self._pending_access:
+            return
+
+        updates = [
+            (last_accessed, hits, key)
+            for key, (last_accessed, hits) in self._pending_access.items()
+        ]
+        self._pending_access.clear()
+        with self._conn as conn:
+            conn.executemany(
+                "UPDATE cache_metadata SET last_accessed = ?, access_count = access_count + ? WHERE key = ?",
+                updates,
+            )
+
+    def _maybe_cleanup_expired(self) -> None:
+        """Sweep expired entries at most once per cleanup interval."""
+        if time.monotonic() - self._last_cleanup >= self.cleanup_interval:
+            self._cleanup_expired()
 
     def _cleanup_expired(self) -> None:
         """Remove expired cache entries."""
         now = datetime.now().isoformat()
 
-        with sqlite3.connect(self.metadata_db) as conn:
+        with self._lock, self._conn as conn:
+            self._last_cleanup = time.monotonic()
+
             # Find expired entries
             expired = conn.execute(
                 "SELECT key, filename FROM cache_metadata WHERE expires_at IS NOT NULL AND expires_at < ?",
@@ -278,86 +501,84 @@ class DiskCache:
 
             # Remove expired files and metadata
             for key, filename in expired:
-                file_path = self.cache_dir / filename
-                if file_path.exists():
-                    file_path.unlink()
+                self._remove_file(filename)
+                self._pending_access.pop(key, None)
 
-                conn.execute("DELETE FROM cache_metadata WHERE key = ?", (key,))
+            conn.executemany(
+                "DELETE FROM cache_metadata WHERE key = ?", [(key,) for key, _ in expired]
+            )
 
     def _evict_lru(self) -> None:
         """Evict least recently used entries to stay under size limit."""
-        # Calculate current size
-        total_size = 0
-        for file_path in self.cache_dir.glob("*.pkl"):
-            if file_path.exists():
-                total_size += file_path.stat().st_size
-
-        if total_size <= self.max_size_bytes:
-            return
+        with self._lock:
+            # Eviction order depends on up-to-date access times
+            self._flush_access()
 
-        # Get entries sorted by last accessed
-        with sqlite3.connect(self.metadata_db) as conn:
-            entries = conn.execute(
-                "SELECT key, filename, size_bytes FROM cache_metadata ORDER BY last_accessed ASC"
-            ).fetchall()
+            with self._conn as conn:
+                total_size = conn.execute(
+                    "SELECT COALESCE(SUM(size_bytes), 0) FROM cache_metadata"
+                ).fetchone()[0]
 
-            # Remove oldest entries
-            for key, filename, size_bytes in entries:
                 if total_size <= self.max_size_bytes:
-                    break
+                    return
 
-                file_path = self.cache_dir / filename
-                if file_path.exists():
-                    file_path.unlink()
+                # Get entries sorted by last accessed
+                entries = conn.execute(
+                    "SELECT key, filename, size_bytes FROM cache_metadata ORDER BY last_accessed ASC"
+                )
+
+                # Remove oldest entries
+                evicted = []
+                for key, filename, size_bytes in entries:
+                    if total_size <= self.max_size_bytes:
+                        break
+
+                    self._remove_file(filename)
                     total_size -= size_bytes
+                    evicted.append((key,))
+                    logger.debug(f"Evicted disk cache entry: {key}")
 
-                conn.execute("DELETE FROM cache_metadata WHERE key = ?", (key,))
-                logger.debug(f"Evicted disk cache entry: {key}")
+                conn.executemany("DELETE FROM cache_metadata WHERE key = ?", evicted)
 
     def get(self, key: str) -> Optional[Any]:
         """Get item from disk cache."""
-        self._cleanup_expired()
+        with self._lock:
+            self._maybe_cleanup_expired()
 
-        with sqlite3.connect(self.metadata_db) as conn:
-            result = conn.execute(
+            result = self._conn.execute(
                 "SELECT filename, expires_at FROM cache_metadata WHERE key = ?", (key,)
             ).fetchone()
 
-            if result is None:
-                return None
+        if result is None:
+            return None
 
-            filename, expires_at = result
+        filename, expires_at = result
 
-            # Check expiration
-            if expires_at:
-                if datetime.now() > datetime.fromisoformat(expires_at):
-                    self.delete(key)
-                    return None
-
-            # Load data from file
-            file_path = self.cache_dir / filename
-            if not file_path.exists():
-                # Clean up orphaned metadata
-                conn.execute("DELETE FROM cache_metadata WHERE key = ?", (key,))
+        # Check expiration
+        if expires_at:
+            if datetime.now() > datetime.fromisoformat(expires_at):
+                self.delete(key)
                 return None
 
-            try:
-                with open(file_path, "rb") as f:
-                    data = pickle.load(f)
+        # Load data from file
+        file_path = self.cache_dir / filename
+        if not file_path.exists():
+            # Clean up orphaned metadata
+            self.delete(key)
+            return None
 
-                # Update access statistics
-                now = datetime.now().isoformat()
-                conn.execute(
-                    "UPDATE cache_metadata SET last_accessed = ?, access_count = access_count + 1 WHERE key = ?",
-                    (now, key),
-                )
+        try:
+            data = self._read_file(file_path)
+        except Exception as e:
+            logger.error(f"Failed to load cache entry {key}: {str(e)}")
+            self.delete(key)
+            return None
 
-                return data
+        # Update access statistics
+        with self._lock:
+            self._record_access(key)
 
-            except Exception as e:
-                logger.error(f"Failed to load cache entry {key}: {str(e)}")
-                self.delete(key)
-                return None
+        return data
 
     def set(
         self,
@@ -367,16 +588,19 @@ class DiskCache:
         metadata: Optional[Dict[str, Any]] = None,
     ) -> None:
         """Set item in disk cache."""
-        filename = self._get_filename(key)
-        file_path = self.cache_dir / filename
+        suffix = self._select_suffix(data)
+        filename = self._get_filename(key, suffix)
 
         try:
-            # Serialize data to file
-            with open(file_path, "wb") as f:
-                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
-
-            # Get file size
-            size_bytes = file_path.stat().st_size
+            try:
+                size_bytes = self._store_file(filename, data)
+            except Exception as e:
+                if suffix != self.ARROW_SUFFIX:
+                    raise
+                # Columns Arrow cannot represent (mixed objects): fall back to pickle
+                logger.debug(f"Arrow serialization failed for {key}, using pickle: {e}")
+                filename = self._get_filename(key, self.PICKLE_SUFFIX)
+                size_bytes = self._store_file(filename, data)
 
             # Calculate expiration
             expires_at = None
@@ -387,7 +611,15 @@ class DiskCache:
             now = datetime.now().isoformat()
             metadata_json = json.dumps(metadata or {})
 
-            with sqlite3.connect(self.metadata_db) as conn:
+            with self._lock, self._conn as conn:
+                previous = conn.execute(
+                    "SELECT filename FROM cache_metadata WHERE key = ?", (key,)
+                ).fetchone()
+                if previous and previous[0] != filename:
+                    # Value stored in a different format before
+                    self._remove_file(previous[0])
+                self._pending_access.pop(key, None)
+
                 conn.execute(
                     """
                     INSERT OR REPLACE INTO cache_metadata
@@ -402,50 +634,52 @@ class DiskCache:
 
         except Exception as e:
             logger.error(f"Failed to cache item {key}: {str(e)}")
-            if file_path.exists():
-                file_path.unlink()
+            self._remove_file(filename)
 
     def delete(self, key: str) -> bool:
         """Delete item from disk cache."""
-        with sqlite3.connect(self.metadata_db) as conn:
+        with self._lock, self._conn as conn:
+            self._pending_access.pop(key, None)
             result = conn.execute(
                 "SELECT filename FROM cache_metadata WHERE key = ?", (key,)
             ).fetchone()
 
             if result:
-                filename = result[0]
-                file_path = self.cache_dir / filename
-
-                if file_path.exists():
-                    file_path.unlink()
-
+                self._remove_file(result[0])
                 conn.execute("DELETE FROM cache_metadata WHERE key = ?", (key,))
                 return True
 
         return False
 
+    def find_keys(self, pattern: str) -> List[str]:
+        """List cache keys matching a SQL LIKE pattern."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT key FROM cache_metadata WHERE key LIKE ?", (pattern,)
+            ).fetchall()
+        return [key for (key,) in rows]
+
     def clear(self) -> None:
         """Clear all disk cache entries."""
-        # Remove all pickle files
-        for file_path in self.cache_dir.glob("*.pkl"):
-            file_path.unlink()
+        with self._lock:
+            self._pending_access.clear()
 
-        # Clear metadata
-        with sqlite3.connect(self.metadata_db) as conn:
-            conn.execute("DELETE FROM cache_metadata")
+            # Remove all cache files
+            for file_path in self._data_files():
+                file_path.unlink()
+
+            # Clear metadata
+            with self._conn as conn:
+                conn.execute("DELETE FROM cache_metadata")
 
     def get_stats(self) -> Dict[str, Any]:
         """Get disk cache statistics."""
-        total_size = 0
-        file_count = 0
-
-        for file_path in self.cache_dir.glob("*.pkl"):
-            if file_path.exists():
-                total_size += file_path.stat().st_size
-                file_count += 1
+        file_count = len(self._data_files())
 
-        with sqlite3.connect(self.metadata_db) as conn:
-            entry_count = conn.execute("SELECT COUNT(*) FROM cache_metadata").fetchone()[0]
+        with self._lock:
+            entry_count, total_size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM cache_metadata"
+            ).fetchone()
 
         return {
             "entries": entry_count,
@@ -470,6 +704,7 @@ class FuelTechCacheManager:
         memory_cache_mb: int = 256,
         disk_cache_mb: int = 1024,
         cache_dir: Union[str, Path] = "cache",
+        memory_quotas_mb: Optional[Dict[str, float]] = None,
     ):
         """
         Initialize cache manager.
@@ -478,8 +713,12 @@ class FuelTechCacheManager:
             memory_cache_mb: Memory cache size in MB
             disk_cache_mb: Disk cache size in MB
             cache_dir: Directory for disk cache
+            memory_quotas_mb: Optional memory quotas in MB per key prefix
+                (``"df"``, ``"analysis"``, ``"chart"``, ...)
         """
-        self.memory_cache = MemoryCache(max_size_mb=memory_cache_mb)
+        self.memory_cache = MemoryCache(
+            max_size_mb=memory_cache_mb, namespace_quotas_mb=memory_quotas_mb
+        )
         self.disk_cache = DiskCache(cache_dir=cache_dir, max_size_mb=disk_cache_mb)
 
         # Cache prefixes for different data types
@@ -574,7 +813,11 @@ class FuelTechCacheManager:
             return data
 
         # Check disk cache
-        return self.disk_cache.get(key)
+        data = self.disk_cache.get(key)
+        if data is not None:
+            # Promote to memory cache
+            self.memory_cache.set(key, data, ttl=3600)
+        return data
 
     def set_analysis_result(
         self,
@@ -583,12 +826,25 @@ class FuelTechCacheManager:
         result: Dict[str, Any],
         parameters: Optional[Dict[str, Any]] = None,
         ttl: int = 3600,
+        persist: bool = False,
     ) -> None:
-        """Cache analysis result."""
+        """
+        Cache analysis result.
+
+        Args:
+            session_id: Session ID (used for invalidation)
+            analysis_type: Analysis name
+            result: Result to cache
+            parameters: Parameters hashed into the key
+            ttl: Time-to-live in seconds
+            persist: Also write to disk so the result survives restarts
+        """
         key = self._generate_key("analysis", session_id, analysis_type, parameters)
 
         # Analysis results go to memory cache (usually small)
         self.memory_cache.set(key, result, ttl=ttl)
+        if persist:
+            self.disk_cache.set(key, result, ttl=ttl)
 
     def get_chart_data(
         self,
@@ -616,22 +872,16 @@ class FuelTechCacheManager:
         """Invalidate all cache entries for a session."""
         # Memory cache
         keys_to_delete = []
-        for key in self.memory_cache._cache.keys():
+        for key in list(self.memory_cache._cache.keys()):
             if f":{session_id}:" in key:
                 keys_to_delete.append(key)
 
         for key in keys_to_delete:
             self.memory_cache.delete(key)
 
-        # Disk cache - more complex as we need to query metadata
-        with sqlite3.connect(self.disk_cache.metadata_db) as conn:
-            keys_to_delete = conn.execute(
-                "SELECT key FROM cache_metadata WHERE key LIKE ?",
-                (f"%:{session_id}:%",),
-            ).fetchall()
-
-            for (key,) in keys_to_delete:
-                self.disk_cache.delete(key)
+        # Disk cache - query metadata for matching keys
+        for key in self.disk_cache.find_keys(f"%:{session_id}:%"):
+            self.disk_cache.delete(key)
 
         logger.info(f"Invalidated cache for session {session_id}")
 
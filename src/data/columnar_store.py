@@ -0,0 +1,341 @@
+"""
+Columnar session store for FuelTech data.
+
+Persists each imported session as a column-compressed Arrow IPC file keyed by
+session_id, alongside the row-oriented SQLite tables. Reads memory-map the
+file, decode only the requested columns and skip record batches that fall
+outside the requested time range, so SQLite is never touched.
+
+Author: A02-DATA-PANDAS Agent
+Created: 2026-10-16
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import List, Optional, Tuple, Union
+
+import pandas as pd
+
+from ..utils.logging_config import get_logger
+
+# pyarrow is optional: without it the store is disabled and callers fall back to SQLite
+try:
+    import pyarrow as pa
+    import pyarrow.ipc as ipc
+
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+    pa = None
+    ipc = None
+
+logger = get_logger(__name__)
+
+
+class ColumnarStoreError(Exception):
+    """Exception raised during columnar store operations."""
+
+
+class ColumnarSessionStore:
+    """
+    Per-session Arrow IPC store for FuelTech log data.
+
+    Features:
+    - One file per session (``<session_id>.arrow``)
+    - Per-column compression (zstd, lz4 or none)
+    - Time-ordered record batches with per-batch time bounds in the schema
+      metadata, used to prune batches on time-range reads
+    - Memory-mapped, column-projected reads
+    """
+
+    FILE_SUFFIX = ".arrow"
+    TIME_COLUMN = "time"
+    DEFAULT_BATCH_ROWS = 65536
+    METADATA_KEY = b"fueltech.time_bounds"
+
+    def __init__(
+        self,
+        base_dir: Union[str, Path],
+        compression: Optional[str] = "zstd",
+        batch_rows: int = DEFAULT_BATCH_ROWS,
+    ):
+        """
+        Initialize columnar session store.
+
+        Args:
+            base_dir: Directory where session files are written
+            compression: IPC buffer codec ('zstd', 'lz4' or None)
+            batch_rows: Rows per record batch (granularity of time pruning)
+        """
+        self.base_dir = Path(base_dir)
+        self.batch_rows = max(1, int(batch_rows))
+        self.compression = compression
+
+        if PYARROW_AVAILABLE and compression and not pa.Codec.is_available(compression):
+            logger.warning(f"Codec '{compression}' not available, writing uncompressed")
+            self.compression = None
+
+    @property
+    def available(self) -> bool:
+        """Whether the columnar backend can be used in this environment."""
+        return PYARROW_AVAILABLE
+
+    def session_path(self, session_id: str) -> Path:
+        """Get file path for a session."""
+        return self.base_dir / f"{session_id}{self.FILE_SUFFIX}"
+
+    def has_session(self, session_id: str) -> bool:
+        """Check whether a columnar file exists for a session."""
+        return self.available and self.session_path(session_id).exists()
+
+    def write_session(self, session_id: str, df: pd.DataFrame) -> Path:
+        """
+        Write session data to its columnar file.
+
+        Rows are sorted by time (when present) so that each record batch covers
+        a contiguous time window. The file is written to a temporary path and
+        atomically moved into place.
+
+        Args:
+            session_id: Session ID used as file key
+            df: Normalized session DataFrame
+
+        Returns:
+            Path of the written file
+        """
+        if not self.available:
+            raise ColumnarStoreError("pyarrow is not installed; columnar store unavailable")
+
+        if self.TIME_COLUMN in df.columns and not df[self.TIME_COLUMN].is_monotonic_increasing:
+            df = df.sort_values(self.TIME_COLUMN, kind="stable")
+
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        batches = table.to_batches(max_chunksize=self.batch_rows)
+
+        time_bounds = []
+        if self.TIME_COLUMN in table.column_names:
+            for batch in batches:
+                times = batch.column(self.TIME_COLUMN).to_numpy(zero_copy_only=False)
+                if len(times):
+                    time_bounds.append([float(times.min()), float(times.max())])
+                else:
+                    time_bounds.append(None)
+
+        metadata = dict(table.schema.metadata or {})
+        metadata[self.METADATA_KEY] = json.dumps(time_bounds).encode("utf-8")
+        schema = table.schema.with_metadata(metadata)
+
+        self.base_dir.mkdir(parents=True, exist_ok=True)
+        target = self.session_path(session_id)
+        tmp_path = target.with_suffix(target.suffix + ".tmp")
+
+        options = ipc.IpcWriteOptions(compression=self.compression)
+        try:
+            with pa.OSFile(str(tmp_path), "wb") as sink:
+                with ipc.new_file(sink, schema, options=options) as writer:
+                    for batch in batches:
+                        writer.write_batch(batch)
+            os.replace(tmp_path, target)
+        except Exception as e:
+            tmp_path.unlink(missing_ok=True)
+            raise ColumnarStoreError(f"Failed to write columnar file for {session_id}: {e}")
+
+        logger.info(
+            f"Columnar session written: {target.name} "
+            f"({len(df)} rows, {len(batches)} batches, codec={self.compression})"
+        )
+        return target
+
+    def open_writer(self, session_id: str) -> "ColumnarSessionWriter":
+        """
+        Open an incremental writer for a session.
+
+        Used by streaming imports, where the session is appended chunk by
+        chunk and never held in memory as a whole.
+
+        Args:
+            session_id: Session ID used as file key
+
+        Returns:
+            ColumnarSessionWriter (close() to commit, abort() to discard)
+        """
+        if not self.available:
+            raise ColumnarStoreError("pyarrow is not installed; columnar store unavailable")
+        return ColumnarSessionWriter(self, session_id)
+
+    def read_session(
+        self,
+        session_id: str,
+        columns: Optional[List[str]] = None,
+        time_range: Optional[Tuple[float, float]] = None,
+    ) -> pd.DataFrame:
+        """
+        Read session data from its columnar file.
+
+        Args:
+            session_id: Session ID
+            columns: Specific columns to retrieve (default: all)
+            time_range: Optional inclusive time range (start, end)
+
+        Returns:
+            DataFrame with the requested columns and rows
+        """
+        if not self.has_session(session_id):
+            raise ColumnarStoreError(f"No columnar file for session {session_id}")
+
+        path = str(self.session_path(session_id))
+        schema = ipc.open_file(pa.memory_map(path, "r")).schema
+
+        # Time is needed for filtering even when not requested
+        read_columns = (
+            list(schema.names) if not columns else [c for c in columns if c in schema.names]
+        )
+        filter_time = time_range is not None and self.TIME_COLUMN in schema.names
+        if filter_time and self.TIME_COLUMN not in read_columns:
+            read_columns.append(self.TIME_COLUMN)
+
+        options = ipc.IpcReadOptions(
+            included_fields=[schema.get_field_index(name) for name in read_columns]
+        )
+        reader = ipc.open_file(pa.memory_map(path, "r"), options=options)
+
+        batch_indices = range(reader.num_record_batches)
+        if filter_time:
+            bounds = json.loads((schema.metadata or {}).get(self.METADATA_KEY, b"[]"))
+            if not bounds:
+                bounds = self._scan_time_bounds(path, schema)
+            start, end = time_range
+            if len(bounds) == reader.num_record_batches:
+                batch_indices = [
+                    i
+                    for i, b in enumerate(bounds)
+                    if b is not None and b[1] >= start and b[0] <= end
+                ]
+
+        batches = [reader.get_batch(i) for i in batch_indices]
+        if batches:
+            table = pa.Table.from_batches(batches)
+        else:
+            table = reader.schema.empty_table()
+
+        df = table.to_pandas()
+
+        if filter_time:
+            start, end = time_range
+            times = df[self.TIME_COLUMN]
+            df = df[(times >= start) & (times <= end)].reset_index(drop=True)
+
+        # Restore requested column order (drops helper time column if not requested)
+        ordered = [c for c in read_columns if not columns or c in columns]
+        return df[ordered]
+
+    def _scan_time_bounds(self, path: str, schema) -> List[Optional[List[float]]]:
+        """Derive per-batch time bounds from the time column (files written incrementally)."""
+        options = ipc.IpcReadOptions(included_fields=[schema.get_field_index(self.TIME_COLUMN)])
+        reader = ipc.open_file(pa.memory_map(path, "r"), options=options)
+        bounds = []
+        for i in range(reader.num_record_batches):
+            times = reader.get_batch(i).column(0).to_numpy(zero_copy_only=False)
+            bounds.append([float(times.min()), float(times.max())] if len(times) else None)
+        return bounds
+
+    def delete_session(self, session_id: str) -> bool:
+        """
+        Delete the columnar file of a session.
+
+        Returns:
+            True if a file was removed
+        """
+        path = self.session_path(session_id)
+        if path.exists():
+            path.unlink()
+            logger.info(f"Columnar session deleted: {path.name}")
+            return True
+        return False
+
+
+class ColumnarSessionWriter:
+    """
+    Incremental writer for one session file.
+
+    The schema is taken from the first chunk; later chunks are cast to it.
+    Data goes to a temporary file that only replaces the session file on
+    close(). Files written this way carry no time-bounds metadata (the bounds
+    are not known when the header is written), so readers derive them from
+    the time column.
+    """
+
+    def __init__(self, store: ColumnarSessionStore, session_id: str):
+        self.store = store
+        self.session_id = session_id
+        self.target = store.session_path(session_id)
+        self.tmp_path = self.target.with_suffix(self.target.suffix + ".tmp")
+        self.rows_written = 0
+        self._sink = None
+        self._writer = None
+        self._schema = None
+
+    def write(self, df: pd.DataFrame) -> None:
+        """Append a chunk of session rows."""
+        time_column = self.store.TIME_COLUMN
+        if time_column in df.columns and not df[time_column].is_monotonic_increasing:
+            df = df.sort_values(time_column, kind="stable")
+
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            if self._writer is None:
+                self._schema = table.schema.remove_metadata()
+                self.store.base_dir.mkdir(parents=True, exist_ok=True)
+                options = ipc.IpcWriteOptions(compression=self.store.compression)
+                self._sink = pa.OSFile(str(self.tmp_path), "wb")
+                self._writer = ipc.new_file(self._sink, self._schema, options=options)
+            else:
+                table = table.select(self._schema.names).cast(self._schema)
+
+            for batch in table.to_batches(max_chunksize=self.store.batch_rows):
+                self._writer.write_batch(batch)
+        except Exception as e:
+            self.abort()
+            raise ColumnarStoreError(f"Failed to append columnar data for {self.session_id}: {e}")
+
+        self.rows_written += len(df)
+
+    def close(self) -> Optional[Path]:
+        """
+        Finish the file and move it into place.
+
+        Returns:
+            Path of the written file, or None if nothing was written
+        """
+        if self._writer is None:
+            return None
+
+        try:
+            self._writer.close()
+            self._sink.close()
+            os.replace(self.tmp_path, self.target)
+        except Exception as e:
+            self.abort()
+            raise ColumnarStoreError(f"Failed to write columnar file for {self.session_id}: {e}")
+        finally:
+            self._writer = None
+            self._sink = None
+
+        logger.info(
+            f"Columnar session written: {self.target.name} "
+            f"({self.rows_written} rows, streamed, codec={self.store.compression})"
+        )
+        return self.target
+
+    def abort(self) -> None:
+        """Discard the partially written file."""
+        for handle in (self._writer, self._sink):
+            if handle is not None:
+                try:
+                    handle.close()
+                except Exception:
+                    pass
+        self._writer = None
+        self._sink = None
+        self.tmp_path.unlink(missing_ok=True)
@@ -10,7 +10,7 @@ Created: 2025-01-02
 
 import csv
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
 import pandas as pd
 
@@ -489,25 +489,51 @@ class CSVParser:
 
     def _parse_csv_chunks(self, file_path: Path, validate_types: bool) -> pd.DataFrame:
         """Parse CSV in chunks for memory efficiency."""
-        chunks = []
+        chunks = list(self.iter_csv_chunks(file_path, validate_types=validate_types))
+
+        # Combine chunks
+        df = pd.concat(chunks, ignore_index=True)
+        logger.info(f"CSV parseado em chunks: {len(df)} linhas, {len(df.columns)} colunas")
+        return df
+
+    def iter_csv_chunks(
+        self,
+        source,
+        validate_types: bool = True,
+        chunk_size: Optional[int] = None,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Parse CSV lazily, yielding normalized chunks.
+
+        Each chunk goes through header normalization, invalid data cleaning
+        and type conversion before being yielded, so only one chunk is held
+        in memory at a time.
+
+        Args:
+            source: Path to CSV file or open binary/text file object
+            validate_types: Apply data type validation
+            chunk_size: Rows per chunk (default: parser chunk_size)
+
+        Yields:
+            Parsed DataFrame chunks with normalized columns
+        """
+        if isinstance(source, (str, Path)) and not self.detected_version:
+            self.detect_csv_format(source)
 
         chunk_reader = pd.read_csv(
-            file_path,
+            source,
             encoding=self.encoding,
             sep=",",
-            chunksize=self.chunk_size,
+            chunksize=chunk_size or self.chunk_size,
             low_memory=False,
         )
 
         normalized_headers = None
         for i, chunk in enumerate(chunk_reader):
-            # Normalize headers on first chunk and store them
-            if i == 0:
+            # Normalize headers on first chunk and reuse them for all chunks
+            if normalized_headers is None:
                 normalized_headers = self.normalize_headers(chunk.columns.tolist())
-                chunk.columns = normalized_headers
-            else:
-                # Use the same normalized headers for all chunks
-                chunk.columns = normalized_headers
+            chunk.columns = normalized_headers
 
             # Clean invalid data
             chunk = self._clean_invalid_data(chunk)
@@ -516,13 +542,8 @@ class CSVParser:
             if validate_types:
                 chunk = self._apply_data_types(chunk)
 
-            chunks.append(chunk)
             logger.debug(f"Processado chunk {i+1}: {len(chunk)} linhas")
-
-        # Combine chunks
-        df = pd.concat(chunks, ignore_index=True)
-        logger.info(f"CSV parseado em chunks: {len(df)} linhas, {len(df.columns)} colunas")
-        return df
+            yield chunk
 
     def _clean_invalid_data(self, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -554,7 +575,7 @@ class CSVParser:
         }
 
         # Marcar linhas para remoção
-        rows_to_remove = pd.Series([False] * len(df))
+        rows_to_remove = pd.Series(False, index=df.index)
 
         for col in df.columns:
             # Normalizar nome da coluna para comparação
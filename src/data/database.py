@@ -12,18 +12,21 @@ import hashlib
 from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
-from sqlalchemy import or_
-from sqlalchemy.sql import func
+from sqlalchemy import Integer, String, func, or_, select
 
 from ..utils.logging_config import get_logger
+from .cache import get_cache_manager
+from .columnar_store import ColumnarSessionStore, ColumnarStoreError
 from .csv_parser import CSVParser
 from .models import DatabaseManager as BaseDBManager
-from .models import DataQualityCheck, DataSession, FuelTechCoreData, Vehicle
+from .models import DataQualityCheck, DataSession, FuelTechCoreData, SessionSummary, Vehicle
 from .normalizer import normalize_fueltech_data
 from .quality import assess_fueltech_data_quality
+from .session_summary import SessionSummaryAccumulator, summarize_session
 from .validators import validate_fueltech_data
 
 logger = get_logger(__name__)
@@ -47,15 +50,31 @@ class FuelTechDatabase:
     - Query interface
     - Export capabilities
     - Data quality tracking
+    - Columnar (Arrow IPC) session copies for fast column/time-range reads
+    - Streaming (chunked) import for large logs
+    - Per-session summary statistics written at import time
     """
 
-    def __init__(self, db_path: str = "data/fueltech_data.db", create_tables: bool = True):
+    # Streaming import: rows kept for quality assessment and validation issues kept per kind
+    QUALITY_SAMPLE_ROWS = 100000
+    MAX_STREAMED_ISSUES = 100
+
+    def __init__(
+        self,
+        db_path: str = "data/fueltech_data.db",
+        create_tables: bool = True,
+        columnar_dir: Optional[Union[str, Path]] = None,
+        enable_columnar_store: bool = True,
+    ):
         """
         Initialize FuelTech database.
 
         Args:
             db_path: Path to SQLite database file
             create_tables: Whether to create tables if they don't exist
+            columnar_dir: Directory for per-session columnar files
+                (default: ``sessions/`` next to the database file)
+            enable_columnar_store: Write/read columnar session files when pyarrow is available
         """
         self.db_path = Path(db_path)
         self.database_url = f"sqlite:///{self.db_path.absolute()}"
@@ -63,6 +82,15 @@ class FuelTechDatabase:
         # Initialize base database manager
         self.db_manager = BaseDBManager(self.database_url)
 
+        # Columnar copy of each session, keyed by session_id
+        self.columnar_store = None
+        if enable_columnar_store:
+            store = ColumnarSessionStore(columnar_dir or self.db_path.parent / "sessions")
+            if store.available:
+                self.columnar_store = store
+            else:
+                logger.info("pyarrow not installed; columnar session store disabled")
+
         if create_tables:
             self.initialize_database()
 
@@ -197,8 +225,9 @@ class FuelTechDatabase:
             normalization_stats = None
             if normalize_data:
                 logger.info("Step 3: Normalizing data")
+                # The parsed frame is ours, so normalize it in place (columnar mode)
                 df, normalization_stats = normalize_fueltech_data(
-                    df, outlier_method="clip", missing_method="interpolate"
+                    df, outlier_method="clip", missing_method="interpolate", inplace=True
                 )
                 import_results["steps_completed"].append("data_normalization")
                 import_results["normalization_stats"] = normalization_stats
@@ -252,8 +281,23 @@ class FuelTechDatabase:
 
             # Step 6: Insert data records
             logger.info("Step 6: Inserting data records")
-            self._insert_data_records(df, session_record.id, parser.detected_version)
+            inserted_df = self._insert_data_records(df, session_record.id, parser.detected_version)
             import_results["steps_completed"].append("data_insertion")
+            import_results["inserted_records"] = len(inserted_df)
+
+            # Step 6b: Write columnar copy (non-fatal: SQLite remains the source of truth)
+            if self.columnar_store is not None:
+                try:
+                    self._write_columnar_session(inserted_df, session_record.id)
+                    import_results["steps_completed"].append("columnar_storage")
+                except ColumnarStoreError as e:
+                    logger.warning(str(e))
+                    import_results["warnings"].append(f"Columnar storage skipped: {e}")
+
+            # Step 6c: Precompute summary statistics for dashboards and listings
+            self._store_session_summary(
+                session_record.id, summarize_session(inserted_df), import_results
+            )
 
             # Step 7: Insert quality check results
             if quality_results:
@@ -276,32 +320,313 @@ class FuelTechDatabase:
         except Exception as e:
             import_results["status"] = "failed"
 
-            # Handle specific constraint errors
-            error_msg = str(e)
-            if "CHECK constraint failed: chk_g_accel_range" in error_msg:
-                user_friendly_msg = (
-                    "Erro: Valores de g_force_accel fora do range permitido (-7.0 a 7.0). "
-                    "Verifique se os dados estão corretos ou se o arquivo foi modificado."
-                )
-                import_results["errors"].append(user_friendly_msg)
-                import_results["error_type"] = "constraint_g_accel_range"
-            elif "CHECK constraint failed: chk_g_lateral_range" in error_msg:
-                user_friendly_msg = (
-                    "Erro: Valores de g_force_lateral fora do range permitido (-7.0 a 7.0). "
-                    "Verifique se os dados estão corretos ou se o arquivo foi modificado."
+            error_msg = self._record_import_error(import_results, e)
+            logger.error(f"Import failed: {error_msg}")
+
+            # Update session status if record was created
+            if "session_id" in import_results:
+                try:
+                    with self.get_session() as db:
+                        db.query(DataSession).filter(
+                            DataSession.id == import_results["session_id"]
+                        ).update({"import_status": "failed"})
+                        db.commit()
+                except Exception:
+                    pass  # Don't fail again if status update fails
+
+            raise DataImportError(f"Import failed: {import_results['errors'][0]}")
+
+        return import_results
+
+    @staticmethod
+    def _record_import_error(import_results: Dict[str, Any], error: Exception) -> str:
+        """Append a user-facing message for an import failure and return the raw message."""
+        # Handle specific constraint errors
+        error_msg = str(error)
+        if "CHECK constraint failed: chk_g_accel_range" in error_msg:
+            user_friendly_msg = (
+                "Erro: Valores de g_force_accel fora do range permitido (-7.0 a 7.0). "
+                "Verifique se os dados estão corretos ou se o arquivo foi modificado."
+            )
+            import_results["errors"].append(user_friendly_msg)
+            import_results["error_type"] = "constraint_g_accel_range"
+        elif "CHECK constraint failed: chk_g_lateral_range" in error_msg:
+            user_friendly_msg = (
+                "Erro: Valores de g_force_lateral fora do range permitido (-7.0 a 7.0). "
+                "Verifique se os dados estão corretos ou se o arquivo foi modificado."
+            )
+            import_results["errors"].append(user_friendly_msg)
+            import_results["error_type"] = "constraint_g_lateral_range"
+        elif "CHECK constraint failed" in error_msg:
+            import_results["errors"].append(f"Erro de validação de dados: {error_msg}")
+            import_results["error_type"] = "constraint_violation"
+        else:
+            import_results["errors"].append(error_msg)
+            import_results["error_type"] = "general_error"
+
+        return error_msg
+
+    def import_csv_file_streaming(
+        self,
+        file_path: Union[str, Path],
+        session_name: Optional[str] = None,
+        force_reimport: bool = False,
+        validate_data: bool = True,
+        normalize_data: bool = True,
+        assess_quality: bool = True,
+        chunk_size: int = 50000,
+        batch_size: Optional[int] = None,
+        progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Import CSV file chunk by chunk with bounded memory.
+
+        Each chunk is parsed, validated, normalized and inserted before the
+        next one is read, so peak memory depends on chunk_size rather than on
+        the file size. Differences from import_csv_file:
+
+        - Normalization (outlier clipping, interpolation) is computed per chunk
+        - Quality is assessed on a systematic sample of at most
+          QUALITY_SAMPLE_ROWS rows
+        - The session record is created after the first chunk and its
+          statistics are filled in once the whole file has been read
+
+        Args:
+            file_path: Path to CSV file
+            session_name: Custom session name (default: filename)
+            force_reimport: Force reimport even if file already exists
+            validate_data: Validate each chunk before insertion
+            normalize_data: Normalize each chunk before insertion
+            assess_quality: Assess data quality on the sampled rows
+            chunk_size: Rows parsed per chunk
+            batch_size: Rows per INSERT batch (default: DatabaseManager default)
+            progress_callback: Called after each chunk with a progress dict
+                (chunk, rows_read, rows_inserted, bytes_read, total_bytes, fraction)
+
+        Returns:
+            Dictionary with import results and statistics
+        """
+        file_path = Path(file_path)
+
+        if not file_path.exists():
+            raise DataImportError(f"File not found: {file_path}")
+
+        file_hash = self.calculate_file_hash(file_path)
+
+        existing_session = self.db_manager.get_session_by_hash(file_hash)
+        if existing_session:
+            if not force_reimport:
+                logger.info(f"File already imported as session {existing_session.id}")
+                return {
+                    "status": "skipped",
+                    "reason": "file_already_imported",
+                    "session_id": existing_session.id,
+                    "session_name": existing_session.session_name,
+                }
+            logger.info(f"Force reimport: Deleting existing session {existing_session.id}")
+            if not self.delete_session(existing_session.id, confirm=True):
+                raise DataImportError("Failed to delete existing session for force reimport")
+
+        logger.info(f"Starting streaming import of {file_path.name}")
+
+        import_results = {
+            "status": "processing",
+            "file_path": str(file_path),
+            "file_hash": file_hash,
+            "import_timestamp": datetime.now(),
+            "steps_completed": [],
+            "errors": [],
+            "warnings": [],
+        }
+
+        parser = CSVParser(chunk_size=chunk_size)
+        total_bytes = file_path.stat().st_size
+        columnar_writer = None
+
+        # Running statistics across chunks
+        rows_read = 0
+        rows_inserted = 0
+        time_min = time_max = None
+        interval_medians = []
+        validation_summary = {"is_valid": True, "errors": [], "warnings": [], "chunks": 0}
+        sample_parts = []
+        sample_stride = 1
+        summary = SessionSummaryAccumulator()
+
+        try:
+            parser.detect_csv_format(file_path)
+            file_info = parser.get_file_info(file_path)
+
+            with open(file_path, "rb") as handle:
+                chunks = parser.iter_csv_chunks(handle, validate_types=True)
+                for chunk_number, chunk in enumerate(chunks, start=1):
+                    if chunk.empty:
+                        continue
+                    chunk.index = pd.RangeIndex(rows_read, rows_read + len(chunk))
+                    rows_read += len(chunk)
+
+                    if validate_data:
+                        self._merge_chunk_validation(
+                            validation_summary,
+                            validate_fueltech_data(chunk, parser.detected_version),
+                        )
+
+                    if normalize_data:
+                        chunk, _ = normalize_fueltech_data(
+                            chunk,
+                            outlier_method="clip",
+                            missing_method="interpolate",
+                            inplace=True,
+                        )
+
+                    if "session_id" not in import_results:
+                        session_record = self.db_manager.create_session_record(
+                            session_name=session_name or file_path.stem,
+                            filename=file_path.name,
+                            file_hash=file_hash,
+                            format_version=parser.detected_version,
+                            field_count=len(chunk.columns),
+                            file_size_mb=file_info.get("file_size_mb"),
+                            original_encoding=parser.encoding,
+                            import_status="processing",
+                            metadata_json={
+                                "import_config": {
+                                    "validate_data": validate_data,
+                                    "normalize_data": normalize_data,
+                                    "assess_quality": assess_quality,
+                                    "streaming": True,
+                                    "chunk_size": chunk_size,
+                                },
+                                "file_info": file_info,
+                                "processing_timestamp": datetime.now().isoformat(),
+                            },
+                        )
+                        import_results["session_id"] = session_record.id
+                        import_results["session_name"] = session_record.session_name
+                        import_results["format_version"] = parser.detected_version
+                        import_results["field_count"] = len(chunk.columns)
+
+                        if self.columnar_store is not None:
+                            columnar_writer = self.columnar_store.open_writer(session_record.id)
+
+                    inserted = self._insert_data_records(
+                        chunk,
+                        import_results["session_id"],
+                        parser.detected_version,
+                        batch_size=batch_size,
+                    )
+                    rows_inserted += len(inserted)
+                    summary.update(inserted)
+
+                    if columnar_writer is not None:
+                        try:
+                            columnar_writer.write(self._columnar_frame(inserted))
+                        except ColumnarStoreError as e:
+                            logger.warning(str(e))
+                            import_results["warnings"].append(f"Columnar storage skipped: {e}")
+                            columnar_writer = None
+
+                    if "time" in chunk.columns and chunk["time"].notna().any():
+                        chunk_min, chunk_max = chunk["time"].min(), chunk["time"].max()
+                        time_min = chunk_min if time_min is None else min(time_min, chunk_min)
+                        time_max = chunk_max if time_max is None else max(time_max, chunk_max)
+                        interval = chunk["time"].diff().median()
+                        if pd.notna(interval):
+                            interval_medians.append(interval)
+
+                    if assess_quality:
+                        sample_stride = self._update_quality_sample(
+                            sample_parts, chunk, sample_stride
+                        )
+
+                    if progress_callback is not None:
+                        bytes_read = min(handle.tell(), total_bytes)
+                        progress_callback(
+                            {
+                                "chunk": chunk_number,
+                                "rows_read": rows_read,
+                                "rows_inserted": rows_inserted,
+                                "bytes_read": bytes_read,
+                                "total_bytes": total_bytes,
+                                "fraction": bytes_read / total_bytes if total_bytes else 1.0,
+                            }
+                        )
+
+            if "session_id" not in import_results:
+                raise DataImportError("CSV file contains no data rows")
+
+            session_id = import_results["session_id"]
+            import_results["steps_completed"] += ["csv_parsing", "session_creation"]
+            import_results["total_records"] = rows_read
+            import_results["inserted_records"] = rows_inserted
+
+            if validate_data:
+                import_results["steps_completed"].append("data_validation")
+                import_results["validation_results"] = validation_summary
+                if not validation_summary["is_valid"]:
+                    import_results["warnings"].append(
+                        f"Validation issues found: {len(validation_summary['errors'])} errors"
+                    )
+            if normalize_data:
+                import_results["steps_completed"].append("data_normalization")
+            import_results["steps_completed"].append("data_insertion")
+
+            if columnar_writer is not None:
+                try:
+                    columnar_writer.close()
+                    import_results["steps_completed"].append("columnar_storage")
+                except ColumnarStoreError as e:
+                    logger.warning(str(e))
+                    import_results["warnings"].append(f"Columnar storage skipped: {e}")
+                columnar_writer = None
+
+            self._store_session_summary(session_id, summary.result(), import_results)
+
+            quality_results = None
+            if assess_quality and sample_parts:
+                sample = pd.concat(sample_parts).reset_index(drop=True)
+                quality_results = assess_fueltech_data_quality(sample)
+                quality_results["sample_rows"] = len(sample)
+                import_results["steps_completed"].append("quality_assessment")
+                import_results["quality_results"] = quality_results
+                self._insert_quality_results(quality_results, session_id)
+                import_results["steps_completed"].append("quality_results_insertion")
+
+            with self.get_session() as db:
+                db.query(DataSession).filter(DataSession.id == session_id).update(
+                    {
+                        "total_records": rows_read,
+                        "duration_seconds": (
+                            float(time_max - time_min) if time_min is not None else None
+                        ),
+                        "sample_rate_hz": (
+                            float(1 / np.median(interval_medians)) if interval_medians else None
+                        ),
+                        "quality_score": (
+                            quality_results.get("overall_score") if quality_results else None
+                        ),
+                        "validation_status": (
+                            "valid"
+                            if validate_data and validation_summary["is_valid"]
+                            else "invalid"
+                        ),
+                        "import_status": "completed",
+                    }
                 )
-                import_results["errors"].append(user_friendly_msg)
-                import_results["error_type"] = "constraint_g_lateral_range"
-            elif "CHECK constraint failed" in error_msg:
-                import_results["errors"].append(f"Erro de validação de dados: {error_msg}")
-                import_results["error_type"] = "constraint_violation"
-            else:
-                import_results["errors"].append(error_msg)
-                import_results["error_type"] = "general_error"
+                db.commit()
+
+            import_results["status"] = "completed"
+            import_results["steps_completed"].append("status_update")
+            logger.info(f"Streaming import completed for session {session_id}: {rows_read} rows")
 
+        except Exception as e:
+            import_results["status"] = "failed"
+            if columnar_writer is not None:
+                columnar_writer.abort()
+
+            error_msg = self._record_import_error(import_results, e)
             logger.error(f"Import failed: {error_msg}")
 
-            # Update session status if record was created
             if "session_id" in import_results:
                 try:
                     with self.get_session() as db:
@@ -316,8 +641,42 @@ class FuelTechDatabase:
 
         return import_results
 
-    def _insert_data_records(self, df: pd.DataFrame, session_id: str, version: str) -> None:
-        """Insert data records into appropriate tables."""
+    @staticmethod
+    def _merge_chunk_validation(summary: Dict[str, Any], chunk_results: Dict[str, Any]) -> None:
+        """Fold the validation results of one chunk into the running summary."""
+        summary["chunks"] += 1
+        summary["is_valid"] = summary["is_valid"] and bool(chunk_results.get("is_valid", True))
+        for key in ("errors", "warnings"):
+            room = FuelTechDatabase.MAX_STREAMED_ISSUES - len(summary[key])
+            if room > 0:
+                summary[key].extend(list(chunk_results.get(key) or [])[:room])
+
+    @staticmethod
+    def _update_quality_sample(parts: List[pd.DataFrame], chunk: pd.DataFrame, stride: int) -> int:
+        """
+        Keep every stride-th row (by global row number) for quality assessment.
+
+        The stride doubles whenever the sample would exceed QUALITY_SAMPLE_ROWS,
+        so the sample stays evenly spread over the whole file.
+        """
+        parts.append(chunk[chunk.index % stride == 0])
+        while sum(len(p) for p in parts) > FuelTechDatabase.QUALITY_SAMPLE_ROWS:
+            stride *= 2
+            parts[:] = [p[p.index % stride == 0] for p in parts]
+        return stride
+
+    def _insert_data_records(
+        self, df: pd.DataFrame, session_id: str, version: str, batch_size: Optional[int] = None
+    ) -> pd.DataFrame:
+        """
+        Insert data records into the unified core table.
+
+        Core fields and, for v2.0 files, the unified extended fields are cleaned
+        and inserted in a single vectorized pass.
+
+        Returns:
+            The cleaned DataFrame exactly as inserted
+        """
         # Prepare core data (always present)
         core_fields = [
             "time",
@@ -359,49 +718,110 @@ class FuelTechDatabase:
             "fuel_pump",
         ]
 
-        # Filter to existing columns
-        available_core_fields = [f for f in core_fields if f in df.columns]
-        core_data = df[available_core_fields].to_dict("records")
+        fields = list(core_fields)
+        if version == "v2.0":
+            # Extended fields live in the unified core table
+            fields += self.db_manager.EXTENDED_FIELDS
+
+        available_fields = [f for f in fields if f in df.columns]
+        cleaned, skipped = self.db_manager.prepare_core_dataframe(df[available_fields])
+        if skipped > 0:
+            logger.warning(f"Skipped {skipped} records with invalid values")
+
+        self.db_manager.bulk_insert_core_dataframe(
+            session_id, cleaned, batch_size=batch_size, clean=False
+        )
+        return cleaned
+
+    def _write_columnar_session(self, df: pd.DataFrame, session_id: str) -> None:
+        """Write the persisted columns of a session to the columnar store."""
+        self.columnar_store.write_session(session_id, self._columnar_frame(df))
+
+    def _columnar_frame(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Select the columns persisted in the core table, as written to the columnar store."""
+        table_columns = FuelTechCoreData.__table__.columns.keys()
+        persisted = [c for c in df.columns if c in table_columns and c not in self.KEY_COLUMNS]
+        return df[persisted]
+
+    def _store_session_summary(
+        self, session_id: str, summary: Dict[str, Any], import_results: Dict[str, Any]
+    ) -> None:
+        """Persist the session summary during import (non-fatal: it can be backfilled)."""
+        try:
+            self.save_session_summary(session_id, summary)
+            import_results["steps_completed"].append("session_summary")
+        except Exception as e:
+            logger.warning(f"Session summary skipped for {session_id}: {e}")
+            import_results["warnings"].append(f"Session summary skipped: {e}")
 
-        # Insert core data
-        self.db_manager.bulk_insert_core_data(session_id, core_data)
+    def save_session_summary(self, session_id: str, summary: Dict[str, Any]) -> None:
+        """
+        Insert or replace the summary statistics of a session.
 
-        # Include extended fields in core insert if present (schema unified)
-        if version == "v2.0":
-            unified_fields = [
-                "total_consumption",
-                "average_consumption",
-                "instant_consumption",
-                "estimated_power",
-                "estimated_torque",
-                "total_distance",
-                "range",
-                "traction_speed",
-                "acceleration_speed",
-                "traction_control_slip",
-                "traction_control_slip_rate",
-                "delta_tps",
-                "g_force_accel",
-                "g_force_lateral",
-                "pitch_angle",
-                "pitch_rate",
-                "roll_angle",
-                "roll_rate",
-                "heading",
-                "acceleration_distance",
-                "g_force_accel_raw",
-                "g_force_lateral_raw",
-                "accel_enrichment",
-                "decel_enrichment",
-                "injection_cutoff",
-                "after_start_injection",
-                "start_button_toggle",
-            ]
-            # Merge into core records by index
-            for i, rec in enumerate(core_data):
-                for f in unified_fields:
-                    if f in df.columns:
-                        rec[f] = df.iloc[i].get(f)
+        Args:
+            session_id: Session ID
+            summary: Summary as returned by summarize_session
+        """
+        with self.get_session() as db:
+            db.merge(
+                SessionSummary(
+                    session_id=session_id,
+                    record_count=summary["record_count"],
+                    time_min=summary["time_min"],
+                    time_max=summary["time_max"],
+                    duration_seconds=summary["duration_seconds"],
+                    sample_rate_hz=summary["sample_rate_hz"],
+                    column_stats=summary["columns"],
+                    product_stats=summary["products"],
+                )
+            )
+            db.commit()
+
+    def get_session_summary(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the precomputed summary statistics of a session.
+
+        Args:
+            session_id: Session ID
+
+        Returns:
+            Summary dictionary, or None if the session has no summary yet
+        """
+        with self.get_session() as db:
+            record = db.get(SessionSummary, session_id)
+            return record.to_dict() if record is not None else None
+
+    def backfill_session_summaries(self, force: bool = False) -> Dict[str, int]:
+        """
+        Compute summaries for sessions imported before summaries existed.
+
+        Args:
+            force: Recompute summaries that already exist
+
+        Returns:
+            Counts of sessions processed, skipped (no data) and failed
+        """
+        with self.get_session() as db:
+            query = db.query(DataSession.id).filter(DataSession.import_status == "completed")
+            if not force:
+                query = query.outerjoin(SessionSummary).filter(SessionSummary.session_id.is_(None))
+            session_ids = [row[0] for row in query.all()]
+
+        results = {"processed": 0, "skipped": 0, "failed": 0}
+        for session_id in session_ids:
+            try:
+                df = self.load_session_frame(session_id)
+                if df.empty:
+                    results["skipped"] += 1
+                    continue
+                self.save_session_summary(session_id, summarize_session(df))
+                results["processed"] += 1
+            except Exception as e:
+                logger.error(f"Failed to summarize session {session_id}: {e}")
+                results["failed"] += 1
+
+        logger.info(f"Session summary backfill: {results}")
+        return results
 
     def _insert_quality_results(self, quality_results: Dict[str, Any], session_id: str) -> None:
         """Insert quality assessment results.
@@ -484,6 +904,9 @@ class FuelTechDatabase:
         """Get all data sessions with summary information."""
         return self.db_manager.get_sessions_summary()
 
+    # Columns that identify rows rather than carry data
+    KEY_COLUMNS = ("id", "session_id")
+
     def get_session_data(
         self,
         session_id: str,
@@ -494,6 +917,8 @@ class FuelTechDatabase:
         """
         Get data for a specific session.
 
+        Column selection and time range are pushed into the SQL query.
+
         Args:
             session_id: Session ID
             include_extended: Include extended data fields
@@ -503,27 +928,202 @@ class FuelTechDatabase:
         Returns:
             DataFrame with session data
         """
-        with self.get_session() as db:
-            # Build query for core data
-            query = db.query(FuelTechCoreData).filter(FuelTechCoreData.session_id == session_id)
+        # include_extended is kept for compatibility; unified table already has these fields
+        return self.load_session_frame(
+            session_id,
+            columns=columns or list(FuelTechCoreData.__table__.columns.keys()),
+            time_range=time_range,
+            use_columnar=False,
+        )
+
+    def load_session_frame(
+        self,
+        session_id: str,
+        columns: Optional[List[str]] = None,
+        time_range: Optional[Tuple[float, float]] = None,
+        step: Optional[int] = None,
+        max_points: Optional[int] = None,
+        limit: Optional[int] = None,
+        descending: bool = False,
+        use_columnar: bool = True,
+    ) -> pd.DataFrame:
+        """
+        Load session data with projection, filtering and decimation pushed down.
+
+        This is the shared loader for analysis and UI pages. When a columnar
+        file exists for the session (and ``use_columnar`` is set) it is read
+        directly; otherwise a single SQL query selects only the requested
+        columns, applies the time window, decimation, ordering and limit, and
+        the result is converted column-wise into typed NumPy arrays.
 
-            if time_range:
-                query = query.filter(
-                    FuelTechCoreData.time >= time_range[0],
-                    FuelTechCoreData.time <= time_range[1],
+        Args:
+            session_id: Session ID
+            columns: Columns to retrieve (default: all data columns). Unknown
+                columns are ignored.
+            time_range: Optional inclusive time range (start, end)
+            step: Keep every ``step``-th sample (in time order)
+            max_points: Decimate so that at most ``max_points`` samples are returned
+                (ignored when ``step`` is given)
+            limit: Maximum number of rows, taken from the start of the ordering
+            descending: Order by time descending (e.g. latest samples first)
+            use_columnar: Prefer the columnar store when available
+
+        Returns:
+            DataFrame with the requested columns (empty if no data)
+        """
+        table_columns = FuelTechCoreData.__table__.columns
+        if columns:
+            selected = [c for c in dict.fromkeys(columns) if c in table_columns]
+        else:
+            selected = [c for c in table_columns.keys() if c not in self.KEY_COLUMNS]
+
+        if use_columnar and (
+            self.columnar_store is not None and self.columnar_store.has_session(session_id)
+        ):
+            df = self._load_session_frame_columnar(
+                session_id, selected, time_range, step, max_points, limit, descending
+            )
+            if df is not None:
+                return df
+
+        return self._load_session_frame_sql(
+            session_id, selected, time_range, step, max_points, limit, descending
+        )
+
+    def _load_session_frame_columnar(
+        self,
+        session_id: str,
+        selected: List[str],
+        time_range: Optional[Tuple[float, float]],
+        step: Optional[int],
+        max_points: Optional[int],
+        limit: Optional[int],
+        descending: bool,
+    ) -> Optional[pd.DataFrame]:
+        """Columnar branch of load_session_frame."""
+        data_columns = [c for c in selected if c not in self.KEY_COLUMNS]
+        df = self.get_session_data_columnar(session_id, columns=data_columns, time_range=time_range)
+        if df is None:
+            return None
+
+        step = step or self._decimation_step(len(df), max_points)
+        if step > 1:
+            df = df.iloc[::step]
+        if descending:
+            df = df.iloc[::-1]
+        if limit:
+            df = df.iloc[:limit]
+
+        df = df.reset_index(drop=True)
+        for col in selected:
+            if col == "session_id":
+                df[col] = session_id
+            elif col not in df.columns:
+                # Column absent from the source file: stored as NULL in SQLite too
+                df[col] = None if col == "id" else np.nan
+        return df[selected]
+
+    def _load_session_frame_sql(
+        self,
+        session_id: str,
+        selected: List[str],
+        time_range: Optional[Tuple[float, float]],
+        step: Optional[int],
+        max_points: Optional[int],
+        limit: Optional[int],
+        descending: bool,
+    ) -> pd.DataFrame:
+        """SQL branch of load_session_frame."""
+        table = FuelTechCoreData.__table__
+        conditions = [table.c.session_id == session_id]
+        if time_range:
+            conditions += [table.c.time >= time_range[0], table.c.time <= time_range[1]]
+
+        with self.db_manager.engine.connect() as conn:
+            if not step and max_points:
+                total = conn.execute(
+                    select(func.count()).select_from(table).where(*conditions)
+                ).scalar()
+                step = self._decimation_step(total, max_points)
+
+            if step and step > 1:
+                # Number samples in time order and keep every step-th one
+                row_number = func.row_number().over(order_by=table.c.time).label("_row_number")
+                inner = list(dict.fromkeys(selected + ["time"]))
+                numbered = select(*[table.c[c] for c in inner], row_number)
+                numbered = numbered.where(*conditions).subquery()
+                stmt = select(*[numbered.c[c] for c in selected]).where(
+                    (numbered.c._row_number - 1) % step == 0
                 )
+                time_column = numbered.c.time
+            else:
+                stmt = select(*[table.c[c] for c in selected]).where(*conditions)
+                time_column = table.c.time
+
+            stmt = stmt.order_by(time_column.desc() if descending else time_column)
+            if limit:
+                stmt = stmt.limit(limit)
+
+            rows = conn.execute(stmt).fetchall()
+
+        return self._rows_to_frame(rows, selected)
+
+    @staticmethod
+    def _decimation_step(total: int, max_points: Optional[int]) -> int:
+        """Step that brings ``total`` samples down to at most ``max_points``."""
+        if not max_points or total <= max_points:
+            return 1
+        return int(np.ceil(total / max_points))
+
+    @staticmethod
+    def _rows_to_frame(rows: List[Tuple], columns: List[str]) -> pd.DataFrame:
+        """Build a typed DataFrame column-wise from cursor rows."""
+        table_columns = FuelTechCoreData.__table__.columns
+        values = list(zip(*rows)) if rows else [()] * len(columns)
+
+        data = {}
+        for col, col_values in zip(columns, values):
+            col_type = table_columns[col].type
+            if isinstance(col_type, String):
+                data[col] = np.array(col_values, dtype=object)
+            elif isinstance(col_type, Integer) and None not in col_values:
+                data[col] = np.array(col_values, dtype=np.int64)
+            else:
+                # None becomes NaN
+                data[col] = np.array(col_values, dtype=np.float64)
 
-            # Convert to DataFrame
-            core_data = pd.read_sql(query.statement, db.bind)
+        return pd.DataFrame(data, columns=columns)
 
-            # include_extended is kept for compatibility; unified table already has these fields
+    def get_session_data_columnar(
+        self,
+        session_id: str,
+        columns: Optional[List[str]] = None,
+        time_range: Optional[Tuple[float, float]] = None,
+    ) -> Optional[pd.DataFrame]:
+        """
+        Get session data from the columnar store without touching SQLite.
 
-            # Filter columns if specified
-            if columns:
-                available_columns = [col for col in columns if col in core_data.columns]
-                core_data = core_data[available_columns]
+        The session file is memory-mapped; only the requested columns are
+        decoded and only record batches overlapping ``time_range`` are read.
 
-            return core_data
+        Args:
+            session_id: Session ID
+            columns: Specific columns to retrieve (default: all stored columns)
+            time_range: Optional inclusive time range (start, end)
+
+        Returns:
+            DataFrame with session data, or None if no columnar file exists
+        """
+        if self.columnar_store is None or not self.columnar_store.has_session(session_id):
+            return None
+
+        try:
+            return self.columnar_store.read_session(
+                session_id, columns=columns, time_range=time_range
+            )
+        except Exception as e:
+            logger.warning(f"Columnar read failed for session {session_id}: {str(e)}")
+            return None
 
     def get_session_quality(self, session_id: str) -> Dict[str, Any]:
         """Get quality assessment results for a session."""
@@ -608,6 +1208,15 @@ class FuelTechDatabase:
             db.delete(session_record)
             db.commit()
 
+            if self.columnar_store is not None:
+                self.columnar_store.delete_session(session_id)
+
+            # Cached analysis results and frames of this session are stale now
+            try:
+                get_cache_manager().invalidate_session(session_id)
+            except Exception as e:
+                logger.warning(f"Failed to invalidate cache for session {session_id}: {e}")
+
             logger.info(f"Deleted session {session_id}")
             return True
 
@@ -628,8 +1237,24 @@ class FuelTechDatabase:
                 "failed": total_sessions - completed_sessions,
             }
 
-            # Data statistics
-            total_core_records = db.query(FuelTechCoreData).count()
+            # Data statistics: summarized sessions are counted from session_summary,
+            # only sessions without a summary touch the core table
+            total_core_records = db.query(
+                func.coalesce(func.sum(SessionSummary.record_count), 0)
+            ).scalar()
+            unsummarized = [
+                row[0]
+                for row in db.query(DataSession.id)
+                .outerjoin(SessionSummary)
+                .filter(SessionSummary.session_id.is_(None))
+                .all()
+            ]
+            if unsummarized:
+                total_core_records += (
+                    db.query(FuelTechCoreData)
+                    .filter(FuelTechCoreData.session_id.in_(unsummarized))
+                    .count()
+                )
 
             stats["records"] = {
                 "core_data": total_core_records,
@@ -915,13 +1540,27 @@ def get_vehicle_statistics(vehicle_id: str) -> dict:
                 .first()
             )
 
-            # Contar registros de dados
+            # Contar registros de dados (resumo pré-calculado; varre só sessões sem resumo)
             core_data_count = (
-                session.query(FuelTechCoreData)
+                session.query(func.coalesce(func.sum(SessionSummary.record_count), 0))
+                .select_from(SessionSummary)
                 .join(DataSession)
                 .filter(DataSession.vehicle_id == vehicle_id)
-                .count()
+                .scalar()
             )
+            unsummarized = [
+                row[0]
+                for row in session.query(DataSession.id)
+                .outerjoin(SessionSummary)
+                .filter(DataSession.vehicle_id == vehicle_id, SessionSummary.session_id.is_(None))
+                .all()
+            ]
+            if unsummarized:
+                core_data_count += (
+                    session.query(FuelTechCoreData)
+                    .filter(FuelTechCoreData.session_id.in_(unsummarized))
+                    .count()
+                )
 
             return {
                 "vehicle_id": vehicle_id,
@@ -0,0 +1,530 @@
+"""
+FTML binary log reader for FuelTech data.
+
+Reads FTManager ``.ftml`` datalogger files directly, without the FTManager
+CSV export step. An FTML file is a raw-deflate compressed .NET binary
+serialization stream (MS-NRBF) of a ``DataloggerFile`` object. Each logged
+channel holds its samples in a ``List<double>`` whose backing array is a
+contiguous little-endian float64 block, so channel data is exposed with
+``np.frombuffer`` views over the inflated stream instead of per-value parsing.
+
+Author: A02-DATA-PANDAS Agent
+Created: 2026-10-16
+"""
+
+import mmap
+import struct
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from ..utils.logging_config import get_logger
+from .csv_parser import CSVParser
+
+logger = get_logger(__name__)
+
+
+class FTMLReadError(Exception):
+    """Exception raised when an FTML file cannot be decoded."""
+
+
+@dataclass
+class FTMLChannel:
+    """One logged channel of an FTML file."""
+
+    measure_type: int
+    name: str
+    period_ms: int
+    values: np.ndarray
+
+
+class _Reference:
+    """Reference to an object defined elsewhere in the stream."""
+
+    __slots__ = ("object_id",)
+
+    def __init__(self, object_id: int):
+        self.object_id = object_id
+
+
+class _ClassObject(dict):
+    """Deserialized class instance (member name -> value)."""
+
+    def __init__(self, class_name: str):
+        super().__init__()
+        self.class_name = class_name
+
+
+_NULL = object()
+
+
+class _NRBFStream:
+    """
+    Minimal MS-NRBF (.NET BinaryFormatter) record reader.
+
+    Decodes the record types used by FTManager log files. Primitive arrays are
+    returned as read-only numpy views over the underlying buffer.
+    """
+
+    # PrimitiveTypeEnum -> (struct format, numpy dtype)
+    PRIMITIVES = {
+        1: ("<?", "?"),
+        2: ("<B", "u1"),
+        6: ("<d", "<f8"),
+        7: ("<h", "<i2"),
+        8: ("<i", "<i4"),
+        9: ("<q", "<i8"),
+        10: ("<b", "i1"),
+        11: ("<f", "<f4"),
+        12: ("<q", "<i8"),
+        13: ("<q", "<i8"),
+        14: ("<H", "<u2"),
+        15: ("<I", "<u4"),
+        16: ("<Q", "<u8"),
+    }
+
+    def __init__(self, buffer):
+        self.buffer = buffer
+        self.pos = 0
+        self.objects: Dict[int, Any] = {}
+        self.classes: Dict[int, tuple] = {}
+
+    def resolve(self, value: Any) -> Any:
+        """Follow a member reference to its object."""
+        if isinstance(value, _Reference):
+            return self.objects.get(value.object_id)
+        return value
+
+    def read_root(self) -> Any:
+        """Read all records and return the root object."""
+        if self._byte() != 0:
+            raise FTMLReadError("Missing serialization header")
+        root_id = self._int32()
+        self.pos += 12  # header id, major and minor version
+
+        while self.pos < len(self.buffer):
+            if self._record() is _MESSAGE_END:
+                break
+
+        if root_id not in self.objects:
+            raise FTMLReadError("Root object not found in stream")
+        return self.objects[root_id]
+
+    def _byte(self) -> int:
+        value = self.buffer[self.pos]
+        self.pos += 1
+        return value
+
+    def _int32(self) -> int:
+        value = struct.unpack_from("<i", self.buffer, self.pos)[0]
+        self.pos += 4
+        return value
+
+    def _string(self) -> str:
+        length = shift = 0
+        while True:
+            byte = self._byte()
+            length |= (byte & 0x7F) << shift
+            shift += 7
+            if not byte & 0x80:
+                break
+        value = bytes(self.buffer[self.pos : self.pos + length]).decode("utf-8")
+        self.pos += length
+        return value
+
+    def _primitive(self, type_code: int) -> Any:
+        if type_code in (5, 18):  # Decimal, String
+            return self._string()
+        if type_code == 3:  # Char (UTF-8, 1-4 bytes)
+            lead = self.buffer[self.pos]
+            size = 1 if lead < 0x80 else 2 if lead < 0xE0 else 3 if lead < 0xF0 else 4
+            value = bytes(self.buffer[self.pos : self.pos + size]).decode("utf-8")
+            self.pos += size
+            return value
+        if type_code not in self.PRIMITIVES:
+            raise FTMLReadError(f"Unsupported primitive type {type_code} at offset {self.pos}")
+        fmt = self.PRIMITIVES[type_code][0]
+        value = struct.unpack_from(fmt, self.buffer, self.pos)[0]
+        self.pos += struct.calcsize(fmt)
+        return value
+
+    def _member_types(self, count: int) -> List[tuple]:
+        binary_types = [self._byte() for _ in range(count)]
+        types = []
+        for binary_type in binary_types:
+            if binary_type in (0, 7):  # Primitive, PrimitiveArray
+                types.append((binary_type, self._byte()))
+            elif binary_type == 3:  # SystemClass
+                types.append((binary_type, self._string()))
+            elif binary_type == 4:  # Class
+                types.append((binary_type, (self._string(), self._int32())))
+            else:
+                types.append((binary_type, None))
+        return types
+
+    def _class_values(self, object_id: int, class_name: str, names: List[str], types) -> Any:
+        obj = _ClassObject(class_name)
+        self.objects[object_id] = obj
+        for name, (binary_type, extra) in zip(names, types):
+            obj[name] = self._primitive(extra) if binary_type == 0 else self._record()
+        return obj
+
+    def _elements(self, count: int) -> List[Any]:
+        items = []
+        while len(items) < count:
+            value = self._record()
+            if isinstance(value, _NullRun):
+                items.extend([_NULL] * value.count)
+            else:
+                items.append(value)
+        return items
+
+    def _record(self) -> Any:
+        record_type = self._byte()
+
+        if record_type in (4, 5):  # (System)ClassWithMembersAndTypes
+            object_id = self._int32()
+            class_name = self._string()
+            names = [self._string() for _ in range(self._int32())]
+            types = self._member_types(len(names))
+            if record_type == 5:
+                self._int32()  # library id
+            self.classes[object_id] = (class_name, names, types)
+            return self._class_values(object_id, class_name, names, types)
+        if record_type == 1:  # ClassWithId
+            object_id = self._int32()
+            class_name, names, types = self.classes[self._int32()]
+            self.classes[object_id] = (class_name, names, types)
+            return self._class_values(object_id, class_name, names, types)
+        if record_type == 6:  # BinaryObjectString
+            object_id = self._int32()
+            self.objects[object_id] = self._string()
+            return self.objects[object_id]
+        if record_type == 9:  # MemberReference
+            return _Reference(self._int32())
+        if record_type == 10:  # ObjectNull
+            return _NULL
+        if record_type == 13:  # ObjectNullMultiple256
+            return _NullRun(self._byte())
+        if record_type == 14:  # ObjectNullMultiple
+            return _NullRun(self._int32())
+        if record_type == 8:  # MemberPrimitiveTyped
+            return self._primitive(self._byte())
+        if record_type == 15:  # ArraySinglePrimitive
+            object_id = self._int32()
+            length = self._int32()
+            type_code = self._byte()
+            if type_code in self.PRIMITIVES:
+                array = np.frombuffer(self.buffer, self.PRIMITIVES[type_code][1], length, self.pos)
+                self.pos += array.nbytes
+            else:
+                array = [self._primitive(type_code) for _ in range(length)]
+            self.objects[object_id] = array
+            return array
+        if record_type in (16, 17):  # ArraySingleObject, ArraySingleString
+            object_id = self._int32()
+            self.objects[object_id] = self._elements(self._int32())
+            return self.objects[object_id]
+        if record_type == 7:  # BinaryArray
+            object_id = self._int32()
+            array_type = self._byte()
+            rank = self._int32()
+            total = int(np.prod([self._int32() for _ in range(rank)]))
+            if array_type in (3, 4, 5):  # arrays with lower bounds
+                self.pos += 4 * rank
+            (binary_type, extra) = self._member_types(1)[0]
+            if binary_type == 0:
+                items = [self._primitive(extra) for _ in range(total)]
+            else:
+                items = self._elements(total)
+            self.objects[object_id] = items
+            return items
+        if record_type == 12:  # BinaryLibrary
+            self._int32()
+            self._string()
+            return self._record()
+        if record_type == 11:  # MessageEnd
+            return _MESSAGE_END
+
+        raise FTMLReadError(f"Unsupported record type {record_type} at offset {self.pos - 1}")
+
+
+class _NullRun:
+    """Run of consecutive null array elements."""
+
+    __slots__ = ("count",)
+
+    def __init__(self, count: int):
+        self.count = count
+
+
+_MESSAGE_END = object()
+
+
+class FTMLReader:
+    """
+    Reader for FTManager ``.ftml`` datalogger files.
+
+    Features:
+    - Memory-mapped input, inflated in one pass
+    - Channel samples exposed as zero-copy float64 views
+    - Channels mapped to the normalized field names used by CSVParser
+    - Channels with other sample periods aligned to the base period
+      (sample-and-hold)
+    - Lazy block iteration
+    """
+
+    # FTManager MeasureTypeEnum -> normalized field name (as produced by
+    # CSVParser.normalize_headers). Unlisted channels are named channel_<id>.
+    MEASURE_TYPE_FIELDS = {
+        0: "tps",
+        1: "map",
+        2: "air_temp",
+        3: "engine_temp",
+        4: "oil_pressure",
+        5: "fuel_pressure",
+        8: "battery_voltage",
+        24: "rpm",
+        25: "injection_time_a",
+        51: "injection_phase_angle",
+        54: "ignition_dwell",
+        55: "ignition_timing",
+        98: "injector_duty_a",
+        151: "closed_loop_target",
+        152: "closed_loop_correction",
+        204: "o2_general",
+        230: "delta_tps",
+        231: "closed_loop_o2",
+        351: "flow_bank_a",
+        434: "throttle_position",
+    }
+
+    DEFAULT_BLOCK_ROWS = 50000
+    _SERIALIZATION_HEADER = b"\x00\x01\x00\x00\x00"
+
+    def __init__(self, file_path: Union[str, Path], block_rows: int = DEFAULT_BLOCK_ROWS):
+        """
+        Initialize FTML reader.
+
+        Args:
+            file_path: Path to .ftml file
+            block_rows: Rows per block yielded by iter_blocks
+        """
+        self.file_path = Path(file_path)
+        self.block_rows = max(1, int(block_rows))
+        self.metadata: Dict[str, Any] = {}
+        self.channels: List[FTMLChannel] = []
+        self.base_period_ms: Optional[int] = None
+        self.num_rows = 0
+        self._loaded = False
+
+    def load(self) -> "FTMLReader":
+        """Decode the file header and channel table (idempotent)."""
+        if self._loaded:
+            return self
+
+        if not self.file_path.exists():
+            raise FTMLReadError(f"File not found: {self.file_path}")
+
+        buffer = self._read_stream()
+        stream = _NRBFStream(buffer)
+        try:
+            root = stream.read_root()
+        except (IndexError, KeyError, struct.error, UnicodeDecodeError) as e:
+            raise FTMLReadError(f"Corrupted FTML stream in {self.file_path.name}: {e}")
+
+        if getattr(root, "class_name", "") != "FTManager_Bll.FTDatalogger.DataloggerFile":
+            raise FTMLReadError(f"Unexpected root object in {self.file_path.name}")
+
+        member = self._member_reader(root, stream)
+        self.metadata = {
+            "sw_version": member("SW_Version"),
+            "file_version": member("FileVersion"),
+            "start_time": float(member("StartTime") or 0.0),
+            "end_time": float(member("EndTime") or 0.0),
+            "channels_count": member("ChannelsCount"),
+            "file_size": self.file_path.stat().st_size,
+        }
+
+        channel_list = member("Channels")
+        items = stream.resolve(channel_list["_items"])[: channel_list["_size"]]
+        for item in items:
+            self.channels.append(self._decode_channel(stream.resolve(item), stream))
+
+        self._align_channels()
+        self._loaded = True
+
+        logger.info(
+            f"FTML carregado: {self.file_path.name} - {len(self.channels)} canais, "
+            f"{self.num_rows} linhas @ {self.base_period_ms} ms"
+        )
+        return self
+
+    @property
+    def columns(self) -> List[str]:
+        """Normalized column names, starting with time."""
+        self.load()
+        return ["time"] + [channel.name for channel in self.channels]
+
+    def read(self, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Read the whole log as a DataFrame.
+
+        Args:
+            columns: Specific columns to return (default: all)
+
+        Returns:
+            DataFrame with normalized column names
+        """
+        return self._frame(0, self.load().num_rows, columns)
+
+    def iter_blocks(
+        self, block_rows: Optional[int] = None, columns: Optional[List[str]] = None
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Yield the log as consecutive DataFrame blocks.
+
+        Args:
+            block_rows: Rows per block (default: reader block_rows)
+            columns: Specific columns to return (default: all)
+
+        Yields:
+            DataFrame blocks with a global RangeIndex
+        """
+        step = block_rows or self.block_rows
+        total = self.load().num_rows
+        for start in range(0, total, step):
+            yield self._frame(start, min(start + step, total), columns)
+
+    def get_file_info(self) -> Dict[str, Any]:
+        """Get file metadata in the shape returned by CSVParser.get_file_info."""
+        self.load()
+        return {
+            "file_path": str(self.file_path),
+            "file_size_mb": round(self.metadata["file_size"] / (1024 * 1024), 3),
+            "format": "ftml",
+            "sw_version": self.metadata["sw_version"],
+            "total_rows": self.num_rows,
+            "total_columns": len(self.channels) + 1,
+            "sample_period_ms": self.base_period_ms,
+        }
+
+    def _read_stream(self):
+        """Memory-map the file and inflate it if compressed."""
+        with open(self.file_path, "rb") as handle:
+            try:
+                mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                raise FTMLReadError(f"Empty FTML file: {self.file_path.name}")
+
+        # Uncompressed streams are parsed straight from the mapping
+        if mapped[: len(self._SERIALIZATION_HEADER)] == self._SERIALIZATION_HEADER:
+            return mapped
+
+        try:
+            return zlib.decompress(mapped, wbits=-15)
+        except zlib.error as e:
+            raise FTMLReadError(f"Not an FTML file ({self.file_path.name}): {e}")
+        finally:
+            mapped.close()
+
+    @staticmethod
+    def _member_reader(obj: _ClassObject, stream: _NRBFStream):
+        """Build an accessor for auto-property backing fields."""
+
+        def member(name: str) -> Any:
+            value = stream.resolve(obj.get(f"<{name}>k__BackingField"))
+            return None if value is _NULL else value
+
+        return member
+
+    def _decode_channel(self, obj: _ClassObject, stream: _NRBFStream) -> FTMLChannel:
+        member = self._member_reader(obj, stream)
+
+        measure_type = member("ChannelType")["value__"]
+        value_list = member("Values")
+        values = stream.resolve(value_list["_items"])[: value_list["_size"]]
+
+        # Scaling is stored per channel; identity for all channels seen so far
+        dividend = member("Dividend") or 1.0
+        divider = member("Divider") or 1.0
+        offset = member("ValOffset") or 0.0
+        if (dividend, divider, offset) != (1.0, 1.0, 0.0):
+            values = values * (dividend / divider) + offset
+
+        name = self.MEASURE_TYPE_FIELDS.get(measure_type, f"channel_{measure_type}")
+        return FTMLChannel(measure_type, name, int(member("SampleRate") or 0), values)
+
+    def _align_channels(self) -> None:
+        """Pick the base sample period and disambiguate duplicate names."""
+        if not self.channels:
+            raise FTMLReadError(f"No channels in {self.file_path.name}")
+
+        periods = [c.period_ms for c in self.channels if c.period_ms > 0]
+        if not periods:
+            raise FTMLReadError(f"No channel sample periods in {self.file_path.name}")
+        self.base_period_ms = max(set(periods), key=periods.count)
+        self.num_rows = max(
+            len(c.values) for c in self.channels if c.period_ms == self.base_period_ms
+        )
+
+        seen: Dict[str, int] = {}
+        for channel in self.channels:
+            count = seen.get(channel.name, 0)
+            seen[channel.name] = count + 1
+            if count:
+                channel.name = f"{channel.name}_{count + 1}"
+
+    def _frame(self, start: int, stop: int, columns: Optional[List[str]]) -> pd.DataFrame:
+        """Build rows [start, stop) on the base time grid."""
+        rows = np.arange(start, stop, dtype=np.int64)
+        offset_ms = rows * self.base_period_ms
+
+        data = {}
+        if not columns or "time" in columns:
+            data["time"] = self.metadata["start_time"] + offset_ms / 1000.0
+
+        for channel in self.channels:
+            if columns and channel.name not in columns:
+                continue
+            if channel.period_ms == self.base_period_ms or channel.period_ms <= 0:
+                index = rows
+            else:
+                index = offset_ms // channel.period_ms
+            if len(channel.values) == 0:
+                data[channel.name] = np.full(len(rows), np.nan)
+                continue
+            data[channel.name] = channel.values.take(index, mode="clip")
+
+        df = pd.DataFrame(data, index=pd.RangeIndex(start, stop))
+        if columns:
+            df = df[[c for c in columns if c in df.columns]]
+        return self._apply_data_types(df)
+
+    @staticmethod
+    def _apply_data_types(df: pd.DataFrame) -> pd.DataFrame:
+        """Cast integer fields the same way the CSV pipeline does."""
+        for column in df.columns:
+            if CSVParser.DATA_TYPES.get(column) == "int64" and not df[column].isna().any():
+                df[column] = df[column].round().astype("int64")
+        return df
+
+
+def parse_ftml_file(
+    file_path: Union[str, Path], columns: Optional[List[str]] = None
+) -> pd.DataFrame:
+    """
+    Convenience function to read FuelTech FTML files.
+
+    Args:
+        file_path: Path to .ftml file
+        columns: Specific columns to return (default: all)
+
+    Returns:
+        DataFrame with normalized column names
+    """
+    return FTMLReader(file_path).read(columns=columns)
@@ -9,7 +9,7 @@ Created: 2025-01-02
 """
 
 import uuid
-from typing import Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 from sqlalchemy import (
     Boolean,
@@ -33,6 +33,9 @@ from sqlalchemy.sql import func
 
 from ..utils.logging_config import get_logger
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 logger = get_logger(__name__)
 
 Base = declarative_base()
@@ -89,6 +92,9 @@ class DataSession(Base):
     quality_checks = relationship(
         "DataQualityCheck", back_populates="session", cascade="all, delete-orphan"
     )
+    summary = relationship(
+        "SessionSummary", back_populates="session", uselist=False, cascade="all, delete-orphan"
+    )
 
     # Constraints
     __table_args__ = (
@@ -281,6 +287,47 @@ class DataQualityCheck(Base):
     )
 
 
+class SessionSummary(Base):
+    """
+    Precomputed summary statistics for one session.
+    Written at import time so dashboards and listings never scan the raw data.
+    """
+
+    __tablename__ = "session_summary"
+
+    session_id = Column(String(36), ForeignKey("data_sessions.id"), primary_key=True)
+
+    record_count = Column(Integer, nullable=False, default=0)  # Rows inserted
+    time_min = Column(Float)
+    time_max = Column(Float)
+    duration_seconds = Column(Float)
+    sample_rate_hz = Column(Float)
+
+    # {column: {count, min, max, mean, std, p05, p25, p50, p75, p95}}
+    column_stats = Column(JSON)
+    # Means of column products, e.g. {"rpm*map": ...}
+    product_stats = Column(JSON)
+
+    created_at = Column(DateTime, default=func.now())
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+
+    # Relationships
+    session = relationship("DataSession", back_populates="summary")
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Summary in the same layout produced by summarize_session."""
+        return {
+            "session_id": self.session_id,
+            "record_count": self.record_count,
+            "time_min": self.time_min,
+            "time_max": self.time_max,
+            "duration_seconds": self.duration_seconds,
+            "sample_rate_hz": self.sample_rate_hz,
+            "columns": self.column_stats or {},
+            "products": self.product_stats or {},
+        }
+
+
 class Vehicle(Base):
     """
     Modelo de dados para veículos cadastrados.
@@ -510,6 +557,22 @@ class Vehicle(Base):
         return len(conflicts) > 0, conflicts
 
 
+def _generate_uuid_strings(count: int) -> List[str]:
+    """Generate ``count`` random (version 4) UUID strings from a single urandom buffer."""
+    import os
+
+    import numpy as np
+
+    raw = np.frombuffer(os.urandom(16 * count), dtype=np.uint8).reshape(count, 16).copy()
+    raw[:, 6] = (raw[:, 6] & 0x0F) | 0x40  # version 4
+    raw[:, 8] = (raw[:, 8] & 0x3F) | 0x80  # RFC 4122 variant
+    h = raw.tobytes().hex()
+    return [
+        f"{h[i:i + 8]}-{h[i + 8:i + 12]}-{h[i + 12:i + 16]}-{h[i + 16:i + 20]}-{h[i + 20:i + 32]}"
+        for i in range(0, 32 * count, 32)
+    ]
+
+
 class DatabaseManager:
     """
     Database manager for FuelTech data models.
@@ -629,121 +692,199 @@ class DatabaseManager:
                     "quality_score": s.quality_score,
                     "status": s.import_status,
                     "created_at": s.created_at,
+                    "sample_rate": s.sample_rate_hz,
+                    "file_size_mb": s.file_size_mb,
                 }
                 for s in sessions
             ]
         finally:
             db.close()
 
-    def bulk_insert_core_data(self, session_id: str, data_records: List[Dict]) -> None:
-        """Bulk insert core data records."""
+    # Valid ranges applied during ingest; rows outside these bounds are dropped
+    CORE_VALUE_RANGES = {
+        "rpm": (0, 20000),
+        "tps": (-5, 105),
+        "throttle_position": (-5, 105),
+        "map": (-1, 5),
+        "engine_temp": (-50, 200),
+        "o2_general": (0, 2),
+    }
+
+    # Unified v2.0 fields (formerly the extended table); missing values become NULL
+    EXTENDED_FIELDS = [
+        "total_consumption",
+        "average_consumption",
+        "instant_consumption",
+        "estimated_power",
+        "estimated_torque",
+        "total_distance",
+        "range",
+        "traction_speed",
+        "acceleration_speed",
+        "traction_control_slip",
+        "traction_control_slip_rate",
+        "delta_tps",
+        "g_force_accel",
+        "g_force_lateral",
+        "pitch_angle",
+        "pitch_rate",
+        "roll_angle",
+        "roll_rate",
+        "heading",
+        "acceleration_distance",
+        "g_force_accel_raw",
+        "g_force_lateral_raw",
+        "accel_enrichment",
+        "decel_enrichment",
+        "injection_cutoff",
+        "after_start_injection",
+        "start_button_toggle",
+    ]
+
+    DEFAULT_INSERT_BATCH_SIZE = 20000
+
+    def prepare_core_dataframe(self, df: "pd.DataFrame") -> Tuple["pd.DataFrame", int]:
+        """
+        Clean a DataFrame for insertion into FuelTechCoreData in one vectorized pass.
+
+        Rules (same as the former per-record cleaning):
+        - Columns not present in the table are ignored
+        - Rows with null/NaN/inf in any core field are dropped
+        - Range-checked fields (CORE_VALUE_RANGES) must be numeric and in range
+        - Numeric columns are coerced from text; RPM is stored as integer
+        - Extended v2.0 fields keep their rows; invalid values become NULL
+
+        Args:
+            df: Session DataFrame with normalized column names
+
+        Returns:
+            Tuple of (cleaned DataFrame, number of dropped rows)
+        """
         import numpy as np
+        import pandas as pd
 
-        # Clean and validate data before insertion
-        cleaned_records = []
-        skipped_count = 0
+        table_columns = FuelTechCoreData.__table__.columns
+        columns = [c for c in df.columns if c in table_columns and c not in ("id", "session_id")]
+        frame = df[columns]
+        extended = set(self.EXTENDED_FIELDS)
 
-        for record in data_records:
-            # Skip records with invalid values
-            skip_record = False
-            cleaned_record = {"session_id": session_id}
-
-            for key, value in record.items():
-                # Check for invalid values
-                if value is None or (
-                    isinstance(value, float) and (np.isnan(value) or np.isinf(value))
-                ):
-                    skip_record = True
-                    break
-
-                # Convert string numbers to appropriate types
-                if key == "rpm":
-                    try:
-                        # Convert RPM to integer
-                        rpm_value = float(str(value))
-                        if rpm_value < 0 or rpm_value > 20000:
-                            skip_record = True
-                            break
-                        cleaned_record[key] = int(rpm_value)
-                    except (ValueError, TypeError):
-                        skip_record = True
-                        break
-                elif key in ["throttle_position", "tps"]:
-                    try:
-                        tps_value = float(value)
-                        if tps_value < -5 or tps_value > 105:
-                            skip_record = True
-                            break
-                        cleaned_record[key] = tps_value
-                    except (ValueError, TypeError):
-                        skip_record = True
-                        break
-                elif key == "map":
-                    try:
-                        map_value = float(value)
-                        if map_value < -1 or map_value > 5:
-                            skip_record = True
-                            break
-                        cleaned_record[key] = map_value
-                    except (ValueError, TypeError):
-                        skip_record = True
-                        break
-                elif key == "engine_temp":
-                    try:
-                        temp_value = float(value)
-                        if temp_value < -50 or temp_value > 200:
-                            skip_record = True
-                            break
-                        cleaned_record[key] = temp_value
-                    except (ValueError, TypeError):
-                        skip_record = True
-                        break
-                elif key == "o2_general":
-                    try:
-                        o2_value = float(value)
-                        if o2_value < 0 or o2_value > 2:
-                            skip_record = True
-                            break
-                        cleaned_record[key] = o2_value
-                    except (ValueError, TypeError):
-                        skip_record = True
-                        break
-                else:
-                    # For other fields, just ensure it's a valid number if it should be
-                    if isinstance(value, str) and key != "id":
-                        try:
-                            cleaned_record[key] = float(value)
-                        except (ValueError, TypeError):
-                            cleaned_record[key] = value
-                    else:
-                        cleaned_record[key] = value
+        valid = np.ones(len(frame), dtype=bool)
+        cleaned = {}
+
+        for col in columns:
+            series = frame[col]
+            is_text_column = isinstance(table_columns[col].type, String)
 
-            if not skip_record:
-                cleaned_records.append(cleaned_record)
+            if is_text_column:
+                values = series
+                missing = series.isna().to_numpy()
             else:
-                skipped_count += 1
+                values = pd.to_numeric(series, errors="coerce").astype("float64")
+                missing = series.isna().to_numpy() | ~np.isfinite(values.to_numpy())
+                # Unparseable text in a range-checked field invalidates the row
+                if col in self.CORE_VALUE_RANGES:
+                    missing |= values.isna().to_numpy()
+
+            bounds = self.CORE_VALUE_RANGES.get(col)
+            if bounds is not None:
+                arr = values.to_numpy()
+                with np.errstate(invalid="ignore"):
+                    missing |= (arr < bounds[0]) | (arr > bounds[1])
+
+            if col in extended:
+                # Nullable field: keep the row, store NULL
+                if not is_text_column:
+                    values = values.where(~missing)
+            else:
+                valid &= ~missing
+
+            cleaned[col] = values
+
+        result = pd.DataFrame(cleaned, index=frame.index)[valid]
+        if "rpm" in result.columns:
+            result["rpm"] = result["rpm"].astype("int64")
+
+        return result.reset_index(drop=True), int((~valid).sum())
+
+    def bulk_insert_core_dataframe(
+        self,
+        session_id: str,
+        df: "pd.DataFrame",
+        batch_size: Optional[int] = None,
+        clean: bool = True,
+    ) -> int:
+        """
+        Bulk insert a DataFrame into FuelTechCoreData.
+
+        Rows are cleaned with prepare_core_dataframe (unless clean=False) and
+        streamed in batches through the compiled Core insert() with the DBAPI
+        executemany, inside a single transaction.
+
+        Args:
+            session_id: Session ID for all rows
+            df: Session DataFrame with normalized column names
+            batch_size: Rows per executemany batch (default: DEFAULT_INSERT_BATCH_SIZE)
+            clean: Apply vectorized cleaning/range masks before insert
+
+        Returns:
+            Number of inserted rows
+        """
+        if not self.engine:
+            raise RuntimeError("Database not initialized. Call init_database() first.")
+
+        skipped_count = 0
+        if clean:
+            df, skipped_count = self.prepare_core_dataframe(df)
 
         if skipped_count > 0:
             logger.warning(f"Skipped {skipped_count} records with invalid values")
 
-        if not cleaned_records:
+        if df.empty:
             logger.warning("No valid records to insert after cleaning")
-            return
+            return 0
+
+        batch_size = max(1, int(batch_size or self.DEFAULT_INSERT_BATCH_SIZE))
+        keys = ["id", "session_id"] + list(df.columns)
+
+        # One Python list per column, None for missing values
+        column_values = {
+            col: df[col].astype(object).where(df[col].notna(), None).tolist() for col in df.columns
+        }
+        column_values["id"] = _generate_uuid_strings(len(df))
+        column_values["session_id"] = [session_id] * len(df)
+
+        # Compile once for the active dialect and feed the DBAPI executemany directly
+        compiled = FuelTechCoreData.__table__.insert().compile(
+            dialect=self.engine.dialect, column_keys=keys
+        )
+        sql = str(compiled)
+        order = list(compiled.positiontup) if compiled.positional else keys
 
-        db = self.get_session()
         try:
-            db.bulk_insert_mappings(FuelTechCoreData, cleaned_records)
-            db.commit()
+            with self.engine.begin() as conn:
+                for start in range(0, len(df), batch_size):
+                    stop = min(start + batch_size, len(df))
+                    batch = [column_values[key][start:stop] for key in order]
+                    if compiled.positional:
+                        params = list(zip(*batch))
+                    else:
+                        params = [dict(zip(order, row)) for row in zip(*batch)]
+                    conn.exec_driver_sql(sql, params)
+
             logger.info(
-                f"Bulk inserted {len(cleaned_records)} core data records (skipped {skipped_count} invalid)"
+                f"Bulk inserted {len(df)} core data records (skipped {skipped_count} invalid)"
             )
+            return len(df)
 
         except Exception as e:
-            db.rollback()
             logger.error(f"Bulk insert failed: {str(e)}")
             raise
-        finally:
-            db.close()
+
+    def bulk_insert_core_data(self, session_id: str, data_records: List[Dict]) -> None:
+        """Bulk insert core data records (list-of-dicts wrapper over bulk_insert_core_dataframe)."""
+        import pandas as pd
+
+        self.bulk_insert_core_dataframe(session_id, pd.DataFrame.from_records(data_records))
 
     def bulk_insert_extended_data(self, session_id: str, data_records: List[Dict]) -> None:
         """Deprecated: extended data unified into FuelTechCoreData. No-op for compatibility."""
@@ -10,7 +10,8 @@ Created: 2025-01-02
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, List
+from functools import cached_property
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
@@ -19,6 +20,9 @@ from ..utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Rows used for quartiles/correlations by assess_fueltech_data_quality on long logs
+QUALITY_SAMPLE_SIZE = 100000
+
 
 @dataclass
 class QualityCheckResult:
@@ -39,6 +43,153 @@ class DataQualityError(Exception):
     """Exception raised during quality assessment."""
 
 
+class QualityProfile:
+    """
+    Column statistics shared by the quality checks.
+
+    Statistics are computed lazily and cached, so running every check against
+    one profile touches each column once per statistic instead of once per
+    check. With ``sample_size`` set, the heavy order statistics (quartiles)
+    and correlations of logs longer than that are estimated from a uniform
+    random sample of rows, and the checks report 95% error bounds.
+    """
+
+    # Two-sided 95% confidence
+    CONFIDENCE = 0.95
+    CONFIDENCE_Z = 1.959964
+
+    def __init__(self, df: pd.DataFrame, sample_size: Optional[int] = None, random_state: int = 0):
+        """
+        Initialize profile.
+
+        Args:
+            df: DataFrame to profile
+            sample_size: Rows used for quartiles/correlations (None = all rows)
+            random_state: Seed for row sampling
+        """
+        self.df = df
+        self.n_rows = len(df)
+        self.sample_size = sample_size
+        self.random_state = random_state
+        self._stats: Dict[str, Dict[str, float]] = {}
+        self._quartiles: Dict[str, Tuple[float, float]] = {}
+
+    @cached_property
+    def numeric_columns(self) -> List[str]:
+        """Numeric columns (booleans excluded, as in select_dtypes)."""
+        return list(self.df.select_dtypes(include=[np.number]).columns)
+
+    @cached_property
+    def null_counts(self) -> pd.Series:
+        """Missing values per column."""
+        numeric = set(self.numeric_columns)
+        counts = [
+            (
+                np.count_nonzero(np.isnan(self.column(col)))
+                if col in numeric
+                else int(self.df[col].isna().sum())
+            )
+            for col in self.df.columns
+        ]
+        return pd.Series(counts, index=self.df.columns, dtype=np.int64)
+
+    def column(self, name: str) -> np.ndarray:
+        """Column as float64 with NaN for missing values (a view when already float64)."""
+        series = self.df[name]
+        if series.dtype == np.float64:
+            return series.to_numpy()
+        return series.to_numpy(dtype=np.float64, na_value=np.nan)
+
+    def valid(self, name: str) -> np.ndarray:
+        """Non-missing values of a column."""
+        values = self.column(name)
+        missing = np.isnan(values)
+        return values[~missing] if missing.any() else values
+
+    def stats(self, name: str, valid: Optional[np.ndarray] = None) -> Dict[str, float]:
+        """Count, mean, std (ddof=1), min and max of the non-missing values."""
+        if name not in self._stats:
+            if valid is None:
+                valid = self.valid(name)
+            count = len(valid)
+            self._stats[name] = {
+                "count": count,
+                "mean": valid.mean() if count else np.nan,
+                "std": valid.std(ddof=1) if count > 1 else np.nan,
+                "min": valid.min() if count else np.nan,
+                "max": valid.max() if count else np.nan,
+            }
+        return self._stats[name]
+
+    @property
+    def sampled(self) -> bool:
+        """Whether order statistics and correlations use a row sample."""
+        return self.sample_size is not None and self.n_rows > self.sample_size
+
+    @cached_property
+    def sample_positions(self) -> Optional[np.ndarray]:
+        """Sorted row positions of the sample (None when not sampling)."""
+        if not self.sampled:
+            return None
+        rng = np.random.default_rng(self.random_state)
+        return np.sort(rng.choice(self.n_rows, size=self.sample_size, replace=False))
+
+    def quartiles(self, name: str, valid: Optional[np.ndarray] = None) -> Tuple[float, float]:
+        """First and third quartiles (linear interpolation, like Series.quantile)."""
+        if name not in self._quartiles:
+            if self.sampled:
+                values = self.column(name)[self.sample_positions]
+                values = values[~np.isnan(values)]
+            else:
+                values = self.valid(name) if valid is None else valid
+            q1, q3 = np.quantile(values, [0.25, 0.75]) if len(values) else (np.nan, np.nan)
+            self._quartiles[name] = (q1, q3)
+        return self._quartiles[name]
+
+    def paired(self, first: str, second: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Rows (sampled when sampling) where both columns are present."""
+        x = self.column(first)
+        y = self.column(second)
+        if self.sampled:
+            x = x[self.sample_positions]
+            y = y[self.sample_positions]
+        mask = ~(np.isnan(x) | np.isnan(y))
+        return x[mask], y[mask]
+
+    @cached_property
+    def time_diff(self) -> np.ndarray:
+        """Row-to-row time deltas (NaN where either sample is missing)."""
+        time = self.column("time")
+        diff = np.empty_like(time)
+        diff[:1] = np.nan
+        np.subtract(time[1:], time[:-1], out=diff[1:])
+        return diff
+
+    @cached_property
+    def time_intervals(self) -> np.ndarray:
+        """Deltas between consecutive present timestamps."""
+        return np.diff(self.valid("time"))
+
+    def sampling_details(self) -> Dict[str, Any]:
+        """Sample size and error bounds of sampled statistics."""
+        m = len(self.sample_positions)
+        return {
+            "sample_rows": m,
+            "total_rows": self.n_rows,
+            "confidence": self.CONFIDENCE,
+            # DKW bound: sampled quartiles lie within this rank distance of the true ones
+            "quartile_rank_error": float(np.sqrt(np.log(2 / (1 - self.CONFIDENCE)) / (2 * m))),
+        }
+
+    def correlation_interval(self, r: float, n: int) -> Tuple[float, float]:
+        """Fisher z confidence interval of a Pearson correlation from n pairs."""
+        if n <= 3 or abs(r) >= 1:
+            return (float(r), float(r))
+        z = np.arctanh(r)
+        half_width = self.CONFIDENCE_Z / np.sqrt(n - 3)
+        return (float(np.tanh(z - half_width)), float(np.tanh(z + half_width)))
+
+
 class DataQualityAssessor:
     """
     Comprehensive data quality assessor for FuelTech data.
@@ -50,6 +201,7 @@ class DataQualityAssessor:
     - Physical plausibility checks
     - Statistical anomaly detection
     - Correlation analysis
+    - Fused assessment: all checks share one QualityProfile of column statistics
     """
 
     # Physical constraints for engine data
@@ -83,20 +235,30 @@ class DataQualityAssessor:
         ("rpm", "ignition_dwell", "negative"),  # Higher RPM = shorter dwell
     ]
 
-    def __init__(self, tolerance_factor: float = 2.0):
+    def __init__(self, tolerance_factor: float = 2.0, sample_size: Optional[int] = None):
         """
         Initialize quality assessor.
 
         Args:
             tolerance_factor: Factor for adjusting tolerance of checks
+            sample_size: Rows used for quartiles and correlations on longer logs
+                (None = always use every row)
         """
         self.tolerance_factor = tolerance_factor
+        self.sample_size = sample_size
         self.quality_results: List[QualityCheckResult] = []
 
-    def check_data_completeness(self, df: pd.DataFrame) -> QualityCheckResult:
+    def _profile(self, df: pd.DataFrame, profile: Optional[QualityProfile]) -> QualityProfile:
+        """Use the shared profile, or build one for a standalone check."""
+        if profile is not None and profile.df is df:
+            return profile
+        return QualityProfile(df, sample_size=self.sample_size)
+
+    def check_data_completeness(
+        self, df: pd.DataFrame, profile: Optional[QualityProfile] = None
+    ) -> QualityCheckResult:
         """Check for missing data and completeness."""
         total_cells = df.size
-        missing_cells = df.isna().sum().sum()
 
         # Special case for empty DataFrame
         if total_cells == 0:
@@ -117,6 +279,8 @@ class DataQualityAssessor:
                 timestamp=datetime.now(),
             )
 
+        missing_by_column = self._profile(df, profile).null_counts
+        missing_cells = missing_by_column.sum()
         missing_percentage = (missing_cells / total_cells) * 100
 
         if missing_percentage == 0:
@@ -137,7 +301,6 @@ class DataQualityAssessor:
             message = f"Significant missing data: {missing_percentage:.2f}%"
 
         # Column-wise analysis
-        missing_by_column = df.isna().sum()
         columns_with_missing = missing_by_column[missing_by_column > 0].to_dict()
 
         return QualityCheckResult(
@@ -156,7 +319,9 @@ class DataQualityAssessor:
             timestamp=datetime.now(),
         )
 
-    def check_range_validity(self, df: pd.DataFrame) -> QualityCheckResult:
+    def check_range_validity(
+        self, df: pd.DataFrame, profile: Optional[QualityProfile] = None
+    ) -> QualityCheckResult:
         """Check if values are within expected ranges."""
         # Handle empty DataFrame
         if df.empty:
@@ -174,6 +339,7 @@ class DataQualityAssessor:
 
         from .normalizer import DataNormalizer
 
+        profile = self._profile(df, profile)
         range_violations = {}
         total_violations = 0
 
@@ -181,17 +347,19 @@ class DataQualityAssessor:
             if field not in df.columns:
                 continue
 
-            series = df[field].dropna()
-            if len(series) == 0:
+            stats = profile.stats(field)
+            if stats["count"] == 0:
                 continue
 
-            violations = ((series < min_val) | (series > max_val)).sum()
+            # NaN compares False, so only present values can violate
+            values = profile.column(field)
+            violations = np.count_nonzero((values < min_val) | (values > max_val))
             if violations > 0:
                 range_violations[field] = {
                     "violations": violations,
-                    "percentage": (violations / len(series)) * 100,
+                    "percentage": (violations / stats["count"]) * 100,
                     "expected_range": (min_val, max_val),
-                    "actual_range": (series.min(), series.max()),
+                    "actual_range": (stats["min"], stats["max"]),
                 }
                 total_violations += violations
 
@@ -223,7 +391,9 @@ class DataQualityAssessor:
             timestamp=datetime.now(),
         )
 
-    def check_temporal_consistency(self, df: pd.DataFrame) -> QualityCheckResult:
+    def check_temporal_consistency(
+        self, df: pd.DataFrame, profile: Optional[QualityProfile] = None
+    ) -> QualityCheckResult:
         """Check temporal consistency and monotonicity."""
         issues = []
 
@@ -240,26 +410,33 @@ class DataQualityAssessor:
                 timestamp=datetime.now(),
             )
 
-        time_series = df["time"].dropna()
+        profile = self._profile(df, profile)
+        time_diffs = profile.time_intervals
 
         # Check monotonicity
-        non_monotonic = (time_series.diff() < 0).sum()
+        non_monotonic = np.count_nonzero(time_diffs < 0)
         if non_monotonic > 0:
             issues.append(f"Non-monotonic time sequence: {non_monotonic} instances")
 
-        # Check for duplicates
-        duplicates = time_series.duplicated().sum()
+        # Check for duplicates (on a sorted sequence they are the zero intervals)
+        if non_monotonic == 0:
+            duplicates = np.count_nonzero(time_diffs == 0)
+        else:
+            time_values = profile.valid("time")
+            duplicates = len(time_values) - len(np.unique(time_values))
         if duplicates > 0:
             issues.append(f"Duplicate timestamps: {duplicates} instances")
 
         # Check sampling rate consistency
-        time_diffs = time_series.diff().dropna()
+        median_interval = None
         if len(time_diffs) > 0:
-            median_interval = time_diffs.median()
-            interval_std = time_diffs.std()
+            median_interval = np.median(time_diffs)
+            interval_std = time_diffs.std(ddof=1) if len(time_diffs) > 1 else np.nan
 
             # Look for significant deviations in sampling rate
-            irregular_intervals = (abs(time_diffs - median_interval) > 3 * interval_std).sum()
+            irregular_intervals = np.count_nonzero(
+                np.abs(time_diffs - median_interval) > 3 * interval_std
+            )
             if irregular_intervals > len(time_diffs) * 0.1:  # More than 10% irregular
                 issues.append(f"Irregular sampling intervals: {irregular_intervals} instances")
 
@@ -289,17 +466,19 @@ class DataQualityAssessor:
             error_percentage=issue_percentage,
             details={
                 "issues": issues,
-                "median_interval": (median_interval if "median_interval" in locals() else None),
+                "median_interval": median_interval,
                 "sampling_rate_hz": (
                     1 / median_interval
-                    if "median_interval" in locals() and median_interval > 0
+                    if median_interval is not None and median_interval > 0
                     else None
                 ),
             },
             timestamp=datetime.now(),
         )
 
-    def check_physical_plausibility(self, df: pd.DataFrame) -> QualityCheckResult:
+    def check_physical_plausibility(
+        self, df: pd.DataFrame, profile: Optional[QualityProfile] = None
+    ) -> QualityCheckResult:
         """Check physical plausibility of rate changes and values."""
         if "time" not in df.columns:
             return QualityCheckResult(
@@ -314,11 +493,12 @@ class DataQualityAssessor:
                 timestamp=datetime.now(),
             )
 
+        profile = self._profile(df, profile)
         violations = {}
         total_violations = 0
 
         # Calculate time deltas
-        time_delta = df["time"].diff()
+        time_delta = profile.time_diff[1:]
 
         # Check rate limits for various parameters
         rate_checks = [
@@ -336,15 +516,15 @@ class DataQualityAssessor:
             if field not in df.columns:
                 continue
 
-            field_diff = df[field].diff().abs()
-            rate = field_diff / time_delta
-            rate = rate.dropna()
+            with np.errstate(divide="ignore", invalid="ignore"):
+                rate = np.abs(np.diff(profile.column(field))) / time_delta
+            rate = rate[~np.isnan(rate)]
 
             if len(rate) == 0:
                 continue
 
             limit = self.PHYSICAL_CONSTRAINTS[limit_key] * self.tolerance_factor
-            rate_violations = (rate > limit).sum()
+            rate_violations = np.count_nonzero(rate > limit)
 
             if rate_violations > 0:
                 violations[field] = {
@@ -365,12 +545,13 @@ class DataQualityAssessor:
         for field in g_force_fields:
             if field in df.columns:
                 g_limit = self.PHYSICAL_CONSTRAINTS["g_force_max"] * self.tolerance_factor
-                g_violations = (df[field].abs() > g_limit).sum()
+                g_violations = np.count_nonzero(np.abs(profile.column(field)) > g_limit)
 
                 if g_violations > 0:
+                    stats = profile.stats(field)
                     violations[field] = {
                         "violations": g_violations,
-                        "max_value": df[field].abs().max(),
+                        "max_value": max(abs(stats["min"]), abs(stats["max"])),
                         "limit": g_limit,
                         "percentage": (g_violations / len(df)) * 100,
                     }
@@ -383,12 +564,14 @@ class DataQualityAssessor:
                 lambda_min = self.PHYSICAL_CONSTRAINTS["lambda_min"]
                 lambda_max = self.PHYSICAL_CONSTRAINTS["lambda_max"]
 
-                lambda_violations = ((df[field] < lambda_min) | (df[field] > lambda_max)).sum()
+                values = profile.column(field)
+                lambda_violations = np.count_nonzero((values < lambda_min) | (values > lambda_max))
 
                 if lambda_violations > 0:
+                    stats = profile.stats(field)
                     violations[field] = {
                         "violations": lambda_violations,
-                        "range": (df[field].min(), df[field].max()),
+                        "range": (stats["min"], stats["max"]),
                         "expected_range": (lambda_min, lambda_max),
                         "percentage": (lambda_violations / len(df)) * 100,
                     }
@@ -421,8 +604,16 @@ class DataQualityAssessor:
             timestamp=datetime.now(),
         )
 
-    def check_statistical_anomalies(self, df: pd.DataFrame) -> QualityCheckResult:
-        """Check for statistical anomalies and outliers."""
+    def check_statistical_anomalies(
+        self, df: pd.DataFrame, profile: Optional[QualityProfile] = None
+    ) -> QualityCheckResult:
+        """
+        Check for statistical anomalies and outliers.
+
+        Outliers are counted on every row. When the profile samples, the IQR
+        fences come from sampled quartiles and the details carry their rank
+        error bound.
+        """
         # Handle empty DataFrame
         if df.empty:
             return QualityCheckResult(
@@ -437,26 +628,36 @@ class DataQualityAssessor:
                 timestamp=datetime.now(),
             )
 
-        numeric_cols = df.select_dtypes(include=[np.number]).columns
+        profile = self._profile(df, profile)
         anomalies = {}
         total_anomalies = 0
 
-        for col in numeric_cols:
-            series = df[col].dropna()
+        for col in profile.numeric_columns:
+            series = profile.valid(col)
             if len(series) < 3:  # Need minimum data for statistical analysis (reduced for tests)
                 continue
 
-            # Z-score based outlier detection
-            z_scores = np.abs((series - series.mean()) / series.std())
-            z_outliers = (z_scores > 3).sum()
+            stats = profile.stats(col, series)
+            mean, std = stats["mean"], stats["std"]
+
+            # Z-score based outlier detection (a constant column has no z-score outliers)
+            if std > 0:
+                z_scores = series - mean
+                np.abs(z_scores, out=z_scores)
+                z_scores /= std
+                z_outliers = np.count_nonzero(z_scores > 3)
+            else:
+                z_outliers = 0
 
             # IQR based outlier detection
-            Q1, Q3 = series.quantile([0.25, 0.75])
+            Q1, Q3 = profile.quartiles(col, series)
             IQR = Q3 - Q1
-            iqr_outliers = ((series < (Q1 - 1.5 * IQR)) | (series > (Q3 + 1.5 * IQR))).sum()
+            iqr_outliers = np.count_nonzero(
+                (series < (Q1 - 1.5 * IQR)) | (series > (Q3 + 1.5 * IQR))
+            )
 
             # Check for constant values (no variation)
-            if series.std() == 0:
+            if std == 0:
                 constant_values = len(series)
             else:
                 constant_values = 0
@@ -466,10 +667,10 @@ class DataQualityAssessor:
                     "z_score_outliers": z_outliers,
                     "iqr_outliers": iqr_outliers,
                     "constant_values": constant_values,
-                    "mean": series.mean(),
-                    "std": series.std(),
-                    "min": series.min(),
-                    "max": series.max(),
+                    "mean": mean,
+                    "std": std,
+                    "min": stats["min"],
+                    "max": stats["max"],
                 }
                 total_anomalies += max(z_outliers, iqr_outliers) + constant_values
 
@@ -488,6 +689,10 @@ class DataQualityAssessor:
             severity = "error"
             message = f"Many statistical anomalies: {anomaly_percentage:.2f}%"
 
+        details = {"anomalies": anomalies}
+        if profile.sampled:
+            details["sampling"] = profile.sampling_details()
+
         return QualityCheckResult(
             check_name="statistical_anomalies",
             status=status,
@@ -496,12 +701,19 @@ class DataQualityAssessor:
             affected_records=total_anomalies,
             total_records=len(df),
             error_percentage=anomaly_percentage,
-            details={"anomalies": anomalies},
+            details=details,
             timestamp=datetime.now(),
         )
 
-    def check_correlations(self, df: pd.DataFrame) -> QualityCheckResult:
-        """Check expected correlations between related fields."""
+    def check_correlations(
+        self, df: pd.DataFrame, profile: Optional[QualityProfile] = None
+    ) -> QualityCheckResult:
+        """
+        Check expected correlations between related fields.
+
+        Only the expected pairs are correlated. When the profile samples, each
+        issue carries the 95% confidence interval of its correlation.
+        """
         # Handle empty DataFrame
         if df.empty:
             return QualityCheckResult(
@@ -516,6 +728,7 @@ class DataQualityAssessor:
                 timestamp=datetime.now(),
             )
 
+        profile = self._profile(df, profile)
         correlation_issues = []
 
         for field1, field2, expected_sign in self.EXPECTED_CORRELATIONS:
@@ -523,11 +736,12 @@ class DataQualityAssessor:
                 continue
 
             # Calculate correlation
-            data_subset = df[[field1, field2]].dropna()
-            if len(data_subset) < 10:
+            x, y = profile.paired(field1, field2)
+            if len(x) < 10:
                 continue
 
-            correlation = data_subset[field1].corr(data_subset[field2])
+            with np.errstate(divide="ignore", invalid="ignore"):
+                correlation = np.corrcoef(x, y)[0, 1]
 
             if np.isnan(correlation):
                 correlation_issues.append(
@@ -541,24 +755,22 @@ class DataQualityAssessor:
                 continue
 
             # Check if correlation matches expected sign
+            issue = None
             if expected_sign == "positive" and correlation < 0.1:
-                correlation_issues.append(
-                    {
-                        "fields": (field1, field2),
-                        "issue": "weak_positive_correlation",
-                        "expected": "positive",
-                        "actual": correlation,
-                    }
-                )
+                issue = "weak_positive_correlation"
             elif expected_sign == "negative" and correlation > -0.1:
-                correlation_issues.append(
-                    {
-                        "fields": (field1, field2),
-                        "issue": "weak_negative_correlation",
-                        "expected": "negative",
-                        "actual": correlation,
-                    }
-                )
+                issue = "weak_negative_correlation"
+
+            if issue is not None:
+                entry = {
+                    "fields": (field1, field2),
+                    "issue": issue,
+                    "expected": expected_sign,
+                    "actual": correlation,
+                }
+                if profile.sampled:
+                    entry["confidence_interval"] = profile.correlation_interval(correlation, len(x))
+                correlation_issues.append(entry)
 
         if not correlation_issues:
             status = "passed"
@@ -573,6 +785,10 @@ class DataQualityAssessor:
             severity = "error"
             message = f"Many correlation issues: {len(correlation_issues)} found"
 
+        details = {"correlation_issues": correlation_issues}
+        if profile.sampled:
+            details["sampling"] = profile.sampling_details()
+
         return QualityCheckResult(
             check_name="correlation_analysis",
             status=status,
@@ -581,16 +797,19 @@ class DataQualityAssessor:
             affected_records=len(correlation_issues),
             total_records=len(self.EXPECTED_CORRELATIONS),
             error_percentage=(len(correlation_issues) / len(self.EXPECTED_CORRELATIONS)) * 100,
-            details={"correlation_issues": correlation_issues},
+            details=details,
             timestamp=datetime.now(),
         )
 
-    def assess_data_quality(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def assess_data_quality(self, df: pd.DataFrame, fused: bool = True) -> Dict[str, Any]:
         """
         Perform comprehensive data quality assessment.
 
         Args:
             df: DataFrame to assess
+            fused: Share one QualityProfile across all checks, so null counts,
+                column moments, quartiles and time deltas are computed once.
+                With False every check profiles the data on its own.
 
         Returns:
             Dictionary with quality assessment results
@@ -598,6 +817,7 @@ class DataQualityAssessor:
         logger.info("Starting comprehensive data quality assessment")
 
         self.quality_results = []
+        profile = QualityProfile(df, sample_size=self.sample_size) if fused else None
 
         # Run all quality checks
         checks = [
@@ -611,7 +831,7 @@ class DataQualityAssessor:
 
         for check_func in checks:
             try:
-                result = check_func(df)
+                result = check_func(df, profile)
                 self.quality_results.append(result)
                 logger.debug(f"Quality check '{result.check_name}': {result.status}")
             except Exception as e:
@@ -733,17 +953,21 @@ class DataQualityAssessor:
         return "\n".join(report)
 
 
-def assess_fueltech_data_quality(df: pd.DataFrame) -> Dict[str, Any]:
+def assess_fueltech_data_quality(
+    df: pd.DataFrame, sample_size: Optional[int] = QUALITY_SAMPLE_SIZE
+) -> Dict[str, Any]:
     """
     Convenience function to assess FuelTech data quality.
 
     Args:
         df: DataFrame to assess
+        sample_size: Rows used for quartiles and correlations on longer logs
+            (None = use every row)
 
     Returns:
         Quality assessment results
     """
-    assessor = DataQualityAssessor()
+    assessor = DataQualityAssessor(sample_size=sample_size)
     return assessor.assess_data_quality(df)
 
 
@@ -0,0 +1,229 @@
+"""
+Per-session summary statistics for FuelTech data.
+
+Computes the figures that dashboards and listings need (per-column count,
+min, max, mean, std and quantiles, plus duration and sample rate) once, at
+import time, so readers never have to scan the raw log again. Statistics are
+accumulated chunk by chunk, which lets the streaming importer build the same
+summary as the in-memory importer.
+
+Author: A02-DATA-PANDAS Agent
+Created: 2026-10-16
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ..utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Quantiles stored for every column, keyed as p05, p25, ...
+SUMMARY_QUANTILES = (0.05, 0.25, 0.50, 0.75, 0.95)
+
+# Means of column products that cannot be derived from per-column statistics
+SUMMARY_PRODUCTS: Tuple[Tuple[str, str], ...] = (("rpm", "map"),)
+
+# Quantiles are computed on a systematic sample of at most this many rows
+SUMMARY_SAMPLE_ROWS = 100000
+
+TIME_COLUMN = "time"
+EXCLUDED_COLUMNS = ("id", "session_id")
+
+
+def _quantile_key(q: float) -> str:
+    """Key used for a quantile in the column statistics (0.05 -> 'p05')."""
+    return f"p{int(round(q * 100)):02d}"
+
+
+def _optional_float(value: float) -> Optional[float]:
+    """Convert to float, mapping NaN/inf to None (JSON friendly)."""
+    value = float(value)
+    return value if np.isfinite(value) else None
+
+
+class SessionSummaryAccumulator:
+    """
+    Mergeable summary statistics over the chunks of one session.
+
+    Count, min, max, mean and std are exact for any number of chunks
+    (moments are combined with the parallel variance formula). Quantiles
+    come from a systematic sample of at most ``sample_rows`` rows, so they
+    are exact for sessions up to that size.
+    """
+
+    def __init__(self, sample_rows: int = SUMMARY_SAMPLE_ROWS):
+        self.sample_rows = sample_rows
+        self.rows = 0
+        self._moments: Dict[str, Dict[str, float]] = {}
+        self._products: Dict[str, List[float]] = {}
+        self._sample_parts: List[pd.DataFrame] = []
+        self._sample_stride = 1
+        self._time_min: Optional[float] = None
+        self._time_max: Optional[float] = None
+        self._interval_medians: List[float] = []
+
+    @staticmethod
+    def _numeric_columns(df: pd.DataFrame) -> List[str]:
+        """Numeric data columns (booleans and key columns excluded)."""
+        return [
+            c
+            for c in df.columns
+            if c not in EXCLUDED_COLUMNS
+            and pd.api.types.is_numeric_dtype(df[c])
+            and not pd.api.types.is_bool_dtype(df[c])
+        ]
+
+    def update(self, df: pd.DataFrame) -> "SessionSummaryAccumulator":
+        """Fold one chunk of session data into the summary."""
+        if df.empty:
+            return self
+
+        columns = self._numeric_columns(df)
+        values = df[columns].to_numpy(dtype=np.float64, na_value=np.nan)
+
+        with np.errstate(invalid="ignore"):
+            valid = np.isfinite(values)
+            counts = valid.sum(axis=0)
+            masked = np.where(valid, values, 0.0)
+            sums = masked.sum(axis=0)
+            means = np.divide(sums, counts, out=np.zeros_like(sums), where=counts > 0)
+            m2 = (np.where(valid, values - means, 0.0) ** 2).sum(axis=0)
+            mins = np.where(valid, values, np.inf).min(axis=0)
+            maxs = np.where(valid, values, -np.inf).max(axis=0)
+
+        for i, column in enumerate(columns):
+            self._merge_moments(column, counts[i], means[i], m2[i], mins[i], maxs[i])
+
+        for left, right in SUMMARY_PRODUCTS:
+            if left in df.columns and right in df.columns:
+                product = df[left].to_numpy(np.float64, na_value=np.nan) * df[right].to_numpy(
+                    np.float64, na_value=np.nan
+                )
+                finite = product[np.isfinite(product)]
+                total = self._products.setdefault(f"{left}*{right}", [0.0, 0.0])
+                total[0] += float(finite.sum())
+                total[1] += len(finite)
+
+        if TIME_COLUMN in df.columns:
+            time = df[TIME_COLUMN].to_numpy(np.float64, na_value=np.nan)
+            time = time[np.isfinite(time)]
+            if len(time):
+                chunk_min, chunk_max = float(time.min()), float(time.max())
+                self._time_min = (
+                    chunk_min if self._time_min is None else min(self._time_min, chunk_min)
+                )
+                self._time_max = (
+                    chunk_max if self._time_max is None else max(self._time_max, chunk_max)
+                )
+                if len(time) > 1:
+                    self._interval_medians.append(float(np.median(np.diff(time))))
+
+        self._update_sample(df[columns])
+        self.rows += len(df)
+        return self
+
+    def _merge_moments(self, column, count, mean, m2, minimum, maximum) -> None:
+        """Combine chunk moments with the running moments of a column."""
+        state = self._moments.get(column)
+        if state is None:
+            self._moments[column] = {
+                "count": float(count),
+                "mean": float(mean),
+                "m2": float(m2),
+                "min": float(minimum),
+                "max": float(maximum),
+            }
+            return
+        if count == 0:
+            return
+
+        total = state["count"] + count
+        delta = mean - state["mean"]
+        state["mean"] += delta * count / total
+        state["m2"] += m2 + delta * delta * state["count"] * count / total
+        state["count"] = total
+        state["min"] = min(state["min"], float(minimum))
+        state["max"] = max(state["max"], float(maximum))
+
+    def _update_sample(self, df: pd.DataFrame) -> None:
+        """Keep every stride-th row (by global row number) for quantiles."""
+        positions = np.arange(self.rows, self.rows + len(df))
+        keep = positions % self._sample_stride == 0
+        part = df[keep]
+        part.index = positions[keep]
+        self._sample_parts.append(part)
+        while sum(len(p) for p in self._sample_parts) > self.sample_rows:
+            self._sample_stride *= 2
+            self._sample_parts = [p[p.index % self._sample_stride == 0] for p in self._sample_parts]
+
+    def result(self) -> Dict[str, Any]:
+        """
+        Build the summary.
+
+        Returns:
+            Dictionary with record_count, time_min, time_max, duration_seconds,
+            sample_rate_hz, columns (per-column statistics) and products
+            (means of column products)
+        """
+        sample = pd.concat(self._sample_parts) if self._sample_parts else pd.DataFrame()
+
+        columns = {}
+        for column, state in self._moments.items():
+            count = int(state["count"])
+            stats: Dict[str, Any] = {"count": count}
+            if count == 0:
+                columns[column] = stats
+                continue
+
+            stats.update(
+                {
+                    "min": _optional_float(state["min"]),
+                    "max": _optional_float(state["max"]),
+                    "mean": _optional_float(state["mean"]),
+                    "std": (
+                        _optional_float(np.sqrt(state["m2"] / (count - 1))) if count > 1 else None
+                    ),
+                }
+            )
+            if column in sample.columns:
+                data = sample[column].to_numpy(np.float64, na_value=np.nan)
+                data = data[np.isfinite(data)]
+                if len(data):
+                    for q, value in zip(SUMMARY_QUANTILES, np.quantile(data, SUMMARY_QUANTILES)):
+                        stats[_quantile_key(q)] = float(value)
+            columns[column] = stats
+
+        duration = None
+        if self._time_min is not None:
+            duration = self._time_max - self._time_min
+        interval = np.median(self._interval_medians) if self._interval_medians else None
+
+        return {
+            "record_count": self.rows,
+            "time_min": self._time_min,
+            "time_max": self._time_max,
+            "duration_seconds": duration,
+            "sample_rate_hz": float(1 / interval) if interval else None,
+            "columns": columns,
+            "products": {
+                name: (total / count if count else None)
+                for name, (total, count) in self._products.items()
+            },
+        }
+
+
+def summarize_session(df: pd.DataFrame, sample_rows: int = SUMMARY_SAMPLE_ROWS) -> Dict[str, Any]:
+    """
+    Compute the summary of a whole session DataFrame.
+
+    Args:
+        df: Session data (as inserted into the database)
+        sample_rows: Maximum rows used for quantiles
+
+    Returns:
+        Summary dictionary (see SessionSummaryAccumulator.result)
+    """
+    return SessionSummaryAccumulator(sample_rows).update(df).result()
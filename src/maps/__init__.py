@@ -8,6 +8,8 @@ versioning system, and FTManager integration.
 Classes:
     MapEditor: Main map editing interface
     MapOperations: Map manipulation operations
+    MapEditBuffer: In-place map editing with sparse-delta undo/redo
+    OperationHistory: Byte-bounded undo/redo history
     MapAlgorithms: Smoothing and interpolation algorithms
     MapVisualization: 3D visualization components
     MapSnapshots: Versioning and snapshot management
@@ -25,13 +27,15 @@ Version: 1.0.0
 from .algorithms import MapAlgorithms
 from .editor import MapEditor
 from .ftmanager import FTManagerBridge
-from .operations import MapOperations
+from .operations import MapEditBuffer, MapOperations, OperationHistory
 from .snapshots import MapSnapshots
 from .visualization import MapVisualization
 
 __all__ = [
     "MapEditor",
     "MapOperations",
+    "MapEditBuffer",
+    "OperationHistory",
     "MapAlgorithms",
     "MapVisualization",
     "MapSnapshots",
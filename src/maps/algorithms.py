@@ -12,16 +12,21 @@ CRITICAL: Follows PYTHON-CODE-STANDARDS.md:
 """
 
 import logging
+import warnings
 from dataclasses import dataclass
-from typing import Any, Dict, Literal, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Literal, Optional, Tuple
 
 import numpy as np
 import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
 from scipy import interpolate, ndimage
 from scipy.signal import savgol_filter
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on window elements materialized at once by the windowed filters
+MAX_WINDOW_ELEMENTS = 4_000_000
+
 
 @dataclass
 class SmoothingParams:
@@ -239,13 +244,12 @@ class MapAlgorithms:
 
             result_df = map_data.copy()
 
-            for col in numeric_cols:
-                values = result_df[col].values.reshape(len(result_df), -1)
-
-                # Apply custom bilateral filter
-                filtered = self._bilateral_filter_2d(values, sigma_spatial, sigma_range)
+            # Filter every column of the same dtype in one call
+            for columns, stack in self._numeric_column_stacks(map_data, numeric_cols):
+                filtered = self._bilateral_filter_2d(stack, sigma_spatial, sigma_range)
 
-                result_df[col] = filtered.flatten()
+                for col, values in zip(columns, filtered):
+                    result_df[col] = values.flatten()
 
             # Record performance
             self.last_operation_time = time.time() - start_time
@@ -431,19 +435,12 @@ class MapAlgorithms:
 
             result_df = map_data.copy()
 
-            for col in numeric_cols:
-                values = result_df[col].values.reshape(len(result_df), -1)
-
-                # Estimate local noise levels
-                noise_map = self._estimate_local_noise(values)
-
-                # Create adaptive sigma map
-                sigma_map = np.clip(noise_map / noise_threshold * max_sigma, 0.1, max_sigma)
+            # Smooth every column of the same dtype in one call
+            for columns, stack in self._numeric_column_stacks(map_data, numeric_cols):
+                smoothed = self._adaptive_smooth_stack(stack, noise_threshold, max_sigma)
 
-                # Apply variable smoothing
-                smoothed = self._variable_gaussian_filter(values, sigma_map)
-
-                result_df[col] = smoothed.flatten()
+                for col, values in zip(columns, smoothed):
+                    result_df[col] = values.flatten()
 
             # Record performance
             self.last_operation_time = time.time() - start_time
@@ -455,6 +452,81 @@ class MapAlgorithms:
             logger.error(f"Adaptive smoothing failed: {e}")
             raise
 
+    def smooth_batch(
+        self,
+        maps: np.ndarray,
+        method: Literal["gaussian", "median", "bilateral", "adaptive"] = "gaussian",
+        sigma: float = 1.0,
+        sigma_range: float = 0.1,
+        kernel_size: int = 3,
+        noise_threshold: float = 0.1,
+        max_sigma: float = 2.0,
+    ) -> np.ndarray:
+        """
+        Smooth a stack of maps of the same shape in one call.
+
+        Args:
+            maps: Array of shape (n_maps, rows, cols); a single 2D map is also accepted
+            method: Smoothing method ('gaussian', 'median', 'bilateral', 'adaptive')
+            sigma: Gaussian sigma, or spatial sigma for bilateral
+            sigma_range: Range standard deviation for bilateral
+            kernel_size: Window size for median
+            noise_threshold: Threshold for noise detection (adaptive)
+            max_sigma: Maximum smoothing sigma (adaptive)
+
+        Returns:
+            Smoothed maps with the same shape as the input
+
+        Raises:
+            ValueError: If maps are not 2D or parameters are invalid
+
+        Performance (1000 maps of 32x32):
+            gaussian < 50ms, median (3x3) < 250ms, adaptive < 500ms,
+            bilateral < 1.5s at sigma=1 (7x7 window; cost grows with sigma**2)
+        """
+
+        import time
+
+        start_time = time.time()
+
+        try:
+            maps = np.asarray(maps, dtype=np.float64)
+            if maps.ndim < 2:
+                raise ValueError("Maps must have at least 2 dimensions (rows, cols)")
+            if sigma <= 0:
+                raise ValueError("Sigma must be positive")
+
+            # Only the last two axes are spatial
+            leading = (0,) * (maps.ndim - 2)
+
+            if method == "gaussian":
+                smoothed = ndimage.gaussian_filter(
+                    maps, sigma=leading + (sigma, sigma), mode="reflect"
+                )
+            elif method == "median":
+                smoothed = ndimage.median_filter(
+                    maps, size=(1,) * len(leading) + (kernel_size, kernel_size), mode="reflect"
+                )
+            elif method == "bilateral":
+                smoothed = self._bilateral_filter_2d(maps, sigma, sigma_range)
+            elif method == "adaptive":
+                smoothed = self._adaptive_smooth_stack(maps, noise_threshold, max_sigma)
+            else:
+                raise ValueError(f"Unknown smoothing method: {method}")
+
+            # Record performance
+            self.last_operation_time = time.time() - start_time
+            logger.debug(
+                f"Batch {method} smoothing of {maps.shape} completed "
+                f"in {self.last_operation_time:.3f}s"
+            )
+
+            return smoothed
+
+        except Exception as e:
+            logger.error(f"Batch smoothing failed: {e}")
+            raise
+
     def get_performance_metrics(self) -> Dict[str, Any]:
         """
         Get performance metrics for last operation.
@@ -471,6 +543,35 @@ class MapAlgorithms:
 
     # Private helper methods
 
+    def _numeric_column_stacks(
+        self, map_data: pd.DataFrame, numeric_cols: pd.Index
+    ) -> Iterator[Tuple[List[Any], np.ndarray]]:
+        """Group numeric columns by dtype and stack them as (n_columns, rows, 1) maps."""
+
+        columns_by_dtype: Dict[Any, List[Any]] = {}
+        for col in numeric_cols:
+            columns_by_dtype.setdefault(map_data[col].dtype, []).append(col)
+
+        for columns in columns_by_dtype.values():
+            stack = np.stack(
+                [map_data[col].to_numpy().reshape(len(map_data), -1) for col in columns]
+            )
+            yield columns, stack
+
+    def _adaptive_smooth_stack(
+        self, values: np.ndarray, noise_threshold: float, max_sigma: float
+    ) -> np.ndarray:
+        """Adaptive smoothing of maps stacked along the leading axes."""
+
+        # Estimate local noise levels
+        noise_map = self._estimate_local_noise(values)
+
+        # Create adaptive sigma map
+        sigma_map = np.clip(noise_map / noise_threshold * max_sigma, 0.1, max_sigma)
+
+        # Apply variable smoothing
+        return self._variable_gaussian_filter(values, sigma_map)
+
     def _detect_outliers_iqr(self, values: np.ndarray, factor: float = 1.5) -> np.ndarray:
         """Detect outliers using IQR method."""
 
@@ -529,10 +630,15 @@ class MapAlgorithms:
     def _bilateral_filter_2d(
         self, values: np.ndarray, sigma_spatial: float, sigma_range: float
     ) -> np.ndarray:
-        """Simplified 2D bilateral filter implementation."""
+        """
+        Simplified 2D bilateral filter implementation.
+
+        Filters the last two axes, so a stack of maps (..., rows, cols) is
+        processed in one call. Neighborhoods are truncated at the map edges.
+        """
 
-        rows, cols = values.shape
-        result = np.zeros_like(values)
+        values = np.asarray(values)
+        rows, cols = values.shape[-2:]
 
         # Create spatial Gaussian kernel
         kernel_size = int(2 * sigma_spatial * 3) + 1  # 3-sigma rule
@@ -543,33 +649,33 @@ class MapAlgorithms:
         y, x = np.mgrid[-center : center + 1, -center : center + 1]
         spatial_kernel = np.exp(-(x**2 + y**2) / (2 * sigma_spatial**2))
 
-        # Apply bilateral filtering (simplified version)
-        for i in range(rows):
-            for j in range(cols):
-                # Get neighborhood
-                y_min = max(0, i - center)
-                y_max = min(rows, i + center + 1)
-                x_min = max(0, j - center)
-                x_max = min(cols, j + center + 1)
+        # Cells outside the map get zero weight
+        inside = np.pad(np.ones((rows, cols)), center)
+        spatial_windows = sliding_window_view(inside, (kernel_size, kernel_size)) * spatial_kernel
 
-                neighborhood = values[y_min:y_max, x_min:x_max]
-                spatial_weights = spatial_kernel[
-                    center - (i - y_min) : center + (y_max - i),
-                    center - (j - x_min) : center + (x_max - j),
-                ]
+        stack = values.reshape(-1, rows, cols).astype(np.float64, copy=False)
+        padded = np.pad(stack, ((0, 0), (center, center), (center, center)))
+        result = np.empty(stack.shape)
 
-                # Range weights based on intensity difference
-                center_value = values[i, j]
-                range_weights = np.exp(-((neighborhood - center_value) ** 2) / (2 * sigma_range**2))
+        # Bound the (maps, rows, cols, k, k) window temporaries
+        chunk = max(1, MAX_WINDOW_ELEMENTS // (rows * cols * kernel_size**2))
+        for first in range(0, len(stack), chunk):
+            windows = sliding_window_view(
+                padded[first : first + chunk], (kernel_size, kernel_size), axis=(1, 2)
+            )
+            center_values = stack[first : first + chunk, :, :, None, None]
 
-                # Combined weights
-                weights = spatial_weights * range_weights
-                weights /= np.sum(weights)
+            # Range weights based on intensity difference
+            weights = spatial_windows * np.exp(
+                -((windows - center_values) ** 2) / (2 * sigma_range**2)
+            )
 
-                # Weighted average
-                result[i, j] = np.sum(neighborhood * weights)
+            # Weighted average
+            result[first : first + chunk] = np.sum(windows * weights, axis=(-2, -1)) / np.sum(
+                weights, axis=(-2, -1)
+            )
 
-        return result
+        return result.reshape(values.shape).astype(values.dtype, copy=False)
 
     def _griddata_interpolation(
         self, values: np.ndarray, valid_mask: np.ndarray, method: str, fill_value: Optional[float]
@@ -632,23 +738,52 @@ class MapAlgorithms:
             return values
 
     def _estimate_local_noise(self, values: np.ndarray, window_size: int = 3) -> np.ndarray:
-        """Estimate local noise levels using local standard deviation."""
-
-        # Calculate local standard deviation as noise estimate
-        local_std = ndimage.generic_filter(values, np.nanstd, size=window_size, mode="reflect")
-
-        return local_std
+        """Estimate local noise levels using local standard deviation (last two axes)."""
+
+        values = np.asarray(values)
+        rows, cols = values.shape[-2:]
+        stack = values.reshape(-1, rows, cols).astype(np.float64, copy=False)
+
+        # Same window placement and "reflect" boundary as ndimage filters
+        before = window_size // 2
+        after = window_size - 1 - before
+        padded = np.pad(stack, ((0, 0), (before, after), (before, after)), mode="symmetric")
+        local_std = np.empty(stack.shape)
+
+        # Bound the (maps, rows, cols, k, k) temporaries of nanstd
+        chunk = max(1, MAX_WINDOW_ELEMENTS // (rows * cols * window_size**2))
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)  # All-NaN windows
+            for first in range(0, len(stack), chunk):
+                windows = sliding_window_view(
+                    padded[first : first + chunk], (window_size, window_size), axis=(1, 2)
+                )
+                # Calculate local standard deviation as noise estimate
+                local_std[first : first + chunk] = np.nanstd(windows, axis=(-2, -1))
+
+        return local_std.reshape(values.shape).astype(values.dtype, copy=False)
 
     def _variable_gaussian_filter(self, values: np.ndarray, sigma_map: np.ndarray) -> np.ndarray:
         """Apply Gaussian filter with variable sigma (simplified)."""
 
         # Simplified implementation - could be enhanced with proper variable kernel
-        # For now, use average sigma and blend
-        avg_sigma = np.nanmean(sigma_map)
-        smoothed = ndimage.gaussian_filter(values, sigma=avg_sigma, mode="reflect")
+        # For now, use average sigma per map and blend
+        values = np.asarray(values)
+        rows, cols = values.shape[-2:]
+        stack = values.reshape(-1, rows, cols)
+        sigmas = np.nanmean(sigma_map.reshape(-1, rows, cols), axis=(1, 2))
+        smoothed = np.empty_like(stack)
+
+        # One filter call per distinct sigma: maps sharing a sigma are filtered together
+        for sigma in np.unique(sigmas):
+            group = (sigmas == sigma) | (np.isnan(sigmas) & np.isnan(sigma))
+            smoothed[group] = ndimage.gaussian_filter(
+                stack[group], sigma=(0, sigma, sigma), mode="reflect"
+            )
+        smoothed = smoothed.reshape(values.shape)
 
         # Blend based on local sigma
-        normalized_sigma = sigma_map / np.nanmax(sigma_map)
+        normalized_sigma = sigma_map / np.nanmax(sigma_map, axis=(-2, -1), keepdims=True)
         result = normalized_sigma * smoothed + (1 - normalized_sigma) * values
 
         return result
@@ -24,7 +24,7 @@ from st_aggrid import AgGrid, DataReturnMode, GridOptionsBuilder, GridUpdateMode
 from st_aggrid.shared import DataReturnMode, GridUpdateMode
 
 from .algorithms import MapAlgorithms
-from .operations import MapOperations
+from .operations import CellSelection, MapEditBuffer, MapOperations
 from .snapshots import MapSnapshots
 from .visualization import MapVisualization
 
@@ -78,8 +78,8 @@ class MapEditor:
         if "current_map" not in st.session_state:
             st.session_state.current_map = None
 
-        if "map_history" not in st.session_state:
-            st.session_state.map_history = []
+        if "map_buffer" not in st.session_state:
+            st.session_state.map_buffer = None
 
         if "selected_cells" not in st.session_state:
             st.session_state.selected_cells = []
@@ -462,6 +462,7 @@ class MapEditor:
 
             # Store in session state
             st.session_state.current_map = df
+            st.session_state.map_buffer = MapEditBuffer.from_frame(df)
 
             # Create metadata
             st.session_state.map_metadata = MapMetadata(
@@ -508,13 +509,10 @@ class MapEditor:
                         # Boost should be reasonable (0-3.0)
                         updated_data[col] = updated_data[col].clip(0.0, 3.0)
 
-            # Update session state
-            st.session_state.current_map = updated_data
-
-            # Update metadata
-            if st.session_state.map_metadata:
-                st.session_state.map_metadata.modified_at = datetime.now()
-                st.session_state.map_metadata.version += 1
+            # Record only the cells that changed
+            buffer = self._get_edit_buffer()
+            if buffer.set_values(updated_data[numeric_columns].to_numpy(), "edit"):
+                self._sync_from_buffer(updated_data)
 
         except Exception as e:
             logger.error(f"Grid update error: {e}")
@@ -534,13 +532,50 @@ class MapEditor:
 
     def _undo_operation(self) -> None:
         """Undo last operation."""
-        # TODO: Implement undo functionality
-        st.info("Undo functionality will be implemented")
+        try:
+            if st.session_state.current_map is not None and self._get_edit_buffer().undo():
+                self._sync_from_buffer(st.session_state.current_map)
+                st.rerun()
+            else:
+                st.info("Nothing to undo")
+        except Exception as e:
+            logger.error(f"Undo error: {e}")
+            st.error("Undo failed")
 
     def _redo_operation(self) -> None:
         """Redo last undone operation."""
-        # TODO: Implement redo functionality
-        st.info("Redo functionality will be implemented")
+        try:
+            if st.session_state.current_map is not None and self._get_edit_buffer().redo():
+                self._sync_from_buffer(st.session_state.current_map)
+                st.rerun()
+            else:
+                st.info("Nothing to redo")
+        except Exception as e:
+            logger.error(f"Redo error: {e}")
+            st.error("Redo failed")
+
+    def _get_edit_buffer(self) -> MapEditBuffer:
+        """Get the edit buffer of the current map, creating it if needed."""
+
+        current_map = st.session_state.current_map
+        buffer = st.session_state.get("map_buffer")
+        numeric_shape = current_map.select_dtypes(include=[np.number]).shape
+
+        if buffer is None or buffer.shape != numeric_shape:
+            buffer = MapEditBuffer.from_frame(current_map)
+            st.session_state.map_buffer = buffer
+
+        return buffer
+
+    def _sync_from_buffer(self, template: pd.DataFrame) -> None:
+        """Publish the edit buffer values as the current map."""
+
+        st.session_state.current_map = st.session_state.map_buffer.to_frame(template)
+
+        # Update metadata
+        if st.session_state.map_metadata:
+            st.session_state.map_metadata.modified_at = datetime.now()
+            st.session_state.map_metadata.version += 1
 
     def _apply_smoothing(self) -> None:
         """Apply smoothing algorithm to selected cells."""
@@ -549,7 +584,11 @@ class MapEditor:
                 smoothed_map = self.algorithms.gaussian_smooth(
                     st.session_state.current_map, sigma=1.0
                 )
-                st.session_state.current_map = smoothed_map
+                numeric_columns = smoothed_map.select_dtypes(include=[np.number]).columns
+                self._get_edit_buffer().set_values(
+                    smoothed_map[numeric_columns].to_numpy(), "smooth", {"sigma": 1.0}
+                )
+                self._sync_from_buffer(smoothed_map)
                 st.success("Smoothing applied!")
                 st.rerun()
         except Exception as e:
@@ -583,10 +622,10 @@ class MapEditor:
         try:
             if st.session_state.current_map is not None:
                 # For now, increment all numeric cells
-                numeric_columns = st.session_state.current_map.select_dtypes(
-                    include=[np.number]
-                ).columns
-                st.session_state.current_map[numeric_columns] += value
+                buffer = self._get_edit_buffer()
+                rows, cols = buffer.shape
+                buffer.increment(CellSelection(0, rows - 1, 0, cols - 1), value)
+                self._sync_from_buffer(st.session_state.current_map)
                 st.success(f"Incremented by {value}")
                 st.rerun()
         except Exception as e:
@@ -2,7 +2,8 @@
 Map Operations - Core editing operations for tuning maps
 
 This module provides optimized operations for map editing including
-copy/paste, increment/decrement, region selection, and batch operations.
+copy/paste, increment/decrement, region selection, and batch operations,
+plus an in-place edit buffer with sparse-delta undo/redo history.
 
 CRITICAL: Follows PYTHON-CODE-STANDARDS.md:
 - Type hints 100% coverage
@@ -12,15 +13,23 @@ CRITICAL: Follows PYTHON-CODE-STANDARDS.md:
 """
 
 import logging
+from collections import deque
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Deque, Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+# Default byte budget of an operation history (indices + old + new values)
+DEFAULT_HISTORY_BYTES = 1 << 20  # 1 MiB
+
+# Consecutive edits of the same kind on the same cells within this window
+# are merged into a single undo step
+COALESCE_SECONDS = 1.0
+
 
 @dataclass
 class CellSelection:
@@ -41,15 +50,249 @@ class CellSelection:
 
 @dataclass
 class MapOperation:
-    """Type-safe operation record for undo/redo."""
+    """Type-safe operation record for undo/redo (sparse cell deltas)."""
 
-    operation_type: str  # 'increment', 'smooth', 'interpolate', 'paste'
+    operation_type: str  # 'increment', 'scale', 'fill', 'paste', 'edit', 'smooth'
     timestamp: datetime
-    affected_cells: CellSelection
-    old_values: np.ndarray
-    new_values: np.ndarray
+    affected_cells: Optional[CellSelection]  # None for whole-map edits
+    cell_indices: np.ndarray  # Flat (row * n_cols + col) indices of changed cells
+    old_values: np.ndarray  # Value of each changed cell before the operation
+    new_values: np.ndarray  # Value of each changed cell after the operation
     parameters: Dict[str, Any]
 
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the delta arrays."""
+        return self.cell_indices.nbytes + self.old_values.nbytes + self.new_values.nbytes
+
+
+def _sparse_delta(
+    before: np.ndarray, after: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Flat indices and old/new values of the cells that differ (NaN equals NaN)."""
+
+    before = np.asarray(before).ravel()
+    after = np.asarray(after).ravel()
+
+    changed = before != after
+    if np.issubdtype(before.dtype, np.floating) and np.issubdtype(after.dtype, np.floating):
+        changed &= ~(np.isnan(before) & np.isnan(after))
+
+    indices = np.flatnonzero(changed).astype(np.int32)
+    return indices, before[indices], after[indices]
+
+
+def _write_numeric_cells(
+    map_data: pd.DataFrame,
+    numeric_cols: pd.Index,
+    cell_indices: np.ndarray,
+    values: np.ndarray,
+) -> pd.DataFrame:
+    """Copy of map_data with cells (flat numeric-block indices) set to values.
+
+    Only the touched columns are rewritten, and each keeps its dtype unless
+    the values do not fit it (fractional values in an integer column).
+    """
+
+    result_df = map_data.copy()
+    rows, cols = np.divmod(cell_indices, len(numeric_cols))
+
+    for col_position in np.unique(cols):
+        col = numeric_cols[col_position]
+        in_column = cols == col_position
+        column_values = values[in_column]
+        column = result_df[col].to_numpy()
+
+        if np.issubdtype(column.dtype, np.integer) and not np.array_equal(
+            column_values, np.round(column_values)
+        ):
+            column = column.astype(np.float64)
+        else:
+            column = column.copy()
+            column_values = column_values.astype(column.dtype)
+
+        column[rows[in_column]] = column_values
+        result_df[col] = column
+
+    return result_df
+
+
+def _merge_operations(first: MapOperation, second: MapOperation) -> MapOperation:
+    """Merge two consecutive operations into one undo step."""
+
+    indices = np.concatenate([first.cell_indices, second.cell_indices])
+    old_values = np.concatenate([first.old_values, second.old_values])
+    new_values = np.concatenate([first.new_values, second.new_values])
+
+    # Earliest old value and latest new value of every cell
+    cells, first_position = np.unique(indices, return_index=True)
+    _, last_from_end = np.unique(indices[::-1], return_index=True)
+    last_position = len(indices) - 1 - last_from_end
+
+    merged_indices, old, new = _sparse_delta(old_values[first_position], new_values[last_position])
+
+    return MapOperation(
+        operation_type=second.operation_type,
+        timestamp=second.timestamp,
+        affected_cells=second.affected_cells,
+        cell_indices=cells[merged_indices].astype(np.int32),
+        old_values=old,
+        new_values=new,
+        parameters={**second.parameters, "coalesced": first.parameters.get("coalesced", 1) + 1},
+    )
+
+
+def _fill_pattern(rows: int, cols: int, fill_value: float, fill_pattern: str) -> np.ndarray:
+    """Generate fill data for a region of the given size."""
+
+    if fill_pattern == "constant":
+        return np.full((rows, cols), fill_value)
+
+    if fill_pattern == "gradient_x":
+        # Horizontal gradient from fill_value to fill_value * 1.5
+        x_gradient = np.linspace(fill_value, fill_value * 1.5, cols)
+        return np.tile(x_gradient, (rows, 1))
+
+    if fill_pattern == "gradient_y":
+        # Vertical gradient
+        y_gradient = np.linspace(fill_value, fill_value * 1.5, rows)
+        return np.tile(y_gradient.reshape(-1, 1), (1, cols))
+
+    raise ValueError(f"Unknown fill pattern: {fill_pattern}")
+
+
+def _scale_values(values: Any, scale_factor: float, scale_mode: str) -> Any:
+    """Scale values ('multiply', 'percentage' or 'offset')."""
+
+    if scale_mode == "multiply":
+        return values * scale_factor
+
+    if scale_mode == "percentage":
+        # Scale by percentage: new = old * (1 + factor/100)
+        return values * (1.0 + scale_factor / 100.0)
+
+    if scale_mode == "offset":
+        # Add offset to current values
+        return values + scale_factor
+
+    raise ValueError(f"Unknown scale mode: {scale_mode}")
+
+
+class OperationHistory:
+    """
+    Bounded undo/redo history of sparse map operations.
+
+    Features:
+    - Ring buffer: the oldest operations are dropped once the held deltas
+      exceed max_bytes or the count exceeds max_operations
+    - Consecutive operations of the same type on the same selection within
+      coalesce_seconds are merged into one undo step
+    - Undo/redo move records between stacks (no copies)
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_HISTORY_BYTES,
+        max_operations: int = 100,
+        coalesce_seconds: float = COALESCE_SECONDS,
+    ):
+        """
+        Initialize operation history.
+
+        Args:
+            max_bytes: Maximum memory held by undo and redo deltas
+            max_operations: Maximum number of undo steps
+            coalesce_seconds: Window for merging consecutive edits (0 disables)
+        """
+        self.max_bytes = max_bytes
+        self.max_operations = max_operations
+        self.coalesce_seconds = coalesce_seconds
+        self.nbytes = 0
+        self._undo: Deque[MapOperation] = deque()
+        self._redo: List[MapOperation] = []
+
+    def __len__(self) -> int:
+        return len(self._undo)
+
+    @property
+    def operations(self) -> List[MapOperation]:
+        """Undo steps, oldest first."""
+        return list(self._undo)
+
+    @property
+    def can_undo(self) -> bool:
+        return bool(self._undo)
+
+    @property
+    def can_redo(self) -> bool:
+        return bool(self._redo)
+
+    def record(self, operation: MapOperation) -> None:
+        """Add an operation, coalescing and evicting as needed."""
+
+        # A new edit invalidates the redo stack
+        self.nbytes -= sum(op.nbytes for op in self._redo)
+        self._redo.clear()
+
+        if self._undo and self._can_coalesce(self._undo[-1], operation):
+            previous = self._undo.pop()
+            self.nbytes -= previous.nbytes
+            operation = _merge_operations(previous, operation)
+
+            if len(operation.cell_indices) == 0:
+                # Edits cancelled each other out
+                return
+
+        self._undo.append(operation)
+        self.nbytes += operation.nbytes
+
+        while self._undo and (
+            self.nbytes > self.max_bytes or len(self._undo) > self.max_operations
+        ):
+            dropped = self._undo.popleft()
+            self.nbytes -= dropped.nbytes
+
+            if dropped is operation:
+                logger.warning(
+                    f"Operation '{operation.operation_type}' ({operation.nbytes} bytes) "
+                    f"exceeds history budget of {self.max_bytes} bytes and cannot be undone"
+                )
+
+    def undo(self) -> Optional[MapOperation]:
+        """Move the last operation to the redo stack and return it."""
+        if not self._undo:
+            return None
+
+        operation = self._undo.pop()
+        self._redo.append(operation)
+        return operation
+
+    def redo(self) -> Optional[MapOperation]:
+        """Move the last undone operation back to the undo stack and return it."""
+        if not self._redo:
+            return None
+
+        operation = self._redo.pop()
+        self._undo.append(operation)
+        return operation
+
+    def clear(self) -> None:
+        """Drop all undo and redo steps."""
+        self._undo.clear()
+        self._redo.clear()
+        self.nbytes = 0
+
+    def _can_coalesce(self, previous: MapOperation, operation: MapOperation) -> bool:
+        """Whether an operation continues the previous one."""
+        return (
+            self.coalesce_seconds > 0
+            and operation.affected_cells is not None
+            and operation.operation_type == previous.operation_type
+            and operation.affected_cells == previous.affected_cells
+            and (operation.timestamp - previous.timestamp).total_seconds()
+            <= self.coalesce_seconds
+        )
+
 
 class MapOperations:
     """
@@ -57,13 +300,26 @@ class MapOperations:
 
     All operations are optimized using NumPy vectorization for
     performance targets < 100ms on typical map sizes (16x16 to 32x32).
+
+    Each call returns a new DataFrame, so it copies the whole map (O(map));
+    undo recording diffs only the selected columns. For edits that cost
+    O(cells changed) use MapEditBuffer, which edits one array in place.
     """
 
-    def __init__(self):
-        """Initialize map operations handler."""
-        self.operation_history: List[MapOperation] = []
+    def __init__(self, max_history_bytes: int = DEFAULT_HISTORY_BYTES):
+        """
+        Initialize map operations handler.
+
+        Args:
+            max_history_bytes: Memory budget of the undo/redo history
+        """
+        self.history = OperationHistory(max_bytes=max_history_bytes, max_operations=50)
         self.clipboard_data: Optional[np.ndarray] = None
-        self.max_history_size = 50
+
+    @property
+    def operation_history(self) -> List[MapOperation]:
+        """Undo steps, oldest first."""
+        return self.history.operations
 
     def increment_region(
         self,
@@ -104,37 +360,27 @@ class MapOperations:
                 raise ValueError("No numeric columns found in map data")
 
             # Extract selection bounds
-            row_slice = slice(selection.start_row, selection.end_row + 1)
+            row_labels = result_df.index[selection.start_row : selection.end_row + 1]
             col_indices = numeric_cols[selection.start_col : selection.end_col + 1]
 
-            # Store old values for undo
-            old_values = result_df.loc[row_slice, col_indices].values.copy()
-
             # Vectorized increment operation
-            result_df.loc[row_slice, col_indices] += increment_value
+            result_df.loc[row_labels, col_indices] += increment_value
 
-            # Apply limits if requested
+            # Apply limits if requested (limits apply to whole columns)
             if apply_limits:
                 result_df = self._apply_value_limits(result_df, col_indices)
 
-            # Store new values
-            new_values = result_df.loc[row_slice, col_indices].values.copy()
-
-            # Record operation for undo
-            operation = MapOperation(
-                operation_type="increment",
-                timestamp=datetime.now(),
-                affected_cells=selection,
-                old_values=old_values,
-                new_values=new_values,
-                parameters={"increment_value": increment_value, "apply_limits": apply_limits},
+            # Record changed cells for undo
+            changed = self._record_operation(
+                map_data,
+                result_df,
+                numeric_cols,
+                "increment",
+                selection,
+                {"increment_value": increment_value, "apply_limits": apply_limits},
             )
 
-            self._add_to_history(operation)
-
-            logger.debug(
-                f"Incremented region by {increment_value}, affected {old_values.size} cells"
-            )
+            logger.debug(f"Incremented region by {increment_value}, changed {changed} cells")
 
             return result_df
 
@@ -163,11 +409,11 @@ class MapOperations:
             numeric_cols = map_data.select_dtypes(include=[np.number]).columns
 
             # Extract selection
-            row_slice = slice(selection.start_row, selection.end_row + 1)
+            row_labels = map_data.index[selection.start_row : selection.end_row + 1]
             col_indices = numeric_cols[selection.start_col : selection.end_col + 1]
 
             # Copy to clipboard
-            self.clipboard_data = map_data.loc[row_slice, col_indices].values.copy()
+            self.clipboard_data = map_data.loc[row_labels, col_indices].values.copy()
 
             logger.debug(
                 f"Copied region {selection} to clipboard, shape: {self.clipboard_data.shape}"
@@ -244,26 +490,22 @@ class MapOperations:
                     f"target size {target_rows}x{target_cols}"
                 )
 
-            # Store old values for undo
-            row_slice = slice(target_selection.start_row, target_selection.end_row + 1)
+            row_labels = result_df.index[target_selection.start_row : target_selection.end_row + 1]
             col_indices = numeric_cols[target_selection.start_col : target_selection.end_col + 1]
-            old_values = result_df.loc[row_slice, col_indices].values.copy()
 
             # Paste data
-            result_df.loc[row_slice, col_indices] = paste_data
-
-            # Record operation
-            operation = MapOperation(
-                operation_type="paste",
-                timestamp=datetime.now(),
-                affected_cells=target_selection,
-                old_values=old_values,
-                new_values=paste_data.copy(),
-                parameters={"resize_if_needed": resize_if_needed},
+            result_df.loc[row_labels, col_indices] = paste_data
+
+            # Record changed cells for undo
+            self._record_operation(
+                map_data,
+                result_df,
+                numeric_cols,
+                "paste",
+                target_selection,
+                {"resize_if_needed": resize_if_needed},
             )
 
-            self._add_to_history(operation)
-
             logger.debug(f"Pasted data to region {target_selection}")
 
             return result_df
@@ -305,44 +547,25 @@ class MapOperations:
             cols = selection.end_col - selection.start_col + 1
 
             # Generate fill data based on pattern
-            if fill_pattern == "constant":
-                fill_data = np.full((rows, cols), fill_value)
-
-            elif fill_pattern == "gradient_x":
-                # Horizontal gradient from fill_value to fill_value * 1.5
-                x_gradient = np.linspace(fill_value, fill_value * 1.5, cols)
-                fill_data = np.tile(x_gradient, (rows, 1))
-
-            elif fill_pattern == "gradient_y":
-                # Vertical gradient
-                y_gradient = np.linspace(fill_value, fill_value * 1.5, rows)
-                fill_data = np.tile(y_gradient.reshape(-1, 1), (1, cols))
-
-            else:
-                raise ValueError(f"Unknown fill pattern: {fill_pattern}")
+            fill_data = _fill_pattern(rows, cols, fill_value, fill_pattern)
 
             # Apply fill
-            row_slice = slice(selection.start_row, selection.end_row + 1)
+            row_labels = result_df.index[selection.start_row : selection.end_row + 1]
             col_indices = numeric_cols[selection.start_col : selection.end_col + 1]
 
-            # Store old values
-            old_values = result_df.loc[row_slice, col_indices].values.copy()
-
             # Fill region
-            result_df.loc[row_slice, col_indices] = fill_data
-
-            # Record operation
-            operation = MapOperation(
-                operation_type="fill",
-                timestamp=datetime.now(),
-                affected_cells=selection,
-                old_values=old_values,
-                new_values=fill_data.copy(),
-                parameters={"fill_value": fill_value, "fill_pattern": fill_pattern},
+            result_df.loc[row_labels, col_indices] = fill_data
+
+            # Record changed cells for undo
+            self._record_operation(
+                map_data,
+                result_df,
+                numeric_cols,
+                "fill",
+                selection,
+                {"fill_value": fill_value, "fill_pattern": fill_pattern},
             )
 
-            self._add_to_history(operation)
-
             logger.debug(f"Filled region {selection} with pattern '{fill_pattern}'")
 
             return result_df
@@ -379,41 +602,23 @@ class MapOperations:
             result_df = map_data.copy()
             numeric_cols = result_df.select_dtypes(include=[np.number]).columns
 
-            row_slice = slice(selection.start_row, selection.end_row + 1)
+            row_labels = result_df.index[selection.start_row : selection.end_row + 1]
             col_indices = numeric_cols[selection.start_col : selection.end_col + 1]
 
-            # Store old values
-            old_values = result_df.loc[row_slice, col_indices].values.copy()
-
             # Apply scaling based on mode
-            if scale_mode == "multiply":
-                result_df.loc[row_slice, col_indices] *= scale_factor
-
-            elif scale_mode == "percentage":
-                # Scale by percentage: new = old * (1 + factor/100)
-                result_df.loc[row_slice, col_indices] *= 1.0 + scale_factor / 100.0
-
-            elif scale_mode == "offset":
-                # Add offset to current values
-                result_df.loc[row_slice, col_indices] += scale_factor
-
-            else:
-                raise ValueError(f"Unknown scale mode: {scale_mode}")
-
-            # Get new values
-            new_values = result_df.loc[row_slice, col_indices].values.copy()
-
-            # Record operation
-            operation = MapOperation(
-                operation_type="scale",
-                timestamp=datetime.now(),
-                affected_cells=selection,
-                old_values=old_values,
-                new_values=new_values,
-                parameters={"scale_factor": scale_factor, "scale_mode": scale_mode},
+            result_df.loc[row_labels, col_indices] = _scale_values(
+                result_df.loc[row_labels, col_indices], scale_factor, scale_mode
             )
 
-            self._add_to_history(operation)
+            # Record changed cells for undo
+            self._record_operation(
+                map_data,
+                result_df,
+                numeric_cols,
+                "scale",
+                selection,
+                {"scale_factor": scale_factor, "scale_mode": scale_mode},
+            )
 
             logger.debug(f"Scaled region {selection} by {scale_factor} ({scale_mode})")
 
@@ -433,36 +638,55 @@ class MapOperations:
         Returns:
             DataFrame with last operation undone, or None if no history
 
-        Performance: < 10ms for restoration
+        Performance: < 10ms for restoration (O(cells changed))
         """
 
         try:
-            if not self.operation_history:
+            operation = self.history.undo()
+            if operation is None:
                 return None
 
-            last_operation = self.operation_history.pop()
-            result_df = map_data.copy()
+            result_df = self._write_cells(map_data, operation.cell_indices, operation.old_values)
 
-            # Restore old values
-            numeric_cols = result_df.select_dtypes(include=[np.number]).columns
-            selection = last_operation.affected_cells
+            logger.debug(f"Undid operation: {operation.operation_type}")
 
-            row_slice = slice(selection.start_row, selection.end_row + 1)
-            col_indices = numeric_cols[selection.start_col : selection.end_col + 1]
+            return result_df
+
+        except Exception as e:
+            logger.error(f"Undo operation failed: {e}")
+            raise
+
+    def redo_last_operation(self, map_data: pd.DataFrame) -> Optional[pd.DataFrame]:
+        """
+        Redo the last undone operation.
+
+        Args:
+            map_data: Current map DataFrame
+
+        Returns:
+            DataFrame with the operation reapplied, or None if nothing to redo
 
-            result_df.loc[row_slice, col_indices] = last_operation.old_values
+        Performance: < 10ms for restoration (O(cells changed))
+        """
+
+        try:
+            operation = self.history.redo()
+            if operation is None:
+                return None
+
+            result_df = self._write_cells(map_data, operation.cell_indices, operation.new_values)
 
-            logger.debug(f"Undid operation: {last_operation.operation_type}")
+            logger.debug(f"Redid operation: {operation.operation_type}")
 
             return result_df
 
         except Exception as e:
-            logger.error(f"Undo operation failed: {e}")
+            logger.error(f"Redo operation failed: {e}")
             raise
 
     def clear_history(self) -> None:
         """Clear operation history to free memory."""
-        self.operation_history.clear()
+        self.history.clear()
         logger.debug("Operation history cleared")
 
     def get_clipboard_info(self) -> Optional[Dict[str, Any]]:
@@ -525,14 +749,47 @@ class MapOperations:
 
         return result_df
 
-    def _add_to_history(self, operation: MapOperation) -> None:
-        """Add operation to history with size management."""
+    def _record_operation(
+        self,
+        before: pd.DataFrame,
+        after: pd.DataFrame,
+        numeric_cols: pd.Index,
+        operation_type: str,
+        selection: CellSelection,
+        parameters: Dict[str, Any],
+    ) -> int:
+        """Record the cells changed between two map versions; returns the count."""
+
+        # Edits only touch the selected columns (value limits may clip any of their rows)
+        selected_cols = numeric_cols[selection.start_col : selection.end_col + 1]
+        local_indices, old_values, new_values = _sparse_delta(
+            before[selected_cols].to_numpy(), after[selected_cols].to_numpy()
+        )
+        rows, cols = np.divmod(local_indices, len(selected_cols))
+        cell_indices = (rows * len(numeric_cols) + selection.start_col + cols).astype(np.int32)
+
+        if len(cell_indices) > 0:
+            self.history.record(
+                MapOperation(
+                    operation_type=operation_type,
+                    timestamp=datetime.now(),
+                    affected_cells=selection,
+                    cell_indices=cell_indices,
+                    old_values=old_values,
+                    new_values=new_values,
+                    parameters=parameters,
+                )
+            )
+
+        return len(cell_indices)
 
-        self.operation_history.append(operation)
+    def _write_cells(
+        self, map_data: pd.DataFrame, cell_indices: np.ndarray, values: np.ndarray
+    ) -> pd.DataFrame:
+        """Copy of map_data with cells (flat numeric-block indices) set to values."""
 
-        # Limit history size to prevent memory issues
-        if len(self.operation_history) > self.max_history_size:
-            self.operation_history.pop(0)
+        numeric_cols = map_data.select_dtypes(include=[np.number]).columns
+        return _write_numeric_cells(map_data, numeric_cols, cell_indices, values)
 
     def get_operation_history_summary(self) -> List[Dict[str, Any]]:
         """
@@ -546,9 +803,260 @@ class MapOperations:
             {
                 "type": op.operation_type,
                 "timestamp": op.timestamp.isoformat(),
-                "affected_cells": f"{op.affected_cells.start_row}-{op.affected_cells.end_row}, "
-                f"{op.affected_cells.start_col}-{op.affected_cells.end_col}",
+                "affected_cells": (
+                    f"{op.affected_cells.start_row}-{op.affected_cells.end_row}, "
+                    f"{op.affected_cells.start_col}-{op.affected_cells.end_col}"
+                    if op.affected_cells is not None
+                    else "all"
+                ),
+                "changed_cells": len(op.cell_indices),
+                "bytes": op.nbytes,
                 "parameters": op.parameters,
             }
             for op in self.operation_history
         ]
+
+
+class MapEditBuffer:
+    """
+    In-place edit engine over a float32 map with sparse-delta undo/redo.
+
+    Edits modify the array in place and record only the cells that changed,
+    so edits, undo and redo cost O(cells changed) and the history stays within
+    its byte budget (see OperationHistory).
+    """
+
+    def __init__(
+        self,
+        values: np.ndarray,
+        history: Optional[OperationHistory] = None,
+        dtype: Any = np.float32,
+    ):
+        """
+        Initialize edit buffer.
+
+        Args:
+            values: 2D map values (copied once)
+            history: Operation history (default: new OperationHistory)
+            dtype: Storage dtype of the map
+        """
+        self.values = np.array(values, dtype=dtype, order="C")
+        if self.values.ndim != 2:
+            raise ValueError("Map values must be 2D")
+
+        self.history = history if history is not None else OperationHistory()
+
+    @classmethod
+    def from_frame(
+        cls,
+        map_data: pd.DataFrame,
+        history: Optional[OperationHistory] = None,
+        dtype: Any = np.float32,
+    ) -> "MapEditBuffer":
+        """Create a buffer from the numeric columns of a map DataFrame."""
+
+        numeric_cols = map_data.select_dtypes(include=[np.number]).columns
+        if len(numeric_cols) == 0:
+            raise ValueError("No numeric columns found in map data")
+
+        return cls(map_data[numeric_cols].to_numpy(), history=history, dtype=dtype)
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self.values.shape
+
+    def to_frame(self, template: pd.DataFrame) -> pd.DataFrame:
+        """
+        Copy of template with the cells that differ from the buffer updated.
+
+        Cells whose template value matches the buffer at the buffer precision
+        are left untouched, so publishing an edit never perturbs the rest of
+        the map. Updated cells get the shortest decimal that round-trips the
+        stored value (14.8, not 14.800000190734863).
+
+        Args:
+            template: DataFrame providing index, columns and non-numeric data
+
+        Returns:
+            Map DataFrame
+        """
+
+        numeric_cols = template.select_dtypes(include=[np.number]).columns
+        if len(numeric_cols) != self.shape[1] or len(template) != self.shape[0]:
+            raise ValueError(f"Template numeric shape does not match buffer {self.shape}")
+
+        current = template[numeric_cols].to_numpy().astype(self.values.dtype)
+        cell_indices, _, values = _sparse_delta(current, self.values)
+        if len(cell_indices) == 0:
+            return template.copy()
+
+        values = values.astype(str).astype(np.float64)
+        return _write_numeric_cells(template, numeric_cols, cell_indices, values)
+
+    def increment(
+        self,
+        selection: CellSelection,
+        increment_value: float,
+        limits: Optional[Tuple[float, float]] = None,
+    ) -> int:
+        """Add a value to a region (optionally clipped to limits); returns cells changed."""
+
+        def transform(region: np.ndarray) -> np.ndarray:
+            new_values = region + increment_value
+            return np.clip(new_values, *limits) if limits is not None else new_values
+
+        return self._apply_region(
+            selection,
+            transform,
+            "increment",
+            {"increment_value": increment_value, "limits": limits},
+        )
+
+    def scale(
+        self, selection: CellSelection, scale_factor: float, scale_mode: str = "multiply"
+    ) -> int:
+        """Scale a region ('multiply', 'percentage', 'offset'); returns cells changed."""
+
+        return self._apply_region(
+            selection,
+            lambda region: _scale_values(region, scale_factor, scale_mode),
+            "scale",
+            {"scale_factor": scale_factor, "scale_mode": scale_mode},
+        )
+
+    def fill(
+        self, selection: CellSelection, fill_value: float, fill_pattern: str = "constant"
+    ) -> int:
+        """Fill a region with a value or pattern; returns cells changed."""
+
+        return self._apply_region(
+            selection,
+            lambda region: _fill_pattern(*region.shape, fill_value, fill_pattern),
+            "fill",
+            {"fill_value": fill_value, "fill_pattern": fill_pattern},
+        )
+
+    def paste(self, selection: CellSelection, data: np.ndarray) -> int:
+        """Paste data of the selection's size into a region; returns cells changed."""
+
+        data = np.asarray(data)
+
+        def transform(region: np.ndarray) -> np.ndarray:
+            if data.shape != region.shape:
+                raise ValueError(
+                    f"Paste data shape {data.shape} doesn't match selection {region.shape}"
+                )
+            return data
+
+        return self._apply_region(selection, transform, "paste", {})
+
+    def set_values(
+        self,
+        values: np.ndarray,
+        operation_type: str = "edit",
+        parameters: Optional[Dict[str, Any]] = None,
+    ) -> int:
+        """
+        Replace the whole map, recording only the cells that differ.
+
+        Used for grid edits and whole-map algorithms (smoothing, interpolation).
+
+        Returns:
+            Number of cells changed
+        """
+
+        new_values = np.asarray(values, dtype=self.values.dtype)
+        if new_values.shape != self.values.shape:
+            raise ValueError(f"Map shape {new_values.shape} doesn't match {self.values.shape}")
+
+        cell_indices, old_values, changed_values = _sparse_delta(self.values, new_values)
+        return self._commit(
+            cell_indices, old_values, changed_values, operation_type, None, parameters
+        )
+
+    def undo(self) -> bool:
+        """Undo the last operation in place; returns False if there is nothing to undo."""
+
+        operation = self.history.undo()
+        if operation is None:
+            return False
+
+        np.put(self.values, operation.cell_indices, operation.old_values)
+        return True
+
+    def redo(self) -> bool:
+        """Redo the last undone operation in place; returns False if there is nothing to redo."""
+
+        operation = self.history.redo()
+        if operation is None:
+            return False
+
+        np.put(self.values, operation.cell_indices, operation.new_values)
+        return True
+
+    def _apply_region(
+        self,
+        selection: CellSelection,
+        transform: Any,
+        operation_type: str,
+        parameters: Dict[str, Any],
+    ) -> int:
+        """Apply transform to a region in place and record the changed cells."""
+
+        rows, cols = self.values.shape
+        if selection.start_row < 0 or selection.end_row >= rows:
+            raise ValueError(
+                f"Row selection out of bounds: {selection.start_row}-{selection.end_row}"
+            )
+        if selection.start_col < 0 or selection.end_col >= cols:
+            raise ValueError(
+                f"Column selection out of bounds: {selection.start_col}-{selection.end_col}"
+            )
+
+        region = self.values[
+            selection.start_row : selection.end_row + 1,
+            selection.start_col : selection.end_col + 1,
+        ]
+        new_region = np.asarray(transform(region), dtype=self.values.dtype)
+
+        local_indices, old_values, new_values = _sparse_delta(region, new_region)
+
+        # Region-local indices to map indices
+        local_rows, local_cols = np.divmod(local_indices, region.shape[1])
+        cell_indices = (
+            (local_rows + selection.start_row) * cols + local_cols + selection.start_col
+        ).astype(np.int32)
+
+        return self._commit(
+            cell_indices, old_values, new_values, operation_type, selection, parameters
+        )
+
+    def _commit(
+        self,
+        cell_indices: np.ndarray,
+        old_values: np.ndarray,
+        new_values: np.ndarray,
+        operation_type: str,
+        selection: Optional[CellSelection],
+        parameters: Optional[Dict[str, Any]],
+    ) -> int:
+        """Write changed cells in place and record them in the history."""
+
+        if len(cell_indices) == 0:
+            return 0
+
+        np.put(self.values, cell_indices, new_values)
+
+        self.history.record(
+            MapOperation(
+                operation_type=operation_type,
+                timestamp=datetime.now(),
+                affected_cells=selection,
+                cell_indices=cell_indices,
+                old_values=old_values,
+                new_values=new_values,
+                parameters=parameters or {},
+            )
+        )
+
+        return len(cell_indices)
@@ -17,6 +17,9 @@ import json
 import logging
 import pickle
 import sqlite3
+import struct
+import zlib
+from collections import OrderedDict
 from dataclasses import asdict, dataclass
 from datetime import datetime
 from pathlib import Path
@@ -27,6 +30,12 @@ import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+# Snapshot blob format: magic, header length, JSON header, zlib body
+SNAPSHOT_MAGIC = b"FTSD"
+SNAPSHOT_CODEC_LEVEL = 1
+# A full keyframe is written at least every N versions of a map
+KEYFRAME_INTERVAL = 16
+
 
 @dataclass
 class SnapshotMetadata:
@@ -70,18 +79,51 @@ class SnapshotDiff:
     change_summary: Dict[str, Any]
 
 
+@dataclass
+class _MapState:
+    """Decoded snapshot values with their labels and keyframe distance."""
+
+    index: pd.Index
+    columns: pd.Index
+    values: np.ndarray
+    depth: int
+
+    def to_frame(self) -> pd.DataFrame:
+        """Build an independent DataFrame from the state."""
+        return pd.DataFrame(self.values.copy(), index=self.index, columns=self.columns)
+
+    def is_compatible(self, other: "_MapState") -> bool:
+        """Check whether cell-level deltas between both states are meaningful."""
+        return (
+            self.values.shape == other.values.shape
+            and self.values.dtype == other.values.dtype
+            and self.index.equals(other.index)
+            and self.columns.equals(other.columns)
+        )
+
+
 class MapSnapshots:
     """
     Professional versioning system for tuning maps.
 
     Features:
     - SQLite-based storage with compression
+    - Keyframe + cell-level delta chains for numeric maps
     - Diff tracking between versions
     - Rollback capabilities
     - Metadata tagging and search
     - Performance optimized for frequent snapshots
+
+    Uniform numeric maps are stored as raw value buffers: a full keyframe
+    every ``KEYFRAME_INTERVAL`` versions and, in between, only the cells
+    that changed against ``parent_snapshot_id`` (with their old and new
+    values). Any version is rebuilt from at most ``KEYFRAME_INTERVAL``
+    records, and diffs along a chain are computed from the deltas alone.
+    Other maps fall back to compressed pickles.
     """
 
+    STATE_CACHE_SIZE = 16
+
     def __init__(self, db_path: Optional[Path] = None):
         """
         Initialize snapshot manager with database connection.
@@ -96,6 +138,9 @@ class MapSnapshots:
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
+        # Recently decoded snapshots (snapshots are immutable once written)
+        self._state_cache: "OrderedDict[str, _MapState]" = OrderedDict()
+
         # Initialize database
         self._init_database()
 
@@ -145,13 +190,13 @@ class MapSnapshots:
                 logger.warning(f"Identical snapshot {snapshot_id} already exists")
                 return snapshot_id
 
-            # Compress and serialize map data
-            compressed_data = self._compress_map_data(map_data)
-            data_hash = self._calculate_data_hash(compressed_data)
-
             # Find parent snapshot (latest version of same map)
             parent_id = self._find_latest_snapshot(metadata.name, metadata.map_type)
 
+            # Encode as keyframe or delta against the parent
+            compressed_data, state = self._encode_snapshot(map_data, parent_id)
+            data_hash = self._calculate_data_hash(compressed_data)
+
             # Calculate next version number
             next_version = self._get_next_version(metadata.name, metadata.map_type)
 
@@ -209,6 +254,9 @@ class MapSnapshots:
 
                 conn.commit()
 
+            if state is not None:
+                self._cache_state(snapshot_id, state)
+
             logger.info(f"Saved snapshot {snapshot_id} v{next_version} for {metadata.name}")
 
             return snapshot_id
@@ -255,20 +303,8 @@ class MapSnapshots:
                 metadata_dict["created_at"] = datetime.fromisoformat(metadata_dict["created_at"])
                 metadata_dict["tags"] = json.loads(metadata_dict["tags"])
 
-                # Get compressed data
-                cursor.execute(
-                    """
-                    SELECT compressed_data FROM snapshot_data WHERE snapshot_id = ?
-                """,
-                    (snapshot_id,),
-                )
-
-                data_row = cursor.fetchone()
-                if data_row is None:
-                    raise ValueError(f"Snapshot data {snapshot_id} not found")
-
-                # Decompress map data
-                map_data = self._decompress_map_data(data_row[0])
+                # Rebuild map data from its keyframe/delta chain
+                map_data = self._load_map_data(snapshot_id, conn)
 
                 logger.debug(f"Loaded snapshot {snapshot_id}")
 
@@ -354,23 +390,27 @@ class MapSnapshots:
         """
 
         try:
-            # Load both snapshots
-            map_1, meta_1 = self.load_snapshot(snapshot_id_1)
-            map_2, meta_2 = self.load_snapshot(snapshot_id_2)
+            # Versions on the same delta chain are compared from the deltas alone
+            diff_data = self._diff_from_deltas(snapshot_id_1, snapshot_id_2)
+
+            if diff_data is None:
+                # Load both snapshots
+                map_1, meta_1 = self.load_snapshot(snapshot_id_1)
+                map_2, meta_2 = self.load_snapshot(snapshot_id_2)
 
-            # Ensure compatible dimensions
-            if map_1.shape != map_2.shape:
-                raise ValueError("Cannot compare snapshots with different dimensions")
+                # Ensure compatible dimensions
+                if map_1.shape != map_2.shape:
+                    raise ValueError("Cannot compare snapshots with different dimensions")
 
-            # Get numeric columns
-            numeric_cols_1 = map_1.select_dtypes(include=[np.number]).columns
-            numeric_cols_2 = map_2.select_dtypes(include=[np.number]).columns
+                # Get numeric columns
+                numeric_cols_1 = map_1.select_dtypes(include=[np.number]).columns
+                numeric_cols_2 = map_2.select_dtypes(include=[np.number]).columns
 
-            if not numeric_cols_1.equals(numeric_cols_2):
-                raise ValueError("Cannot compare snapshots with different column structures")
+                if not numeric_cols_1.equals(numeric_cols_2):
+                    raise ValueError("Cannot compare snapshots with different column structures")
 
-            # Calculate differences
-            diff_data = map_2[numeric_cols_2].values - map_1[numeric_cols_1].values
+                # Calculate differences
+                diff_data = map_2[numeric_cols_2].values - map_1[numeric_cols_1].values
 
             # Compute statistics
             cells_changed = np.sum(np.abs(diff_data) > 1e-6)  # Account for floating point precision
@@ -499,6 +539,8 @@ class MapSnapshots:
 
                 conn.commit()
 
+            self._state_cache.pop(snapshot_id, None)
+
             logger.info(f"Deleted snapshot {snapshot_id}")
 
         except Exception as e:
@@ -588,6 +630,7 @@ class MapSnapshots:
                                     )
 
                                     deleted_count += 1
+                                    self._state_cache.pop(snapshot_id, None)
                                     logger.debug(f"Deleted old snapshot {snapshot_id}")
 
                             except Exception as e:
@@ -778,6 +821,283 @@ class MapSnapshots:
 
         return map_data
 
+    def _encode_snapshot(
+        self, map_data: pd.DataFrame, parent_id: Optional[str]
+    ) -> Tuple[bytes, Optional[_MapState]]:
+        """
+        Encode map data as a keyframe or a delta against its parent.
+
+        Returns:
+            Tuple of (blob, decoded state or None for pickled maps)
+        """
+
+        dtypes = set(map_data.dtypes)
+        if len(dtypes) != 1 or np.dtype(dtypes.pop()).kind not in "biuf":
+            # Mixed or non-numeric maps keep the pickle format
+            return self._compress_map_data(map_data), None
+
+        state = _MapState(
+            index=map_data.index,
+            columns=map_data.columns,
+            values=np.ascontiguousarray(map_data.to_numpy(copy=True)),
+            depth=0,
+        )
+
+        parent = None
+        if parent_id is not None:
+            try:
+                parent = self._get_state(parent_id)
+            except Exception as e:
+                logger.warning(f"Could not decode parent snapshot {parent_id}: {e}")
+
+        if parent is None or not parent.is_compatible(state):
+            return self._pack_snapshot(state, full=True), state
+
+        # Cells that changed, compared bitwise so NaN and -0.0 round-trip exactly
+        uint_dtype = f"u{state.values.dtype.itemsize}"
+        old = parent.values.ravel()
+        new = state.values.ravel()
+        changed = np.flatnonzero(old.view(uint_dtype) != new.view(uint_dtype))
+
+        state.depth = parent.depth + 1
+        full = state.depth >= KEYFRAME_INTERVAL
+        if full:
+            state.depth = 0
+
+        delta = (changed.astype(np.uint32), old[changed], new[changed])
+        return self._pack_snapshot(state, full=full, delta=delta), state
+
+    def _pack_snapshot(
+        self,
+        state: _MapState,
+        full: bool,
+        delta: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None,
+    ) -> bytes:
+        """Serialize a snapshot record (keyframe values and/or delta cells)."""
+
+        sections = []
+        if full:
+            labels = pickle.dumps((state.index, state.columns), protocol=pickle.HIGHEST_PROTOCOL)
+            sections += [("labels", labels), ("values", state.values.tobytes())]
+        if delta is not None:
+            indices, old, new = delta
+            sections += [
+                ("indices", indices.tobytes()),
+                ("old", old.tobytes()),
+                ("new", new.tobytes()),
+            ]
+
+        header = json.dumps(
+            {
+                "shape": list(state.values.shape),
+                "dtype": state.values.dtype.str,
+                "depth": state.depth,
+                "sections": [[name, len(data)] for name, data in sections],
+            }
+        ).encode("utf-8")
+        body = zlib.compress(b"".join(data for _, data in sections), SNAPSHOT_CODEC_LEVEL)
+
+        return SNAPSHOT_MAGIC + struct.pack("<I", len(header)) + header + body
+
+    def _unpack_snapshot(self, blob: bytes) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Parse a snapshot record into its header and decoded sections."""
+
+        header_length = struct.unpack_from("<I", blob, len(SNAPSHOT_MAGIC))[0]
+        start = len(SNAPSHOT_MAGIC) + 4
+        header = json.loads(blob[start : start + header_length])
+        body = zlib.decompress(blob[start + header_length :])
+
+        dtype = np.dtype(header["dtype"])
+        sections: Dict[str, Any] = {}
+        offset = 0
+        for name, length in header["sections"]:
+            data = body[offset : offset + length]
+            offset += length
+            if name == "labels":
+                sections[name] = pickle.loads(data)
+            elif name == "indices":
+                sections[name] = np.frombuffer(data, dtype=np.uint32)
+            else:
+                sections[name] = np.frombuffer(data, dtype=dtype)
+
+        return header, sections
+
+    def _cache_state(self, snapshot_id: str, state: _MapState) -> None:
+        """Remember a decoded snapshot."""
+
+        state.values.flags.writeable = False
+        self._state_cache[snapshot_id] = state
+        self._state_cache.move_to_end(snapshot_id)
+        while len(self._state_cache) > self.STATE_CACHE_SIZE:
+            self._state_cache.popitem(last=False)
+
+    def _get_state(
+        self, snapshot_id: str, conn: Optional[sqlite3.Connection] = None
+    ) -> Optional[_MapState]:
+        """
+        Rebuild a numeric snapshot from its nearest keyframe.
+
+        Returns:
+            Decoded state, or None if the snapshot is stored as a pickle
+        """
+
+        if snapshot_id in self._state_cache:
+            self._state_cache.move_to_end(snapshot_id)
+            return self._state_cache[snapshot_id]
+
+        if conn is None:
+            with self._get_db_connection() as own_conn:
+                return self._get_state(snapshot_id, own_conn)
+
+        # Walk parents back to the keyframe (bounded by the keyframe interval)
+        rows = conn.execute(
+            """
+            WITH RECURSIVE chain(snapshot_id, parent_snapshot_id, step) AS (
+                SELECT snapshot_id, parent_snapshot_id, 0 FROM snapshots WHERE snapshot_id = ?
+                UNION ALL
+                SELECT s.snapshot_id, s.parent_snapshot_id, chain.step + 1
+                FROM snapshots s JOIN chain ON s.snapshot_id = chain.parent_snapshot_id
+                WHERE chain.step < ?
+            )
+            SELECT chain.snapshot_id, d.compressed_data
+            FROM chain JOIN snapshot_data d ON d.snapshot_id = chain.snapshot_id
+            ORDER BY chain.step
+        """,
+            (snapshot_id, KEYFRAME_INTERVAL),
+        ).fetchall()
+
+        if not rows or rows[0][0] != snapshot_id:
+            raise ValueError(f"Snapshot data {snapshot_id} not found")
+
+        pending = []
+        base: Optional[_MapState] = None
+        for chain_id, blob in rows:
+            if chain_id in self._state_cache:
+                base = self._state_cache[chain_id]
+                break
+            if not blob.startswith(SNAPSHOT_MAGIC):
+                # Legacy/pickled snapshot: usable as a base only if it is numeric
+                frame = self._decompress_map_data(blob)
+                if not pending:
+                    return None
+                base = _MapState(
+                    frame.index, frame.columns, np.ascontiguousarray(frame.to_numpy()), 0
+                )
+                break
+            header, sections = self._unpack_snapshot(blob)
+            if "values" in sections:
+                index, columns = sections["labels"]
+                values = sections["values"].reshape(header["shape"])
+                base = _MapState(index, columns, values, header["depth"])
+                break
+            pending.append((chain_id, header, sections))
+
+        if base is None:
+            raise ValueError(f"Snapshot chain for {snapshot_id} is broken")
+
+        # Apply deltas from the keyframe forward
+        state = base
+        for chain_id, header, sections in reversed(pending):
+            values = state.values.copy()
+            values.ravel()[sections["indices"]] = sections["new"]
+            state = _MapState(state.index, state.columns, values, header["depth"])
+
+        self._cache_state(snapshot_id, state)
+        return state
+
+    def _load_map_data(self, snapshot_id: str, conn: sqlite3.Connection) -> pd.DataFrame:
+        """Load snapshot map data as an independent DataFrame."""
+
+        state = self._get_state(snapshot_id, conn)
+        if state is not None:
+            return state.to_frame()
+
+        row = conn.execute(
+            "SELECT compressed_data FROM snapshot_data WHERE snapshot_id = ?", (snapshot_id,)
+        ).fetchone()
+        if row is None:
+            raise ValueError(f"Snapshot data {snapshot_id} not found")
+        return self._decompress_map_data(row[0])
+
+    def _diff_from_deltas(self, snapshot_id_1: str, snapshot_id_2: str) -> Optional[np.ndarray]:
+        """
+        Compute ``map_2 - map_1`` from the stored deltas.
+
+        Only applies when one snapshot is an ancestor of the other and every
+        record between them carries a delta; returns None otherwise.
+        """
+
+        with self._get_db_connection() as conn:
+            rows = conn.execute(
+                """
+                SELECT s.snapshot_id, s.parent_snapshot_id FROM snapshots s
+                JOIN snapshots t ON s.map_name = t.map_name AND s.map_type = t.map_type
+                WHERE t.snapshot_id = ?
+            """,
+                (snapshot_id_1,),
+            ).fetchall()
+            parents = dict(rows)
+            if snapshot_id_1 not in parents or snapshot_id_2 not in parents:
+                return None
+
+            def path_between(ancestor: str, descendant: str) -> Optional[List[str]]:
+                path = []
+                current = descendant
+                while current != ancestor:
+                    if current is None or len(path) > 2 * KEYFRAME_INTERVAL:
+                        return None
+                    path.append(current)
+                    current = parents.get(current)
+                return path[::-1]
+
+            sign = 1.0
+            path = path_between(snapshot_id_1, snapshot_id_2)
+            if path is None:
+                path = path_between(snapshot_id_2, snapshot_id_1)
+                sign = -1.0
+            if path is None:
+                return None
+            if not path:
+                base = self._get_state(snapshot_id_1, conn)
+                return None if base is None else np.zeros(base.values.shape)
+
+            placeholders = ",".join("?" * len(path))
+            blobs = dict(
+                conn.execute(
+                    f"SELECT snapshot_id, compressed_data FROM snapshot_data "
+                    f"WHERE snapshot_id IN ({placeholders})",
+                    path,
+                ).fetchall()
+            )
+
+        indices, old, new = [], [], []
+        shape = None
+        for chain_id in path:
+            blob = blobs.get(chain_id)
+            if blob is None or not blob.startswith(SNAPSHOT_MAGIC):
+                return None
+            header, sections = self._unpack_snapshot(blob)
+            if "indices" not in sections or (shape and header["shape"] != shape):
+                return None
+            shape = header["shape"]
+            indices.append(sections["indices"])
+            old.append(sections["old"])
+            new.append(sections["new"])
+
+        indices = np.concatenate(indices)
+        old = np.concatenate(old)
+        new = np.concatenate(new)
+
+        # Net change per cell: first old value along the path vs last new value
+        cells, first = np.unique(indices, return_index=True)
+        _, last_reversed = np.unique(indices[::-1], return_index=True)
+        last = len(indices) - 1 - last_reversed
+
+        forward = new[last].astype(np.float64) - old[first].astype(np.float64)
+        diff_data = np.zeros(int(np.prod(shape)))
+        diff_data[cells] = forward if sign > 0 else -forward
+        return diff_data.reshape(shape)
+
     def _calculate_data_hash(self, data: bytes) -> str:
         """Calculate hash of data for integrity checking."""
 
@@ -6,15 +6,19 @@ Builder de gráficos padronizado usando Plotly com suporte a:
 - Themes responsivos
 - Interatividade avançada
 - Export automático
+- Downsampling de séries temporais (min/max e LTTB) preservando picos
 
 Author: A03-UI-STREAMLIT Agent
 Created: 2025-01-02
 """
 
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Any, Dict, List, Literal, Optional, Tuple, Union
+from typing import Any, Dict, Hashable, List, Literal, Optional, Tuple, Union
 
 import numpy as np
+import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 import streamlit as st
@@ -34,6 +38,9 @@ class ChartConfig:
     show_legend: bool = True
     show_grid: bool = True
     animation: bool = False
+    # Pontos máximos por série em gráficos de linha (None = 2 por pixel)
+    max_points: Optional[int] = None
+    downsample_method: Literal["minmax", "lttb", "none"] = "minmax"
 
 
 @dataclass
@@ -50,6 +57,276 @@ class SeriesData:
     secondary_y: bool = False
 
 
+# Largura de referência (px) usada quando o gráfico não define width
+DEFAULT_CHART_WIDTH_PX = 1200
+
+# Cache LRU de séries reduzidas: (sessão, coluna, janela, largura, ...) -> DataFrame
+_DOWNSAMPLE_CACHE_SIZE = 128
+_downsample_cache: "OrderedDict[Tuple, pd.DataFrame]" = OrderedDict()
+_downsample_lock = threading.Lock()
+
+
+def _numeric_axis(x: Any) -> Optional[np.ndarray]:
+    """Converter eixo X em float64 (datas viram ns); None se não for numérico."""
+    values = np.asarray(x)
+    if values.dtype.kind == "M":
+        return values.astype("datetime64[ns]").view(np.int64).astype(np.float64)
+    if values.dtype.kind in "iuf":
+        return values.astype(np.float64, copy=False)
+    return None
+
+
+def minmax_indices(x: np.ndarray, y: np.ndarray, n_buckets: int) -> np.ndarray:
+    """
+    Selecionar índices por agregação min/max (M4) em n_buckets faixas.
+
+    Cada faixa contribui com o primeiro, o último, o mínimo e o máximo,
+    então picos e vales nunca são perdidos. Faixas são definidas pela
+    largura em X quando o eixo é crescente, ou pela posição caso contrário.
+
+    Args:
+        x: Eixo X numérico
+        y: Valores da série
+        n_buckets: Número de faixas (tipicamente colunas de pixel)
+
+    Returns:
+        Índices ordenados dos pontos mantidos (NaNs são descartados)
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    valid = np.flatnonzero(np.isfinite(x) & np.isfinite(y))
+    n = len(valid)
+    if n <= 4 * max(n_buckets, 1):
+        return valid
+
+    xv = x[valid]
+    yv = y[valid]
+
+    if np.all(xv[1:] >= xv[:-1]) and xv[-1] > xv[0]:
+        edges = np.linspace(xv[0], xv[-1], n_buckets + 1)
+        bucket = np.clip(np.searchsorted(edges, xv, side="right") - 1, 0, n_buckets - 1)
+    else:
+        bucket = np.arange(n) * n_buckets // n
+
+    starts = np.concatenate(([0], np.flatnonzero(np.diff(bucket)) + 1))
+    lengths = np.diff(np.append(starts, n))
+    segment = np.repeat(np.arange(len(starts)), lengths)
+
+    # Primeira ocorrência do mínimo/máximo de cada faixa
+    mins = np.minimum.reduceat(yv, starts)
+    maxs = np.maximum.reduceat(yv, starts)
+    min_pos = np.flatnonzero(yv == mins[segment])
+    max_pos = np.flatnonzero(yv == maxs[segment])
+    _, first_min = np.unique(segment[min_pos], return_index=True)
+    _, first_max = np.unique(segment[max_pos], return_index=True)
+
+    keep = np.concatenate((starts, starts + lengths - 1, min_pos[first_min], max_pos[first_max]))
+    return valid[np.unique(keep)]
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Selecionar índices pelo algoritmo Largest-Triangle-Three-Buckets.
+
+    Args:
+        x: Eixo X numérico
+        y: Valores da série
+        n_out: Número de pontos desejado
+
+    Returns:
+        Índices ordenados dos pontos mantidos (NaNs são descartados)
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    valid = np.flatnonzero(np.isfinite(x) & np.isfinite(y))
+    n = len(valid)
+    if n_out >= n or n_out < 3:
+        return valid
+
+    xv = x[valid]
+    yv = y[valid]
+    every = (n - 2) / (n_out - 2)
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0] = 0
+    a = 0
+
+    for i in range(n_out - 2):
+        start = int(i * every) + 1
+        end = int((i + 1) * every) + 1
+        next_end = min(int((i + 2) * every) + 1, n)
+
+        avg_x = xv[end:next_end].mean()
+        avg_y = yv[end:next_end].mean()
+
+        # Área do triângulo (ponto anterior, candidato, média da próxima faixa)
+        area = np.abs(
+            (xv[a] - avg_x) * (yv[start:end] - yv[a]) - (xv[a] - xv[start:end]) * (avg_y - yv[a])
+        )
+        a = start + int(np.argmax(area))
+        selected[i + 1] = a
+
+    selected[-1] = n - 1
+    return valid[selected]
+
+
+def downsample_indices(
+    x: Any,
+    y: Any,
+    max_points: Optional[int] = None,
+    x_range: Optional[Tuple[float, float]] = None,
+    width_px: int = DEFAULT_CHART_WIDTH_PX,
+    method: Literal["minmax", "lttb"] = "minmax",
+) -> np.ndarray:
+    """
+    Calcular os índices a exibir de uma série, opcionalmente em uma janela de X.
+
+    Com x_range, apenas a janela (mais um ponto de cada lado, para a linha
+    chegar às bordas) é reduzida, o que dá mais resolução ao dar zoom.
+
+    Args:
+        x: Eixo X (numérico ou datas)
+        y: Valores da série
+        max_points: Pontos máximos (padrão: 2 por pixel de width_px)
+        x_range: Janela (início, fim) no eixo X
+        width_px: Largura do gráfico em pixels
+        method: "minmax" (preserva picos) ou "lttb" (preserva forma)
+
+    Returns:
+        Índices dos pontos mantidos, em ordem
+    """
+    y_values = np.asarray(y, dtype=np.float64)
+    x_raw = np.asarray(x)
+    x_values = _numeric_axis(x_raw)
+    if x_values is None:
+        x_values = np.arange(len(y_values), dtype=np.float64)
+
+    max_points = max_points or 2 * width_px
+    lo, hi = 0, len(y_values)
+    if x_range is not None:
+        bounds_dtype = x_raw.dtype if x_raw.dtype.kind == "M" else np.float64
+        start, end = _numeric_axis(np.asarray(x_range, dtype=bounds_dtype))
+        lo = max(int(np.searchsorted(x_values, start, side="left")) - 1, 0)
+        hi = min(int(np.searchsorted(x_values, end, side="right")) + 1, hi)
+
+    xs = x_values[lo:hi]
+    ys = y_values[lo:hi]
+    if method == "lttb":
+        indices = lttb_indices(xs, ys, max_points)
+    else:
+        indices = minmax_indices(xs, ys, max(max_points // 4, 1))
+    return indices + lo
+
+
+def downsample_series(
+    x: Any,
+    y: Any,
+    max_points: Optional[int] = None,
+    x_range: Optional[Tuple[float, float]] = None,
+    width_px: int = DEFAULT_CHART_WIDTH_PX,
+    method: Literal["minmax", "lttb"] = "minmax",
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Reduzir uma série para exibição (ver downsample_indices).
+
+    Returns:
+        Tupla (x, y) com os pontos mantidos
+    """
+    x_values = np.asarray(x)
+    y_values = np.asarray(y)
+    indices = downsample_indices(x_values, y_values, max_points, x_range, width_px, method)
+    return x_values[indices], y_values[indices]
+
+
+def downsample_column(
+    df: pd.DataFrame,
+    column: str,
+    x_column: str = "time",
+    session_id: Optional[Hashable] = None,
+    window: Optional[Tuple[float, float]] = None,
+    width_px: int = DEFAULT_CHART_WIDTH_PX,
+    method: Literal["minmax", "lttb"] = "minmax",
+    max_points: Optional[int] = None,
+) -> pd.DataFrame:
+    """
+    Reduzir uma coluna de DataFrame para gráfico, com cache por sessão.
+
+    O resultado fica em cache por (sessão, coluna, janela, largura); reruns
+    do Streamlit com os mesmos parâmetros não reprocessam a série.
+
+    Args:
+        df: Dados da sessão
+        column: Coluna do eixo Y
+        x_column: Coluna do eixo X
+        session_id: Identificador da sessão (None desativa o cache)
+        window: Janela (início, fim) no eixo X
+        width_px: Largura do gráfico em pixels
+        method: "minmax" ou "lttb"
+        max_points: Pontos máximos (padrão: 2 por pixel de width_px)
+
+    Returns:
+        DataFrame com as colunas x_column e column, apenas com os pontos mantidos
+    """
+    x = df[x_column].to_numpy()
+    y = df[column].to_numpy(dtype=np.float64, na_value=np.nan)
+
+    key = None
+    if session_id is not None:
+        # Impressão digital barata para não servir cache de dados filtrados
+        fingerprint = (len(df), x[0] if len(x) else None, x[-1] if len(x) else None)
+        fingerprint += (float(np.nansum(y)),)
+        key = (session_id, column, x_column, window, width_px, method, max_points, fingerprint)
+        with _downsample_lock:
+            cached = _downsample_cache.get(key)
+            if cached is not None:
+                _downsample_cache.move_to_end(key)
+                return cached.copy()
+
+    indices = downsample_indices(x, y, max_points, window, width_px, method)
+    result = pd.DataFrame({x_column: x[indices], column: y[indices]})
+
+    if key is not None:
+        with _downsample_lock:
+            _downsample_cache[key] = result
+            while len(_downsample_cache) > _DOWNSAMPLE_CACHE_SIZE:
+                _downsample_cache.popitem(last=False)
+        result = result.copy()
+    return result
+
+
+def clear_downsample_cache() -> None:
+    """Limpar o cache de séries reduzidas."""
+    with _downsample_lock:
+        _downsample_cache.clear()
+
+
+def render_time_window_control(
+    x_min: float, x_max: float, key: str, label: str = "Janela de tempo (s)"
+) -> Optional[Tuple[float, float]]:
+    """
+    Renderizar controle de janela de tempo para zoom com re-amostragem.
+
+    Ao estreitar a janela, os gráficos são reconsultados apenas nesse
+    intervalo e ganham resolução, em vez de ampliar a série já reduzida.
+
+    Args:
+        x_min: Início dos dados
+        x_max: Fim dos dados
+        key: Chave única do widget
+        label: Rótulo do controle
+
+    Returns:
+        Janela selecionada, ou None quando todo o intervalo está selecionado
+    """
+    x_min, x_max = float(x_min), float(x_max)
+    if not x_max > x_min:
+        return None
+
+    window = st.slider(label, min_value=x_min, max_value=x_max, value=(x_min, x_max), key=key)
+    if window[0] <= x_min and window[1] >= x_max:
+        return None
+    return (float(window[0]), float(window[1]))
+
+
 class ChartBuilder:
     """
     Builder de gráficos padronizado para FuelTune Analyzer.
@@ -100,10 +377,11 @@ class ChartBuilder:
         for series in series_data:
             line_shape = "spline" if smooth_lines else "linear"
             fill_mode = "tonexty" if fill_area else None
+            x, y = self._reduce_series(series)
 
             trace = go.Scatter(
-                x=series.x,
-                y=series.y,
+                x=x,
+                y=y,
                 name=series.name,
                 line=dict(color=series.color, width=series.line_width, shape=line_shape),
                 marker=dict(size=series.marker_size),
@@ -391,10 +669,11 @@ class ChartBuilder:
 
         # Adicionar séries primárias
         for series in primary_series:
+            x, y = self._reduce_series(series)
             self.fig.add_trace(
                 go.Scatter(
-                    x=series.x,
-                    y=series.y,
+                    x=x,
+                    y=y,
                     name=series.name,
                     line=dict(color=series.color, width=series.line_width),
                 ),
@@ -403,10 +682,11 @@ class ChartBuilder:
 
         # Adicionar séries secundárias
         for series in secondary_series:
+            x, y = self._reduce_series(series)
             self.fig.add_trace(
                 go.Scatter(
-                    x=series.x,
-                    y=series.y,
+                    x=x,
+                    y=y,
                     name=series.name,
                     line=dict(color=series.color, width=series.line_width),
                 ),
@@ -421,6 +701,15 @@ class ChartBuilder:
         self._apply_layout()
         return self.fig
 
+    def _reduce_series(self, series: SeriesData) -> Tuple[Any, Any]:
+        """Reduzir série longa conforme config (max_points/downsample_method)."""
+        method = self.config.downsample_method
+        width_px = self.config.width or DEFAULT_CHART_WIDTH_PX
+        max_points = self.config.max_points or 2 * width_px
+        if method == "none" or len(series.y) <= max_points:
+            return series.x, series.y
+        return downsample_series(series.x, series.y, max_points, width_px=width_px, method=method)
+
     def add_annotations(self, annotations: List[Dict[str, Any]]) -> None:
         """
         Adicionar anotações ao gráfico.
@@ -38,6 +38,7 @@ class SessionInfo:
     created_at: datetime
     import_status: str
     file_size_mb: Optional[float]
+    sample_rate_hz: Optional[float] = None
 
 
 class SessionSelector:
@@ -95,6 +96,7 @@ class SessionSelector:
                         created_at=session_data["created_at"],
                         import_status=session_data["status"],
                         file_size_mb=session_data.get("file_size_mb"),
+                        sample_rate_hz=session_data.get("sample_rate"),
                     )
                 )
 
@@ -356,10 +358,33 @@ class SessionSelector:
                 size_str = f"{session.file_size_mb:.1f} MB" if session.file_size_mb else "N/A"
                 st.metric("Tamanho", size_str)
 
+            # Faixas das principais variáveis (resumo pré-calculado, sem ler os dados)
+            summary = self._load_summary(session.id)
+            if summary:
+                col1, col2, col3 = st.columns(3)
+                rate = summary["sample_rate_hz"] or session.sample_rate_hz
+                rate_str = f"{rate:.1f} Hz" if rate else "N/A"
+                col1.metric("Taxa Amostragem", rate_str)
+                rpm = summary["columns"].get("rpm", {})
+                if rpm.get("max") is not None:
+                    col2.metric("RPM Máx", f"{rpm['max']:.0f}", help=f"Média: {rpm['mean']:.0f}")
+                map_stats = summary["columns"].get("map", {})
+                if map_stats.get("max") is not None:
+                    col3.metric("MAP Máx", f"{map_stats['max']:.2f} bar")
+
             # Informações adicionais
             st.markdown("**Arquivo:** " + session.filename)
             st.markdown("**Criado em:** " + session.created_at.strftime("%d/%m/%Y às %H:%M:%S"))
 
+    @st.cache_data(ttl=300)
+    def _load_summary(_self, session_id: str) -> Optional[Dict[str, Any]]:
+        """Carregar resumo estatístico da sessão (com cache)."""
+        try:
+            return _self.db_manager.get_session_summary(session_id)
+        except Exception as e:
+            logger.error(f"Erro ao carregar resumo da sessão: {str(e)}")
+            return None
+
     def _create_sessions_dataframe(self, sessions: List[SessionInfo]) -> pd.DataFrame:
         """Criar DataFrame das sessões para exibição."""
         data = []
@@ -28,8 +28,9 @@ from plotly.subplots import make_subplots
 
 try:
     # Tentar importação relativa primeiro (para quando chamado como módulo)
-    from ...data.database import FuelTechCoreData, get_database
+    from ...data.database import get_database
     from ...utils.logging_config import get_logger
+    from ..components.chart_builder import downsample_column, render_time_window_control
     from ..components.metric_card import MetricCard
     from ..components.session_selector import SessionSelector
 except ImportError:
@@ -38,7 +39,11 @@ except ImportError:
     from pathlib import Path
 
     sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
-    from src.data.database import FuelTechCoreData, get_database
+    from src.data.database import get_database
+    from src.ui.components.chart_builder import (
+        downsample_column,
+        render_time_window_control,
+    )
     from src.ui.components.metric_card import MetricCard
     from src.ui.components.session_selector import SessionSelector
     from src.utils.logging_config import get_logger
@@ -58,9 +63,52 @@ class DataAnalysisManager:
     - Export de dados
     """
 
+    # Colunas carregadas para a análise (projeção feita no banco)
+    SESSION_COLUMNS = [
+        "time",
+        "rpm",
+        "tps",
+        "throttle_position",
+        "ignition_timing",
+        "map",
+        "closed_loop_target",
+        "closed_loop_o2",
+        "closed_loop_correction",
+        "o2_general",
+        "ethanol_content",
+        "two_step",
+        "launch_validated",
+        "gear",
+        "fuel_temp",
+        "flow_bank_a",
+        "injection_phase_angle",
+        "injector_duty_a",
+        "injection_time_a",
+        "fuel_pressure",
+        "fuel_level",
+        "engine_temp",
+        "air_temp",
+        "oil_pressure",
+        "battery_voltage",
+        "ignition_dwell",
+        "fan1_enrichment",
+        "engine_sync",
+        "decel_cutoff",
+        "engine_cranking",
+        "idle",
+        "first_pulse_cranking",
+        "accel_decel_injection",
+        "active_adjustment",
+        "fan1",
+        "fan2",
+        "fuel_pump",
+    ]
+
     def __init__(self):
         self.db = get_database()
         self.metric_card = MetricCard()
+        # Sessão em exibição (chave do cache de séries reduzidas)
+        self.current_session_id: Optional[str] = None
 
     @st.cache_data(ttl=300)
     def load_session_data(
@@ -78,68 +126,12 @@ class DataAnalysisManager:
         """
         try:
             _self.db.initialize_database()
-            with _self.db.get_session() as db_session:
-                query = (
-                    db_session.query(FuelTechCoreData)
-                    .filter(FuelTechCoreData.session_id == session_id)
-                    .order_by(FuelTechCoreData.time)
-                )
+            df = _self.db.load_session_frame(session_id, columns=_self.SESSION_COLUMNS, limit=limit)
 
-                if limit:
-                    query = query.limit(limit)
-
-                core_data = query.all()
-                # Session is automatically closed by context manager
-
-            if not core_data:
+            if df.empty:
                 return None
 
-            # Converter para DataFrame
-            data_list = []
-            for record in core_data:
-                data_list.append(
-                    {
-                        "time": record.time,
-                        "rpm": record.rpm,
-                        "tps": record.tps,
-                        "throttle_position": record.throttle_position,
-                        "ignition_timing": record.ignition_timing,
-                        "map": record.map,
-                        "closed_loop_target": record.closed_loop_target,
-                        "closed_loop_o2": record.closed_loop_o2,
-                        "closed_loop_correction": record.closed_loop_correction,
-                        "o2_general": record.o2_general,
-                        "ethanol_content": record.ethanol_content,
-                        "two_step": record.two_step,
-                        "launch_validated": record.launch_validated,
-                        "gear": record.gear,
-                        "fuel_temp": record.fuel_temp,
-                        "flow_bank_a": record.flow_bank_a,
-                        "injection_phase_angle": record.injection_phase_angle,
-                        "injector_duty_a": record.injector_duty_a,
-                        "injection_time_a": record.injection_time_a,
-                        "fuel_pressure": record.fuel_pressure,
-                        "fuel_level": record.fuel_level,
-                        "engine_temp": record.engine_temp,
-                        "air_temp": record.air_temp,
-                        "oil_pressure": record.oil_pressure,
-                        "battery_voltage": record.battery_voltage,
-                        "ignition_dwell": record.ignition_dwell,
-                        "fan1_enrichment": record.fan1_enrichment,
-                        "engine_sync": record.engine_sync,
-                        "decel_cutoff": record.decel_cutoff,
-                        "engine_cranking": record.engine_cranking,
-                        "idle": record.idle,
-                        "first_pulse_cranking": record.first_pulse_cranking,
-                        "accel_decel_injection": record.accel_decel_injection,
-                        "active_adjustment": record.active_adjustment,
-                        "fan1": record.fan1,
-                        "fan2": record.fan2,
-                        "fuel_pump": record.fuel_pump,
-                    }
-                )
-
-            return pd.DataFrame(data_list)
+            return df
 
         except Exception as e:
             logger.error(f"Erro ao carregar dados da sessão: {str(e)}")
@@ -392,6 +384,11 @@ class DataAnalysisManager:
             )
 
         if primary_vars or secondary_vars:
+            # Zoom: estreitar a janela reconsulta a série com mais resolução
+            window = render_time_window_control(
+                df["time"].min(), df["time"].max(), key="analysis_time_window"
+            )
+
             # Criar subplot com eixo Y duplo
             fig = make_subplots(specs=[[{"secondary_y": True}]])
 
@@ -402,10 +399,13 @@ class DataAnalysisManager:
             # Adicionar variáveis primárias
             for var in primary_vars:
                 if var in df.columns:
+                    points = downsample_column(
+                        df, var, session_id=self.current_session_id, window=window
+                    )
                     fig.add_trace(
                         go.Scatter(
-                            x=df["time"],
-                            y=df[var],
+                            x=points["time"],
+                            y=points[var],
                             name=var,
                             line=dict(color=colors[color_idx % len(colors)]),
                             yaxis="y",
@@ -417,10 +417,13 @@ class DataAnalysisManager:
             # Adicionar variáveis secundárias
             for var in secondary_vars:
                 if var in df.columns:
+                    points = downsample_column(
+                        df, var, session_id=self.current_session_id, window=window
+                    )
                     fig.add_trace(
                         go.Scatter(
-                            x=df["time"],
-                            y=df[var],
+                            x=points["time"],
+                            y=points[var],
                             name=f"{var} (2º eixo)",
                             line=dict(color=colors[color_idx % len(colors)], dash="dash"),
                             yaxis="y2",
@@ -783,6 +786,7 @@ def render_analysis_page() -> None:
             # Carregar dados
             with st.spinner("Carregando dados da sessão..."):
                 df = analysis_manager.load_session_data(selected_session.id, limit=data_limit)
+                analysis_manager.current_session_id = selected_session.id
 
             if df is None or df.empty:
                 st.error("Nenhum dado encontrado para esta sessão")
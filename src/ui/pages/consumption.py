@@ -27,8 +27,9 @@ import streamlit as st
 
 try:
     # Tentar importação relativa primeiro (para quando chamado como módulo)
-    from ...data.database import FuelTechCoreData, get_database
+    from ...data.database import get_database
     from ...utils.logging_config import get_logger
+    from ..components.chart_builder import downsample_column, render_time_window_control
     from ..components.metric_card import MetricCard
     from ..components.session_selector import SessionSelector
 except ImportError:
@@ -37,7 +38,11 @@ except ImportError:
     from pathlib import Path
 
     sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
-    from src.data.database import FuelTechCoreData, get_database
+    from src.data.database import get_database
+    from src.ui.components.chart_builder import (
+        downsample_column,
+        render_time_window_control,
+    )
     from src.ui.components.metric_card import MetricCard
     from src.ui.components.session_selector import SessionSelector
     from src.utils.logging_config import get_logger
@@ -74,9 +79,34 @@ class ConsumptionAnalysisManager:
     - Visualizações especializadas em consumo
     """
 
+    # Colunas de consumo carregadas da sessão (projeção feita no banco)
+    CONSUMPTION_COLUMNS = [
+        "time",
+        "rpm",
+        "throttle_position",
+        "map",
+        "flow_bank_a",
+        "injection_time_a",
+        "injector_duty_a",
+        "fuel_pressure",
+        "engine_temp",
+        "air_temp",
+        "ethanol_content",
+        "gear",
+        "o2_general",
+        "total_consumption",
+        "average_consumption",
+        "instant_consumption",
+        "total_distance",
+        "range",
+        "traction_speed",
+    ]
+
     def __init__(self):
         self.db = get_database()
         self.metric_card = MetricCard()
+        # Sessão em exibição (chave do cache de séries reduzidas)
+        self.current_session_id: Optional[str] = None
 
         # Constantes para cálculos
         self.GASOLINE_DENSITY = 0.75  # kg/L
@@ -97,57 +127,12 @@ class ConsumptionAnalysisManager:
         """
         try:
             _self.db.initialize_database()
-            with _self.db.get_session() as db_session:
-                # Buscar dados core
-                core_query = (
-                    db_session.query(FuelTechCoreData)
-                    .filter(FuelTechCoreData.session_id == session_id)
-                    .order_by(FuelTechCoreData.time)
-                )
-
-                core_data = core_query.all()
+            # Campos estendidos já estão na tabela core após unificação
+            df = _self.db.load_session_frame(session_id, columns=_self.CONSUMPTION_COLUMNS)
 
-                # Extended data unificado na tabela core
-                # Session is automatically closed by context manager
-
-            if not core_data:
+            if df.empty:
                 return None
 
-            # Converter dados core para DataFrame
-            data_list = []
-            for record in core_data:
-                data_list.append(
-                    {
-                        "time": record.time,
-                        "rpm": record.rpm,
-                        "throttle_position": record.throttle_position,
-                        "map": record.map,
-                        "flow_bank_a": record.flow_bank_a,
-                        "injection_time_a": record.injection_time_a,
-                        "injector_duty_a": record.injector_duty_a,
-                        "fuel_pressure": record.fuel_pressure,
-                        "engine_temp": record.engine_temp,
-                        "air_temp": record.air_temp,
-                        "ethanol_content": record.ethanol_content,
-                        "gear": record.gear,
-                        "o2_general": record.o2_general,
-                    }
-                )
-
-            df = pd.DataFrame(data_list)
-
-            # Os campos estendidos já estão na tabela core após unificação
-            for col in [
-                "total_consumption",
-                "average_consumption",
-                "instant_consumption",
-                "total_distance",
-                "range",
-                "traction_speed",
-            ]:
-                if hasattr(core_data[0], col):
-                    df[col] = [getattr(r, col, None) for r in core_data]
-
             return df
 
         except Exception as e:
@@ -346,14 +331,22 @@ class ConsumptionAnalysisManager:
             st.warning("Nenhum dado válido de fluxo encontrado")
             return
 
+        # Zoom: estreitar a janela reconsulta a série com mais resolução
+        window = render_time_window_control(
+            valid_data["time"].min(), valid_data["time"].max(), key="consumption_time_window"
+        )
+        points = downsample_column(
+            valid_data, "flow_bank_a", session_id=self.current_session_id, window=window
+        )
+
         # Criar gráfico principal
         fig = go.Figure()
 
         # Linha de fluxo
         fig.add_trace(
             go.Scatter(
-                x=valid_data["time"],
-                y=valid_data["flow_bank_a"],
+                x=points["time"],
+                y=points["flow_bank_a"],
                 mode="lines",
                 name="Fluxo de Combustível",
                 line=dict(color="blue", width=2),
@@ -846,6 +839,7 @@ def render_consumption_page() -> None:
             # Carregar dados
             with st.spinner("Carregando dados de consumo..."):
                 df = consumption_manager.load_consumption_data(selected_session.id)
+                consumption_manager.current_session_id = selected_session.id
 
             if df is None or df.empty:
                 st.error("Nenhum dado de consumo encontrado para esta sessão")
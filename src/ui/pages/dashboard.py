@@ -25,7 +25,7 @@ import streamlit as st
 
 try:
     # Tentar importação relativa primeiro (para quando chamado como módulo)
-    from ...data.database import FuelTechCoreData, get_database
+    from ...data.database import get_database
     from ...utils.logging_config import get_logger
     from ..components.chart_builder import (
         ChartBuilder,
@@ -46,7 +46,7 @@ except ImportError:
     from pathlib import Path
 
     sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
-    from src.data.database import FuelTechCoreData, get_database
+    from src.data.database import get_database
     from src.ui.components.chart_builder import (
         ChartBuilder,
         ChartConfig,
@@ -76,6 +76,19 @@ class DashboardManager:
     - Atualizações automáticas
     """
 
+    # Colunas exibidas no dashboard (projeção feita no banco)
+    LATEST_DATA_COLUMNS = [
+        "time",
+        "rpm",
+        "throttle_position",
+        "map",
+        "o2_general",
+        "engine_temp",
+        "fuel_pressure",
+        "battery_voltage",
+        "ignition_timing",
+    ]
+
     def __init__(self):
         self.db = get_database()
         self.metric_card = MetricCard()
@@ -130,39 +143,15 @@ class DashboardManager:
         """Obter dados da sessão mais recente."""
         try:
             _self.db.initialize_database()
-            with _self.db.get_session() as db_session:
-                # Buscar dados mais recentes
-                core_data = (
-                    db_session.query(FuelTechCoreData)
-                    .filter(FuelTechCoreData.session_id == session_id)
-                    .order_by(FuelTechCoreData.time.desc())
-                    .limit(limit)
-                    .all()
-                )
-                # Session is automatically closed by context manager
+            # Buscar dados mais recentes
+            df = _self.db.load_session_frame(
+                session_id, columns=_self.LATEST_DATA_COLUMNS, limit=limit, descending=True
+            )
 
-            if not core_data:
+            if df.empty:
                 return None
 
-            # Converter para DataFrame
-            data_list = []
-            for record in core_data:
-                data_list.append(
-                    {
-                        "time": record.time,
-                        "rpm": record.rpm,
-                        "throttle_position": record.throttle_position,
-                        "map": record.map,
-                        "o2_general": record.o2_general,
-                        "engine_temp": record.engine_temp,
-                        "fuel_pressure": record.fuel_pressure,
-                        "battery_voltage": record.battery_voltage,
-                        "ignition_timing": record.ignition_timing,
-                    }
-                )
-
-            df = pd.DataFrame(data_list)
-            return df.sort_values("time")  # Ordenar por tempo
+            return df.iloc[::-1].reset_index(drop=True)  # Ordenar por tempo
 
         except Exception as e:
             logger.error(f"Erro ao carregar dados da sessão: {str(e)}")
@@ -172,6 +161,11 @@ class DashboardManager:
     def calculate_session_statistics(_self, session_id: str) -> Dict[str, float]:
         """Calcular estatísticas da sessão."""
         try:
+            # Resumo pré-calculado na importação (sem varrer os dados)
+            summary = _self.db.get_session_summary(session_id)
+            if summary is not None:
+                return _self._statistics_from_summary(summary)
+
             df = _self.get_latest_session_data(session_id)
 
             if df is None or df.empty:
@@ -209,6 +203,40 @@ class DashboardManager:
             logger.error(f"Erro ao calcular estatísticas: {str(e)}")
             return {}
 
+    @staticmethod
+    def _statistics_from_summary(summary: Dict[str, Any]) -> Dict[str, float]:
+        """Montar as estatísticas do dashboard a partir do resumo da sessão."""
+        columns = summary["columns"]
+
+        def stat(column: str, name: str) -> float:
+            value = columns.get(column, {}).get(name)
+            return value if value is not None else 0
+
+        stats = {
+            "avg_rpm": stat("rpm", "mean"),
+            "max_rpm": stat("rpm", "max"),
+            "min_rpm": stat("rpm", "min"),
+            "avg_throttle": stat("throttle_position", "mean"),
+            "max_throttle": stat("throttle_position", "max"),
+            "avg_map": stat("map", "mean"),
+            "max_map": stat("map", "max"),
+            "avg_lambda": stat("o2_general", "mean"),
+            "avg_temp": stat("engine_temp", "mean"),
+            "max_temp": stat("engine_temp", "max"),
+            "avg_fuel_pressure": stat("fuel_pressure", "mean"),
+            "avg_battery": stat("battery_voltage", "mean"),
+            "avg_timing": stat("ignition_timing", "mean"),
+            "session_duration": summary["duration_seconds"] or 0,
+            "data_points": summary["record_count"],
+        }
+
+        # Estimativa simples de potência baseada em RPM e MAP
+        rpm_map = summary["products"].get("rpm*map")
+        if rpm_map is not None:
+            stats["estimated_power"] = rpm_map * 0.001
+
+        return stats
+
     def render_system_overview(self) -> None:
         """Renderizar overview do sistema."""
         st.markdown(
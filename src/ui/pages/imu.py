@@ -28,8 +28,10 @@ from plotly.subplots import make_subplots
 
 try:
     # Tentar importação relativa primeiro (para quando chamado como módulo)
-    from ...data.database import FuelTechCoreData, get_database
+    from ...analysis.imu import EVENT_THRESHOLD_G, derive_imu_columns
+    from ...data.database import get_database
     from ...utils.logging_config import get_logger
+    from ..components.chart_builder import downsample_column, render_time_window_control
     from ..components.metric_card import MetricCard
     from ..components.session_selector import SessionSelector
 except ImportError:
@@ -38,7 +40,12 @@ except ImportError:
     from pathlib import Path
 
     sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
-    from src.data.database import FuelTechCoreData, get_database
+    from src.analysis.imu import EVENT_THRESHOLD_G, derive_imu_columns
+    from src.data.database import get_database
+    from src.ui.components.chart_builder import (
+        downsample_column,
+        render_time_window_control,
+    )
     from src.ui.components.metric_card import MetricCard
     from src.ui.components.session_selector import SessionSelector
     from src.utils.logging_config import get_logger
@@ -59,63 +66,68 @@ class IMUAnalysisManager:
     - Mapas de calor de dirigibilidade
     """
 
+    # Colunas IMU carregadas da sessão (projeção feita no banco)
+    IMU_COLUMNS = [
+        "time",
+        "g_force_accel",
+        "g_force_lateral",
+        "g_force_accel_raw",
+        "g_force_lateral_raw",
+        "pitch_angle",
+        "pitch_rate",
+        "roll_angle",
+        "roll_rate",
+        "heading",
+        "traction_speed",
+        "acceleration_speed",
+        "traction_control_slip",
+        "traction_control_slip_rate",
+    ]
+
     def __init__(self):
         self.db = get_database()
         self.metric_card = MetricCard()
+        # Sessão em exibição (chave do cache de séries reduzidas)
+        self.current_session_id: Optional[str] = None
+        self.max_chart_points: Optional[int] = None
 
     @st.cache_data(ttl=300)
-    def load_imu_data(_self, session_id: str) -> Optional[pd.DataFrame]:
+    def load_imu_data(
+        _self,
+        session_id: str,
+        event_threshold: float = EVENT_THRESHOLD_G,
+        smooth: bool = False,
+    ) -> Optional[pd.DataFrame]:
         """
         Carregar dados IMU da sessão.
 
+        Os dados derivados (e a suavização) ficam no cache por sessão,
+        threshold e opção de suavização, então não são recalculados a cada
+        interação com a página.
+
         Args:
             session_id: ID da sessão
+            event_threshold: Threshold (g) para detecção de eventos
+            smooth: Aplicar média móvel centrada nas colunas de G-force
 
         Returns:
             DataFrame com dados IMU ou None
         """
         try:
             _self.db.initialize_database()
-            with _self.db.get_session() as db_session:
-                # Buscar dados na tabela unificada (core)
-                core_query = (
-                    db_session.query(FuelTechCoreData)
-                    .filter(FuelTechCoreData.session_id == session_id)
-                    .order_by(FuelTechCoreData.time)
-                )
-
-                core_data = core_query.all()
-                # Session is automatically closed by context manager
+            df = _self.db.load_session_frame(session_id, columns=_self.IMU_COLUMNS)
 
-            if not core_data:
+            if df.empty:
                 return None
 
-            # Converter para DataFrame
-            data_list = []
-            for record in core_data:
-                data_list.append(
-                    {
-                        "time": record.time,
-                        "g_force_accel": record.g_force_accel,
-                        "g_force_lateral": record.g_force_lateral,
-                        "g_force_accel_raw": record.g_force_accel_raw,
-                        "g_force_lateral_raw": record.g_force_lateral_raw,
-                        "pitch_angle": record.pitch_angle,
-                        "pitch_rate": record.pitch_rate,
-                        "roll_angle": record.roll_angle,
-                        "roll_rate": record.roll_rate,
-                        "heading": record.heading,
-                        "traction_speed": record.traction_speed,
-                        "acceleration_speed": record.acceleration_speed,
-                        "traction_control_slip": record.traction_control_slip,
-                        "traction_control_slip_rate": record.traction_control_slip_rate,
-                    }
-                )
-
-            df = pd.DataFrame(data_list)
-
             # Calcular dados derivados
-            df = _self.calculate_derived_imu_data(df)
+            df = _self.calculate_derived_imu_data(df, event_threshold)
+
+            if smooth:
+                # Suavização simples (eventos já detectados nos dados brutos)
+                for col in ["g_force_accel", "g_force_lateral"]:
+                    if col in df.columns:
+                        df[col] = df[col].rolling(window=5, center=True).mean()
 
             return df
 
@@ -123,12 +135,19 @@ class IMUAnalysisManager:
             logger.error(f"Erro ao carregar dados IMU: {str(e)}")
             return None
 
-    def calculate_derived_imu_data(self, df: pd.DataFrame) -> pd.DataFrame:
+    def calculate_derived_imu_data(
+        self, df: pd.DataFrame, event_threshold: float = EVENT_THRESHOLD_G
+    ) -> pd.DataFrame:
         """
         Calcular dados derivados dos dados IMU.
 
+        Usa os kernels vetorizados de src.analysis.imu (os mesmos do
+        VehicleDynamicsAnalyzer): G resultante, jerk, uso do círculo de
+        atrito, deriva estimada, eventos, variação de atitude e estabilidade.
+
         Args:
             df: DataFrame com dados IMU básicos
+            event_threshold: Threshold (g) para detecção de eventos
 
         Returns:
             DataFrame com dados derivados adicionados
@@ -137,43 +156,8 @@ class IMUAnalysisManager:
             return df
 
         try:
-            # Calcular G-force resultante
-            if "g_force_accel" in df.columns and "g_force_lateral" in df.columns:
-                df["g_force_resultant"] = np.sqrt(
-                    df["g_force_accel"].fillna(0) ** 2 + df["g_force_lateral"].fillna(0) ** 2
-                )
-
-            # Calcular ângulo de deriva estimado
-            if "g_force_lateral" in df.columns and "traction_speed" in df.columns:
-                # Simplificado: ângulo baseado em força lateral e velocidade
-                df["slip_angle_estimate"] = np.degrees(
-                    np.arctan(df["g_force_lateral"].fillna(0) / 9.81 * 0.1)
-                )
-
-            # Detectar eventos de aceleração/frenagem
-            if "g_force_accel" in df.columns:
-                df["acceleration_event"] = df["g_force_accel"] > 0.3
-                df["braking_event"] = df["g_force_accel"] < -0.3
-
-            # Detectar curvas (força lateral alta)
-            if "g_force_lateral" in df.columns:
-                df["cornering_event"] = np.abs(df["g_force_lateral"]) > 0.3
-
-            # Calcular variação de atitude
-            for angle_col in ["pitch_angle", "roll_angle"]:
-                if angle_col in df.columns:
-                    df[f"{angle_col}_variation"] = df[angle_col].rolling(window=10).std()
-
-            # Índice de estabilidade (combinação de variações)
-            stability_factors = []
-            for col in ["pitch_angle_variation", "roll_angle_variation"]:
-                if col in df.columns:
-                    stability_factors.append(df[col].fillna(0))
-
-            if stability_factors:
-                df["stability_index"] = np.mean(stability_factors, axis=0)
-                df["stability_index"] = 100 - (df["stability_index"] * 10)  # Inverter e escalar
-                df["stability_index"] = df["stability_index"].clip(0, 100)
+            for column, values in derive_imu_columns(df, event_threshold).items():
+                df[column] = values
 
         except Exception as e:
             logger.error(f"Erro no cálculo de dados derivados: {str(e)}")
@@ -222,6 +206,12 @@ class IMUAnalysisManager:
                     metrics[f"{col}_count"] = df[col].sum()
                     metrics[f"{col}_percentage"] = (df[col].sum() / len(df)) * 100
 
+            # Métricas de dirigibilidade (jerk e círculo de atrito)
+            if "g_force_jerk" in df.columns:
+                metrics["max_jerk"] = float(np.abs(df["g_force_jerk"]).max())
+            if "friction_circle_usage" in df.columns:
+                metrics["avg_friction_usage"] = float(df["friction_circle_usage"].mean())
+
             # Métricas de estabilidade
             if "stability_index" in df.columns:
                 stability_data = df["stability_index"].dropna()
@@ -314,6 +304,24 @@ class IMUAnalysisManager:
                 help="Variação do heading (direção)",
             )
 
+        if "max_jerk" in metrics or "avg_friction_usage" in metrics:
+            st.markdown("#### Dirigibilidade")
+            col1, col2 = st.columns(2)
+
+            with col1:
+                st.metric(
+                    "Uso Médio do Círculo de Atrito",
+                    f"{metrics.get('avg_friction_usage', 0):.1f}%",
+                    help="G resultante em relação ao limite de aderência (percentil 99,5)",
+                )
+
+            with col2:
+                st.metric(
+                    "Jerk Máximo",
+                    f"{metrics.get('max_jerk', 0):.2f} g/s",
+                    help="Maior taxa de variação do G resultante",
+                )
+
     def render_3d_attitude_visualization(self, df: pd.DataFrame) -> None:
         """Renderizar visualização 3D da atitude do veículo."""
         st.markdown("### Visualização 3D da Atitude")
@@ -447,6 +455,11 @@ class IMUAnalysisManager:
             st.warning("Dados de tempo não disponíveis")
             return
 
+        # Zoom: estreitar a janela reconsulta as séries com mais resolução
+        window = render_time_window_control(
+            df["time"].min(), df["time"].max(), key="imu_time_window"
+        )
+
         # Criar subplot com múltiplos eixos Y
         fig = make_subplots(
             rows=3,
@@ -462,7 +475,13 @@ class IMUAnalysisManager:
 
         # G-force longitudinal
         if "g_force_accel" in df.columns:
-            valid_data = df.dropna(subset=["time", "g_force_accel"])
+            valid_data = downsample_column(
+                df,
+                "g_force_accel",
+                session_id=self.current_session_id,
+                window=window,
+                max_points=self.max_chart_points,
+            )
             fig.add_trace(
                 go.Scatter(
                     x=valid_data["time"],
@@ -477,7 +496,13 @@ class IMUAnalysisManager:
 
         # G-force lateral
         if "g_force_lateral" in df.columns:
-            valid_data = df.dropna(subset=["time", "g_force_lateral"])
+            valid_data = downsample_column(
+                df,
+                "g_force_lateral",
+                session_id=self.current_session_id,
+                window=window,
+                max_points=self.max_chart_points,
+            )
             fig.add_trace(
                 go.Scatter(
                     x=valid_data["time"],
@@ -492,7 +517,13 @@ class IMUAnalysisManager:
 
         # G-force resultante
         if "g_force_resultant" in df.columns:
-            valid_data = df.dropna(subset=["time", "g_force_resultant"])
+            valid_data = downsample_column(
+                df,
+                "g_force_resultant",
+                session_id=self.current_session_id,
+                window=window,
+                max_points=self.max_chart_points,
+            )
             fig.add_trace(
                 go.Scatter(
                     x=valid_data["time"],
@@ -878,7 +909,13 @@ def render_imu_page() -> None:
         try:
             # Carregar dados IMU
             with st.spinner("Carregando dados IMU..."):
-                df = imu_manager.load_imu_data(selected_session.id)
+                df = imu_manager.load_imu_data(
+                    selected_session.id,
+                    event_threshold=min_g_threshold,
+                    smooth=smooth_data and not show_raw_data,
+                )
+                imu_manager.current_session_id = selected_session.id
+                imu_manager.max_chart_points = sample_rate
 
             if df is None or df.empty:
                 st.error("Nenhum dado IMU encontrado para esta sessão")
@@ -892,13 +929,6 @@ def render_imu_page() -> None:
                 )
                 return
 
-            # Aplicar filtros se configurados
-            if not show_raw_data and smooth_data:
-                # Aplicar suavização simples
-                for col in ["g_force_accel", "g_force_lateral"]:
-                    if col in df.columns:
-                        df[col] = df[col].rolling(window=5, center=True).mean()
-
             # Overview IMU
             imu_manager.render_imu_overview(df)
 
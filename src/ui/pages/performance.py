@@ -28,7 +28,7 @@ from plotly.subplots import make_subplots
 
 try:
     # Tentar importação relativa primeiro (para quando chamado como módulo)
-    from ...data.database import FuelTechCoreData, get_database
+    from ...data.database import get_database
     from ...utils.logging_config import get_logger
     from ..components.metric_card import MetricCard
     from ..components.session_selector import SessionSelector
@@ -38,7 +38,7 @@ except ImportError:
     from pathlib import Path
 
     sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
-    from src.data.database import FuelTechCoreData, get_database
+    from src.data.database import get_database
     from src.ui.components.metric_card import MetricCard
     from src.ui.components.session_selector import SessionSelector
     from src.utils.logging_config import get_logger
@@ -59,6 +59,25 @@ class PerformanceAnalysisManager:
     - Detecção de knock
     """
 
+    # Colunas de performance carregadas da sessão (projeção feita no banco)
+    PERFORMANCE_COLUMNS = [
+        "time",
+        "rpm",
+        "throttle_position",
+        "map",
+        "ignition_timing",
+        "o2_general",
+        "engine_temp",
+        "flow_bank_a",
+        "injection_time_a",
+        "fuel_pressure",
+        "ethanol_content",
+        "estimated_power",
+        "estimated_torque",
+        "acceleration_speed",
+        "traction_speed",
+    ]
+
     def __init__(self):
         self.db = get_database()
         self.metric_card = MetricCard()
@@ -85,51 +104,12 @@ class PerformanceAnalysisManager:
         """Carregar dados de performance da sessão."""
         try:
             _self.db.initialize_database()
-            with _self.db.get_session() as db_session:
-                # Buscar dados core e extended
-                core_query = (
-                    db_session.query(FuelTechCoreData)
-                    .filter(FuelTechCoreData.session_id == session_id)
-                    .order_by(FuelTechCoreData.time)
-                )
-
-                core_data = core_query.all()
-                # Session is automatically closed by context manager
+            # Campos estendidos já no core após unificação
+            df = _self.db.load_session_frame(session_id, columns=_self.PERFORMANCE_COLUMNS)
 
-            if not core_data:
+            if df.empty:
                 return None
 
-            # Converter core data
-            data_list = []
-            for record in core_data:
-                data_list.append(
-                    {
-                        "time": record.time,
-                        "rpm": record.rpm,
-                        "throttle_position": record.throttle_position,
-                        "map": record.map,
-                        "ignition_timing": record.ignition_timing,
-                        "o2_general": record.o2_general,
-                        "engine_temp": record.engine_temp,
-                        "flow_bank_a": record.flow_bank_a,
-                        "injection_time_a": record.injection_time_a,
-                        "fuel_pressure": record.fuel_pressure,
-                        "ethanol_content": record.ethanol_content,
-                    }
-                )
-
-            df = pd.DataFrame(data_list)
-
-            # Campos estendidos já no core após unificação
-            for col in [
-                "estimated_power",
-                "estimated_torque",
-                "acceleration_speed",
-                "traction_speed",
-            ]:
-                if hasattr(core_data[0], col):
-                    df[col] = [getattr(r, col, None) for r in core_data]
-
             # Calcular métricas derivadas
             df = _self.calculate_performance_metrics(df)
 
@@ -585,48 +585,44 @@ class UploadManager:
 
                 step_status = st.empty()
 
-            # Passo 1: Preparar dados
-            overall_progress.progress(10, text="Preparando dados...")
-            step_status.info("Carregando arquivo completo...")
+            # Passo 1: Salvar arquivo temporário em blocos (sem carregar o CSV inteiro)
+            overall_progress.progress(5, text="Preparando arquivo...")
+            step_status.info("Copiando arquivo para processamento...")
 
-            uploaded_file.seek(0)
-            full_df = pd.read_csv(uploaded_file)
-
-            # Passo 2: Validação (se não pulada)
-            if not skip_validation:
-                overall_progress.progress(30, text="Validando dados...")
-                step_status.info("Executando validação detalhada...")
-
-                validation_results = self.run_detailed_validation(full_df)
-
-                if validation_results["has_errors"]:
-                    status_container.error("Validação falhou")
-                    for error in validation_results["errors"]:
-                        st.error(f"{error}")
-                    return
-
-            # Passo 3: Salvar arquivo temporário e importar usando a função completa
-            overall_progress.progress(50, text="Processando arquivo...")
-            step_status.info("Importando dados para o banco...")
-
-            # Salvar arquivo temporário
             import os
+            import shutil
             import tempfile
 
             with tempfile.NamedTemporaryFile(delete=False, suffix=".csv") as tmp_file:
                 uploaded_file.seek(0)
-                tmp_file.write(uploaded_file.read())
+                shutil.copyfileobj(uploaded_file, tmp_file, length=1024 * 1024)
                 tmp_file_path = tmp_file.name
 
+            # Passo 2: Importação em streaming (parse, validação e inserção por chunk)
+            overall_progress.progress(10, text="Importando dados...")
+            step_status.info("Importando dados para o banco em chunks...")
+
+            def update_progress(progress: Dict[str, Any]) -> None:
+                percent = 10 + int(85 * progress["fraction"])
+                overall_progress.progress(
+                    min(percent, 95), text=f"Importando dados... chunk {progress['chunk']}"
+                )
+                detail_progress.progress(
+                    min(int(100 * progress["fraction"]), 100),
+                    text=f"{progress['rows_read']:,} linhas lidas, "
+                    f"{progress['rows_inserted']:,} inseridas",
+                )
+
             try:
-                # Usar a função import_csv_file que já tem toda a lógica
-                import_results = self.db.import_csv_file(
+                import_results = self.db.import_csv_file_streaming(
                     file_path=tmp_file_path,
                     session_name=session_name,
                     force_reimport=force_reimport,
                     validate_data=not skip_validation,
                     normalize_data=True,
                     assess_quality=True,
+                    chunk_size=chunk_size,
+                    progress_callback=update_progress,
                 )
 
                 overall_progress.progress(100, text="Finalizando...")
@@ -708,30 +704,20 @@ class UploadManager:
 
     def prepare_chunk_for_db(self, chunk_df: pd.DataFrame) -> List[Dict]:
         """Preparar chunk de dados para inserção no banco."""
-        records = []
-
-        for _, row in chunk_df.iterrows():
-            # Mapear colunas para campos do banco
-            record = {}
-
-            # Mapear campos conhecidos (simplificado)
-            column_mapping = {
-                "TIME": "time",
-                "RPM": "rpm",
-                "Posição_do_acelerador": "throttle_position",
-                "MAP": "map",
-                "Sonda_Geral": "o2_general",
-                "Temp._do_motor": "engine_temp",
-            }
-
-            for csv_col, db_field in column_mapping.items():
-                if csv_col in chunk_df.columns:
-                    value = row[csv_col]
-                    record[db_field] = None if pd.isna(value) else value
-
-            records.append(record)
+        # Mapear campos conhecidos (simplificado)
+        column_mapping = {
+            "TIME": "time",
+            "RPM": "rpm",
+            "Posição_do_acelerador": "throttle_position",
+            "MAP": "map",
+            "Sonda_Geral": "o2_general",
+            "Temp._do_motor": "engine_temp",
+        }
 
-        return records
+        # Renomear e converter NaN em None de uma vez (sem iterrows)
+        present = [col for col in column_mapping if col in chunk_df.columns]
+        mapped = chunk_df[present].rename(columns=column_mapping).astype(object)
+        return mapped.where(mapped.notna(), None).to_dict("records")
 
 
 def render_upload_page() -> None:
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Performance test script for adaptive binning.
+
+Times bin assignment and per-bin statistics (AdaptiveBinner) on a
+1M-point log with a 32×32 grid against the module target. Wall-clock
+limits depend on the machine, so this runs on demand rather than as part
+of the unit suite:
+
+    python tests/performance_test_binning.py
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+# Add src to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.analysis.binning import AdaptiveBinner, BinningConfig
+
+TARGET_SECONDS = 0.100
+REPEATS = 7
+
+
+def create_test_data(size=1_000_000):
+    """Create a synthetic MAP×RPM log for performance testing."""
+    rng = np.random.default_rng(0)
+
+    return {
+        "rpm": rng.uniform(800, 7000, size),
+        "map": rng.uniform(-0.8, 1.5, size),
+        "lambda_sensor": 0.85 + 0.1 * rng.standard_normal(size),
+    }
+
+
+def time_binning(data, repeats=REPEATS):
+    """Best wall time of cell assignment, density, bins and statistics."""
+    binner = AdaptiveBinner(BinningConfig(base_rpm_bins=32, base_map_bins=32))
+
+    # Warm-up run (also covers first-touch allocations)
+    binner.create_bins(data)
+
+    arrays = binner._prepare_data_arrays(data, "rpm", "map", None)
+    base_grid = binner._create_base_grid(arrays, *binner._determine_optimal_ranges(arrays))
+
+    timings = []
+    for _ in range(repeats):
+        start_time = time.perf_counter()
+        assignment = binner._assign_cells(arrays, base_grid)
+        density = binner._analyze_data_density(assignment, base_grid)
+        bins = binner._create_adaptive_bins(base_grid, density, assignment)
+        binner._calculate_bin_statistics(bins, arrays, assignment)
+        timings.append(time.perf_counter() - start_time)
+
+    return min(timings)
+
+
+def main():
+    """Main function to run the binning performance test."""
+    print("FuelTune Analysis Engine - Binning Performance Test")
+    print("=" * 60)
+
+    data = create_test_data()
+    best_time = time_binning(data)
+
+    status = "✓ PASS" if best_time < TARGET_SECONDS else "✗ FAIL"
+    print(f"1M points, 32×32 grid | best of {REPEATS}: {best_time * 1000:.1f}ms | {status}")
+    print(f"Target: < {TARGET_SECONDS * 1000:.0f}ms (one core)")
+
+    return 0 if best_time < TARGET_SECONDS else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,21 +7,32 @@ Author: A04-ANALYSIS-SCIPY Agent
 Created: 2025-01-02
 """
 
+import tempfile
+import time
 from unittest.mock import patch
 
 import numpy as np
 import pandas as pd
 import pytest
 
-from src.analysis.anomaly import AnomalyDetector
-from src.analysis.correlation import CorrelationAnalyzer
+from src.analysis.analysis import AnalysisEngine
+from src.analysis.anomaly import AnomalyDetector, AnomalyModelStore
+from src.analysis.confidence import ConfidenceLevel
+from src.analysis.correlation import CorrelationAnalyzer, CorrelationMatrix
 from src.analysis.dynamics import VehicleDynamicsAnalyzer
 from src.analysis.fuel_efficiency import FuelEfficiencyAnalyzer
 from src.analysis.performance import PerformanceAnalyzer
 from src.analysis.predictive import PredictiveAnalyzer
 from src.analysis.reports import ReportGenerator
+from src.analysis.result_cache import (
+    AnalysisResultCache,
+    decode_result,
+    encode_result,
+    frame_content_hash,
+)
 from src.analysis.statistics import DescriptiveStats, StatisticalAnalyzer
 from src.analysis.time_series import TimeSeriesAnalyzer
+from src.data.cache import FuelTechCacheManager
 
 
 class TestStatisticalAnalyzer:
@@ -177,6 +188,96 @@ class TestCorrelationAnalyzer:
         assert hasattr(results, "top_features")
         assert "x" in results.top_features  # x should be important for y
 
+    def test_cross_correlation_matches_direct(self):
+        """FFT cross-correlation matches np.correlate on the kept lags."""
+        x, y = self.test_data["x"].to_numpy(), self.test_data["y"].to_numpy()
+        results = self.analyzer.compute_cross_correlation(x, y, max_lag=10)
+
+        zx, zy = (x - x.mean()) / x.std(), (y - y.mean()) / y.std()
+        full = np.correlate(zx, zy, mode="full") / len(x)
+        mid = len(full) // 2
+
+        np.testing.assert_allclose(
+            results.correlation_function, full[mid - 10 : mid + 11], atol=1e-10
+        )
+        np.testing.assert_array_equal(results.lags, np.arange(-10, 11))
+
+    def test_lag_correlation_matrix(self):
+        """All-pairs matrix finds a known delay and matches the pairwise result."""
+        rng = np.random.default_rng(1)
+        source = rng.normal(0, 1, 2000)
+        data = pd.DataFrame(
+            {
+                "source": source,
+                "delayed": np.roll(source, 7) + rng.normal(0, 0.1, 2000),
+                "noise": rng.normal(0, 1, 2000),
+                "constant": np.ones(2000),
+            }
+        )
+
+        matrix = self.analyzer.compute_lag_correlation_matrix(data, max_lag=20)
+        pair = self.analyzer.compute_cross_correlation(data["delayed"], data["source"], 20)
+
+        assert matrix.optimal_lag.loc["delayed", "source"] == 7
+        assert matrix.optimal_lag.loc["source", "delayed"] == -7
+        np.testing.assert_allclose(matrix.correlations[1, 0], pair.correlation_function, atol=1e-10)
+        assert np.isnan(matrix.max_correlation.loc["constant", "source"])
+
+    def _assert_granger_matches_pairwise_fit(self, results, data, lag):
+        """Compare F statistics with explicit per-pair least squares."""
+        n = len(data)
+
+        def ssr(design, target):
+            beta, *_ = np.linalg.lstsq(design, target, rcond=None)
+            return np.sum((target - design @ beta) ** 2)
+
+        for cause_var in data.columns:
+            for effect_var in data.columns:
+                if cause_var == effect_var:
+                    continue
+                y, x = data[effect_var].to_numpy(), data[cause_var].to_numpy()
+                Y = y[lag:]
+                y_lags = np.column_stack([y[lag - i - 1 : n - i - 1] for i in range(lag)])
+                x_lags = np.column_stack([x[lag - i - 1 : n - i - 1] for i in range(lag)])
+                restricted = np.column_stack([np.ones(len(Y)), y_lags])
+                unrestricted = np.column_stack([restricted, x_lags])
+                df_den = len(Y) - unrestricted.shape[1]
+                ssr_r, ssr_u = ssr(restricted, Y), ssr(unrestricted, Y)
+                expected = ((ssr_r - ssr_u) / lag) / (ssr_u / df_den)
+
+                f_stat, _ = results.granger_results[cause_var][effect_var]
+                assert f_stat == pytest.approx(expected, rel=1e-6)
+
+    def test_batched_granger_matches_pairwise_fit(self):
+        """Batched Granger F-tests match explicit per-pair least squares."""
+        rng = np.random.default_rng(2)
+        n, lag = 500, 3
+        cause = rng.normal(0, 1, n)
+        effect = 0.6 * np.roll(cause, 2) + rng.normal(0, 0.5, n)
+        data = pd.DataFrame({"cause": cause, "effect": effect + 100, "other": rng.normal(0, 1, n)})
+
+        results = self.analyzer.analyze_granger_causality(data, list(data.columns), max_lag=lag)
+
+        self._assert_granger_matches_pairwise_fit(results, data, lag)
+        assert "effect" in results.causal_graph["cause"]
+
+    def test_batched_granger_autocorrelated_channels(self):
+        """Smooth, strongly autocorrelated channels give ill-conditioned lag matrices."""
+        rng = np.random.default_rng(4)
+        n, lag = 2000, 8
+        rpm = np.convolve(np.cumsum(rng.normal(0, 1, n)), np.ones(50) / 50, "same")
+        data = pd.DataFrame(
+            {
+                "rpm": rpm,
+                "tps": np.roll(rpm, 3) + rng.normal(0, 0.01, n),
+                "other": np.sin(np.arange(n) * 0.01) + rng.normal(0, 1e-3, n),
+            }
+        )
+
+        results = self.analyzer.analyze_granger_causality(data, list(data.columns), max_lag=lag)
+
+        self._assert_granger_matches_pairwise_fit(results, data, lag)
+
 
 class TestAnomalyDetector:
     """Test anomaly detection functionality."""
@@ -225,6 +326,89 @@ class TestAnomalyDetector:
         assert len(results.z_score_anomalies) > 0  # Should detect outliers
 
 
+class TestAnomalyModelReuse:
+    """Test subsampled training and fitted-model reuse in AnomalyDetector."""
+
+    def setup_method(self):
+        """Setup test fixtures."""
+        rng = np.random.default_rng(0)
+        n = 6000
+        idle = rng.random(n) < 0.9
+        self.data = pd.DataFrame(
+            {
+                "time": np.arange(n) * 0.05,
+                "rpm": np.where(idle, rng.normal(900, 30, n), rng.normal(5500, 300, n)),
+                "tps": np.where(idle, rng.uniform(0, 3, n), rng.uniform(70, 100, n)),
+                "map": np.where(idle, rng.normal(0.4, 0.02, n), rng.normal(1.6, 0.1, n)),
+            }
+        )
+        self.store = AnomalyModelStore(tempfile.mkdtemp())
+        self.detector = AnomalyDetector(
+            max_training_samples=1000, batch_size=2000, model_store=self.store
+        )
+
+    def test_stratified_sample_keeps_rare_states(self):
+        sample = self.detector.stratified_sample(self.data, 500)
+        high_load = self.data["tps"].to_numpy() > 50
+
+        assert len(sample) < len(self.data)
+        assert np.all(np.diff(sample) > 0)
+        assert high_load[sample].sum() >= AnomalyDetector.MIN_SAMPLES_PER_STATE
+
+    def test_large_input_scored_in_batches(self):
+        for detect in (
+            self.detector.detect_isolation_forest_anomalies,
+            self.detector.detect_lof_anomalies,
+        ):
+            results = detect(self.data)
+
+            assert len(results.anomaly_scores) == len(self.data)
+            assert 0 < results.anomaly_rate < 0.5
+
+    def test_lof_model_matches_exact_labels(self):
+        model = self.detector.fit_model(self.data, "lof")
+        self.store.save("car-2", model)
+        loaded = AnomalyModelStore(self.store.base_dir).load("car-2", "lof")
+
+        results = self.detector.score_with_model(self.data, loaded)
+        X = model.scaler.transform(self.data[model.feature_columns].to_numpy(dtype=float))
+        exact = model.estimator.score_samples(X)
+
+        # Approximate neighbours never change a label; flagged rows carry exact scores
+        np.testing.assert_array_equal(results.anomaly_labels, model.estimator.predict(X))
+        flagged = results.anomaly_labels == -1
+        assert flagged.any()
+        np.testing.assert_allclose(results.anomaly_scores[flagged], exact[flagged])
+
+    def test_large_input_clustering(self):
+        results = self.detector.detect_clustering_anomalies(self.data)
+
+        assert len(results.cluster_labels) == len(self.data)
+        assert len(results.noise_points) < len(self.data) * 0.5
+
+    def test_vehicle_model_reused_across_sessions(self):
+        first = self.detector.score_session(self.data, "car-1")
+        model = self.store.load("car-1", "isolation_forest")
+        assert self.store.model_path("car-1", "isolation_forest").exists()
+
+        # A fresh detector loads the persisted model instead of refitting
+        other = AnomalyDetector(model_store=AnomalyModelStore(self.store.base_dir))
+        second = other.score_session(self.data, "car-1")
+
+        np.testing.assert_allclose(first.anomaly_scores, second.anomaly_scores)
+        assert model.n_training_samples <= 1000 + 8 * AnomalyDetector.MIN_SAMPLES_PER_STATE
+
+    def test_model_scores_new_session(self):
+        model = self.detector.fit_model(self.data, "elliptic_envelope")
+        shifted = self.data.copy()
+        shifted["rpm"] += 3000
+
+        baseline = self.detector.score_with_model(self.data, model)
+        drifted = self.detector.score_with_model(shifted, model)
+
+        assert drifted.anomaly_rate > baseline.anomaly_rate
+
+
 class TestFuelEfficiencyAnalyzer:
     """Test fuel efficiency analysis functionality."""
 
@@ -530,5 +714,185 @@ class TestAnalysisIntegration:
         assert speed_rpm_corr > 0.5  # Should be strongly correlated
 
 
+class TestAnalysisEngineParallel:
+    """Test parallel, dependency-aware execution in AnalysisEngine."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.engine = AnalysisEngine()
+        self.data = pd.DataFrame({"time": np.arange(100) * 0.1, "rpm": np.arange(100) * 50.0})
+
+    def _fake_run(self, delays, order):
+        def run(analysis_type, data):
+            time.sleep(delays.get(analysis_type, 0.0))
+            if analysis_type == "correlation":
+                raise ValueError("boom")
+            order.append(analysis_type)
+            return {"type": analysis_type, "rows": len(data)}
+
+        return run
+
+    def test_parallel_matches_sequential(self):
+        order = []
+        with patch.object(self.engine, "run_analysis", self._fake_run({}, order)):
+            sequential = self.engine.analyze(self.data)
+            parallel = self.engine.analyze(self.data, parallel=True)
+
+        assert sequential == parallel
+        assert parallel["correlation"] == {"error": "boom"}
+        assert parallel["statistics"] == {"type": "statistics", "rows": 100}
+
+    def test_parallel_runs_concurrently(self):
+        types = ["statistics", "anomaly", "dynamics", "performance"]
+        delays = {t: 0.2 for t in types}
+        with patch.object(self.engine, "run_analysis", self._fake_run(delays, [])):
+            start = time.perf_counter()
+            results = self.engine.analyze(
+                self.data, analysis_types=types, parallel=True, max_workers=4
+            )
+            elapsed = time.perf_counter() - start
+
+        assert set(results) == set(types)
+        assert elapsed < 0.6
+
+    def test_respects_max_workers(self):
+        types = ["report", "statistics", "anomaly", "dynamics"]
+        active = []
+        peak = []
+
+        def run(analysis_type, data):
+            active.append(analysis_type)
+            peak.append(len(active))
+            time.sleep(0.05)
+            active.remove(analysis_type)
+            return analysis_type
+
+        with patch.object(self.engine, "run_analysis", run):
+            results = self.engine.analyze(
+                self.data, analysis_types=types, parallel=True, max_workers=2
+            )
+
+        assert results == {t: t for t in types}
+        assert max(peak) <= 2
+
+    def test_process_mode_matches_sequential(self):
+        """Real analyzers in worker processes, reading the shared Arrow file."""
+        pytest.importorskip("pyarrow")
+        rng = np.random.default_rng(0)
+        n = 500
+        data = pd.DataFrame(
+            {
+                "time": np.arange(n) * 0.1,
+                "rpm": 3000 + rng.normal(0, 300, n),
+                "tps": rng.uniform(0, 100, n),
+                "map_pressure": rng.uniform(0.3, 1.8, n),
+            }
+        )
+        types = ["statistics", "anomaly"]
+
+        sequential = self.engine.analyze(data, analysis_types=types)
+        parallel = self.engine.analyze(
+            data, analysis_types=types, parallel=True, executor="process", max_workers=2
+        )
+
+        assert set(parallel) == set(types)
+        assert "error" not in parallel["statistics"]
+        assert encode_result(parallel) == encode_result(sequential)
+
+    def test_timeout_returns_partial_results(self):
+        finished = []
+        delays = {"anomaly": 1.0}
+        with patch.object(self.engine, "run_analysis", self._fake_run(delays, [])):
+            results = self.engine.analyze(
+                self.data,
+                analysis_types=["statistics", "anomaly"],
+                parallel=True,
+                timeout=0.2,
+                on_result=lambda name, result: finished.append(name),
+            )
+
+        assert results["statistics"]["type"] == "statistics"
+        assert "Timed out" in results["anomaly"]["error"]
+        assert finished == ["statistics", "anomaly"]
+
+
+class TestAnalysisResultCache:
+    """Test the persistent analysis result cache."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.manager = FuelTechCacheManager(
+            memory_cache_mb=8, disk_cache_mb=8, cache_dir=tempfile.mkdtemp()
+        )
+        self.engine = AnalysisEngine(result_cache=AnalysisResultCache(self.manager))
+        self.data = pd.DataFrame({"time": np.arange(100) * 0.1, "rpm": np.arange(100) * 50.0})
+        self.calls = []
+
+    def _fake_run(self, analysis_type, data):
+        self.calls.append(analysis_type)
+        if analysis_type == "correlation":
+            raise ValueError("boom")
+        return {"type": analysis_type, "rows": len(data)}
+
+    def test_typed_round_trip(self):
+        matrix = CorrelationMatrix(
+            correlation_matrix=pd.DataFrame([[1.0]], columns=["a"], index=["a"]),
+            p_values=pd.DataFrame([[0.0]], columns=["a"], index=["a"]),
+            significant_pairs=[("a", "b", 0.9, 0.01)],
+            method="pearson",
+            sample_size=10,
+        )
+        result = {"matrix": matrix, "level": ConfidenceLevel.HIGH}
+
+        decoded = decode_result(encode_result(result))
+
+        assert isinstance(decoded["matrix"], CorrelationMatrix)
+        assert decoded["matrix"].significant_pairs == [("a", "b", 0.9, 0.01)]
+        pd.testing.assert_frame_equal(decoded["matrix"].p_values, matrix.p_values)
+        assert decoded["level"] is ConfidenceLevel.HIGH
+
+    def test_rejects_foreign_types(self):
+        with pytest.raises(ValueError):
+            decode_result({"__result_dataclass__": "os:PathLike", "fields": {}})
+
+    def test_content_hash(self):
+        changed = self.data.copy()
+        changed.loc[5, "rpm"] = -1.0
+
+        assert frame_content_hash(self.data) == frame_content_hash(self.data.copy())
+        assert frame_content_hash(self.data) != frame_content_hash(changed)
+
+    def test_repeat_analysis_hits_cache(self):
+        types = ["statistics", "correlation"]
+        with patch.object(self.engine, "run_analysis", self._fake_run):
+            first = self.engine.analyze(self.data, types, session_id="s1")
+            second = self.engine.analyze(self.data, types, session_id="s1")
+
+        assert first == second
+        # Failed analyses are not cached
+        assert self.calls == ["statistics", "correlation", "correlation"]
+
+    def test_key_includes_window_and_parameters(self):
+        with patch.object(self.engine, "run_analysis", self._fake_run):
+            self.engine.analyze(self.data, ["statistics"], session_id="s1")
+            self.engine.analyze(self.data, ["statistics"], session_id="s1", time_window=(0, 5))
+            self.engine.statistics_analyzer.alpha = 0.01
+            self.engine.analyze(self.data, ["statistics"], session_id="s1")
+
+        assert self.calls == ["statistics"] * 3
+
+    def test_persists_and_invalidates(self):
+        with patch.object(self.engine, "run_analysis", self._fake_run):
+            self.engine.analyze(self.data, ["statistics"], session_id="s1")
+            self.manager.memory_cache.clear()
+            self.engine.analyze(self.data, ["statistics"], session_id="s1")
+            assert self.calls == ["statistics"]
+
+            self.manager.invalidate_session("s1")
+            self.engine.analyze(self.data, ["statistics"], session_id="s1")
+
+        assert self.calls == ["statistics", "statistics"]
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
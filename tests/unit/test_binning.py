@@ -0,0 +1,221 @@
+"""
+Unit tests for binning.py - Adaptive MAP×RPM binning engine.
+
+The grouped (sort-based) bin statistics are checked against a direct
+per-bin NumPy computation on small data; the incremental accumulator is
+checked against single-pass accumulation of the same samples.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.analysis.binning import AdaptiveBinner, BinningAccumulator, BinningConfig
+from src.analysis.suggestions import SuggestionEngine
+
+
+def _reference_statistics(data, factor=1.5):
+    """Per-bin statistics computed one bin at a time."""
+    q1, q3 = np.percentile(data, [25, 75])
+    iqr = q3 - q1
+    mask = ~((data < q1 - factor * iqr) | (data > q3 + factor * iqr))
+    clean = data[mask] if np.any(mask) else data
+    return {
+        "mean": np.mean(clean),
+        "std": np.std(clean),
+        "min": np.min(clean),
+        "max": np.max(clean),
+        "median": np.median(clean),
+        "count": len(clean),
+        "outlier_count": len(data) - len(clean),
+    }
+
+
+@pytest.fixture
+def log_data():
+    rng = np.random.default_rng(42)
+    n = 5000
+    rpm = rng.uniform(800, 7000, n)
+    map_pressure = rng.uniform(-0.8, 1.5, n)
+    lambda_sensor = 0.85 + 0.1 * rng.standard_normal(n)
+    lambda_sensor[::97] = 3.0  # sensor spikes
+    return pd.DataFrame(
+        {
+            "rpm": rpm,
+            "map_pressure": map_pressure,
+            "lambda_sensor": lambda_sensor,
+            "ignition_timing": rng.uniform(-5, 35, n),
+        }
+    )
+
+
+class TestAdaptiveBinner:
+    def test_bin_membership_matches_edges(self, log_data):
+        config = BinningConfig(base_rpm_bins=12, base_map_bins=10, min_points_per_bin=1)
+        result = AdaptiveBinner(config).create_bins(log_data, additional_cols=["lambda_sensor"])
+
+        rpm = log_data["rpm"].values.astype(np.float32)
+        map_pressure = log_data["map_pressure"].values.astype(np.float32)
+        rpm_idx = np.clip(np.digitize(rpm, result.rpm_edges) - 1, 0, 11)
+        map_idx = np.clip(np.digitize(map_pressure, result.map_edges) - 1, 0, 9)
+
+        assert result.bins
+        for (i, j), cell in result.bins.items():
+            expected = np.flatnonzero((rpm_idx == i) & (map_idx == j))
+            np.testing.assert_array_equal(cell.data_indices, expected)
+            assert cell.index_range[1] - cell.index_range[0] == cell.point_count
+
+    def test_statistics_match_per_bin_reference(self, log_data):
+        config = BinningConfig(base_rpm_bins=8, base_map_bins=6, min_points_per_bin=1)
+        columns = ["lambda_sensor", "ignition_timing"]
+        result = AdaptiveBinner(config).create_bins(log_data, additional_cols=columns)
+
+        for cell in result.bins.values():
+            for col in columns:
+                data = log_data[col].values.astype(np.float32)[cell.data_indices]
+                expected = _reference_statistics(data.astype(np.float64))
+                stats = cell.statistics[col]
+                for key in ("mean", "std", "min", "max", "median"):
+                    assert stats[key] == pytest.approx(expected[key], rel=1e-6, abs=1e-9)
+                assert stats["count"] == expected["count"]
+                assert stats["outlier_count"] == expected["outlier_count"]
+
+        assert any(
+            cell.statistics["lambda_sensor"]["outlier_count"] > 0 for cell in result.bins.values()
+        )
+
+    def test_density_matches_histogram(self, log_data):
+        config = BinningConfig(base_rpm_bins=10, base_map_bins=10, min_points_per_bin=1)
+        result = AdaptiveBinner(config).create_bins(log_data)
+
+        histogram, _, _ = np.histogram2d(
+            log_data["rpm"].values.astype(np.float32),
+            log_data["map_pressure"].values.astype(np.float32),
+            bins=[result.rpm_edges, result.map_edges],
+        )
+        histogram /= histogram.max()
+
+        for (i, j), cell in result.bins.items():
+            assert cell.density_score == pytest.approx(histogram[i, j])
+
+    def test_single_point_bin_is_fully_concentrated(self):
+        binner = AdaptiveBinner()
+        counts = np.array([1, 3])
+        starts = np.array([0, 1])
+        rpm = np.array([1000.0, 2000.0, 2000.0, 2000.0])
+        map_pressure = np.array([0.5, 0.1, 0.2, 0.3])
+
+        spatial = binner._grouped_spatial_statistics(rpm, map_pressure, starts, counts)
+        concentration = spatial["data_concentration"]
+
+        assert concentration[0] == 1.0
+        assert 0.0 <= concentration[1] < 1.0
+
+    def test_large_log_bins_every_point(self):
+        # Timing against the module target: tests/performance_test_binning.py
+        rng = np.random.default_rng(0)
+        n = 1_000_000
+        data = {
+            "rpm": rng.uniform(800, 7000, n),
+            "map": rng.uniform(-0.8, 1.5, n),
+            "lambda_sensor": 0.85 + 0.1 * rng.standard_normal(n),
+        }
+        binner = AdaptiveBinner(BinningConfig(base_rpm_bins=32, base_map_bins=32))
+
+        result = binner.create_bins(data)
+
+        assert result.total_points == n
+        assert all(cell.point_count == len(cell.data_indices) for cell in result.bins.values())
+
+
+class TestBinningAccumulator:
+    @pytest.fixture
+    def config(self):
+        return BinningConfig(base_rpm_bins=6, base_map_bins=5, min_points_per_bin=1)
+
+    def test_updates_match_single_pass(self, log_data, config):
+        columns = ["lambda_sensor", "ignition_timing"]
+        full = BinningAccumulator.from_data(log_data, config, additional_cols=columns)
+
+        incremental = BinningAccumulator(full.rpm_edges, full.map_edges, columns, config)
+        for start in range(0, len(log_data), 1200):
+            incremental.update(log_data.iloc[start : start + 1200])
+
+        assert incremental.total_points == full.total_points == len(log_data)
+        np.testing.assert_array_equal(incremental.counts, full.counts)
+        for col in columns:
+            np.testing.assert_allclose(
+                incremental._moments[col]["sum"], full._moments[col]["sum"], rtol=1e-12
+            )
+            np.testing.assert_array_equal(incremental._sketches[col], full._sketches[col])
+
+    def test_merge_combines_sessions(self, log_data, config):
+        first, second = log_data.iloc[:3000], log_data.iloc[3000:]
+        merged = BinningAccumulator.from_data(first, config, additional_cols=["lambda_sensor"])
+        other = BinningAccumulator(
+            merged.rpm_edges, merged.map_edges, ["lambda_sensor"], config
+        ).update(second)
+
+        merged.merge(other)
+        combined = BinningAccumulator(
+            merged.rpm_edges, merged.map_edges, ["lambda_sensor"], config
+        ).update(log_data)
+
+        np.testing.assert_array_equal(merged.counts, combined.counts)
+        np.testing.assert_array_equal(
+            merged._moments["lambda_sensor"]["max"], combined._moments["lambda_sensor"]["max"]
+        )
+        np.testing.assert_array_equal(
+            merged._sketches["lambda_sensor"], combined._sketches["lambda_sensor"]
+        )
+
+    def test_merge_rejects_different_grid(self, log_data, config):
+        accumulator = BinningAccumulator.from_data(log_data, config)
+        other = BinningAccumulator(accumulator.rpm_edges * 2, accumulator.map_edges)
+
+        with pytest.raises(ValueError):
+            accumulator.merge(other)
+
+    def test_result_statistics(self, log_data, config):
+        accumulator = BinningAccumulator.from_data(
+            log_data, config, additional_cols=["lambda_sensor"]
+        )
+        result = accumulator.to_result()
+
+        rpm = log_data["rpm"].values.astype(np.float32)
+        map_pressure = log_data["map_pressure"].values.astype(np.float32)
+        lambda_sensor = log_data["lambda_sensor"].values.astype(np.float32).astype(np.float64)
+        rpm_idx = np.clip(np.digitize(rpm, result.rpm_edges) - 1, 0, 5)
+        map_idx = np.clip(np.digitize(map_pressure, result.map_edges) - 1, 0, 4)
+
+        assert result.bins
+        assert accumulator.to_result() is result
+        for (i, j), cell in result.bins.items():
+            values = lambda_sensor[(rpm_idx == i) & (map_idx == j)]
+            stats = cell.statistics["lambda_sensor"]
+            assert cell.point_count == len(values)
+            assert stats["mean"] == pytest.approx(np.mean(values), rel=1e-9)
+            assert stats["std"] == pytest.approx(np.std(values), rel=1e-6)
+            assert stats["max"] == pytest.approx(np.max(values))
+            # Sketch quantiles are within the relative accuracy of a sample near the median
+            assert stats["median"] == pytest.approx(np.median(values), rel=0.03)
+
+        assert any(
+            cell.statistics["lambda_sensor"]["outlier_count"] > 0 for cell in result.bins.values()
+        )
+
+    def test_suggestion_engine_consumes_accumulator(self, log_data, config):
+        accumulator = BinningAccumulator.from_data(
+            log_data, config, additional_cols=["lambda_sensor"]
+        )
+
+        from_accumulator = SuggestionEngine().generate_suggestions(
+            log_data, binning_result=accumulator
+        )
+        from_result = SuggestionEngine().generate_suggestions(
+            log_data, binning_result=accumulator.to_result()
+        )
+
+        assert [s.title for s in from_accumulator.suggestions] == [
+            s.title for s in from_result.suggestions
+        ]
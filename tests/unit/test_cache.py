@@ -160,12 +160,44 @@ class TestMemoryCache:
         assert cache.get("key1") is None  # Should be evicted (oldest)
         assert cache.get("key4") == "value4"  # Should be present (newest)
 
+    def test_lru_eviction_respects_access_order(self):
+        """Test that reading an entry protects it from eviction."""
+        cache = MemoryCache(max_size_mb=10, max_entries=3)
+        for key in ("key1", "key2", "key3"):
+            cache.set(key, key)
+
+        cache.get("key1")
+        cache.set("key4", "value4")
+
+        assert list(cache._cache) == ["key3", "key1", "key4"]
+
+    def test_namespace_quota_eviction(self):
+        """Test that a namespace over quota evicts only its own entries."""
+        cache = MemoryCache(max_size_mb=10, namespace_quotas_mb={"df": 0.01})
+        cache.set("analysis:s1:stats", {"mean": 1.0})
+        cache.set("df:s1:a", "x" * 4000)
+        cache.set("df:s1:b", "x" * 4000)
+        cache.get("df:s1:a")
+
+        cache.set("df:s1:c", "x" * 4000)
+
+        assert cache.get("df:s1:b") is None
+        assert cache.get("df:s1:a") is not None
+        assert cache.get("analysis:s1:stats") == {"mean": 1.0}
+        namespace = cache.get_stats()["namespaces"]["df"]
+        assert namespace["entries"] == 2
+        assert namespace["size_mb"] * 1024 * 1024 == 8000
+
+        # Larger than the namespace quota: not cached at all
+        cache.set("df:s1:big", "x" * 20000)
+        assert cache.get("df:s1:big") is None
+
     def test_calculate_size_dataframe(self):
         """Test size calculation for DataFrame."""
         df = pd.DataFrame({"a": [1, 2, 3], "b": [4, 5, 6]})
         size = self.cache._calculate_size(df)
 
-        assert size > 0
+        assert size == int(df.memory_usage(deep=False).sum())
         assert isinstance(size, int)
 
     def test_calculate_size_numpy_array(self):
@@ -260,6 +292,56 @@ class TestDiskCache:
         assert isinstance(retrieved_df, pd.DataFrame)
         pd.testing.assert_frame_equal(df, retrieved_df)
 
+    def test_columnar_formats(self):
+        """Test DataFrames and arrays are stored in memory-mappable formats."""
+        pytest.importorskip("pyarrow")
+        df = pd.DataFrame({"rpm": [1000, 2000], "map": [0.5, 1.0]}, index=["a", "b"])
+        arr = np.linspace(0, 1, 50)
+
+        self.cache.set("df_key", df)
+        self.cache.set("arr_key", arr)
+        self.cache.set("mixed_key", pd.DataFrame({"m": [1, "a"]}))
+
+        suffixes = sorted(p.suffix for p in Path(self.temp_dir).glob("*.*") if p.stem != "metadata")
+        assert suffixes == [".arrow", ".npy", ".pkl"]
+        pd.testing.assert_frame_equal(self.cache.get("df_key"), df)
+        loaded = self.cache.get("arr_key")
+        assert isinstance(loaded, np.memmap)
+        np.testing.assert_array_equal(loaded, arr)
+        assert self.cache.get("mixed_key")["m"].tolist() == [1, "a"]
+
+        # Overwriting with another format removes the previous file
+        self.cache.set("arr_key", [1, 2, 3])
+        assert self.cache.get_stats()["files"] == 3
+
+    def test_access_updates_are_batched(self):
+        """Test access statistics are buffered and flushed together."""
+        self.cache.set("key1", "value1")
+        self.cache.access_flush_interval = 3600
+
+        for _ in range(3):
+            self.cache.get("key1")
+
+        count_sql = "SELECT access_count FROM cache_metadata WHERE key = ?"
+        assert self.cache._conn.execute(count_sql, ("key1",)).fetchone()[0] == 1
+
+        self.cache._flush_access()
+        assert self.cache._conn.execute(count_sql, ("key1",)).fetchone()[0] == 4
+
+    def test_expired_sweep_is_periodic(self):
+        """Test expired entries are swept once per cleanup interval."""
+        self.cache.cleanup_interval = 3600
+        self.cache.get("warmup")  # first call sweeps
+        self.cache.set("key1", "value1", ttl=-1)
+        self.cache.set("key2", "value2")
+
+        self.cache.get("key2")
+        assert self.cache.get_stats()["entries"] == 2
+
+        self.cache._last_cleanup = float("-inf")
+        self.cache.get("key2")
+        assert self.cache.get_stats()["entries"] == 1
+
     def test_set_with_ttl(self):
         """Test setting with TTL."""
         self.cache.set("key1", "value1", ttl=1)
@@ -0,0 +1,152 @@
+"""
+Unit tests for columnar_store.py - Arrow IPC session store.
+
+Tests cover:
+- Write/read round trip
+- Column projection and time-range pruning
+- Integration with FuelTechDatabase import and delete
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from src.data.columnar_store import ColumnarSessionStore, ColumnarStoreError
+from src.data.csv_parser import CSVParser
+from src.data.database import FuelTechDatabase
+
+
+def write_fueltech_csv(path, n=500):
+    """Write a minimal 37-field FuelTech CSV with Portuguese headers."""
+    data = {}
+    for header, field in CSVParser.FIELD_MAPPINGS_37.items():
+        if CSVParser.DATA_TYPES.get(field) == "string":
+            data[header] = ["OFF"] * n
+        else:
+            data[header] = np.ones(n)
+    data["TIME"] = np.arange(n) * 0.01
+    data["RPM"] = np.linspace(800, 6000, n).astype(int)
+    data["TPS"] = np.linspace(0, 100, n)
+    pd.DataFrame(data).to_csv(path, index=False)
+
+
+@pytest.fixture
+def session_df():
+    """Time-ordered session data spanning several record batches."""
+    n = 1000
+    return pd.DataFrame(
+        {
+            "time": np.arange(n) * 0.01,
+            "rpm": np.linspace(800, 7000, n).astype("int64"),
+            "tps": np.linspace(0, 100, n),
+            "map": np.linspace(-0.5, 2.0, n),
+            "idle": ["ON" if i % 2 else "OFF" for i in range(n)],
+        }
+    )
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ColumnarSessionStore(tmp_path / "sessions", batch_rows=128)
+
+
+class TestColumnarSessionStore:
+    def test_round_trip(self, store, session_df):
+        store.write_session("abc", session_df)
+
+        assert store.has_session("abc")
+        result = store.read_session("abc")
+        pd.testing.assert_frame_equal(result, session_df)
+
+    def test_column_projection_and_time_range(self, store, session_df):
+        store.write_session("abc", session_df)
+
+        result = store.read_session("abc", columns=["rpm", "tps"], time_range=(2.0, 3.0))
+
+        expected = session_df[(session_df["time"] >= 2.0) & (session_df["time"] <= 3.0)]
+        assert list(result.columns) == ["rpm", "tps"]
+        assert len(result) == len(expected)
+        np.testing.assert_array_equal(result["rpm"].values, expected["rpm"].values)
+
+    def test_time_range_outside_data(self, store, session_df):
+        store.write_session("abc", session_df)
+
+        result = store.read_session("abc", columns=["time", "rpm"], time_range=(100.0, 200.0))
+        assert result.empty
+        assert list(result.columns) == ["time", "rpm"]
+
+    def test_unsorted_input_is_sorted_by_time(self, store, session_df):
+        store.write_session("abc", session_df.sample(frac=1.0, random_state=0))
+
+        result = store.read_session("abc", columns=["time"])
+        assert result["time"].is_monotonic_increasing
+
+    def test_streamed_writer_round_trip_and_pruning(self, store, session_df):
+        writer = store.open_writer("abc")
+        for start in range(0, len(session_df), 300):
+            writer.write(session_df.iloc[start : start + 300])
+        writer.close()
+
+        pd.testing.assert_frame_equal(store.read_session("abc"), session_df)
+        result = store.read_session("abc", columns=["rpm"], time_range=(2.0, 3.0))
+        expected = session_df[(session_df["time"] >= 2.0) & (session_df["time"] <= 3.0)]
+        np.testing.assert_array_equal(result["rpm"].values, expected["rpm"].values)
+
+    def test_streamed_writer_abort_leaves_no_file(self, store, session_df):
+        writer = store.open_writer("abc")
+        writer.write(session_df.iloc[:100])
+        writer.abort()
+
+        assert not store.has_session("abc")
+        assert not writer.tmp_path.exists()
+
+    def test_missing_session(self, store):
+        assert not store.has_session("missing")
+        with pytest.raises(ColumnarStoreError):
+            store.read_session("missing")
+
+    def test_delete_session(self, store, session_df):
+        store.write_session("abc", session_df)
+
+        assert store.delete_session("abc")
+        assert not store.has_session("abc")
+        assert not store.delete_session("abc")
+
+
+class TestDatabaseColumnarIntegration:
+    def test_import_writes_and_delete_removes_columnar_file(self, tmp_path):
+        csv_path = tmp_path / "log.csv"
+        write_fueltech_csv(csv_path)
+
+        db = FuelTechDatabase(str(tmp_path / "test.db"), columnar_dir=tmp_path / "columnar")
+        result = db.import_csv_file(csv_path, assess_quality=False)
+        session_id = result["session_id"]
+
+        assert "columnar_storage" in result["steps_completed"]
+        columnar = db.get_session_data_columnar(session_id, columns=["time", "rpm"])
+        assert columnar is not None
+        assert list(columnar.columns) == ["time", "rpm"]
+        assert len(columnar) == result["total_records"]
+
+        assert db.delete_session(session_id, confirm=True)
+        assert db.get_session_data_columnar(session_id) is None
+
+    def test_streaming_import_writes_columnar_file(self, tmp_path):
+        csv_path = tmp_path / "log.csv"
+        write_fueltech_csv(csv_path)
+
+        db = FuelTechDatabase(str(tmp_path / "test.db"), columnar_dir=tmp_path / "columnar")
+        result = db.import_csv_file_streaming(csv_path, chunk_size=120, assess_quality=False)
+
+        assert "columnar_storage" in result["steps_completed"]
+        columnar = db.get_session_data_columnar(result["session_id"], columns=["time", "rpm"])
+        assert len(columnar) == result["inserted_records"]
+        assert columnar["time"].is_monotonic_increasing
+
+    def test_disabled_store_returns_none(self, tmp_path):
+        db = FuelTechDatabase(str(tmp_path / "test.db"), enable_columnar_store=False)
+
+        assert db.columnar_store is None
+        assert db.get_session_data_columnar("any") is None
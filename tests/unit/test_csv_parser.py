@@ -263,6 +263,24 @@ class TestCSVParser:
         finally:
             csv_file.unlink()
 
+    def test_iter_csv_chunks_cleans_later_chunks(self):
+        """Test invalid rows are removed in every chunk, not only the first."""
+        data = [list(self.sample_data_37[0]) for _ in range(6)]
+        for i, row in enumerate(data):
+            row[0] = i * 0.04
+        data[4][1] = 50000  # RPM out of range in the second chunk
+        csv_file = self.create_test_csv(self.sample_37_headers, data)
+
+        try:
+            chunks = list(self.parser.iter_csv_chunks(csv_file, chunk_size=3))
+
+            assert [len(chunk) for chunk in chunks] == [3, 2]
+            assert chunks[1]["rpm"].max() <= 20000
+            assert "time" in chunks[0].columns
+
+        finally:
+            csv_file.unlink()
+
     def test_get_file_info(self):
         """Test file information extraction."""
         csv_file = self.create_test_csv(self.sample_37_headers, self.sample_data_37)
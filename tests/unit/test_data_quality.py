@@ -15,7 +15,12 @@ import numpy as np
 import pandas as pd
 import pytest
 
-from src.data.quality import DataQualityAssessor, QualityCheckResult, assess_fueltech_data_quality
+from src.data.quality import (
+    DataQualityAssessor,
+    QualityCheckResult,
+    QualityProfile,
+    assess_fueltech_data_quality,
+)
 
 
 class TestQualityCheckResult:
@@ -597,5 +602,85 @@ class TestQualityAssessmentEdgeCases:
         assert isinstance(result_lenient.status, str)
 
 
+class TestFusedQualityAssessment:
+    """Test the shared-profile (fused) assessment against pandas references."""
+
+    @pytest.fixture
+    def log_df(self):
+        rng = np.random.default_rng(7)
+        n = 5000
+        df = pd.DataFrame(
+            {
+                "time": np.arange(n) * 0.02,
+                "rpm": rng.integers(800, 7000, n),
+                "tps": rng.uniform(0, 100, n),
+                "map": rng.normal(0.5, 0.3, n),
+                "engine_temp": rng.normal(90, 2, n),
+                "air_temp": rng.normal(30, 2, n),
+                "o2_general": rng.normal(0.95, 0.2, n),
+                "idle": np.where(rng.random(n) > 0.5, "ON", "OFF"),
+            }
+        )
+        df.loc[::97, "map"] = np.nan
+        df.loc[::500, "tps"] = 250.0
+        df.loc[1200, "time"] = 10.0  # time going backwards
+        df.loc[3000, "time"] = df.loc[2999, "time"]  # duplicate timestamp
+        return df
+
+    def test_fused_matches_separate_profiles(self, log_df):
+        fused = DataQualityAssessor().assess_data_quality(log_df)
+        separate = DataQualityAssessor().assess_data_quality(log_df, fused=False)
+
+        assert fused["overall_score"] == separate["overall_score"]
+        for a, b in zip(fused["detailed_results"], separate["detailed_results"]):
+            assert a["status"] == b["status"]
+            assert a["error_percentage"] == b["error_percentage"]
+
+    def test_statistics_match_pandas(self, log_df):
+        assessor = DataQualityAssessor()
+        profile = QualityProfile(log_df)
+
+        completeness = assessor.check_data_completeness(log_df, profile)
+        assert completeness.details["missing_by_column"] == {"map": log_df["map"].isna().sum()}
+
+        anomalies = assessor.check_statistical_anomalies(log_df, profile).details["anomalies"]
+        tps = log_df["tps"]
+        q1, q3 = tps.quantile([0.25, 0.75])
+        z = np.abs((tps - tps.mean()) / tps.std())
+        assert anomalies["tps"]["z_score_outliers"] == (z > 3).sum()
+        assert (
+            anomalies["tps"]["iqr_outliers"]
+            == ((tps < q1 - 1.5 * (q3 - q1)) | (tps > q3 + 1.5 * (q3 - q1))).sum()
+        )
+        assert anomalies["tps"]["std"] == pytest.approx(tps.std())
+
+        temporal = assessor.check_temporal_consistency(log_df, profile)
+        assert (
+            temporal.affected_records
+            == (log_df["time"].diff() < 0).sum() + log_df["time"].duplicated().sum()
+        )
+
+    def test_sampling_reports_error_bounds(self, log_df):
+        assessor = DataQualityAssessor(sample_size=1000)
+        profile = QualityProfile(log_df, sample_size=1000)
+        assert profile.sampled
+
+        anomalies = assessor.check_statistical_anomalies(log_df, profile)
+        sampling = anomalies.details["sampling"]
+        assert sampling["sample_rows"] == 1000
+        assert sampling["total_rows"] == len(log_df)
+        assert 0 < sampling["quartile_rank_error"] < 0.05
+
+        # tps and map are independent: weak correlation flagged with an interval
+        correlations = assessor.check_correlations(log_df, profile)
+        issue = next(
+            i for i in correlations.details["correlation_issues"] if i["fields"] == ("tps", "map")
+        )
+        full = log_df["tps"].corr(log_df["map"])
+        low, high = issue["confidence_interval"]
+        assert low <= issue["actual"] <= high
+        assert low <= full <= high
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -26,6 +26,7 @@ import pytest
 from sqlalchemy import create_engine
 from sqlalchemy.exc import SQLAlchemyError
 
+from src.data.csv_parser import CSVParser
 from src.data.database import DatabaseError, DataImportError, FuelTechDatabase, get_database
 from src.data.models import Base, DataQualityCheck, DataSession, FuelTechCoreData
 
@@ -271,6 +272,59 @@ class TestFuelTechDatabase:
             assert result2["status"] == "skipped"
             assert result2["reason"] == "file_already_imported"
 
+    def test_import_csv_file_streaming(self, tmp_path):
+        """Test streaming import inserts every chunk and fills session statistics."""
+        n = 450
+        data = {}
+        for header, field in CSVParser.FIELD_MAPPINGS_37.items():
+            data[header] = ["OFF"] * n if CSVParser.DATA_TYPES.get(field) == "string" else [1.0] * n
+        data["TIME"] = [i * 0.04 for i in range(n)]
+        data["RPM"] = [800 + i * 10 for i in range(n)]
+        csv_path = tmp_path / "log.csv"
+        pd.DataFrame(data).to_csv(csv_path, index=False)
+
+        db = FuelTechDatabase(str(tmp_path / "test.db"), enable_columnar_store=False)
+        progress = []
+        result = db.import_csv_file_streaming(
+            csv_path, chunk_size=100, progress_callback=progress.append
+        )
+
+        assert result["status"] == "completed"
+        assert result["total_records"] == n
+        assert result["inserted_records"] == n
+        assert [p["chunk"] for p in progress] == [1, 2, 3, 4, 5]
+        assert progress[-1]["rows_read"] == n
+        assert progress[-1]["fraction"] == pytest.approx(1.0)
+
+        frame = db.load_session_frame(result["session_id"], columns=["time", "rpm"])
+        assert len(frame) == n
+        assert frame["time"].is_monotonic_increasing
+
+        session = db.db_manager.get_session_by_hash(result["file_hash"])
+        assert session.import_status == "completed"
+        assert session.total_records == n
+        assert session.duration_seconds == pytest.approx((n - 1) * 0.04)
+        assert session.sample_rate_hz == pytest.approx(25.0)
+
+        summary = db.get_session_summary(result["session_id"])
+        assert summary["record_count"] == n
+        assert summary["duration_seconds"] == pytest.approx((n - 1) * 0.04)
+        # Statistics describe the stored (normalized) data
+        stored = db.load_session_frame(result["session_id"], columns=["rpm"])["rpm"]
+        assert summary["columns"]["rpm"]["max"] == stored.max()
+        assert summary["columns"]["rpm"]["mean"] == pytest.approx(stored.mean())
+        assert summary["columns"]["rpm"]["p50"] == pytest.approx(stored.median())
+        assert "idle" not in summary["columns"]
+
+    def test_import_csv_file_streaming_empty_file(self, tmp_path):
+        """Test streaming import of a header-only file fails cleanly."""
+        csv_path = tmp_path / "empty.csv"
+        csv_path.write_text(",".join(CSVParser.FIELD_MAPPINGS_37) + "\n", encoding="utf-8")
+
+        db = FuelTechDatabase(str(tmp_path / "test.db"), enable_columnar_store=False)
+        with pytest.raises(DataImportError):
+            db.import_csv_file_streaming(csv_path)
+
     def _setup_import_mocks(self, csv_file):
         """Helper to setup mocks for import tests."""
         sample_data = pd.DataFrame(
@@ -407,6 +461,108 @@ class TestFuelTechDatabase:
             assert len(result_df) == 1
             assert result_df.iloc[0]["time"] == 0.5
 
+    def _create_session_with_rows(self, db_instance, count=10):
+        """Create a session with ``count`` samples at 0.1 s spacing."""
+        session_record = db_instance.db_manager.create_session_record(
+            session_name="Loader Test",
+            filename="loader.csv",
+            file_hash=f"loader_{count}",
+            format_version="v1.0",
+            field_count=37,
+        )
+        df = pd.DataFrame(
+            {
+                "time": [i * 0.1 for i in range(count)],
+                "rpm": [1000 + i * 100 for i in range(count)],
+                "tps": [float(i) for i in range(count)],
+                "idle": ["OFF"] * count,
+            }
+        )
+        db_instance.db_manager.bulk_insert_core_dataframe(session_record.id, df)
+        return session_record.id
+
+    def test_load_session_frame_projection_and_types(self, db_instance):
+        """Test SQL loader returns only requested columns with NumPy dtypes."""
+        session_id = self._create_session_with_rows(db_instance)
+
+        df = db_instance.load_session_frame(
+            session_id, columns=["time", "rpm", "map", "idle", "unknown"], use_columnar=False
+        )
+
+        assert list(df.columns) == ["time", "rpm", "map", "idle"]
+        assert df["rpm"].dtype == "int64"
+        assert df["time"].dtype == "float64"
+        assert df["map"].isna().all()
+        assert df["time"].is_monotonic_increasing
+
+    def test_load_session_frame_decimation_limit_and_order(self, db_instance):
+        """Test step/max_points decimation, descending order and limit in SQL."""
+        session_id = self._create_session_with_rows(db_instance, count=10)
+
+        stepped = db_instance.load_session_frame(session_id, columns=["rpm"], step=3)
+        assert stepped["rpm"].tolist() == [1000, 1300, 1600, 1900]
+
+        capped = db_instance.load_session_frame(session_id, columns=["time"], max_points=4)
+        assert len(capped) <= 4
+
+        latest = db_instance.load_session_frame(
+            session_id, columns=["time"], limit=2, descending=True
+        )
+        assert latest["time"].tolist() == pytest.approx([0.9, 0.8])
+
+        window = db_instance.load_session_frame(session_id, columns=["rpm"], time_range=(0.2, 0.4))
+        assert window["rpm"].tolist() == [1200, 1300, 1400]
+
+    def test_load_session_frame_empty_session(self, db_instance):
+        """Test loader returns an empty frame with the requested columns."""
+        df = db_instance.load_session_frame("missing", columns=["time", "rpm"])
+
+        assert df.empty
+        assert list(df.columns) == ["time", "rpm"]
+
+    def test_load_session_frame_columnar_matches_sql(self, db_instance):
+        """Test columnar branch returns the same data as the SQL branch."""
+        pytest.importorskip("pyarrow")
+        session_id = self._create_session_with_rows(db_instance, count=20)
+        sql_df = db_instance.load_session_frame(session_id, columns=["time", "rpm", "tps"])
+        db_instance.columnar_store.write_session(session_id, sql_df)
+
+        kwargs = {"columns": ["time", "rpm", "tps", "map"], "step": 2, "time_range": (0.3, 1.5)}
+        from_sql = db_instance.load_session_frame(session_id, use_columnar=False, **kwargs)
+        from_columnar = db_instance.load_session_frame(session_id, **kwargs)
+
+        pd.testing.assert_frame_equal(from_columnar, from_sql, check_dtype=False)
+
+    def test_backfill_session_summaries(self, db_instance):
+        """Test backfill summarizes old sessions and stats read the summary table."""
+        session_id = self._create_session_with_rows(db_instance, count=10)
+        with db_instance.get_session() as db:
+            db.query(DataSession).filter(DataSession.id == session_id).update(
+                {"import_status": "completed"}
+            )
+            db.commit()
+
+        assert db_instance.get_session_summary(session_id) is None
+        assert db_instance.get_database_stats()["records"]["core_data"] == 10
+
+        assert db_instance.backfill_session_summaries() == {
+            "processed": 1,
+            "skipped": 0,
+            "failed": 0,
+        }
+        assert db_instance.backfill_session_summaries()["processed"] == 0
+
+        summary = db_instance.get_session_summary(session_id)
+        rpm = summary["columns"]["rpm"]
+        assert summary["record_count"] == 10
+        assert summary["sample_rate_hz"] == pytest.approx(10.0)
+        assert (rpm["min"], rpm["max"], rpm["mean"]) == (1000, 1900, pytest.approx(1450))
+        assert rpm["std"] == pytest.approx(pd.Series(range(1000, 2000, 100)).std())
+        assert db_instance.get_database_stats()["records"]["core_data"] == 10
+
+        assert db_instance.delete_session(session_id, confirm=True)
+        assert db_instance.get_session_summary(session_id) is None
+
     def test_get_session_quality(self, db_instance):
         """Test retrieving session quality assessment."""
         # Create test session and quality check
@@ -0,0 +1,163 @@
+"""
+Unit tests for analysis/events.py - vectorized run-length events.
+
+find_runs is compared against a plain loop over the mask, and the
+refactored callers (safety, segmentation, knock detection) are checked
+for the run metrics they report.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.analysis.events import EventRuns, find_runs, threshold_events
+from src.analysis.performance import PerformanceAnalyzer
+from src.analysis.safety import SafetyValidator, ViolationType
+from src.analysis.segmentation import EngineStateSegmenter
+
+
+def _loop_runs(mask):
+    """Reference (start, end) runs, end inclusive."""
+    runs = []
+    start = None
+    for i, flag in enumerate(mask):
+        if flag and start is None:
+            start = i
+        elif not flag and start is not None:
+            runs.append((start, i - 1))
+            start = None
+    if start is not None:
+        runs.append((start, len(mask) - 1))
+    return runs
+
+
+class TestFindRuns:
+    """Test suite for find_runs."""
+
+    def test_matches_loop(self):
+        rng = np.random.default_rng(3)
+        mask = rng.random(5000) > 0.6
+        values = rng.normal(size=5000)
+
+        runs = find_runs(mask, values=values)
+        expected = _loop_runs(mask)
+
+        assert list(zip(runs.start, runs.end)) == expected
+        for (start, end), peak, peak_index in zip(expected, runs.peak, runs.peak_index):
+            assert peak == pytest.approx(values[start : end + 1].max())
+            assert peak_index == start + int(np.argmax(values[start : end + 1]))
+
+    def test_edges_and_empty(self):
+        runs = find_runs(np.array([True, True, False, True]))
+        assert list(runs.start) == [0, 3]
+        assert list(runs.end) == [1, 3]
+        assert list(runs.length) == [2, 1]
+
+        empty = find_runs(np.zeros(10, dtype=bool))
+        assert isinstance(empty, EventRuns)
+        assert len(empty) == 0
+        assert empty.to_frame().empty
+
+    def test_duration_and_integral(self):
+        time = np.arange(10) * 0.5
+        values = np.array([0, 2, 2, 2, 0, 0, 4, 4, 0, 0], dtype=float)
+
+        runs = find_runs(values > 1, values=values, time=time, baseline=1.0)
+
+        assert list(runs.duration) == [1.0, 0.5]
+        assert list(runs.start_time) == [0.5, 3.0]
+        # Trapezoid of (value - 1) between first and last sample of each run
+        assert runs.integral == pytest.approx([1.0, 1.5])
+
+    def test_min_duration_and_min_samples(self):
+        mask = np.array([1, 0, 1, 1, 1, 0, 1, 1], dtype=bool)
+
+        assert list(find_runs(mask, min_samples=2).start) == [2, 6]
+        assert list(find_runs(mask, min_duration=2).start) == [2]
+
+    def test_gap_merge(self):
+        mask = np.array([1, 1, 0, 1, 0, 0, 0, 1], dtype=bool)
+
+        runs = find_runs(mask, max_gap_samples=1)
+
+        assert list(zip(runs.start, runs.end)) == [(0, 3), (7, 7)]
+        assert list(runs.length) == [4, 1]
+        assert list(runs.active_samples) == [3, 1]
+
+        by_time = find_runs(mask, time=np.arange(8) * 0.1, max_gap_time=0.45)
+        assert len(by_time) == 1
+
+    def test_min_peak_and_nan(self):
+        values = np.array([5.0, np.nan, 1.0, 3.0, 9.0])
+
+        runs = find_runs(np.ones(5, dtype=bool), values=values, peak="min")
+
+        assert runs.peak[0] == 1.0
+        assert runs.peak_index[0] == 2
+
+    def test_reduce_and_to_mask(self):
+        mask = np.array([0, 1, 1, 0, 1, 0], dtype=bool)
+        flags = np.array([0, 0, 1, 0, 0, 1], dtype=bool)
+
+        runs = find_runs(mask)
+
+        assert list(runs.reduce(flags, np.logical_or)) == [True, False]
+        np.testing.assert_array_equal(runs.to_mask(len(mask)), mask)
+
+    def test_threshold_events(self):
+        values = np.array([2.0, 0.5, 0.4, 2.0, 0.8, 2.0])
+
+        runs = threshold_events(values, 1.0, "<")
+
+        assert list(zip(runs.start, runs.end)) == [(1, 2), (4, 4)]
+        assert list(runs.peak) == [0.4, 0.8]
+
+        with pytest.raises(ValueError):
+            threshold_events(values, 1.0, "!=")
+
+
+class TestEventCallers:
+    """Test the analyzers built on find_runs."""
+
+    def test_safety_violation_runs(self):
+        rpm = np.full(100, 5000.0)
+        rpm[10:15] = 7700.0
+        rpm[12] = 7900.0
+        rpm[40:42] = 8200.0
+        arrays = {"rpm": rpm, "timestamp": np.arange(100) * 0.1}
+
+        violations = SafetyValidator()._validate_rpm_safety(arrays)
+
+        assert all(v.violation_type == ViolationType.RPM_OVERLIMIT for v in violations)
+        assert [v.consecutive_count for v in violations] == [5, 2, 2]
+        assert [v.current_value for v in violations] == [7900.0, 8200.0, 8200.0]
+        assert [v.timestamp for v in violations] == pytest.approx([1.0, 4.0, 4.0])
+
+    def test_segment_minimum_duration(self):
+        segmenter = EngineStateSegmenter()
+        mask = np.zeros(50, dtype=bool)
+        mask[5:8] = True
+        mask[20:45] = True
+        timestamps = np.arange(50) * 0.1
+
+        processed = segmenter._post_process_segments({"state": mask}, timestamps)["state"]
+
+        # The 0.2s segment is shorter than the 0.5s minimum
+        expected = np.zeros(50, dtype=bool)
+        expected[20:45] = True
+        np.testing.assert_array_equal(processed, expected)
+        assert segmenter._find_continuous_segments(mask) == [(5, 8), (20, 45)]
+
+    def test_knock_episodes(self):
+        knock = np.zeros(100)
+        knock[10:13] = 0.8
+        knock[50] = 1.2
+        data = pd.DataFrame({"knock_sensor": knock, "engine_load": np.linspace(0, 99, 100)})
+
+        result = PerformanceAnalyzer().detect_knock(data)
+
+        assert [event[0] for event in result.knock_events] == pytest.approx([1.0, 1.1, 1.2, 5.0])
+        assert result.knock_prone_conditions["knock_episodes"] == 2
+        assert result.knock_prone_conditions["avg_load_during_knock"] == pytest.approx(
+            np.mean([10, 11, 12, 50])
+        )
@@ -0,0 +1,92 @@
+"""
+Unit tests for ftml_reader.py - FTML binary log reader.
+
+Uses the sample logs in tests/ft and their .analysis.json files as golden
+references.
+"""
+
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data.csv_parser import CSVParser
+from src.data.ftml_reader import FTMLReader, FTMLReadError, parse_ftml_file
+
+FT_DIR = Path(__file__).resolve().parents[1] / "ft"
+
+# (file stem, rows at 50 Hz, first RPM samples)
+SAMPLE_LOGS = [
+    ("Log 3_20230522-2043", 471, [5119, 5084, 5164]),
+    ("Log 3_20250815-1033_20250829-1804", 1493, [1002, 1002, 1002]),
+]
+
+KNOWN_FIELDS = set(CSVParser.FIELD_MAPPINGS_64.values())
+
+
+@pytest.fixture(params=SAMPLE_LOGS, ids=[stem for stem, _, _ in SAMPLE_LOGS])
+def sample_log(request):
+    stem, rows, rpm = request.param
+    ftml_path = FT_DIR / f"{stem}.ftml"
+    golden = json.loads((FT_DIR / f"{stem}.analysis.json").read_text())
+    return ftml_path, golden, rows, rpm
+
+
+class TestFTMLReader:
+    def test_matches_golden_file_info(self, sample_log):
+        ftml_path, golden, _, _ = sample_log
+
+        reader = FTMLReader(ftml_path).load()
+
+        assert reader.metadata["file_size"] == golden["file_size"]
+        assert ftml_path.read_bytes()[:20].hex() == golden["first_bytes"]
+
+    def test_decodes_channels_on_base_time_grid(self, sample_log):
+        ftml_path, _, rows, rpm = sample_log
+
+        df = FTMLReader(ftml_path).read()
+
+        assert len(df) == rows
+        assert df.columns[0] == "time"
+        np.testing.assert_allclose(np.diff(df["time"].values), 0.02)
+        assert df["rpm"].dtype == np.int64
+        assert df["rpm"].tolist()[:3] == rpm
+
+    def test_mapped_columns_use_normalized_names(self, sample_log):
+        ftml_path, _, _, _ = sample_log
+
+        columns = FTMLReader(ftml_path).columns
+
+        named = [c for c in columns if not c.startswith("channel_")]
+        assert {"time", "rpm", "tps", "map", "engine_temp"} <= set(named)
+        assert set(named) <= KNOWN_FIELDS
+        assert len(columns) == len(set(columns))
+
+    def test_iter_blocks_matches_full_read(self, sample_log):
+        ftml_path, _, _, _ = sample_log
+        reader = FTMLReader(ftml_path)
+
+        blocks = list(reader.iter_blocks(block_rows=100, columns=["time", "rpm", "map"]))
+
+        assert all(len(block) <= 100 for block in blocks)
+        pd.testing.assert_frame_equal(
+            pd.concat(blocks), reader.read(columns=["time", "rpm", "map"])
+        )
+
+    def test_column_projection(self):
+        stem = SAMPLE_LOGS[0][0]
+        df = parse_ftml_file(FT_DIR / f"{stem}.ftml", columns=["rpm", "tps"])
+
+        assert list(df.columns) == ["rpm", "tps"]
+
+    def test_invalid_files(self, tmp_path):
+        empty = tmp_path / "empty.ftml"
+        empty.write_bytes(b"")
+        garbage = tmp_path / "garbage.ftml"
+        garbage.write_bytes(b"not a datalogger file")
+
+        for path in (empty, garbage, tmp_path / "missing.ftml"):
+            with pytest.raises(FTMLReadError):
+                FTMLReader(path).load()
@@ -0,0 +1,120 @@
+"""
+Unit tests for core/fuel_maps/calculations.py - 3D map generation.
+
+The vectorized matrix builders are compared bit for bit against per-cell
+loops over the scalar helpers.
+"""
+
+import numpy as np
+import pytest
+
+from src.core.fuel_maps.calculations import (
+    Calculator,
+    _interp1d,
+    _interp1d_array,
+    _lambda_base_from_strategy,
+    _rpm_shape_for_fuel,
+    calculate_lambda_target_closed_loop,
+    generate_ve_3d_matrix,
+)
+
+RPM_AXIS = [1000.0 + i * 300 for i in range(32)]
+MAP_AXIS = [-1.0 + i * 0.1 for i in range(32)]
+
+# Default curves of generate_ve_3d_matrix
+RPM_AXIS_POINTS = (1000, 2000, 3000, 4000, 5000, 6000, 7000, 8000)
+VE_POINTS = (0.70, 0.78, 0.86, 0.90, 0.88, 0.86, 0.84, 0.82)
+MAP_POINTS = (-1.0, -0.5, 0.0, 0.5, 1.0, 1.5, 2.0)
+GAIN_POINTS = (0.80, 0.90, 1.00, 1.05, 1.08, 1.10, 1.12)
+
+
+def assert_bit_identical(actual, expected):
+    actual = np.asarray(actual)
+    expected = np.asarray(expected)
+    assert actual.shape == expected.shape
+    assert actual.tobytes() == expected.tobytes()
+
+
+class TestVectorizedMaps:
+    def test_interp1d_array_matches_scalar(self):
+        xs = (1000, 2000, 3000, 4000, 5000, 6000, 7000, 8000)
+        ys = (0.70, 0.78, 0.86, 0.90, 0.88, 0.86, 0.84, 0.82)
+        x = [500.0, 1000, 1500.5, 2000, 2999.9, 7999.0, 8000, 9000.0, float("nan")]
+
+        expected = [_interp1d(float(v), xs, ys) for v in x]
+
+        assert_bit_identical(_interp1d_array(x, xs, ys), expected)
+
+    def test_ve_matrix_matches_cell_loop(self):
+        expected = [
+            [
+                max(0.65, min(1.10, _interp1d(r, RPM_AXIS_POINTS, VE_POINTS) * gain))
+                for r in RPM_AXIS
+            ]
+            for gain in (_interp1d(m, MAP_POINTS, GAIN_POINTS) for m in MAP_AXIS)
+        ]
+
+        assert_bit_identical(generate_ve_3d_matrix(RPM_AXIS, MAP_AXIS), expected)
+
+    @pytest.mark.parametrize("strategy", ["balanceada", "conservadora", "agressiva"])
+    def test_closed_loop_lambda_matches_cell_loop(self, strategy):
+        pairs = [(1000, 1.0), (4000, 0.97), (7000, 1.03)]
+        rpm_min, rpm_max = min(RPM_AXIS), max(RPM_AXIS)
+        eff = 1.0 / 1.1
+
+        expected = [
+            [
+                max(
+                    0.6,
+                    min(
+                        1.5,
+                        _lambda_base_from_strategy(m, strategy)
+                        * eff
+                        * _interp1d(r, [1000.0, 4000.0, 7000.0], [1.0, 0.97, 1.03])
+                        * _rpm_shape_for_fuel("ethanol", r, rpm_min, rpm_max),
+                    ),
+                )
+                for r in RPM_AXIS
+            ]
+            for m in MAP_AXIS
+        ]
+
+        actual = calculate_lambda_target_closed_loop(
+            RPM_AXIS, MAP_AXIS, strategy=strategy, cl_factor=1.1, rpm_user_pairs=pairs
+        )
+
+        assert_bit_identical(actual, expected)
+
+    def test_afr_and_lambda_rows(self):
+        afr = Calculator.calculate_afr_3d_matrix(RPM_AXIS, MAP_AXIS, {}, "balanced")
+        lam = Calculator.calculate_lambda_3d_matrix(RPM_AXIS, MAP_AXIS, {}, "balanced")
+
+        for i, m in enumerate(MAP_AXIS):
+            target = Calculator.get_afr_target_3d((m + 1.013) * 100, "balanced")
+            assert np.all(afr[i] == target)
+            assert np.all(lam[i] == max(0.7, min(1.3, target / 14.7)))
+
+    def test_smoothing_matches_neighbor_loop(self):
+        matrix = np.random.default_rng(0).normal(size=(12, 9))
+        expected = matrix.copy()
+        for i in range(1, 11):
+            for j in range(1, 8):
+                neighbors = [
+                    matrix[i - 1, j],
+                    matrix[i + 1, j],
+                    matrix[i, j - 1],
+                    matrix[i, j + 1],
+                ]
+                expected[i, j] = (matrix[i, j] * 2 + sum(neighbors)) / 6
+
+        assert_bit_identical(Calculator.interpolate_3d_matrix(matrix), expected)
+
+    def test_fuel_matrix_shape_and_floor(self):
+        vehicle = {"displacement": 2.0, "cylinders": 4, "pw_min_ms": 1.6}
+
+        pw = Calculator.calculate_fuel_3d_matrix(RPM_AXIS, MAP_AXIS, vehicle)
+
+        assert pw.shape == (len(MAP_AXIS), len(RPM_AXIS))
+        assert pw.min() >= 1.6
+        # More pressure means more air and a longer pulse
+        assert np.all(np.diff(pw[:, 10]) >= 0)
@@ -0,0 +1,143 @@
+"""
+Unit tests for core/fuel_maps/persistence.py - JSON and binary (.npz) map storage.
+"""
+
+import os
+
+import numpy as np
+import pytest
+
+from src.core.fuel_maps.persistence import PersistenceManager
+
+RPM_AXIS = [1000.0 + i * 300 for i in range(8)]
+MAP_AXIS = [-1.0 + i * 0.25 for i in range(6)]
+
+
+def _save_3d(manager, vehicle_id="civic", map_type="ve_3d_map", bank_id="shared", offset=0.0):
+    values = np.arange(len(MAP_AXIS) * len(RPM_AXIS), dtype=float).reshape(6, 8) / 7 + offset
+    assert manager.save_3d_map_data(
+        vehicle_id=vehicle_id,
+        map_type=map_type,
+        bank_id=bank_id,
+        rpm_axis=RPM_AXIS,
+        map_axis=MAP_AXIS,
+        rpm_enabled=[True] * 8,
+        map_enabled=[True, False] * 3,
+        values_matrix=values,
+        metadata={"created_from": "test"},
+    )
+    return values
+
+
+class TestBinaryPersistence:
+    def test_round_trip_matches_json(self, tmp_path):
+        json_manager = PersistenceManager(str(tmp_path / "json"), storage_format="json")
+        npz_manager = PersistenceManager(str(tmp_path / "npz"), storage_format="npz")
+        for manager in (json_manager, npz_manager):
+            _save_3d(manager)
+            manager.save_2d_map_data(
+                "civic", "tps_correction", "shared", [0, 25, 50], [1.0, 0.5, 0.0], [True] * 3
+            )
+
+        for map_type, loader in (
+            ("ve_3d_map", "load_3d_map_data"),
+            ("tps_correction", "load_2d_map_data"),
+        ):
+            expected = getattr(json_manager, loader)("civic", map_type, "shared")
+            actual = getattr(npz_manager, loader)("civic", map_type, "shared")
+            expected.pop("timestamp")
+            actual.pop("timestamp")
+            assert actual == expected
+
+        assert [p.name for p in npz_manager.list_map_files()] == ["maps_civic.npz"]
+
+    def test_loads_return_independent_copies(self, tmp_path):
+        manager = PersistenceManager(str(tmp_path), storage_format="npz")
+        _save_3d(manager)
+
+        first = manager.load_3d_map_data("civic", "ve_3d_map", "shared")
+        first["values_matrix"][0][0] = -1.0
+
+        again = manager.load_3d_map_data("civic", "ve_3d_map", "shared")
+        assert again["values_matrix"][0][0] == 0.0
+
+    def test_cache_invalidated_by_external_write(self, tmp_path):
+        writer = PersistenceManager(str(tmp_path), storage_format="npz")
+        reader = PersistenceManager(str(tmp_path), storage_format="npz")
+        _save_3d(writer)
+        assert reader.load_3d_map_data("civic", "ve_3d_map", "shared")["metadata"]
+
+        path = tmp_path / "maps_civic.npz"
+        stat = path.stat()
+        values = _save_3d(writer, offset=10.0)
+        # Garante mtime diferente mesmo em sistemas de arquivos com baixa resolução
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        loaded = reader.load_3d_map_data("civic", "ve_3d_map", "shared")
+        np.testing.assert_array_equal(loaded["values_matrix"], values)
+
+    def test_lru_eviction_reloads_from_disk(self, tmp_path):
+        manager = PersistenceManager(str(tmp_path), storage_format="npz")
+        manager.binary_store.cache_size = 1
+        _save_3d(manager, map_type="ve_3d_map")
+        _save_3d(manager, map_type="ignition_3d_map", offset=1.0)
+
+        assert len(manager.binary_store._cache) == 1
+        assert (
+            manager.load_3d_map_data("civic", "ve_3d_map", "shared")["values_matrix"][0][0] == 0.0
+        )
+        assert (
+            manager.load_3d_map_data("civic", "ignition_3d_map", "shared")["values_matrix"][0][0]
+            == 1.0
+        )
+
+    def test_delete_map(self, tmp_path):
+        manager = PersistenceManager(str(tmp_path), storage_format="npz")
+        _save_3d(manager, bank_id="A")
+        _save_3d(manager, bank_id="B")
+
+        assert manager.delete_map("civic", "ve_3d_map", "A", create_backup=True)
+        assert manager.load_3d_map_data("civic", "ve_3d_map", "A") is None
+        assert manager.load_3d_map_data("civic", "ve_3d_map", "B") is not None
+        assert list((tmp_path / "backups").glob("map_civic_ve_3d_map_A_backup_*.json"))
+        assert not manager.delete_map("civic", "ve_3d_map", "A", create_backup=False)
+
+    def test_migrate_json_to_binary(self, tmp_path):
+        json_manager = PersistenceManager(str(tmp_path), storage_format="json")
+        _save_3d(json_manager, vehicle_id="my_car", bank_id="A")
+        _save_3d(json_manager, vehicle_id="my_car", bank_id="B", offset=2.0)
+        _save_3d(json_manager, vehicle_id="other")
+
+        npz_manager = PersistenceManager(str(tmp_path), storage_format="npz")
+        assert npz_manager.migrate_json_to_binary("my_car", remove_json=True) == 2
+
+        assert sorted(p.name for p in tmp_path.glob("map_*.json")) == [
+            "map_other_ve_3d_map_shared.json"
+        ]
+        for bank in ("A", "B"):
+            loaded = npz_manager.load_3d_map_data("my_car", "ve_3d_map", bank)
+            assert loaded["vehicle_id"] == "my_car"
+            assert loaded["bank_id"] == bank
+        assert npz_manager.binary_store.list_maps("my_car") == [
+            ("ve_3d_map", "A"),
+            ("ve_3d_map", "B"),
+        ]
+
+    def test_ensure_all_maps_uses_single_vehicle_file(self, tmp_path):
+        manager = PersistenceManager(str(tmp_path), storage_format="npz")
+        vehicle = {"id": "civic", "displacement": 2.0, "cylinders": 4}
+
+        assert manager.ensure_all_maps_exist("civic", vehicle)
+        created = manager.binary_store.list_maps("civic")
+
+        assert created
+        assert [p.name for p in tmp_path.iterdir() if p.is_file()] == ["maps_civic.npz"]
+
+        # Segunda chamada não recria nada: o índice em cache responde
+        mtime = (tmp_path / "maps_civic.npz").stat().st_mtime_ns
+        assert manager.ensure_all_maps_exist("civic", vehicle)
+        assert (tmp_path / "maps_civic.npz").stat().st_mtime_ns == mtime
+
+    def test_invalid_storage_format(self, tmp_path):
+        with pytest.raises(ValueError):
+            PersistenceManager(str(tmp_path), storage_format="xml")
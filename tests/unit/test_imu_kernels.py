@@ -0,0 +1,144 @@
+"""
+Unit tests for analysis/imu.py - vectorized IMU kernels.
+
+The kernels are compared against the per-sample loops and pandas
+expressions they replace in VehicleDynamicsAnalyzer and the IMU page.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.analysis.dynamics import VehicleDynamicsAnalyzer
+from src.analysis.imu import (
+    attitude_from_acceleration,
+    comfort_penalty,
+    derive_imu_columns,
+    friction_circle_usage,
+    g_force_distribution,
+    jerk,
+    rolling_std,
+)
+
+
+@pytest.fixture
+def imu_frame():
+    rng = np.random.default_rng(7)
+    n = 2000
+    df = pd.DataFrame(
+        {
+            "time": np.arange(n) * 0.001,
+            "g_force_accel": rng.normal(0, 0.4, n),
+            "g_force_lateral": rng.normal(0, 0.5, n),
+            "pitch_angle": np.cumsum(rng.normal(0, 0.2, n)),
+            "roll_angle": np.cumsum(rng.normal(0, 0.2, n)),
+            "traction_speed": rng.uniform(0, 200, n),
+        }
+    )
+    df.loc[rng.choice(n, 50, replace=False), "g_force_accel"] = np.nan
+    df.loc[rng.choice(n, 50, replace=False), "roll_angle"] = np.nan
+    return df
+
+
+class TestIMUKernels:
+    def test_attitude_matches_sample_loop(self):
+        rng = np.random.default_rng(0)
+        ax, ay, az = rng.normal(0, 3, (3, 500))
+        ax[:5] = ay[:5] = az[:5] = 0.0
+
+        pitch_loop = np.zeros(500)
+        roll_loop = np.zeros(500)
+        for i in range(500):
+            magnitude = np.sqrt(ax[i] ** 2 + ay[i] ** 2 + az[i] ** 2)
+            if magnitude > 0:
+                axn, ayn, azn = ax[i] / magnitude, ay[i] / magnitude, az[i] / magnitude
+                pitch_loop[i] = np.arctan2(axn, np.sqrt(ayn**2 + azn**2)) * 180 / np.pi
+                roll_loop[i] = np.arctan2(ayn, azn) * 180 / np.pi
+
+        pitch, roll = attitude_from_acceleration(ax, ay, az)
+
+        np.testing.assert_allclose(pitch, pitch_loop, rtol=1e-12, atol=1e-12)
+        np.testing.assert_allclose(roll, roll_loop, rtol=1e-12, atol=1e-12)
+
+    def test_rolling_std_matches_pandas(self, imu_frame):
+        for column in ["pitch_angle", "roll_angle"]:
+            expected = imu_frame[column].rolling(window=10).std().to_numpy()
+            np.testing.assert_allclose(
+                rolling_std(imu_frame[column], 10), expected, rtol=1e-9, atol=1e-9
+            )
+
+    def test_derived_columns_match_pandas(self, imu_frame):
+        df = imu_frame
+        accel, lateral = df["g_force_accel"], df["g_force_lateral"]
+        variations = [
+            df[c].rolling(window=10).std().fillna(0) for c in ["pitch_angle", "roll_angle"]
+        ]
+        expected = {
+            "g_force_resultant": np.sqrt(accel.fillna(0) ** 2 + lateral.fillna(0) ** 2),
+            "slip_angle_estimate": np.degrees(np.arctan(lateral.fillna(0) / 9.81 * 0.1)),
+            "acceleration_event": accel > 0.3,
+            "braking_event": accel < -0.3,
+            "cornering_event": np.abs(lateral) > 0.3,
+            "stability_index": pd.Series(100 - np.mean(variations, axis=0) * 10).clip(0, 100),
+        }
+
+        derived = derive_imu_columns(df)
+
+        for column, values in expected.items():
+            np.testing.assert_allclose(derived[column], np.asarray(values), rtol=1e-9, atol=1e-9)
+        assert len(derived["g_force_jerk"]) == len(df)
+        assert len(derived["friction_circle_usage"]) == len(df)
+
+    def test_event_threshold(self, imu_frame):
+        derived = derive_imu_columns(imu_frame, event_threshold=0.8)
+
+        assert derived["cornering_event"].sum() == (imu_frame["g_force_lateral"].abs() > 0.8).sum()
+
+    def test_jerk_uses_timestamps(self):
+        time = np.array([0.0, 0.001, 0.002, 0.002, 0.004])
+        values = np.array([0.0, 0.1, 0.3, 0.3, 0.7])
+
+        result = jerk(values, time)
+
+        np.testing.assert_allclose(result, [0.0, 100.0, 200.0, 0.0, 200.0])
+
+    def test_friction_circle_usage(self):
+        g_total = np.linspace(0, 1.5, 101)
+
+        np.testing.assert_allclose(friction_circle_usage(g_total, 1.5)[-1], 100.0)
+        assert np.all(friction_circle_usage(np.zeros(10)) == 0)
+
+    def test_comfort_and_distribution_match_loop(self):
+        g_total = np.random.default_rng(1).uniform(0, 1.6, 1000)
+
+        penalty = 0
+        for g_val in g_total:
+            if g_val > 0.5:
+                penalty += (g_val - 0.5) * 0.1
+            if g_val > 1.0:
+                penalty += (g_val - 1.0) * 0.2
+
+        assert comfort_penalty(g_total) == pytest.approx(penalty, rel=1e-12)
+        distribution = g_force_distribution(g_total)
+        assert sum(distribution.values()) == len(g_total)
+        assert distribution["extreme"] == int(np.sum(g_total >= 1.2))
+
+    def test_dynamics_analyzer_uses_kernels(self):
+        rng = np.random.default_rng(3)
+        n = 5000
+        data = pd.DataFrame(
+            {
+                "accel_x": rng.normal(0, 3, n),
+                "accel_y": rng.normal(0, 3, n),
+                "accel_z": rng.normal(9.8, 0.5, n),
+            }
+        )
+        analyzer = VehicleDynamicsAnalyzer()
+
+        g_forces = analyzer.analyze_g_forces(data)
+        attitude = analyzer.analyze_vehicle_attitude(data)
+
+        assert len(g_forces.combined_g) == n
+        assert 0 <= g_forces.comfort_rating <= 1
+        assert len(attitude.pitch_angle) == len(attitude.roll_angle) == n
+        assert np.all(np.abs(attitude.pitch_angle) <= 90)
@@ -0,0 +1,146 @@
+"""
+Unit tests for maps/algorithms.py - windowed smoothing kernels.
+
+The sliding-window bilateral filter, local noise estimate and adaptive
+smoothing are compared against the per-cell / per-column implementations
+they replace.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import ndimage
+
+from src.maps.algorithms import MapAlgorithms
+
+
+def assert_close(actual, expected):
+    np.testing.assert_allclose(actual, expected, rtol=1e-10, atol=1e-12)
+
+
+def _loop_bilateral(values, sigma_spatial, sigma_range):
+    """Reference per-cell bilateral filter."""
+    rows, cols = values.shape
+    result = np.zeros_like(values)
+    kernel_size = int(2 * sigma_spatial * 3) + 1
+    if kernel_size % 2 == 0:
+        kernel_size += 1
+    center = kernel_size // 2
+    y, x = np.mgrid[-center : center + 1, -center : center + 1]
+    spatial_kernel = np.exp(-(x**2 + y**2) / (2 * sigma_spatial**2))
+
+    for i in range(rows):
+        for j in range(cols):
+            y_min, y_max = max(0, i - center), min(rows, i + center + 1)
+            x_min, x_max = max(0, j - center), min(cols, j + center + 1)
+            neighborhood = values[y_min:y_max, x_min:x_max]
+            spatial_weights = spatial_kernel[
+                center - (i - y_min) : center + (y_max - i),
+                center - (j - x_min) : center + (x_max - j),
+            ]
+            range_weights = np.exp(-((neighborhood - values[i, j]) ** 2) / (2 * sigma_range**2))
+            weights = spatial_weights * range_weights
+            weights /= np.sum(weights)
+            result[i, j] = np.sum(neighborhood * weights)
+    return result
+
+
+def _loop_adaptive(values, noise_threshold, max_sigma):
+    """Reference single-map adaptive smoothing."""
+    noise_map = ndimage.generic_filter(values, np.nanstd, size=3, mode="reflect")
+    sigma_map = np.clip(noise_map / noise_threshold * max_sigma, 0.1, max_sigma)
+    smoothed = ndimage.gaussian_filter(values, sigma=np.nanmean(sigma_map), mode="reflect")
+    normalized_sigma = sigma_map / np.nanmax(sigma_map)
+    return normalized_sigma * smoothed + (1 - normalized_sigma) * values
+
+
+@pytest.fixture
+def maps():
+    rng = np.random.default_rng(11)
+    base = np.add.outer(np.linspace(0, 1, 16), np.linspace(0, 2, 12))
+    return base + rng.normal(scale=0.05, size=(5, 16, 12))
+
+
+class TestMapAlgorithmKernels:
+    """Test suite for the vectorized map kernels."""
+
+    @pytest.mark.parametrize("sigma_spatial, sigma_range", [(1.0, 0.1), (0.6, 0.5), (2.0, 0.05)])
+    def test_bilateral_matches_loop(self, maps, sigma_spatial, sigma_range):
+        algorithms = MapAlgorithms()
+
+        stacked = algorithms._bilateral_filter_2d(maps, sigma_spatial, sigma_range)
+
+        for values, filtered in zip(maps, stacked):
+            assert_close(filtered, _loop_bilateral(values, sigma_spatial, sigma_range))
+
+    def test_bilateral_chunked(self, maps, monkeypatch):
+        algorithms = MapAlgorithms()
+        expected = algorithms._bilateral_filter_2d(maps, 1.0, 0.1)
+
+        monkeypatch.setattr("src.maps.algorithms.MAX_WINDOW_ELEMENTS", 1)
+
+        assert_close(algorithms._bilateral_filter_2d(maps, 1.0, 0.1), expected)
+
+    def test_local_noise_matches_generic_filter(self, maps):
+        values = maps.copy()
+        values[0, 3, 4] = np.nan
+
+        noise = MapAlgorithms()._estimate_local_noise(values)
+
+        for original, estimated in zip(values, noise):
+            expected = ndimage.generic_filter(original, np.nanstd, size=3, mode="reflect")
+            assert_close(estimated, expected)
+
+    def test_local_noise_chunked(self, maps, monkeypatch):
+        algorithms = MapAlgorithms()
+        expected = algorithms._estimate_local_noise(maps)
+
+        monkeypatch.setattr("src.maps.algorithms.MAX_WINDOW_ELEMENTS", 1)
+
+        assert_close(algorithms._estimate_local_noise(maps), expected)
+        assert_close(algorithms._estimate_local_noise(maps[0]), expected[0])
+
+    def test_adaptive_matches_loop(self, maps):
+        smoothed = MapAlgorithms().smooth_batch(
+            maps, method="adaptive", noise_threshold=0.1, max_sigma=2.0
+        )
+
+        for values, result in zip(maps, smoothed):
+            assert_close(result, _loop_adaptive(values, 0.1, 2.0))
+
+    def test_dataframe_methods_match_per_column(self):
+        rng = np.random.default_rng(5)
+        map_data = pd.DataFrame(
+            {
+                "a": np.linspace(0, 1, 20) + rng.normal(scale=0.05, size=20),
+                "b": np.linspace(2, 0, 20) + rng.normal(scale=0.2, size=20),
+                "label": ["x"] * 20,
+            }
+        )
+        algorithms = MapAlgorithms()
+
+        bilateral = algorithms.bilateral_filter(map_data, sigma_spatial=1.0, sigma_range=0.1)
+        adaptive = algorithms.adaptive_smooth(map_data)
+
+        for col in ["a", "b"]:
+            column = map_data[col].values.reshape(-1, 1)
+            assert_close(bilateral[col].values, _loop_bilateral(column, 1.0, 0.1).flatten())
+            assert_close(adaptive[col].values, _loop_adaptive(column, 0.1, 2.0).flatten())
+        assert list(bilateral["label"]) == ["x"] * 20
+
+    def test_smooth_batch(self, maps):
+        algorithms = MapAlgorithms()
+
+        gaussian = algorithms.smooth_batch(maps, method="gaussian", sigma=1.0)
+        median = algorithms.smooth_batch(maps, method="median", kernel_size=3)
+        single = algorithms.smooth_batch(maps[0], method="bilateral", sigma=1.0)
+
+        assert gaussian.shape == maps.shape
+        assert_close(gaussian[2], ndimage.gaussian_filter(maps[2], sigma=1.0, mode="reflect"))
+        assert_close(median[1], ndimage.median_filter(maps[1], size=3, mode="reflect"))
+        assert_close(single, _loop_bilateral(maps[0], 1.0, 0.1))
+
+        with pytest.raises(ValueError):
+            algorithms.smooth_batch(maps, method="unknown")
+        with pytest.raises(ValueError):
+            algorithms.smooth_batch(np.zeros(5))
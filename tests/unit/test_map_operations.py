@@ -0,0 +1,234 @@
+"""
+Unit tests for maps/operations.py - sparse-delta undo/redo history.
+
+Tests the in-place MapEditBuffer, the byte-bounded OperationHistory with
+edit coalescing, and undo/redo through the DataFrame MapOperations API.
+"""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.maps.operations import (
+    CellSelection,
+    MapEditBuffer,
+    MapOperation,
+    MapOperations,
+    OperationHistory,
+)
+
+
+@pytest.fixture
+def map_values():
+    return np.add.outer(np.arange(8, dtype=float), np.arange(6, dtype=float) / 10) + 10.0
+
+
+def _operation(indices, old, new, timestamp, selection=None, operation_type="increment"):
+    return MapOperation(
+        operation_type=operation_type,
+        timestamp=timestamp,
+        affected_cells=selection,
+        cell_indices=np.asarray(indices, dtype=np.int32),
+        old_values=np.asarray(old, dtype=np.float32),
+        new_values=np.asarray(new, dtype=np.float32),
+        parameters={},
+    )
+
+
+class TestMapEditBuffer:
+    """Test suite for MapEditBuffer."""
+
+    def test_edits_in_place_and_records_changed_cells_only(self, map_values):
+        buffer = MapEditBuffer(map_values)
+        original = buffer.values.copy()
+        values_id = id(buffer.values)
+
+        changed = buffer.increment(CellSelection(1, 2, 3, 4), 0.5)
+
+        assert changed == 4
+        assert id(buffer.values) == values_id
+        assert buffer.values.dtype == np.float32
+        np.testing.assert_allclose(buffer.values[1:3, 3:5], original[1:3, 3:5] + 0.5)
+
+        (operation,) = buffer.history.operations
+        assert sorted(operation.cell_indices.tolist()) == [9, 10, 15, 16]
+        assert operation.nbytes == 4 * (4 + 4 + 4)
+
+    def test_undo_redo_roundtrip(self, map_values):
+        buffer = MapEditBuffer(map_values, history=OperationHistory(coalesce_seconds=0))
+        original = buffer.values.copy()
+
+        buffer.fill(CellSelection(0, 1, 0, 1), 20.0)
+        buffer.scale(CellSelection(2, 7, 0, 5), 10.0, "percentage")
+        after = buffer.values.copy()
+
+        assert buffer.undo() and buffer.undo()
+        np.testing.assert_array_equal(buffer.values, original)
+        assert not buffer.undo()
+
+        assert buffer.redo() and buffer.redo()
+        np.testing.assert_array_equal(buffer.values, after)
+        assert not buffer.redo()
+
+    def test_new_edit_clears_redo(self, map_values):
+        buffer = MapEditBuffer(map_values)
+        buffer.increment(CellSelection(0, 0, 0, 0), 1.0)
+        buffer.undo()
+
+        buffer.fill(CellSelection(1, 1, 1, 1), 0.0)
+
+        assert not buffer.history.can_redo
+        assert buffer.history.nbytes == buffer.history.operations[0].nbytes
+
+    def test_set_values_and_unchanged_edits(self, map_values):
+        buffer = MapEditBuffer(map_values)
+        edited = buffer.values.copy()
+        edited[3, 2] = 99.0
+
+        assert buffer.set_values(edited) == 1
+        assert buffer.set_values(edited) == 0
+        assert len(buffer.history) == 1
+
+        with pytest.raises(ValueError):
+            buffer.set_values(edited[:2])
+        with pytest.raises(ValueError):
+            buffer.paste(CellSelection(0, 1, 0, 1), np.zeros((3, 3)))
+        with pytest.raises(ValueError):
+            buffer.increment(CellSelection(0, 8, 0, 0), 1.0)
+
+    def test_consecutive_edits_coalesce(self, map_values):
+        buffer = MapEditBuffer(map_values)
+        original = buffer.values.copy()
+        selection = CellSelection(0, 3, 0, 3)
+
+        for _ in range(5):
+            buffer.increment(selection, 0.25)
+
+        assert len(buffer.history) == 1
+        assert buffer.history.operations[0].parameters["coalesced"] == 5
+
+        buffer.undo()
+        np.testing.assert_array_equal(buffer.values, original)
+
+    def test_frame_roundtrip(self, map_values):
+        # Values float32 cannot represent exactly
+        map_data = pd.DataFrame(map_values + 1e-9, columns=[f"RPM_{i}" for i in range(6)])
+        map_data.insert(0, "label", "x")
+
+        buffer = MapEditBuffer.from_frame(map_data)
+        buffer.fill(CellSelection(0, 0, 0, 0), 14.8)
+        result = buffer.to_frame(map_data)
+
+        assert result.loc[0, "RPM_0"] == 14.8
+        assert list(result["label"]) == ["x"] * 8
+        assert map_data.loc[0, "RPM_0"] == map_values[0, 0] + 1e-9
+        # Untouched cells are not perturbed by the float32 buffer
+        untouched = result.drop(columns="label").to_numpy().ravel()[1:]
+        np.testing.assert_array_equal(
+            untouched, map_data.drop(columns="label").to_numpy().ravel()[1:]
+        )
+
+        with pytest.raises(ValueError):
+            buffer.to_frame(map_data.iloc[:4])
+
+
+class TestOperationHistory:
+    """Test suite for OperationHistory."""
+
+    def test_byte_budget_evicts_oldest(self):
+        now = datetime.now()
+        history = OperationHistory(max_bytes=100, coalesce_seconds=0)
+
+        for i in range(10):
+            history.record(_operation([i, i + 1], [0, 0], [1, 1], now))  # 24 bytes each
+
+        assert history.nbytes <= 100
+        assert len(history) == 4
+        assert history.operations[0].cell_indices.tolist() == [6, 7]
+
+    def test_operation_count_limit(self):
+        now = datetime.now()
+        history = OperationHistory(max_operations=3, coalesce_seconds=0)
+
+        for i in range(5):
+            history.record(_operation([i], [0], [1], now))
+
+        assert len(history) == 3
+
+    def test_coalescing_rules(self):
+        start = datetime.now()
+        selection = CellSelection(0, 0, 0, 1)
+        history = OperationHistory(coalesce_seconds=1.0)
+
+        history.record(_operation([0, 1], [1, 1], [2, 2], start, selection))
+        history.record(_operation([0], [2], [3], start + timedelta(seconds=0.5), selection))
+        assert len(history) == 1
+        merged = history.operations[0]
+        assert merged.cell_indices.tolist() == [0, 1]
+        assert merged.old_values.tolist() == [1, 1]
+        assert merged.new_values.tolist() == [3, 2]
+
+        # Too late, or a different selection: new undo step
+        history.record(_operation([0], [3], [4], start + timedelta(seconds=2), selection))
+        history.record(
+            _operation([5], [0], [1], start + timedelta(seconds=2.1), CellSelection(1, 1, 1, 1))
+        )
+        assert len(history) == 3
+
+    def test_cancelled_edits_drop_step(self):
+        now = datetime.now()
+        selection = CellSelection(0, 0, 0, 0)
+        history = OperationHistory()
+
+        history.record(_operation([0], [1], [2], now, selection))
+        history.record(_operation([0], [2], [1], now, selection))
+
+        assert len(history) == 0
+        assert history.nbytes == 0
+
+
+class TestMapOperationsHistory:
+    """Test undo/redo through the DataFrame API."""
+
+    def test_undo_redo_dataframe(self, map_values):
+        map_data = pd.DataFrame(map_values, columns=[f"c{i}" for i in range(6)])
+        operations = MapOperations()
+
+        filled = operations.fill_region(map_data, CellSelection(1, 2, 1, 2), 0.0)
+        operation = operations.operation_history[-1]
+        assert len(operation.cell_indices) == int((filled.values != map_data.values).sum())
+
+        undone = operations.undo_last_operation(filled)
+        pd.testing.assert_frame_equal(undone, map_data)
+
+        redone = operations.redo_last_operation(undone)
+        pd.testing.assert_frame_equal(redone, filled)
+
+        assert operations.redo_last_operation(redone) is None
+        summary = operations.get_operation_history_summary()
+        assert summary[0]["type"] == "fill"
+        assert summary[0]["changed_cells"] == len(operation.cell_indices)
+
+    def test_undo_restores_cells_clipped_by_limits(self, map_values):
+        map_data = pd.DataFrame(map_values, columns=[f"c{i}" for i in range(6)])
+        map_data.loc[6, "c3"] = 25.0  # outside the AFR limits, outside the selection
+        operations = MapOperations()
+
+        result = operations.increment_region(map_data, CellSelection(0, 1, 2, 3), 0.5)
+        operation = operations.operation_history[-1]
+
+        assert result.loc[6, "c3"] == 20.0
+        assert len(operation.cell_indices) == int((result.values != map_data.values).sum())
+        pd.testing.assert_frame_equal(operations.undo_last_operation(result), map_data)
+
+    def test_undo_keeps_integer_dtype(self):
+        map_data = pd.DataFrame({"a": np.arange(6), "b": np.arange(6) * 10})
+        operations = MapOperations()
+
+        filled = operations.fill_region(map_data, CellSelection(0, 2, 0, 1), 7)
+        undone = operations.undo_last_operation(filled)
+
+        assert undone.equals(map_data)
+        assert operations.redo_last_operation(undone).equals(filled)
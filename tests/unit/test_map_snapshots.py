@@ -0,0 +1,126 @@
+"""
+Unit tests for maps/snapshots.py - keyframe/delta snapshot storage.
+
+Every version in a chain is rebuilt and compared with the map that was
+saved; diffs computed from deltas are checked against full reloads.
+"""
+
+import gzip
+import pickle
+import sqlite3
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.maps.snapshots import KEYFRAME_INTERVAL, SNAPSHOT_MAGIC, MapSnapshots
+
+
+def _map_frame(values):
+    rows, cols = values.shape
+    return pd.DataFrame(
+        values,
+        index=[f"Load_{i / 10:.2f}" for i in range(rows)],
+        columns=[f"RPM_{1000 + 250 * j}" for j in range(cols)],
+    )
+
+
+@pytest.fixture
+def snapshots(tmp_path):
+    return MapSnapshots(tmp_path / "snapshots.db")
+
+
+@pytest.fixture
+def edit_history():
+    """A 32x32 map edited a few cells at a time."""
+    rng = np.random.default_rng(7)
+    values = np.full((32, 32), 12.5)
+    history = [values.copy()]
+    for _ in range(2 * KEYFRAME_INTERVAL + 5):
+        cells = rng.integers(0, values.size, size=6)
+        values.ravel()[cells] += rng.normal(0, 0.3, size=6)
+        history.append(values.copy())
+    history[10][3, 4] = np.nan
+    return [_map_frame(v) for v in history]
+
+
+def _save_all(snapshots, frames, name="base_fuel"):
+    metadata = SimpleNamespace(name=name, map_type="fuel")
+    return [snapshots.save_snapshot(frame, metadata) for frame in frames]
+
+
+class TestMapSnapshots:
+    def test_every_version_round_trips(self, tmp_path, snapshots, edit_history):
+        ids = _save_all(snapshots, edit_history)
+
+        # A fresh instance has no decoded versions in memory
+        reader = MapSnapshots(tmp_path / "snapshots.db")
+        for snapshot_id, frame in zip(ids, edit_history):
+            loaded, metadata = reader.load_snapshot(snapshot_id)
+            pd.testing.assert_frame_equal(loaded, frame)
+
+        _, last_meta = reader.rollback_to_snapshot(ids[-1])
+        assert last_meta["version"] == len(edit_history)
+
+    def test_deltas_are_small_and_keyframes_periodic(self, snapshots, edit_history):
+        ids = _save_all(snapshots, edit_history)
+
+        with sqlite3.connect(snapshots.db_path) as conn:
+            sizes = dict(conn.execute("SELECT snapshot_id, file_size FROM snapshots"))
+            blobs = dict(conn.execute("SELECT snapshot_id, compressed_data FROM snapshot_data"))
+
+        assert all(blob.startswith(SNAPSHOT_MAGIC) for blob in blobs.values())
+        keyframes = [i for i, sid in enumerate(ids) if "values" in _sections(snapshots, blobs[sid])]
+        assert keyframes == list(range(0, len(ids), KEYFRAME_INTERVAL))
+        # A few edited cells cost a couple hundred bytes, not a full map
+        deltas = [sizes[sid] for i, sid in enumerate(ids) if i not in keyframes]
+        assert max(deltas) < 256
+        assert max(deltas) < min(sizes[ids[i]] for i in keyframes)
+
+    def test_diff_from_deltas_matches_full_comparison(self, snapshots, edit_history):
+        ids = _save_all(snapshots, edit_history)
+
+        for first, second in [(1, 30), (30, 1), (0, 0), (5, 22)]:
+            diff = snapshots.compare_snapshots(ids[first], ids[second])
+            expected = edit_history[second].values - edit_history[first].values
+            changed = np.abs(expected) > 1e-6
+
+            assert diff.cells_changed == int(np.sum(changed))
+            if changed.any():
+                assert diff.max_change == pytest.approx(np.max(expected[changed]))
+                assert diff.mean_change == pytest.approx(np.mean(expected[changed]))
+
+    def test_mixed_maps_and_legacy_blobs(self, snapshots):
+        mixed = pd.DataFrame({"rpm": [1000, 2000], "label": ["idle", "cruise"]})
+        ids = _save_all(snapshots, [mixed], name="labels")
+        pd.testing.assert_frame_equal(snapshots.load_snapshot(ids[0])[0], mixed)
+
+        # Snapshots written by the previous format stay readable
+        legacy = _map_frame(np.arange(16.0).reshape(4, 4))
+        legacy_id = _save_all(snapshots, [legacy], name="legacy")[0]
+        with sqlite3.connect(snapshots.db_path) as conn:
+            conn.execute(
+                "UPDATE snapshot_data SET compressed_data = ? WHERE snapshot_id = ?",
+                (gzip.compress(pickle.dumps(legacy)), legacy_id),
+            )
+        snapshots._state_cache.clear()
+
+        edited = legacy.copy()
+        edited.iloc[0, 0] = -1.0
+        edited_id = _save_all(snapshots, [edited], name="legacy")[0]
+
+        pd.testing.assert_frame_equal(snapshots.load_snapshot(legacy_id)[0], legacy)
+        pd.testing.assert_frame_equal(snapshots.load_snapshot(edited_id)[0], edited)
+        assert snapshots.compare_snapshots(legacy_id, edited_id).cells_changed == 1
+
+    def test_saving_does_not_freeze_caller_frame(self, snapshots, edit_history):
+        frame = edit_history[0]
+        _save_all(snapshots, [frame])
+
+        frame.iloc[0, 0] = 1.0
+        assert frame.iloc[0, 0] == 1.0
+
+
+def _sections(snapshots, blob):
+    return snapshots._unpack_snapshot(blob)[1]
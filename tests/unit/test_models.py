@@ -15,6 +15,7 @@ Created: 2025-01-02
 
 import tempfile
 
+import pandas as pd
 import pytest
 from sqlalchemy import create_engine, inspect
 from sqlalchemy.exc import IntegrityError
@@ -692,6 +693,65 @@ class TestDatabaseManager:
         finally:
             session.close()
 
+    def test_prepare_core_dataframe_range_masks(self, db_manager):
+        """Test vectorized cleaning drops invalid core rows and nulls extended values."""
+        df = pd.DataFrame(
+            {
+                "time": [0.0, 0.1, 0.2, 0.3, 0.4, 0.5],
+                "rpm": ["1000", 25000, 1200, 1300, None, 1500],
+                "tps": [10.0, 10.0, 150.0, 10.0, 10.0, 10.0],
+                "o2_general": [0.9, 0.9, 0.9, 0.9, 0.9, float("inf")],
+                "idle": ["ON", "OFF", "OFF", "OFF", "OFF", "OFF"],
+                "g_force_accel": [0.5, 0.5, 0.5, float("nan"), 0.5, 0.5],
+                "not_a_column": [1, 2, 3, 4, 5, 6],
+            }
+        )
+
+        cleaned, skipped = db_manager.prepare_core_dataframe(df)
+
+        assert skipped == 4  # rpm out of range, tps out of range, rpm missing, o2 inf
+        assert cleaned["time"].tolist() == [0.0, 0.3]
+        assert cleaned["rpm"].tolist() == [1000, 1300]
+        assert cleaned["rpm"].dtype == "int64"
+        assert cleaned["idle"].tolist() == ["ON", "OFF"]
+        assert pd.isna(cleaned["g_force_accel"].iloc[1])
+        assert "not_a_column" not in cleaned.columns
+
+    def test_bulk_insert_core_dataframe_batches(self, db_manager):
+        """Test DataFrame insert across several batches with extended fields."""
+        session_record = db_manager.create_session_record(
+            session_name="Batch Test",
+            filename="batch.csv",
+            file_hash="batch_hash",
+            format_version="v2.0",
+            field_count=64,
+        )
+        df = pd.DataFrame(
+            {
+                "time": [i * 0.1 for i in range(25)],
+                "rpm": [1000 + i for i in range(25)],
+                "g_force_accel": [None if i % 5 == 0 else 0.1 for i in range(25)],
+            }
+        )
+
+        inserted = db_manager.bulk_insert_core_dataframe(session_record.id, df, batch_size=7)
+        assert inserted == 25
+
+        session = db_manager.get_session()
+        try:
+            rows = (
+                session.query(FuelTechCoreData)
+                .filter(FuelTechCoreData.session_id == session_record.id)
+                .order_by(FuelTechCoreData.time)
+                .all()
+            )
+            assert len(rows) == 25
+            assert len({row.id for row in rows}) == 25
+            assert rows[0].g_force_accel is None
+            assert rows[1].g_force_accel == 0.1
+        finally:
+            session.close()
+
     # Removed: bulk_insert_extended_data deprecated after unification
 
 
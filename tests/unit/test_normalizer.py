@@ -883,3 +883,115 @@ class TestPerformance:
         # Allow for reasonable increase due to derived fields
         # but shouldn't be more than 3x original
         assert final_memory < initial_memory * 3
+
+
+class TestColumnarNormalization:
+    """Test the in-place (columnar) normalization mode."""
+
+    @staticmethod
+    def _raw_data(n_rows=2000, seed=0):
+        rng = np.random.default_rng(seed)
+        data = pd.DataFrame(
+            {
+                "time": np.arange(n_rows) * 0.04,
+                "rpm": rng.uniform(800, 16000, n_rows),
+                "map": rng.uniform(-2.0, 3.0, n_rows),
+                "tps": rng.uniform(0, 1.05, n_rows),
+                "engine_temp": rng.uniform(150, 220, n_rows),
+                "o2_general": rng.normal(0.95, 0.3, n_rows),
+                "g_force_accel": rng.normal(0, 2, n_rows),
+                "g_force_lateral": rng.normal(0, 2, n_rows),
+                "fuel_pressure": rng.normal(3, 2, n_rows),
+                "gear": rng.integers(0, 10, n_rows),
+                "label": "run",
+            }
+        )
+        for col in ["map", "o2_general", "fuel_pressure"]:
+            data.loc[rng.random(n_rows) < 0.05, col] = np.nan
+        data.loc[:2, "map"] = np.nan
+        return data
+
+    @pytest.mark.parametrize("outlier_method", ["clip", "remove", "interpolate", "median"])
+    @pytest.mark.parametrize("missing_method", ["interpolate", "forward_fill", "mean", "zero"])
+    def test_inplace_matches_dataframe_pipeline(self, outlier_method, missing_method):
+        raw = self._raw_data()
+        expected, expected_stats = DataNormalizer().normalize_dataframe(
+            raw, outlier_method=outlier_method, missing_method=missing_method
+        )
+        actual, stats = DataNormalizer().normalize_dataframe(
+            raw.copy(), outlier_method=outlier_method, missing_method=missing_method, inplace=True
+        )
+
+        assert list(actual.columns) == list(expected.columns)
+        assert list(actual["label"]) == list(expected["label"])
+        for col in expected.columns.drop("label"):
+            np.testing.assert_allclose(
+                actual[col].to_numpy(float),
+                expected[col].to_numpy(float),
+                rtol=1e-9,
+                atol=1e-9,
+                err_msg=col,
+            )
+
+        assert stats["processing_steps"] == expected_stats["processing_steps"]
+        assert stats["outliers_detected"] == {
+            col: int(count) for col, count in expected_stats["outliers_detected"].items()
+        }
+        assert stats["missing_values_handled"] == expected_stats["missing_values_handled"]
+        assert stats["columns_smoothed"] == expected_stats["columns_smoothed"]
+
+    def test_inplace_modifies_input_and_reports_timings(self):
+        raw = self._raw_data(200)
+
+        normalized, stats = normalize_fueltech_data(raw, inplace=True)
+
+        assert normalized is raw
+        assert "engine_load" in raw.columns
+        assert raw["engine_temp"].max() < 120  # converted from Fahrenheit
+        assert set(stats["stage_timings"]) == {
+            "block_transfer",
+            "unit_normalization",
+            "outlier_detection",
+            "outlier_handling",
+            "missing_value_imputation",
+            "data_smoothing",
+            "derived_field_calculation",
+        }
+        assert all(seconds >= 0 for seconds in stats["stage_timings"].values())
+
+    @pytest.mark.parametrize("window", [4, 5])
+    def test_block_smoothing_matches_pandas_rolling(self, window):
+        rng = np.random.default_rng(1)
+        data = pd.DataFrame(rng.normal(size=(1000, 3)), columns=["rpm", "map", "tps"])
+        data.iloc[500, 1] = np.nan
+
+        expected = data.apply(
+            lambda s: s.rolling(window=window, center=True).mean().bfill().ffill()
+        )
+        # Small chunks exercise the carry between row chunks
+        with patch("src.data.normalizer.ROLLING_CHUNK_ROWS", 64):
+            actual = DataNormalizer().apply_smoothing(
+                data, columns=["rpm", "map", "tps"], window=window
+            )
+
+        np.testing.assert_allclose(actual.to_numpy(), expected.to_numpy(), rtol=1e-9)
+
+    def test_inplace_peak_memory(self):
+        import tracemalloc
+
+        rng = np.random.default_rng(2)
+        columns = list(DataNormalizer.FIELD_RANGES)
+        columns += [f"extra_{i}" for i in range(64 - len(columns))]
+        data = pd.DataFrame(rng.normal(20, 50, size=(150000, len(columns))), columns=columns)
+        data.loc[rng.random(len(data)) < 0.05, "map"] = np.nan
+        input_bytes = data.memory_usage(index=False).sum()
+
+        tracemalloc.start()
+        try:
+            DataNormalizer().normalize_dataframe(data, calculate_derived=False, inplace=True)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        # One block of about 20% of the columns plus a few column temporaries
+        assert peak < 0.35 * input_bytes
@@ -0,0 +1,165 @@
+"""
+Unit tests for time_series.py - Time series analysis kernels.
+
+The cumulative-sum and lag-limited kernels are checked against the direct
+per-index loops they replace; binary segmentation is checked on signals
+with known mean shifts.
+"""
+
+import time
+
+import numpy as np
+import pytest
+
+from src.analysis.time_series import TimeSeriesAnalyzer, _autocorrelation_sums
+
+
+def _reference_change_points(data, method, min_segment_length=10):
+    """Sliding half-window scan with np.var/np.mean at every index."""
+    window_size = max(min_segment_length, len(data) // 20)
+    points, scores = [], []
+    for i in range(window_size, len(data) - window_size):
+        left, right = data[i - window_size : i], data[i : i + window_size]
+        if method == "variance":
+            score = abs(np.var(left) - np.var(right)) / (np.var(left) + np.var(right) + 1e-8)
+        else:
+            pooled_std = np.sqrt((np.var(left) + np.var(right)) / 2)
+            score = abs(np.mean(left) - np.mean(right)) / (pooled_std + 1e-8)
+        if score > 1.0:
+            points.append(i)
+            scores.append(score)
+
+    filtered_points, filtered_scores = [], []
+    i = 0
+    while i < len(points):
+        j = i + 1
+        while j < len(points) and points[j] - points[i] < min_segment_length:
+            j += 1
+        best = i + int(np.argmax(scores[i:j]))
+        filtered_points.append(points[best])
+        filtered_scores.append(scores[best])
+        i = j
+    return filtered_points, filtered_scores
+
+
+@pytest.fixture
+def signal_data():
+    rng = np.random.default_rng(7)
+    t = np.arange(3000)
+    return (
+        5000
+        + 300 * np.sin(2 * np.pi * t / 25)
+        + rng.normal(0, 50, len(t))
+        + np.where(t > 1500, 800, 0)
+    )
+
+
+class TestKernels:
+    @pytest.mark.parametrize("max_lag", [10, 99, 1000])
+    def test_autocorrelation_sums_match_full_correlation(self, signal_data, max_lag):
+        data = signal_data - signal_data.mean()
+        full = np.correlate(data, data, mode="full")
+        expected = full[len(data) - 1 : len(data) + max_lag]
+
+        np.testing.assert_allclose(_autocorrelation_sums(data, max_lag), expected, rtol=1e-9)
+
+    @pytest.mark.parametrize("method", ["variance", "mean"])
+    def test_change_points_match_window_loop(self, signal_data, method):
+        expected_points, expected_scores = _reference_change_points(signal_data, method)
+
+        result = TimeSeriesAnalyzer().detect_change_points(signal_data, method=method)
+
+        assert result.change_points == expected_points
+        np.testing.assert_allclose(result.change_point_scores, expected_scores, rtol=1e-7)
+        for stats, (start, end) in zip(result.segment_statistics, result.segments):
+            assert stats["mean"] == pytest.approx(np.mean(signal_data[start:end]), rel=1e-12)
+            assert stats["std"] == pytest.approx(np.std(signal_data[start:end]), rel=1e-9)
+
+    def test_trend_matches_moving_average_loop(self, signal_data):
+        period = 25
+        half = period // 2
+        expected = np.full_like(signal_data, np.nan)
+        for i in range(half, len(signal_data) - half):
+            expected[i] = np.mean(signal_data[i - half : i + half + 1])
+        expected[:half] = expected[half]
+        expected[-half:] = expected[-half - 1]
+
+        trend = TimeSeriesAnalyzer()._extract_trend(signal_data, period)
+
+        np.testing.assert_allclose(trend, expected, rtol=1e-12)
+
+    def test_seasonal_matches_position_loop(self, signal_data):
+        period = 25
+        trend = TimeSeriesAnalyzer()._extract_trend(signal_data, period)
+        detrended = signal_data - trend
+        expected = np.zeros_like(signal_data)
+        for i in range(period):
+            expected[i::period] = np.mean(detrended[i::period])
+        expected -= expected.mean()
+
+        seasonal = TimeSeriesAnalyzer()._extract_seasonal(signal_data, trend, period)
+
+        np.testing.assert_allclose(seasonal, expected, rtol=1e-9, atol=1e-9)
+
+    def test_ljung_box_matches_formula(self, signal_data):
+        n, lags = len(signal_data), 10
+        full = np.correlate(signal_data, signal_data, mode="full")
+        acf = full[n : n + lags] / full[n - 1]
+        expected = n * (n + 2) * sum(acf[i] ** 2 / (n - i - 1) for i in range(lags))
+
+        stat, _ = TimeSeriesAnalyzer()._ljung_box_test(signal_data, lags)
+
+        assert stat == pytest.approx(expected, rel=1e-9)
+
+
+class TestBinarySegmentation:
+    def test_finds_mean_shifts(self):
+        rng = np.random.default_rng(3)
+        levels = [0.0, 5.0, 2.0, 8.0]
+        data = np.repeat(levels, 500) + rng.normal(0, 1, 2000)
+
+        result = TimeSeriesAnalyzer().detect_change_points(data, method="binseg")
+
+        assert len(result.change_points) == 3
+        for found, expected in zip(result.change_points, [500, 1000, 1500]):
+            assert abs(found - expected) <= 5
+        assert all(score > 2 for score in result.change_point_scores)
+        assert [s["mean"] for s in result.segment_statistics] == pytest.approx(levels, abs=0.2)
+
+    def test_constant_noise_has_no_change_points(self):
+        data = np.random.default_rng(4).normal(10, 1, 5000)
+
+        result = TimeSeriesAnalyzer().detect_change_points(data, method="binseg")
+
+        assert result.change_points == []
+        assert result.segments == [(0, 5000)]
+
+    def test_respects_min_segment_length(self):
+        data = np.r_[np.zeros(100), np.full(5, 50.0), np.zeros(100)]
+
+        result = TimeSeriesAnalyzer().detect_change_points(
+            data, method="binseg", min_segment_length=10
+        )
+
+        assert all(end - start >= 10 for start, end in result.segments)
+
+    def test_unknown_method(self, signal_data):
+        with pytest.raises(ValueError):
+            TimeSeriesAnalyzer().detect_change_points(signal_data, method="unknown")
+
+
+def test_one_hour_log_performance():
+    rng = np.random.default_rng(0)
+    n = 100 * 3600
+    t = np.arange(n)
+    data = 3000 + 500 * np.sin(2 * np.pi * t / 400) + rng.normal(0, 30, n)
+    analyzer = TimeSeriesAnalyzer(sample_rate=100)
+
+    start = time.perf_counter()
+    analyzer.analyze(data)
+    analyzer.detect_change_points(data, method="mean")
+    analyzer.decompose_seasonal(data, period=400)
+    elapsed = time.perf_counter() - start
+
+    # Generous bound for shared CI machines
+    assert elapsed < 3.0
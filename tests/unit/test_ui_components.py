@@ -120,6 +120,75 @@ class TestChartBuilder:
         assert series.color == "blue"
 
 
+class TestChartDownsampling:
+    """Test cases for time-series downsampling in chart_builder."""
+
+    @pytest.fixture
+    def long_series(self):
+        import numpy as np
+
+        rng = np.random.default_rng(0)
+        time = np.arange(200_000) / 100.0
+        values = np.sin(time / 10) + rng.normal(0, 0.05, len(time))
+        values[12_345] = 50.0
+        values[150_001] = -40.0
+        return pd.DataFrame({"time": time, "rpm": values})
+
+    @pytest.mark.parametrize("method", ["minmax", "lttb"])
+    def test_peaks_preserved_and_size_bounded(self, long_series, method):
+        from src.ui.components.chart_builder import downsample_series
+
+        x, y = downsample_series(
+            long_series["time"], long_series["rpm"], width_px=600, method=method
+        )
+
+        assert len(x) <= 1200
+        assert y.max() == 50.0
+        assert y.min() == -40.0
+        assert x[0] == long_series["time"].iloc[0]
+        assert x[-1] == long_series["time"].iloc[-1]
+
+    def test_window_gives_full_resolution(self, long_series):
+        from src.ui.components.chart_builder import downsample_series
+
+        x, _ = downsample_series(long_series["time"], long_series["rpm"], x_range=(100.0, 105.0))
+
+        # 501 points inside the window plus one neighbor on each side
+        assert len(x) == 503
+        assert x[1] == 100.0
+        assert x[-2] == 105.0
+
+    def test_nan_values_dropped(self):
+        import numpy as np
+
+        from src.ui.components.chart_builder import minmax_indices
+
+        y = np.arange(100, dtype=float)
+        y[::7] = np.nan
+        indices = minmax_indices(np.arange(100.0), y, 5)
+
+        assert not np.isnan(y[indices]).any()
+
+    def test_column_cache(self, long_series):
+        from src.ui.components import chart_builder
+
+        chart_builder.clear_downsample_cache()
+        first = chart_builder.downsample_column(long_series, "rpm", session_id="s1")
+        second = chart_builder.downsample_column(long_series, "rpm", session_id="s1")
+        zoomed = chart_builder.downsample_column(
+            long_series, "rpm", session_id="s1", window=(0.0, 10.0)
+        )
+
+        pd.testing.assert_frame_equal(first, second)
+        assert len(chart_builder._downsample_cache) == 2
+        assert zoomed["time"].iloc[-2] == 10.0
+
+        # Changed data for the same session must not be served from cache
+        modified = long_series.assign(rpm=long_series["rpm"] * 2)
+        doubled = chart_builder.downsample_column(modified, "rpm", session_id="s1")
+        assert doubled["rpm"].max() == 100.0
+
+
 class TestSessionStateManager:
     """Test cases for SessionStateManager component."""
 